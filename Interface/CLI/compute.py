@@ -1,106 +1,146 @@
-# *************************************************************************** #
-# *                                                                         * #
-# *         Mstar2t - Central Michigan University University, 2023          * #
-# *                                                                         * #
-# *************************************************************************** #
-#  This file is part of Mstar2t.                                              #                        
-#                                                                             #
-#  Mstar2t is free software: you can redistribute it and/or modify it under   #
-#  the terms of the GNU General Public License as published by the Free       #
-#  Software Foundation, either version 3 of the License, or (at your option)  #
-#  any later version.                                                         #
-#                                                                             #
-#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
-#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
-#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
-#  more details.                                                              #
-#                                                                             #
-#  You should have received a copy of the GNU General Public License along    #
-#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
-#                                                                             #
-# *************************************************************************** #
-
-
-import os
-import argparse
-import subprocess
-
-from colorama import Fore, Style
-
-import requests
-from datetime import datetime
-
-from utils.reading_class import ReadInput
-
-parser = argparse.ArgumentParser()
-parser.add_argument('-i', '--inputfile',
-                    required=True,
-                    help='path to input file')
-parser.add_argument("--conductivity", "-e",
-                    help="compute electrical conductivity",
-                    action='store_true')
-parser.add_argument("--seebeck", "-s",
-                    help="compute Seebeck coefficient",
-                    action='store_true')
-parser.add_argument("--thermal", "-k",
-                    help="compute thermal conductivity",
-                    action='store_true')
-parser.add_argument("--concentration", "-n",
-                    help="compute carrier concentration",
-                    action='store_true')
-parser.add_argument("--tplot",
-                    help="Temperature plot of the tensors",
-                    action='store_true')
-parser.add_argument("--muplot",
-                    help="Fermi level plot of the results",
-                    action='store_true')
-
-args = parser.parse_args()
-# get path of input file
-data_path = args.inputfile
-
-# 1. read the params from input file and create a python dict of parameters
-params = ReadInput(data_path).read_params()
-
-# 2. add the command line arguments to the python dict of parameters
-dict_args = vars(args)
-dict_args.pop("inputfile")
-params["args"] = dict_args
-
-# 3. Send a calculation request
-url_c = 'http://127.0.0.1:1200/api/clicalc'
-headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
-
-try:
-    r_calc = requests.post(url_c, json=params, headers=headers)
-    r_calc.raise_for_status()
-    # 4. Check response
-    if r_calc.status_code == 200:
-        return_value = r_calc.text
-        print("Computation done.")
-        print("Check results in " + return_value)
-    elif r_calc.status_code == 210 and r_calc.text == "-10":
-        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Export path not found.")
-        print("Check input file [results path].")
-    elif r_calc.status_code == 210 and r_calc.text == "-20":
-        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Relaxation time functional form unknown.")
-        print("Check input file.")
-    elif r_calc.status_code == 210 and r_calc.text == "-30":
-        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Domain error in the τ function calculation.")
-        print("Possible reasons: negative arguments in logs, negative radicand in radical expressions.")
-        print(f"{Fore.CYAN + Style.BRIGHT}Hint:{Style.RESET_ALL} shift the zero value of the chosen energy scale in the constraction of the band structure.")
-    else:
-        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Check server terminal.")
-        print(r_calc)
-
-except requests.exceptions.HTTPError as errh:
-    print("Http error:", errh)
-except requests.exceptions.ConnectionError as errc:
-    print("Exception occurred (ConnectionError). Check server terminal.")
-except requests.exceptions.Timeout as errt:
-    print("Timeout error:", errt)
-except requests.exceptions.RequestException as err:
-    print("Exception occurred (RequestException). Check server terminal.", err)
-
-
-
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #                        
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+from colorama import Fore, Style
+
+import requests
+from datetime import datetime
+
+from utils.reading_class import ReadInput
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.server_pool import ServerPool
+from common.profiler import Profiler
+from common.bands import BandError, normalize_bands
+
+parser = argparse.ArgumentParser()
+parser.add_argument('-i', '--inputfile',
+                    required=True,
+                    help='path to input file')
+parser.add_argument("--conductivity", "-e",
+                    help="compute electrical conductivity",
+                    action='store_true')
+parser.add_argument("--seebeck", "-s",
+                    help="compute Seebeck coefficient",
+                    action='store_true')
+parser.add_argument("--thermal", "-k",
+                    help="compute thermal conductivity",
+                    action='store_true')
+parser.add_argument("--concentration", "-n",
+                    help="compute carrier concentration",
+                    action='store_true')
+parser.add_argument("--tplot",
+                    help="Temperature plot of the tensors",
+                    action='store_true')
+parser.add_argument("--muplot",
+                    help="Fermi level plot of the results",
+                    action='store_true')
+parser.add_argument("--workers", "-w",
+                    help="number of computing servers started by run_cli.py (0: one for each core)",
+                    type=int, default=1)
+parser.add_argument("--port",
+                    help="port of the first computing server",
+                    type=int, default=1200)
+parser.add_argument("--profile",
+                    help="print the time spent in each step of the request",
+                    action='store_true')
+parser.add_argument("--profile-log",
+                    help="append the timings to this file (one JSON line per run)",
+                    default=None)
+
+args = parser.parse_args()
+profiler = Profiler(args.profile, args.profile_log)
+profiler.start("clicalc " + os.path.basename(args.inputfile))
+# get path of input file
+data_path = args.inputfile
+
+# 1. read the params from input file and create a python dict of parameters
+with profiler.span("read input"):
+    params = ReadInput(data_path).read_params()
+
+# band structure checked here: a bad input fails before reaching the server
+try:
+    params = normalize_bands(params)
+except BandError as err:
+    print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Invalid band structure.")
+    for problem in err.problems:
+        print("  " + problem)
+    print("Check input file.")
+    sys.exit(1)
+
+# 2. add the command line arguments to the python dict of parameters
+dict_args = vars(args).copy()
+dict_args.pop("inputfile")
+dict_args.pop("workers")
+dict_args.pop("port")
+dict_args.pop("profile")
+dict_args.pop("profile_log")
+params["args"] = dict_args
+
+# 3. Send a calculation request to the least loaded server
+server = ServerPool(args.workers, base_port=args.port, launch=False).start()
+headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+try:
+    t0 = time.perf_counter()
+    r_calc = server.post('/api/clicalc', wait=server.check_timeout + 1, json=params, headers=headers)
+    profiler.add_response(r_calc, time.perf_counter() - t0)
+    r_calc.raise_for_status()
+    # 4. Check response
+    if r_calc.status_code == 200:
+        return_value = r_calc.text
+        print("Computation done.")
+        print("Check results in " + return_value)
+    elif r_calc.status_code == 210 and r_calc.text == "-10":
+        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Export path not found.")
+        print("Check input file [results path].")
+    elif r_calc.status_code == 210 and r_calc.text == "-20":
+        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Relaxation time functional form unknown.")
+        print("Check input file.")
+    elif r_calc.status_code == 210 and r_calc.text == "-30":
+        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Domain error in the τ function calculation.")
+        print("Possible reasons: negative arguments in logs, negative radicand in radical expressions.")
+        print(f"{Fore.CYAN + Style.BRIGHT}Hint:{Style.RESET_ALL} shift the zero value of the chosen energy scale in the constraction of the band structure.")
+    else:
+        print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} Check server terminal.")
+        print(r_calc)
+
+except requests.exceptions.HTTPError as errh:
+    print("Http error:", errh)
+except requests.exceptions.ConnectionError as errc:
+    print("Exception occurred (ConnectionError). Check server terminal.")
+except requests.exceptions.Timeout as errt:
+    print("Timeout error:", errt)
+except requests.exceptions.RequestException as err:
+    print("Exception occurred (RequestException). Check server terminal.", err)
+
+profiler.stop()
+if args.profile:
+    print(profiler.report())
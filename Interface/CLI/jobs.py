@@ -0,0 +1,321 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+# Persistent queue of calculations for the computing servers started by run_cli.py.
+# Jobs and their history live in a SQLite file; a dispatcher running in background
+# sends them to the servers, so that the terminal can be closed in the meantime.
+#   python jobs.py submit -i data.txt --seebeck --sweep "Fermi level=-0.05;0.0;0.05"
+#   python jobs.py status
+#   python jobs.py wait
+#   python jobs.py fetch --json
+
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import threading
+import subprocess
+from datetime import datetime
+
+from colorama import Fore, Style
+
+from utils.async_submit import AsyncSubmitter
+from utils.sweeps import ERRORS, parse_sweep, read_input, make_jobs
+from utils.job_store import JobStore, summary, HEARTBEAT, QUEUED, RUNNING, DONE, FAILED, FINISHED
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.server_pool import ServerPool
+
+TENSOR_FLAGS = ("conductivity", "seebeck", "thermal", "concentration", "tplot", "muplot")
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--db",
+                    help="SQLite file of the jobs",
+                    default="jobs.sqlite")
+commands = parser.add_subparsers(dest="command", required=True)
+
+submit = commands.add_parser("submit", help="queue calculations and start the dispatcher")
+submit.add_argument('-i', '--inputfile',
+                    required=True, nargs='+',
+                    help='path to the input files')
+submit.add_argument("--conductivity", "-e",
+                    help="compute electrical conductivity",
+                    action='store_true')
+submit.add_argument("--seebeck", "-s",
+                    help="compute Seebeck coefficient",
+                    action='store_true')
+submit.add_argument("--thermal", "-k",
+                    help="compute thermal conductivity",
+                    action='store_true')
+submit.add_argument("--concentration", "-n",
+                    help="compute carrier concentration",
+                    action='store_true')
+submit.add_argument("--tplot",
+                    help="Temperature plot of the tensors",
+                    action='store_true')
+submit.add_argument("--muplot",
+                    help="Fermi level plot of the results",
+                    action='store_true')
+submit.add_argument("--sweep",
+                    help='values of an input file entry, e.g. "temperature=300:400:10;300:800:10" (repeatable)',
+                    action='append', default=[])
+submit.add_argument("--batch",
+                    help="name of the batch (default: date and time)",
+                    default=None)
+
+dispatch = commands.add_parser("dispatch", help="send the queued jobs to the servers (started by submit)")
+for command in (submit, dispatch):
+    command.add_argument("--concurrency", "-c",
+                         help="maximum number of requests in flight (default: two for each server)",
+                         type=int, default=0)
+    command.add_argument("--retries",
+                         help="attempts on other servers when a server fails",
+                         type=int, default=2)
+    command.add_argument("--timeout",
+                         help="seconds before a request is abandoned (default: none)",
+                         type=float, default=None)
+    command.add_argument("--workers", "-w",
+                         help="number of computing servers started by run_cli.py (0: one for each core)",
+                         type=int, default=1)
+    command.add_argument("--port",
+                         help="port of the first computing server",
+                         type=int, default=1200)
+    command.add_argument("--server-timeout",
+                         help="seconds the dispatcher waits for a computing server before giving up",
+                         type=float, default=900.0)
+dispatch.add_argument("--linger",
+                      help="seconds the dispatcher waits for new jobs before exiting",
+                      type=float, default=30.0)
+
+for name, text in (("status", "state of the jobs, throughput and failure rate"),
+                   ("wait", "block until the jobs are finished"),
+                   ("fetch", "result folders of the jobs")):
+    command = commands.add_parser(name, help=text)
+    command.add_argument("ids", nargs="*", type=int,
+                         help="job ids (default: all the jobs of the batch)")
+    command.add_argument("--batch",
+                         help="batch of the jobs (default: the last one submitted)",
+                         default=None)
+    command.add_argument("--all",
+                         help="jobs of every batch",
+                         action='store_true')
+    if name == "wait":
+        command.add_argument("--timeout",
+                             help="seconds to wait at most",
+                             type=float, default=None)
+    if name == "fetch":
+        command.add_argument("--json",
+                             help="whole records as JSON lines",
+                             action='store_true')
+args = parser.parse_args()
+args.db = os.path.abspath(args.db)
+
+
+# start the dispatcher detached from the terminal, its output goes to <db>.log
+def start_dispatcher():
+    cmd = [sys.executable, os.path.abspath(__file__), "--db", args.db, "dispatch",
+           "--concurrency", str(args.concurrency), "--retries", str(args.retries),
+           "--workers", str(args.workers), "--port", str(args.port), "--server-timeout", str(args.server_timeout)]
+    if args.timeout is not None:
+        cmd += ["--timeout", str(args.timeout)]
+    if platform.system() == "Windows":
+        detach = dict(creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        detach = dict(start_new_session=True)
+    with open(args.db + ".log", "a") as log:
+        subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                         cwd=os.path.dirname(os.path.abspath(__file__)), **detach)
+
+
+def cmd_submit(store):
+    sweeps = [parse_sweep(s) for s in args.sweep]
+    flags = {k: v for k, v in vars(args).items() if k in TENSOR_FLAGS}
+    inputs = [(inputfile, read_input(inputfile)) for inputfile in args.inputfile]
+    batch = args.batch or datetime.now().strftime("%Y%m%d_%H%M%S")
+    ids = store.add(batch, ((name, inputfile, overrides, '/api/clicalc', message)
+                            for name, inputfile, overrides, message in make_jobs(inputs, sweeps, flags)))
+    print("Queued {} calculation(s) in batch {} (jobs {}-{}).".format(len(ids), batch, ids[0], ids[-1]))
+    if store.dispatcher_alive():
+        print("Dispatcher already running.")
+    else:
+        start_dispatcher()
+        print("Dispatcher started, log in " + args.db + ".log")
+
+
+# jobs of the command line selection
+def selected(store):
+    if args.ids or args.all:
+        return store.select(ids=args.ids)
+    batch = args.batch or store.last_batch()
+    return store.select(batch=batch)
+
+
+def describe(row):
+    if row["status"] == DONE:
+        return f"{Fore.GREEN}done{Style.RESET_ALL} -> " + row["result"]
+    elif row["status"] == FAILED:
+        return f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} " + (row["error"] or "")
+    return row["status"]
+
+
+def print_summary(rows):
+    s = summary(rows)
+    text = "{} job(s): {} queued, {} running, {} done, {} failed".format(s["total"], s[QUEUED], s[RUNNING], s[DONE], s[FAILED])
+    if "failure_rate" in s:
+        text += "; {:.1f} s per job, failure rate {:.1%}".format(s["mean_seconds"], s["failure_rate"])
+        if s["throughput"] is not None:
+            text += ", {:.1f} jobs/hour".format(s["throughput"])
+    print(text)
+
+
+def cmd_status(store):
+    rows = selected(store)
+    for row in rows:
+        seconds = "{:.1f} s".format(row["finished"] - row["started"]) if row["status"] in FINISHED and row["started"] else ""
+        print("{:>6} {:<14} {} {:>8} {}".format(row["id"], row["batch"], row["name"], seconds, describe(row)))
+    print_summary(rows)
+    print("Dispatcher " + ("running." if store.dispatcher_alive() else "stopped."))
+
+
+def cmd_wait(store):
+    t0 = time.monotonic()
+    t_alive = t0
+    while True:
+        rows = selected(store)
+        pending = [row for row in rows if row["status"] not in FINISHED]
+        print("\r{} of {} job(s) finished".format(len(rows) - len(pending), len(rows)), end="", flush=True)
+        if not pending:
+            print()
+            print_summary(rows)
+            sys.exit(1 if any(row["status"] == FAILED for row in rows) else 0)
+        if args.timeout is not None and time.monotonic() - t0 > args.timeout:
+            print()
+            sys.exit("Timeout: {} job(s) not finished.".format(len(pending)))
+        # a dispatcher just started may not have taken its role yet
+        if store.dispatcher_alive():
+            t_alive = time.monotonic()
+        elif time.monotonic() - t_alive > 3 * HEARTBEAT:
+            print()
+            sys.exit("No dispatcher is running: submit again or run 'jobs.py dispatch'.")
+        time.sleep(1.0)
+
+
+def cmd_fetch(store):
+    for row in selected(store):
+        if args.json:
+            record = dict(row)
+            record["sweep"] = json.loads(record["sweep"]) if record["sweep"] else None
+            record.pop("payload")
+            print(json.dumps(record, ensure_ascii=False))
+        elif row["status"] == DONE:
+            print(row["result"])
+        else:
+            print("{} {}: {}".format(row["id"], row["name"], describe(row)), file=sys.stderr)
+
+
+# jobs of the queue handed to the submitter as it asks for them
+def claimed(store):
+    while True:
+        row = store.claim()
+        if row is None:
+            return
+        yield row["id"], row["route"], json.loads(row["payload"])
+
+
+def record(store, result):
+    # a result that cannot be stored fails its job only, the others go on
+    try:
+        if result.status == 200:
+            store.finish(result.job_id, DONE, code=200, result=result.answer, endpoint=result.endpoint, attempts=result.attempts)
+        elif result.status == 210:
+            store.finish(result.job_id, FAILED, code=int(result.answer), error=ERRORS.get(result.answer, "code " + result.answer),
+                         endpoint=result.endpoint, attempts=result.attempts)
+        else:
+            store.finish(result.job_id, FAILED, code=result.status, error=result.error or "HTTP {}".format(result.status),
+                         endpoint=result.endpoint, attempts=result.attempts)
+    except Exception as err:
+        error = "result not recorded ({}: {})".format(type(err).__name__, err)
+        print("[{}] job {}: {}".format(datetime.now().strftime("%H:%M:%S"), result.job_id, error), flush=True)
+        try:
+            store.finish(result.job_id, FAILED, error=error, endpoint=result.endpoint, attempts=result.attempts)
+        except Exception:
+            # left running: the next dispatcher sends it again
+            pass
+        return
+    print("[{}] job {}: {}".format(datetime.now().strftime("%H:%M:%S"), result.job_id, result.answer or result.error), flush=True)
+
+
+# send the queued jobs until the queue stays empty for --linger seconds;
+# only one dispatcher works on a database at a time
+def cmd_dispatch(store):
+    pid = os.getpid()
+    if not store.acquire_dispatcher(pid):
+        print("Another dispatcher is running.")
+        return
+    stopped = threading.Event()
+
+    def heartbeat():
+        while not stopped.wait(HEARTBEAT):
+            store.beat(pid)
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+    server = ServerPool(args.workers, base_port=args.port, launch=False).start()
+    try:
+        # jobs of a dispatcher that was killed are sent again
+        requeued = store.requeue_running()
+        if requeued:
+            print("{} interrupted job(s) queued again.".format(requeued), flush=True)
+        idle = time.monotonic()
+        while True:
+            if store.count(QUEUED) == 0:
+                if time.monotonic() - idle < args.linger:
+                    time.sleep(1.0)
+                    continue
+                # a job queued while leaving is not left behind
+                store.release_dispatcher(pid)
+                if store.count(QUEUED) == 0 or not store.acquire_dispatcher(pid):
+                    break
+            # servers that answer now (waits for the first one)
+            if not server.wait_ready(num=1, timeout=args.server_timeout):
+                print("[{}] No computing server answered on port {} within {:g} s, {} job(s) left queued."
+                      .format(datetime.now().strftime("%H:%M:%S"), args.port, args.server_timeout, store.count(QUEUED)), flush=True)
+                break
+            server.wait_ready(timeout=server.check_timeout + 1)
+            endpoints = [(w.host, w.port) for w in server.workers if w.healthy]
+            submitter = AsyncSubmitter(endpoints, window=args.concurrency or 2 * len(endpoints), retries=args.retries, timeout=args.timeout)
+            asyncio.run(submitter.run(claimed(store), lambda result: record(store, result)))
+            idle = time.monotonic()
+    finally:
+        stopped.set()
+        server.terminate()
+        store.release_dispatcher(pid)
+
+
+store = JobStore(args.db)
+{"submit": cmd_submit, "dispatch": cmd_dispatch, "status": cmd_status, "wait": cmd_wait, "fetch": cmd_fetch}[args.command](store)
@@ -0,0 +1,107 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+# Render results files into figures without Qt (Agg backend), in parallel:
+#   python render.py results/*.csv --temperature 300:650:10 --format pdf --processes 8
+
+
+import os
+import sys
+import glob
+import time
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from colorama import Fore, Style
+
+from utils.figures import init_worker, render_file
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.grid import Grid
+
+parser = argparse.ArgumentParser()
+parser.add_argument('files',
+                    nargs='+',
+                    help='results files (CSV with the layout of the GUI export) or folders of them')
+parser.add_argument("--outdir", "-o",
+                    help="folder of the figures (default: next to each results file)",
+                    default=None)
+parser.add_argument("--format", "-f",
+                    help="image format of the figures",
+                    choices=("png", "pdf", "svg"), default="png")
+parser.add_argument("--dpi",
+                    help="resolution of the figures",
+                    type=int, default=150)
+parser.add_argument("--temperature", "-t",
+                    help="temperatures of the columns when the files only number them, e.g. 300:650:10",
+                    default=None)
+parser.add_argument("--processes", "-p",
+                    help="number of rendering processes (0: one for each core)",
+                    type=int, default=0)
+parser.add_argument("--force",
+                    help="render again the files whose figures are up to date",
+                    action='store_true')
+
+
+# results files given directly or found in the given folders
+def collect(paths):
+    files = list()
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "*.csv"), recursive=True)))
+        else:
+            files.extend(sorted(glob.glob(path)) or [path])
+    return list(dict.fromkeys(files))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    files = collect(args.files)
+    temperatures = None if args.temperature is None else Grid.parse(args.temperature).values()
+    if args.outdir is not None:
+        os.makedirs(args.outdir, exist_ok=True)
+    processes = args.processes if args.processes > 0 else (os.cpu_count() or 1)
+    processes = max(1, min(processes, len(files)))
+
+    render = partial(render_file, outdir=args.outdir, fmt=args.format, temperatures=temperatures, force=args.force)
+    t0 = time.perf_counter()
+    num_figures = num_skipped = num_failed = 0
+    # each process keeps its figures for all the files it renders
+    with ProcessPoolExecutor(max_workers=processes, initializer=init_worker, initargs=(args.dpi,)) as executor:
+        futures = {executor.submit(render, f): f for f in files}
+        for future in as_completed(futures):
+            try:
+                written = future.result()
+            except (OSError, ValueError, IndexError) as err:
+                num_failed += 1
+                print(f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} {futures[future]}: {err}")
+                continue
+            num_figures += len(written)
+            num_skipped += not written
+
+    print("{} figures from {} files in {:.1f} s ({} up to date, {} failed, {} processes).".format(
+        num_figures, len(files), time.perf_counter() - t0, num_skipped, num_failed, processes))
+    sys.exit(1 if num_failed else 0)
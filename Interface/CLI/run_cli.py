@@ -1,50 +1,72 @@
-# *************************************************************************** #
-# *                                                                         * #
-# *         Mstar2t - Central Michigan University University, 2023          * #
-# *                                                                         * #
-# *************************************************************************** #
-#  This file is part of Mstar2t.                                              #                        
-#                                                                             #
-#  Mstar2t is free software: you can redistribute it and/or modify it under   #
-#  the terms of the GNU General Public License as published by the Free       #
-#  Software Foundation, either version 3 of the License, or (at your option)  #
-#  any later version.                                                         #
-#                                                                             #
-#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
-#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
-#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
-#  more details.                                                              #
-#                                                                             #
-#  You should have received a copy of the GNU General Public License along    #
-#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
-#                                                                             #
-# *************************************************************************** #
-
-
-import os
-import sys
-
-import platform
-import subprocess
-
-from PySide2 import QtCore, QtWidgets
-
-from utils.utils import LoadingScreen
-
-if platform.system() == "Windows":
-    import ctypes
-    myappid = 'Mstar2t.bonal1l@cmich.edu' # arbitrary string
-    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-
-# display
-os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
-
-# logo
-app = QtWidgets.QApplication(sys.argv)
-screen = app.primaryScreen()
-loading = LoadingScreen(screen.size())
-app.exec_()
-
-# server
-server = subprocess.Popen(['julia', '../run_server.jl'])
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #                        
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import os
+import sys
+import argparse
+
+import platform
+
+from PySide2 import QtCore, QtWidgets
+
+from utils.utils import LoadingScreen
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.server_pool import ServerPool, STUB_SERVER
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--workers", "-w",
+                    help="number of computing servers (0: one for each core)",
+                    type=int, default=1)
+parser.add_argument("--port",
+                    help="port of the first server, the others use the next ones",
+                    type=int, default=1200)
+parser.add_argument("--stub",
+                    help="run the python stand-in servers with synthetic results (client benchmarks)",
+                    action='store_true')
+args, qt_args = parser.parse_known_args()
+
+if platform.system() == "Windows":
+    import ctypes
+    myappid = 'Mstar2t.bonal1l@cmich.edu' # arbitrary string
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+
+# display
+os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
+
+# logo
+app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+screen = app.primaryScreen()
+loading = LoadingScreen(screen.size())
+app.exec_()
+
+# servers: supervised until Ctrl-C
+server = ServerPool(args.workers, base_port=args.port, command=STUB_SERVER if args.stub else None).start()
+print("Starting {} computing server(s) on ports {}-{}.".format(len(server), args.port, args.port + len(server) - 1))
+try:
+    server.join()
+except KeyboardInterrupt:
+    server.terminate()
+
@@ -0,0 +1,143 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+# Submit many calculations at once (input files x parameter sweeps) to the
+# computing servers started by run_cli.py, with several requests in flight.
+#   python submit.py -i data.txt --seebeck --sweep "Fermi level=-0.05;0.0;0.05" --workers 4
+
+
+import os
+import sys
+import json
+import asyncio
+import argparse
+import itertools
+from datetime import datetime
+
+from colorama import Fore, Style
+
+from utils.async_submit import AsyncSubmitter
+from utils.sweeps import ERRORS, parse_sweep, read_input, make_jobs
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.server_pool import ServerPool
+
+parser = argparse.ArgumentParser()
+parser.add_argument('-i', '--inputfile',
+                    required=True, nargs='+',
+                    help='path to the input files')
+parser.add_argument("--conductivity", "-e",
+                    help="compute electrical conductivity",
+                    action='store_true')
+parser.add_argument("--seebeck", "-s",
+                    help="compute Seebeck coefficient",
+                    action='store_true')
+parser.add_argument("--thermal", "-k",
+                    help="compute thermal conductivity",
+                    action='store_true')
+parser.add_argument("--concentration", "-n",
+                    help="compute carrier concentration",
+                    action='store_true')
+parser.add_argument("--tplot",
+                    help="Temperature plot of the tensors",
+                    action='store_true')
+parser.add_argument("--muplot",
+                    help="Fermi level plot of the results",
+                    action='store_true')
+parser.add_argument("--sweep",
+                    help='values of an input file entry, e.g. "temperature=300:400:10;300:800:10" (repeatable)',
+                    action='append', default=[])
+parser.add_argument("--window",
+                    help="maximum number of requests in flight (default: two for each server)",
+                    type=int, default=0)
+parser.add_argument("--retries",
+                    help="attempts on other servers when a server fails",
+                    type=int, default=2)
+parser.add_argument("--timeout",
+                    help="seconds before a request is abandoned (default: none)",
+                    type=float, default=None)
+parser.add_argument("--output", "-o",
+                    help="file where each result is appended as a JSON line",
+                    default="sweep_{}.jsonl".format(datetime.now().strftime("%Y%m%d_%H%M%S")))
+parser.add_argument("--workers", "-w",
+                    help="number of computing servers started by run_cli.py (0: one for each core)",
+                    type=int, default=1)
+parser.add_argument("--port",
+                    help="port of the first computing server",
+                    type=int, default=1200)
+args = parser.parse_args()
+
+
+sweeps = [parse_sweep(s) for s in args.sweep]
+flags = {k: v for k, v in vars(args).items() if k in ("conductivity", "seebeck", "thermal", "concentration", "tplot", "muplot")}
+inputs = [(inputfile, read_input(inputfile)) for inputfile in args.inputfile]
+num_jobs = len(args.inputfile) * len(list(itertools.product(*[values for _, values in sweeps])))
+
+# servers that answer now
+server = ServerPool(args.workers, base_port=args.port, launch=False).start()
+server.wait_ready(num=len(server), timeout=server.check_timeout + 1)
+endpoints = [(w.host, w.port) for w in server.workers if w.healthy]
+server.terminate()
+if not endpoints:
+    sys.exit("Exception occurred (ConnectionError). Check server terminal.")
+
+submitter = AsyncSubmitter(endpoints, window=args.window or 2 * len(endpoints), retries=args.retries, timeout=args.timeout)
+jobs_info = dict()
+done = [0, 0]
+
+
+def jobs():
+    for job_id, inputfile, overrides, message in make_jobs(inputs, sweeps, flags):
+        jobs_info[job_id] = (inputfile, overrides)
+        yield job_id, '/api/clicalc', message
+
+
+# stream each completed job to the output file
+def on_result(result):
+    inputfile, overrides = jobs_info.pop(result.job_id)
+    ok = result.status == 200
+    record = {"job": result.job_id, "input": inputfile, "sweep": overrides,
+              "status": result.status, "answer": result.answer, "error": result.error,
+              "endpoint": result.endpoint, "attempts": result.attempts, "seconds": round(result.seconds, 4)}
+    store.write(json.dumps(record, ensure_ascii=False) + "\n")
+    store.flush()
+    done[0] += 1
+    done[1] += ok
+    if ok:
+        text = f"{Fore.GREEN}done{Style.RESET_ALL} -> " + result.answer
+    elif result.status == 210:
+        text = f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} " + ERRORS.get(result.answer, "code " + result.answer)
+    else:
+        text = f"{Fore.RED + Style.BRIGHT}ERROR:{Style.RESET_ALL} " + str(result.error)
+    print("[{}/{}] {} ({:.1f} s, {}) {}".format(done[0], num_jobs, result.job_id, result.seconds, result.endpoint, text))
+
+
+print("Submitting {} calculation(s) to {} server(s), {} at a time.".format(num_jobs, len(endpoints), submitter.window))
+with open(args.output, "a", encoding="utf-8") as store:
+    try:
+        asyncio.run(submitter.run(jobs(), on_result))
+    except KeyboardInterrupt:
+        print("Interrupted.")
+print("{} of {} calculation(s) done, {} failed. Results in {}".format(done[0], num_jobs, done[0] - done[1], args.output))
@@ -0,0 +1,254 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import os
+import sys
+import json
+import time
+import asyncio
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from common.single_flight import payload_key
+from common.compression import MIN_SIZE, GzipDecoder, accepts_gzip, encode
+
+
+# raised for a broken connection or an HTTP error status (>= 500)
+class SubmitError(Exception):
+    pass
+
+
+# minimal HTTP/1.1 client connection with keep-alive (JSON requests only).
+# Answers may come gzipped; large requests are gzipped once the server has
+# listed gzip in the Accept-Encoding header of an answer.
+class HttpConnection(object):
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.gzip_requests = False
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    # raw body in chunks as they arrive
+    async def read_chunks(self, headers):
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    return
+                yield await self.reader.readexactly(size)
+                await self.reader.readline()
+        length = headers.get("content-length")
+        if length is None:
+            # body until the server closes the connection
+            yield await self.reader.read()
+            self.close()
+            return
+        length = int(length)
+        while length > 0:
+            chunk = await self.reader.readexactly(min(length, 1 << 16))
+            length -= len(chunk)
+            yield chunk
+
+    # body decompressed while it is received
+    async def read_body(self, headers):
+        decoder = GzipDecoder() if headers.get("content-encoding", "").lower() == "gzip" else None
+        parts = list()
+        async for chunk in self.read_chunks(headers):
+            parts.append(chunk if decoder is None else decoder.feed(chunk))
+        if decoder is not None:
+            parts.append(decoder.flush())
+        return b"".join(parts)
+
+    async def post(self, route, message):
+        body, encoding = encode(json.dumps(message).encode("utf-8"), None if not self.gzip_requests else MIN_SIZE)
+        head = ("POST {} HTTP/1.1\r\nHost: {}:{}\r\nAccept: application/json\r\nAccept-Encoding: gzip\r\n"
+                "Content-Type: application/json\r\n{}Content-Length: {}\r\nConnection: keep-alive\r\n\r\n").format(
+                    route, self.host, self.port, "Content-Encoding: gzip\r\n" if encoding else "", len(body))
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise SubmitError("connection closed by the server")
+        fields = status_line.split()
+        if len(fields) < 2 or not fields[1].isdigit():
+            raise SubmitError("malformed status line {!r}".format(status_line[:80]))
+        status = int(fields[1])
+        headers = dict()
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        answer = await self.read_body(headers)
+        self.gzip_requests = accepts_gzip(headers.get("accept-encoding"))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, answer.decode("utf-8")
+
+
+# one computing server: idle keep-alive connections and requests in flight
+class Endpoint(object):
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.idle = list()
+        self.in_flight = 0
+        self.failures = 0
+        # time.monotonic() at the end of the cool-down after a failure
+        self.retry_at = 0.0
+
+    def __repr__(self):
+        return "{}:{}".format(self.host, self.port)
+
+    async def post(self, route, message, timeout=None):
+        conn = self.idle.pop() if self.idle else None
+        if conn is None or conn.writer is None:
+            conn = HttpConnection(self.host, self.port)
+            await conn.open()
+        try:
+            status, answer = await asyncio.wait_for(conn.post(route, message), timeout)
+        except BaseException:
+            # half-read answer or cancellation: the connection cannot be reused
+            conn.close()
+            raise
+        if conn.writer is not None:
+            self.idle.append(conn)
+        return status, answer
+
+    def close(self):
+        for conn in self.idle:
+            conn.close()
+        self.idle = list()
+
+
+# result of one job, as written in the output store
+class JobResult(object):
+    def __init__(self, job_id, status=None, answer=None, endpoint=None, attempts=0, seconds=0.0, error=None):
+        self.job_id = job_id
+        self.status = status
+        self.answer = answer
+        self.endpoint = endpoint
+        self.attempts = attempts
+        self.seconds = seconds
+        self.error = error
+
+
+# Many requests in flight over a set of servers from a single process: at most
+# `window` requests are sent at once, each to the endpoint with the fewest in
+# flight; a job whose server fails is sent again to another one. A server that failed
+# gets no new job for `cooldown` seconds (doubling with each consecutive failure, up to
+# `max_cooldown`) while other servers are available. A job identical to one in flight
+# is not sent: it waits for that answer. Results are handed to on_result in completion order.
+class AsyncSubmitter(object):
+    def __init__(self, endpoints, window=8, retries=2, timeout=None, cooldown=1.0, max_cooldown=30.0):
+        self.endpoints = [Endpoint(host, port) for host, port in endpoints]
+        self.window = window
+        self.retries = retries
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.in_flight = dict()
+        self.coalesced = 0
+
+    def pick(self, exclude=None):
+        candidates = [e for e in self.endpoints if e is not exclude] or self.endpoints
+        now = time.monotonic()
+        return min(candidates, key=lambda e: (e.retry_at > now, e.in_flight))
+
+    async def submit(self, job_id, route, message):
+        key = payload_key(route, message)
+        if key in self.in_flight:
+            self.coalesced += 1
+            shared = await asyncio.shield(self.in_flight[key])
+            return JobResult(job_id, shared.status, shared.answer, shared.endpoint, 0, shared.seconds, shared.error)
+        future = self.in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self.send(job_id, route, message)
+            future.set_result(result)
+            return result
+        finally:
+            del self.in_flight[key]
+            if not future.done():
+                future.cancel()
+
+    async def send(self, job_id, route, message):
+        result = JobResult(job_id)
+        t0 = time.perf_counter()
+        endpoint = None
+        while True:
+            endpoint = self.pick(exclude=endpoint)
+            endpoint.in_flight += 1
+            result.attempts += 1
+            try:
+                status, answer = await endpoint.post(route, message, self.timeout)
+                if status >= 500:
+                    raise SubmitError("HTTP {}".format(status))
+                endpoint.failures = 0
+                endpoint.retry_at = 0.0
+                result.status, result.answer, result.error = status, answer, None
+                break
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, SubmitError, ValueError) as err:
+                endpoint.failures += 1
+                endpoint.retry_at = time.monotonic() + min(self.cooldown * 2**(endpoint.failures - 1), self.max_cooldown)
+                result.error = "{}: {}".format(type(err).__name__, err)
+                if result.attempts > self.retries:
+                    break
+            finally:
+                endpoint.in_flight -= 1
+        result.endpoint = repr(endpoint)
+        result.seconds = time.perf_counter() - t0
+        return result
+
+    # jobs: iterable of (job_id, route, message), read lazily; on_result(JobResult) is
+    # called as jobs complete. `window` coroutines share the iterator, so that no more
+    # than `window` requests are ever in flight, whatever the length of the sweep.
+    async def run(self, jobs, on_result):
+        jobs = iter(jobs)
+
+        async def slot():
+            for job_id, route, message in jobs:
+                on_result(await self.submit(job_id, route, message))
+
+        slots = [asyncio.ensure_future(slot()) for _ in range(self.window)]
+        try:
+            await asyncio.gather(*slots)
+        finally:
+            # Ctrl-C or error: drop the jobs in flight and close the connections
+            for task in slots:
+                task.cancel()
+            await asyncio.gather(*slots, return_exceptions=True)
+            for endpoint in self.endpoints:
+                endpoint.close()
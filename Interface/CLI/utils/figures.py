@@ -0,0 +1,216 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import os
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib import cm
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+TENSORS = ("conductivity", "seebeck", "thermal", "concentration")
+TAU_LABEL = "tau"
+
+# same look as the plots of the GUI output window
+RC_PARAMS = {'font.size': 9, 'axes.titlesize': 14, 'axes.linewidth': 0.5, 'axes.labelsize': 9,
+             'axes.titlepad': 11, 'axes.spines.top': False, 'axes.spines.right': False,
+             'xtick.major.size': 2, 'xtick.labelsize': 7, 'ytick.major.size': 2, 'ytick.labelsize': 7,
+             'legend.fontsize': 7, 'legend.loc': "upper left", 'lines.linewidth': 1}
+
+# panel of each tensor: position, color of a single curve, y scale factor and label
+PANELS = {"conductivity": ((0, 0), '#1f77b4', 1.0, r"$\sigma\ [(\Omega m)^{-1}]$"),
+          "seebeck": ((0, 1), "orange", 1e6, r"$S\ [\mu VK^{-1}]$"),
+          "thermal": ((1, 0), "red", 1.0, r"$\kappa_{e}\ [WK^{-1}]$"),
+          "concentration": ((1, 1), "limegreen", 1.0, "n")}
+
+
+# traces of a results file with the layout of the GUI export: one row for each
+# (tensor, Fermi level) labelled with the tensor name, then μ and one column per temperature
+#   returns mus, T (None when the header only numbers the columns) and {label: (num_mu, num_t)}
+def read_results(path):
+    with open(path, "r") as f:
+        header = f.readline().rstrip("\n").split(",")
+        labels, rows = list(), list()
+        for line in f:
+            label, _, values = line.rstrip("\n").partition(",")
+            if label.strip() == "":
+                continue
+            labels.append(label.strip().strip('"'))
+            rows.append(np.array([float(v) for v in values.split(",")]))
+    data = np.array(rows)
+    try:
+        T = np.array([float(h.split("=")[-1]) for h in header[2:]])
+    except ValueError:
+        T = None
+    traces = dict()
+    mus = None
+    for label in dict.fromkeys(labels):
+        block = data[[i for i, l in enumerate(labels) if l == label]]
+        mus = block[:, 0] if mus is None else mus
+        traces[label] = block[:, 1:]
+    return mus, T, traces
+
+
+# figures of one process, created at the first render and reused for every file
+class FigureSet(object):
+    def __init__(self, dpi=100):
+        self.dpi = dpi
+        self.tensors = None
+        self.tau = None
+
+    def tensor_figure(self):
+        if self.tensors is None:
+            with matplotlib.rc_context(RC_PARAMS):
+                fig = Figure(figsize=(10, 8), dpi=self.dpi)
+                FigureCanvasAgg(fig)
+                axes = fig.subplots(2, 2)
+                fig.subplots_adjust(wspace=0.5, hspace=0.5, bottom=0.15)
+            self.tensors = (fig, axes, dict())
+        return self.tensors
+
+    def tau_figure(self):
+        if self.tau is None:
+            with matplotlib.rc_context(RC_PARAMS):
+                fig = Figure(figsize=(6, 5), dpi=self.dpi)
+                FigureCanvasAgg(fig)
+                ax = fig.subplots(1, 1)
+                fig.subplots_adjust(left=0.2, bottom=0.2)
+            self.tau = (fig, ax, dict())
+        return self.tau
+
+
+# color scale of the curves, the colorbar of the axes is created once and then updated
+def colorbar(fig, ax, colorbars, values):
+    sm = cm.ScalarMappable(cmap=cm.viridis, norm=Normalize(vmin=values.min(), vmax=values.max()))
+    sm.set_array([])
+    if colorbars.get(ax) is None:
+        colorbars[ax] = fig.colorbar(sm, ax=ax)
+    else:
+        colorbars[ax].update_normal(sm)
+        colorbars[ax].ax.set_visible(True)
+    return sm
+
+
+# hidden rather than removed, the panels keep the same size from file to file
+def hide_colorbar(ax, colorbars):
+    if colorbars.get(ax) is not None:
+        colorbars[ax].ax.set_visible(False)
+
+
+# four-panel layout of the GUI: each tensor against T, one curve for each Fermi level
+def draw_tensors(figures, mus, T, traces, title=""):
+    fig, axes, colorbars = figures.tensor_figure()
+    with matplotlib.rc_context(RC_PARAMS):
+        fig.suptitle(title, y=0.97)
+        for tensor_name, ((r, c), color, scale, ylabel) in PANELS.items():
+            ax = axes[r, c]
+            ax.cla()
+            if tensor_name not in traces:
+                hide_colorbar(ax, colorbars)
+                ax.set_visible(False)
+                continue
+            ax.set_visible(True)
+            y = traces[tensor_name] * scale
+            if mus.size == 1:
+                hide_colorbar(ax, colorbars)
+                ax.plot(T, y[0], "-.", marker='.', fillstyle='none', color=color, label="mu=" + str(np.round(mus[0], 4)), zorder=0)
+                ax.legend()
+            else:
+                sm = colorbar(fig, ax, colorbars, mus)
+                for i in range(mus.size):
+                    ax.plot(T, y[i], color=sm.to_rgba(mus[i]), linewidth=0.5)
+            if tensor_name == "conductivity":
+                ax.ticklabel_format(style="sci", axis='y', scilimits=(3, 0))
+            if r == 1:
+                ax.set_xlabel(r"$T\ [K]$")
+            ax.set_ylabel(ylabel)
+            ax.grid(linewidth=0.3)
+    return fig
+
+
+# relaxation time as in the GUI: τ against μ, one curve for each temperature
+def draw_tau(figures, mus, T, tau, title=""):
+    fig, ax, colorbars = figures.tau_figure()
+    with matplotlib.rc_context(RC_PARAMS):
+        ax.cla()
+        fig.suptitle(title)
+        if mus.size == 1:
+            hide_colorbar(ax, colorbars)
+            ax.plot(T, tau[0], color="#1f77b4")
+            ax.set_xlabel(r"$T\ [K]$", fontsize=12)
+        else:
+            sm = colorbar(fig, ax, colorbars, T)
+            for i in range(T.size):
+                ax.plot(mus, tau[:, i], color=sm.to_rgba(T[i]))
+            ax.set_xlabel(r"$\mu\ [eV]$", fontsize=12)
+        ax.set_ylabel(r"$\tau$", fontsize=12)
+        ax.grid(linewidth=0.5)
+    return fig
+
+
+# figures of the worker process (see init_worker)
+FIGURES = None
+
+
+def init_worker(dpi):
+    global FIGURES
+    FIGURES = FigureSet(dpi)
+
+
+# render one results file: <name>.<fmt> with the tensors and <name>_tau.<fmt> with τ
+#   temperatures: values of the T columns when the file header does not have them
+#   returns the list of written files
+def render_file(path, outdir=None, fmt="png", temperatures=None, force=False):
+    global FIGURES
+    if FIGURES is None:
+        FIGURES = FigureSet()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    outdir = os.path.dirname(os.path.abspath(path)) if outdir is None else outdir
+    targets = {"tensors": os.path.join(outdir, stem + "." + fmt),
+               "tau": os.path.join(outdir, stem + "_tau." + fmt)}
+    # already rendered from this version of the file
+    mtime = os.path.getmtime(path)
+    if not force and any(os.path.isfile(t) for t in targets.values()) \
+            and all(os.path.getmtime(t) >= mtime for t in targets.values() if os.path.isfile(t)):
+        return list()
+
+    mus, T, traces = read_results(path)
+    num_t = next(iter(traces.values())).shape[1]
+    if T is None or T.size != num_t:
+        T = np.asarray(temperatures, dtype=np.float64) if temperatures is not None and len(temperatures) == num_t \
+            else np.arange(1, num_t + 1, dtype=np.float64)
+    written = list()
+    if any(t in traces for t in TENSORS):
+        draw_tensors(FIGURES, mus, T, traces, title=stem).savefig(targets["tensors"], dpi=FIGURES.dpi)
+        written.append(targets["tensors"])
+    if TAU_LABEL in traces:
+        draw_tau(FIGURES, mus, T, traces[TAU_LABEL], title=stem).savefig(targets["tau"], dpi=FIGURES.dpi)
+        written.append(targets["tau"])
+    if not written:
+        raise ValueError("no {} or {} rows".format("/".join(TENSORS), TAU_LABEL))
+    return written
@@ -0,0 +1,204 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    name TEXT NOT NULL,
+    input TEXT,
+    sweep TEXT,
+    route TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    payload_hash TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    code INTEGER,
+    result TEXT,
+    error TEXT,
+    endpoint TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    submitted REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch);
+CREATE TABLE IF NOT EXISTS dispatcher (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    pid INTEGER,
+    heartbeat REAL
+);
+"""
+
+# states of a job
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+FINISHED = (DONE, FAILED)
+
+# seconds between two heartbeats of the dispatcher, missing three of them means it is gone
+HEARTBEAT = 2.0
+
+
+# hash of a request message, the same for the same calculation whatever the key order
+def payload_hash(message):
+    text = json.dumps(message, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# sqlite3 connection closed at the end of a with block (sqlite3 only ends the transaction)
+class Connection(object):
+    def __init__(self, con):
+        self.con = con
+
+    def __enter__(self):
+        return self.con
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.con.in_transaction:
+            self.con.execute("ROLLBACK")
+        self.con.close()
+
+
+# Jobs of the CLI and their history in a local SQLite database. Every call opens its own
+# short connection, so that the submitting process, the dispatcher and its threads can
+# share the file; writes that claim jobs run in immediate transactions.
+class JobStore(object):
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        with self.connect() as con:
+            con.executescript(SCHEMA)
+
+    def connect(self):
+        con = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        con.row_factory = sqlite3.Row
+        con.execute("PRAGMA journal_mode=WAL")
+        return Connection(con)
+
+    # new jobs of a batch: (name, input, sweep, route, message), returns their ids
+    def add(self, batch, jobs):
+        now = time.time()
+        ids = list()
+        with self.connect() as con:
+            con.execute("BEGIN IMMEDIATE")
+            for name, inputfile, sweep, route, message in jobs:
+                cur = con.execute("INSERT INTO jobs (batch, name, input, sweep, route, payload, payload_hash, submitted) "
+                                  "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                  (batch, name, inputfile, json.dumps(sweep, ensure_ascii=False), route,
+                                   json.dumps(message, ensure_ascii=False), payload_hash(message), now))
+                ids.append(cur.lastrowid)
+            con.execute("COMMIT")
+        return ids
+
+    # oldest queued job, marked as running; None if the queue is empty
+    def claim(self):
+        with self.connect() as con:
+            con.execute("BEGIN IMMEDIATE")
+            row = con.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT 1", (QUEUED,)).fetchone()
+            if row is not None:
+                con.execute("UPDATE jobs SET status = ?, started = ? WHERE id = ?", (RUNNING, time.time(), row["id"]))
+            con.execute("COMMIT")
+        return row
+
+    def finish(self, job_id, status, code=None, result=None, error=None, endpoint=None, attempts=0):
+        with self.connect() as con:
+            con.execute("UPDATE jobs SET status = ?, code = ?, result = ?, error = ?, endpoint = ?, attempts = attempts + ?, "
+                        "finished = ? WHERE id = ?", (status, code, result, error, endpoint, attempts, time.time(), job_id))
+
+    # jobs left running by a dispatcher that stopped go back to the queue
+    def requeue_running(self):
+        with self.connect() as con:
+            return con.execute("UPDATE jobs SET status = ?, started = NULL WHERE status = ?", (QUEUED, RUNNING)).rowcount
+
+    def count(self, status):
+        with self.connect() as con:
+            return con.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+
+    # jobs selected by id and/or batch (all of them without a selection)
+    def select(self, ids=None, batch=None):
+        query, params = "SELECT * FROM jobs", list()
+        clauses = list()
+        if ids:
+            clauses.append("id IN ({})".format(",".join("?" * len(ids))))
+            params += list(ids)
+        if batch is not None:
+            clauses.append("batch = ?")
+            params.append(batch)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self.connect() as con:
+            return con.execute(query + " ORDER BY id", params).fetchall()
+
+    def last_batch(self):
+        with self.connect() as con:
+            row = con.execute("SELECT batch FROM jobs ORDER BY id DESC LIMIT 1").fetchone()
+        return None if row is None else row["batch"]
+
+    # take the role of dispatcher if no other process holds it (a live one beats every HEARTBEAT s)
+    def acquire_dispatcher(self, pid):
+        with self.connect() as con:
+            con.execute("BEGIN IMMEDIATE")
+            row = con.execute("SELECT pid, heartbeat FROM dispatcher WHERE id = 1").fetchone()
+            now = time.time()
+            free = row is None or row["heartbeat"] is None or now - row["heartbeat"] > 3 * HEARTBEAT or row["pid"] == pid
+            if free:
+                con.execute("INSERT OR REPLACE INTO dispatcher (id, pid, heartbeat) VALUES (1, ?, ?)", (pid, now))
+            con.execute("COMMIT")
+        return free
+
+    def beat(self, pid):
+        with self.connect() as con:
+            con.execute("UPDATE dispatcher SET heartbeat = ? WHERE id = 1 AND pid = ?", (time.time(), pid))
+
+    def release_dispatcher(self, pid):
+        with self.connect() as con:
+            con.execute("UPDATE dispatcher SET heartbeat = NULL WHERE id = 1 AND pid = ?", (pid,))
+
+    def dispatcher_alive(self):
+        with self.connect() as con:
+            row = con.execute("SELECT heartbeat FROM dispatcher WHERE id = 1").fetchone()
+        return row is not None and row["heartbeat"] is not None and time.time() - row["heartbeat"] <= 3 * HEARTBEAT
+
+
+# throughput and failure rate of a set of jobs
+def summary(rows):
+    counts = {s: 0 for s in (QUEUED, RUNNING, DONE, FAILED)}
+    for row in rows:
+        counts[row["status"]] += 1
+    finished = [row for row in rows if row["status"] in FINISHED and row["started"] is not None]
+    out = dict(counts, total=len(rows))
+    if finished:
+        span = max(row["finished"] for row in finished) - min(row["started"] for row in finished)
+        out["throughput"] = len(finished) / span * 3600 if span > 0 else None
+        out["failure_rate"] = counts[FAILED] / len(finished)
+        out["mean_seconds"] = sum(row["finished"] - row["started"] for row in finished) / len(finished)
+    return out
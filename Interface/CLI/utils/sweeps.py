@@ -0,0 +1,80 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import os
+import sys
+import copy
+import itertools
+
+from utils.reading_class import ReadInput
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from common.bands import BandError, normalize_bands
+
+
+# error codes of the computing server
+ERRORS = {"-10": "export path not found",
+          "-20": "relaxation time functional form unknown",
+          "-30": "domain error in the τ function calculation",
+          "-40": "no model selected for Matthiessen's rule"}
+
+# parse "--sweep name=v1;v2;..." into ("# name", [v1, v2, ...])
+def parse_sweep(text):
+    name, _, values = text.partition("=")
+    values = [v.strip() for v in values.split(";") if v.strip() != ""]
+    if not values:
+        sys.exit("Empty sweep: " + text)
+    return "# " + name.strip(), values
+
+
+# parameters of an input file, with the band structure checked before any job is queued
+def read_input(inputfile):
+    try:
+        return normalize_bands(ReadInput(inputfile).read_params())
+    except BandError as err:
+        sys.exit("Invalid band structure in {}: {}".format(inputfile, err))
+
+
+# all the combinations of input files and swept entries
+def make_jobs(inputs, sweeps, flags):
+    combos = list(itertools.product(*[values for _, values in sweeps]))
+    num_jobs = len(inputs) * len(combos)
+    index = itertools.count(1)
+    for inputfile, params in inputs:
+        for key, _ in sweeps:
+            if not isinstance(params.get(key), str):
+                sys.exit("Cannot sweep '{}' of {}: not a single-valued entry.".format(key, inputfile))
+        for combo in combos:
+            job = copy.deepcopy(params)
+            job.update(zip([key for key, _ in sweeps], combo))
+            job["args"] = flags
+            job_id = "{}_{}".format(next(index), os.path.splitext(os.path.basename(inputfile))[0])
+            if sweeps:
+                job_id += "_" + "_".join(v.replace(":", "-") for v in combo)
+            # one results folder for each job, the files of a sweep would overwrite each other
+            if num_jobs > 1 and job["# results fullpath"] and os.path.isdir(job["# results fullpath"]):
+                job["# results fullpath"] = os.path.join(job["# results fullpath"], job_id)
+                os.makedirs(job["# results fullpath"], exist_ok=True)
+            yield job_id, inputfile, dict(zip([key for key, _ in sweeps], combo)), job
@@ -1,2274 +1,3662 @@
-# *************************************************************************** #
-# *                                                                         * #
-# *         Mstar2t - Central Michigan University University, 2023          * #
-# *                                                                         * #
-# *************************************************************************** #
-#  This file is part of Mstar2t.                                              #                        
-#                                                                             #
-#  Mstar2t is free software: you can redistribute it and/or modify it under   #
-#  the terms of the GNU General Public License as published by the Free       #
-#  Software Foundation, either version 3 of the License, or (at your option)  #
-#  any later version.                                                         #
-#                                                                             #
-#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
-#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
-#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
-#  more details.                                                              #
-#                                                                             #
-#  You should have received a copy of the GNU General Public License along    #
-#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
-#                                                                             #
-# *************************************************************************** #
-
-
-import os
-import sys
-import time
-import threading
-
-import numpy as np
-import pandas as pd
-import itertools
-
-import requests
-from PySide2 import QtCore, QtGui, QtWidgets
-
-import matplotlib
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import matplotlib.cm     as cm
-matplotlib.use('Qt5Agg')
-
-from utils.utils import decimal_digits, LoadingScreen, ClickableLineEdit, QRoundProgressBar
-
-
-############ DESIGN PARAMETERS ############
-# matplotlib params
-plt.rcParams['font.size'] = 9
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['axes.linewidth'] = 0.5
-plt.rcParams['axes.labelsize'] = 9
-plt.rcParams['axes.titlepad'] = 11
-plt.rcParams['axes.spines.bottom'] = True
-plt.rcParams['axes.spines.left'] = True
-plt.rcParams['axes.spines.top'] = False
-plt.rcParams['axes.spines.right'] = False
-plt.rcParams['xtick.major.size'] = 2
-plt.rcParams['xtick.labelsize'] = 7
-plt.rcParams['ytick.major.size'] = 2
-plt.rcParams['ytick.labelsize'] = 7
-plt.rcParams['legend.fontsize'] = 7
-plt.rcParams["legend.loc"] = "upper left"
-plt.rcParams["lines.linewidth"] = 1
-plt.rcParams['lines.markersize'] = 5
-
-# general design params
-gui_color = (31,161,135)
-Qt_gui_color = QtGui.QColor(gui_color[0],gui_color[1],gui_color[2])
-header_color = "rgb({}, {}, {})".format(gui_color[0],gui_color[1],gui_color[2])
-mySetStyleSheet = """QHeaderView::section{
-border-top:0px solid #D8D8D8;
-border-left:0px solid #D8D8D8;
-border-right:1px solid #D8D8D8;
-border-bottom:1px solid #D8D8D8;
-background-color: %s;
-color:white;
-padding:4px;}
-QTableCornerButton::section{
-border-top:0px solid #D8D8D8;
-border-left:0px solid #D8D8D8;
-border-right:1px solid #D8D8D8;
-border-bottom: 1px solid #D8D8D8;
-background-color:white;}""" % (header_color)
-
-###########################################
-
-
-############# DATA STRUCTURES #############
-# class to store input params 
-class Data(object):
-    def __init__(self):
-        self.export_all_data = False # TODO: implement button
-        self.num_cbands = 0
-        self.num_vbands = 0
-        self.num_bands = 0
-        self.cTensors = list()
-        self.mband = list()
-        self.ebandmins = list()
-        self.degeneracies = list()
-        self.T_str = "[300:1000:100]"
-        self.mu_str = "0.5"
-        self.T = 0
-        self.mu = 0
-        self.tau_model_type = "constant"
-        self.tau_acoustic_coeffs = list()
-        self.tau_impurity_coeffs = list()
-        self.tau_matthiessen_models = "000"
-        self.tau_matthiessen_gamma = "0.0"
-
-# class to store experimental data
-class ExpDataDB(object):
-    def __init__(self):
-        self.df = None
-        self.verHeader = ['temperature', 'conductivity', 'seebeck', 'thermal', 'concentration']
-
-    def __getitem__(self, key):
-        return self.df[self.df.iloc[:, 0] == key].iloc[0, 1:].to_numpy()
-
-    def set_exp_data(self, df):
-        self.df = df
-        rows = set(self.df.iloc[:, 0])
-        for r in rows:
-            if r not in self.verHeader:
-                raise ValueError
-
-    def clear(self):
-        self.df = None
-
-
-# class to store output data
-class ResultAllCompData(object):
-    def __init__(self):
-        self.num_t = None
-        self.num_mu = None
-        self.conductivity = None
-        self.seebeck = None
-        self.thermal = None
-        self.concentration = None
-
-    def setTmu(self, num_mu, num_t):
-        self.num_mu = num_mu
-        self.num_t = num_t
-        self.preallocate_tensors()
-
-    def preallocate_tensors(self):
-        self.conductivity = np.empty((6, self.num_mu, self.num_t))
-        self.seebeck = np.empty((6, self.num_mu, self.num_t))
-        self.thermal = np.empty((6, self.num_mu, self.num_t))
-        self.concentration = np.empty((1, self.num_mu, self.num_t))
-
-    def setCond(self, tensor):
-        self.conductivity = tensor
-
-    def setSeebeck(self, tensor):
-        self.seebeck = tensor
-
-    def setThermal(self, tensor):
-        self.thermal = tensor
-
-    def setConc(self, tensor):
-        self.concentration = tensor
-
-    def clear(self):
-        self.conductivity = None
-        self.seebeck = None
-        self.thermal = None
-        self.concentration = None
-
-    def isallocated(self):
-        return True if ((self.num_mu is not None) or (self.num_t is not None)) else False
-
-
-# class to store output data (trace of each matrix)
-class ResultTraceData(object):
-    def __init__(self):
-        self.data = []
-        self.label = []
-
-    def clear(self):
-        self.data = []
-        self.label = []
-
-###########################################
-
-# pyqt main window
-class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self, server=None):
-        super(MainWindow, self).__init__()
-        self.server = server
-
-    def closeEvent(self, event):
-        if self.server is not None:
-            self.server.terminate()
-        event.accept()
-
-# input window
-class UiInputWindow(object):
-    def __init__(self):
-        self.is_first_run_thread_active = True
-        self.is_first_run_completed = False
-        self.data = Data()
-        self.exp_data = ExpDataDB()
-        self.out_trace_data = ResultTraceData()
-        self.out_all_data = ResultAllCompData()
-
-    def setupUi(self, InputWindow):
-        self.InputWindow = InputWindow
-        self.InputWindow.setObjectName("InputWindow")
-        self.InputWindow.resize(730, 642)
-        self.InputWindow.setAutoFillBackground(False)
-        self.appIcon = QtGui.QIcon("./images/icon.png")
-        self.InputWindow.setWindowIcon(self.appIcon)
-        self.OutputWindow = QtWidgets.QMainWindow()
-        self.ui_out = UiOutputWindow(self)
-        self.ui_out.setupUi(self.OutputWindow)
-        self.OutputWindow.show()
-        self.centralwidget = QtWidgets.QWidget(self.InputWindow)
-        self.centralwidget.setObjectName("centralwidget")
-        self.gridFrame = QtWidgets.QFrame(self.centralwidget)
-        self.gridFrame.setGeometry(QtCore.QRect(280, 5, 211, 41))
-        self.gridFrame.setObjectName("gridFrame")
-        self.gridLayout = QtWidgets.QGridLayout(self.gridFrame)
-        self.gridLayout.setContentsMargins(-1, 1, -1, -1)
-        self.gridLayout.setObjectName("gridLayout")
-        self.InputWindow.setCentralWidget(self.centralwidget)
-
-        # menubar
-        self.menubar = QtWidgets.QMenuBar(self.InputWindow)
-        self.menubar.setGeometry(QtCore.QRect(0, 0, 819, 20))
-        self.menubar.setObjectName("menubar")
-        self.menuFile = QtWidgets.QMenu(self.menubar)
-        self.menuFile.setObjectName("menuFile")
-        self.menuHelp = QtWidgets.QMenu(self.menubar)
-        self.menuHelp.setObjectName("menuHelp")
-        self.InputWindow.setMenuBar(self.menubar)
-        # status bar
-        self.statusbar = QtWidgets.QStatusBar(self.InputWindow)
-        self.statusbar.setObjectName("statusbar")
-        self.InputWindow.setStatusBar(self.statusbar)
-
-        # bars actions
-        self.actionImportData = QtWidgets.QAction(self.InputWindow)
-        self.actionImportData.setObjectName("actionImportData")
-        self.actionImportData.triggered.connect(self.import_exp_data)
-        self.actionExit = QtWidgets.QAction(self.InputWindow)
-        self.actionExit.setObjectName("actionExit")
-        self.actionExit.triggered.connect(self.exit)
-        self.actionAbout = QtWidgets.QAction(self.InputWindow)
-        self.actionAbout.setObjectName("actionAbout")
-        self.menubar.addAction(self.menuFile.menuAction())
-        self.menubar.addAction(self.menuHelp.menuAction())
-        self.menuFile.addAction(self.actionImportData)
-        self.menuFile.addAction(self.actionExit)
-        self.menuHelp.addAction(self.actionAbout)
-
-        # header
-        ## title
-        font_title = QtGui.QFont()
-        font_title.setPointSize(12)
-        font_title.setBold(True)
-        self.inputlabel = QtWidgets.QLabel(self.centralwidget)
-        self.inputlabel.setGeometry(QtCore.QRect(269, 20, 193, 40))
-        self.inputlabel.setFont(font_title)
-        self.inputlabel.setTextFormat(QtCore.Qt.PlainText)
-        self.inputlabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.inputlabel.setIndent(0)
-        self.inputlabel.setObjectName("inputlabel")
-        ## server status
-        ### server box
-        self.serverBox = QtWidgets.QGroupBox(self.centralwidget)
-        self.serverBox.setGeometry(QtCore.QRect(537, 25, 150, 60))
-        self.serverBox.setStyleSheet("QGroupBox#serverBox {background-color: none; border:0px;}")
-        self.serverBox.setTitle("")
-        self.serverBox.setObjectName("serverBox")
-        ### server label
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        font.setBold(True)
-        self.serverLabel = QtWidgets.QLabel(self.serverBox)
-        self.serverLabel.setGeometry(QtCore.QRect(0, 5, 90, 20))
-        self.serverLabel.setFont(font)
-        self.serverLabel.setObjectName("serverLabel")
-        ### down signal
-        self.redSignal = QtWidgets.QLabel(self.serverBox)
-        self.redSignal.setGeometry(QtCore.QRect(90, 5, 32, 20))
-        self.redSignal.setScaledContents(True)
-        self.redSignal.setPixmap(QtGui.QPixmap('./images/down.png'))
-        self.redSignal.setObjectName('redSignal')
-        ### up signal
-        self.greenSignal = QtWidgets.QLabel(self.serverBox)
-        self.greenSignal.setGeometry(QtCore.QRect(110, 5, 32, 20))
-        self.greenSignal.setScaledContents(True)
-        self.greenSignal.setPixmap(QtGui.QPixmap('./images/up.png'))
-        self.greenSignal.setVisible(False)
-        self.greenSignal.setObjectName('greenSignal')
-
-        # INPUT section
-        ## input box
-        self.inputBox = QtWidgets.QGroupBox(self.centralwidget)
-        self.inputBox.setGeometry(QtCore.QRect(55, 60, 620, 435))
-        self.inputBox.setStyleSheet("QGroupBox{background-color: white}")
-        self.inputBox.setTitle("")
-        self.inputBox.setObjectName("inputGroupBox")
-
-        ## conduction bands
-        ### title
-        self.CondText = QtWidgets.QLabel(self.inputBox)
-        self.CondText.setGeometry(QtCore.QRect(9, 10, 235, 25))
-        self.CondText.setStyleSheet("Background-color:white;border: 0.8px solid black;")
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        font.setBold(True)
-        self.CondText.setFont(font)
-        self.CondText.setObjectName("CondText")
-        ### font
-        ctfont = QtGui.QFont()
-        ctfont.setBold(False)
-        ctfont.setPointSize(8)
-        ### spin box -> number of conduction bands
-        self.CondSpin = QtWidgets.QSpinBox(self.inputBox)
-        self.CondSpin.setGeometry(QtCore.QRect(243, 10, 62, 25))
-        self.CondSpin.setObjectName("CondSpin")
-        self.CondSpin.setValue(0)
-        self.CondSpin.setFont(ctfont)
-        self.CondSpin.valueChanged.connect(self.add_cond_band)
-        ### conduction bands params table
-        self.CondTable = QtWidgets.QTableWidget(self.inputBox)
-        self.CondTable.setGeometry(QtCore.QRect(8, 33, 297, 120))
-        self.CondTable.setMinimumSize(QtCore.QSize(201, 71))
-        self.CondTable.setFont(ctfont)
-        self.CondTable.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
-        self.CondTable.setAutoFillBackground(False)
-        self.CondTable.setFrameShape(QtWidgets.QFrame.Box)
-        self.CondTable.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.CondTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.CondTable.setLineWidth(1)
-        self.CondTable.setMidLineWidth(1)
-        self.CondTable.setTabKeyNavigation(True)
-        self.CondTable.setDragDropOverwriteMode(False)
-        self.CondTable.setAlternatingRowColors(True)
-        self.CondTable.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
-        self.CondTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.CondTable.setIconSize(QtCore.QSize(1, 1))
-        self.CondTable.setShowGrid(True)
-        self.CondTable.setGridStyle(QtCore.Qt.SolidLine)
-        self.CondTable.setRowCount(0)
-        self.CondTable.setColumnCount(4)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        brush = QtGui.QBrush(QtGui.QColor(0, 0, 255))
-        brush.setStyle(QtCore.Qt.NoBrush)
-        item.setForeground(brush)
-        self.CondTable.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.CondTable.setVerticalHeaderItem(1, item)
-        font_hh = QtGui.QFont()
-        font_hh.setPointSize(8)
-        font_hh.setBold(True)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.CondTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.CondTable.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.CondTable.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.CondTable.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.CondTable.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.CondTable.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.CondTable.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.CondTable.setItem(0, 3, item)
-        self.CondTable.horizontalHeader().setVisible(True)
-        self.CondTable.horizontalHeader().setCascadingSectionResizes(True)
-        self.CondTable.horizontalHeader().setDefaultSectionSize(73)
-        self.CondTable.horizontalHeader().setHighlightSections(True)
-        self.CondTable.horizontalHeader().setMinimumSectionSize(49)
-        self.CondTable.horizontalHeader().setSortIndicatorShown(True)
-        self.CondTable.horizontalHeader().setStretchLastSection(False)
-        self.CondTable.horizontalHeader().setFixedHeight(28)
-        self.CondTable.verticalHeader().setVisible(False)
-        self.CondTable.verticalHeader().setHighlightSections(True)
-        self.CondTable.verticalHeader().setSortIndicatorShown(False)
-        self.CondTable.verticalHeader().setStretchLastSection(False)
-        self.CondTable.setObjectName("CondTable")
-
-        ## valence bands
-        ### title
-        self.ValText = QtWidgets.QLabel(self.inputBox)
-        self.ValText.setGeometry(QtCore.QRect(314, 10, 245, 25))
-        self.ValText.setStyleSheet("Background-color:white;border: 0.8px solid black;")
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        font.setBold(True)
-        self.ValText.setFont(font)
-        self.ValText.setObjectName("ValText")
-        ### font
-        vtfont = QtGui.QFont()
-        vtfont.setPointSize(8)
-        vtfont.setBold(False)
-        ### spin box -> number of valence bands
-        self.ValSpin = QtWidgets.QSpinBox(self.inputBox)
-        self.ValSpin.setGeometry(QtCore.QRect(550, 10, 60, 25))
-        self.ValSpin.setObjectName("ValSpin")
-        self.ValSpin.setValue(0)
-        self.ValSpin.setFont(vtfont)
-        self.ValSpin.valueChanged.connect(self.add_val_band)
-        ### valence bands params table
-        self.ValTable = QtWidgets.QTableWidget(self.inputBox)
-        self.ValTable.setGeometry(QtCore.QRect(313, 33, 297, 120))
-        self.ValTable.setMinimumSize(QtCore.QSize(201, 72))
-        self.ValTable.setFont(vtfont)
-        self.ValTable.setMouseTracking(False)
-        self.ValTable.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
-        self.ValTable.setAutoFillBackground(False)
-        self.ValTable.setFrameShape(QtWidgets.QFrame.Box)
-        self.ValTable.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.ValTable.setLineWidth(1)
-        self.ValTable.setMidLineWidth(1)
-        self.ValTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.ValTable.setTabKeyNavigation(True)
-        self.ValTable.setDragDropOverwriteMode(False)
-        self.ValTable.setAlternatingRowColors(True)
-        self.ValTable.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
-        self.ValTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.ValTable.setIconSize(QtCore.QSize(1, 1))
-        self.ValTable.setShowGrid(True)
-        self.ValTable.setGridStyle(QtCore.Qt.SolidLine)
-        self.ValTable.setRowCount(0)
-        self.ValTable.setColumnCount(4)
-        self.ValTable.horizontalHeader().setFont(font)
-        font = self.ValTable.horizontalHeader().font()
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.ValTable.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.ValTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setFont(font_hh)
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.ValTable.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.ValTable.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_hh)
-        self.ValTable.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.ValTable.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.ValTable.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.ValTable.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.ValTable.setItem(0, 3, item)
-        self.ValTable.horizontalHeader().setVisible(True)
-        self.ValTable.horizontalHeader().setCascadingSectionResizes(True)
-        self.ValTable.horizontalHeader().setDefaultSectionSize(73)
-        self.ValTable.horizontalHeader().setHighlightSections(True)
-        self.ValTable.horizontalHeader().setMinimumSectionSize(49)
-        self.ValTable.horizontalHeader().setSortIndicatorShown(True)
-        self.ValTable.horizontalHeader().setStretchLastSection(False)
-        self.ValTable.horizontalHeader().setFixedHeight(25)
-        self.ValTable.verticalHeader().setVisible(False)
-        self.ValTable.verticalHeader().setHighlightSections(True)
-        self.ValTable.verticalHeader().setSortIndicatorShown(False)
-        self.ValTable.verticalHeader().setStretchLastSection(False)
-        self.ValTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.ValTable.setObjectName("ValTable")
-
-        ## Thermodynamics params
-        self.tmuBox = QtWidgets.QGroupBox(self.inputBox)
-        self.tmuBox.setGeometry(QtCore.QRect(10, 205, 200, 54))
-        self.tmuBox.setStyleSheet("Background-color:white")
-        self.tmuBox.setTitle("")
-        self.tmuBox.setObjectName("tmuBox")
-        ### temperature title
-        self.tLabel = QtWidgets.QLabel(self.tmuBox)
-        self.tLabel.setGeometry(QtCore.QRect(0, 0, 100, 28))
-        self.tLabel.setStyleSheet("Background-color: {}; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color:white".format(header_color))
-        self.tLabel.setFont(font_hh)
-        self.tLabel.setTextFormat(QtCore.Qt.PlainText)
-        self.tLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.tLabel.setIndent(0)
-        self.tLabel.setObjectName("tLabel")
-        ### temperature input 
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        self.tInput = ClickableLineEdit(self.tmuBox)
-        self.tInput.setGeometry(QtCore.QRect(0, 25, 100, 28))
-        self.tInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color: gray}")        
-        self.tInput.clicked.connect(self.insert_new_temperature)
-        self.tInput.editingFinished.connect(self.update_temp)
-        self.tInput.setFont(font)
-        self.tInput.setAlignment(QtCore.Qt.AlignCenter)
-        self.tInput.setObjectName("tInput")
-        ### Fermi level title
-        self.muLabel = QtWidgets.QLabel(self.tmuBox)
-        self.muLabel.setGeometry(QtCore.QRect(99, 0, 100, 28))
-        self.muLabel.setStyleSheet("Background-color: {}; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color:white".format(header_color))
-        self.muLabel.setFont(font_hh)
-        self.muLabel.setTextFormat(QtCore.Qt.PlainText)
-        self.muLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.muLabel.setIndent(0)
-        self.muLabel.setObjectName("muLabel")
-        ### Fermi level input
-        self.muInput = ClickableLineEdit(self.tmuBox)
-        self.muInput.setGeometry(QtCore.QRect(99, 25, 100, 28))
-        self.muInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color: gray}")
-        self.muInput.clicked.connect(self.insert_new_mu)
-        self.muInput.editingFinished.connect(self.update_mu)
-        self.muInput.setFont(font)
-        self.muInput.setAlignment(QtCore.Qt.AlignCenter)
-        self.muInput.setObjectName("muInput")
-
-        ## Relexation time box
-        self.tauBox = QtWidgets.QGroupBox(self.inputBox)
-        self.tauBox.setGeometry(QtCore.QRect(233, 160, 377, 265))
-        self.tauBox.setStyleSheet("background-color: white; border:1px solid darkGray;")
-        self.tauBox.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.tauBox.setObjectName("tauBox")
-        ### relexation time title
-        self.tauTitle = QtWidgets.QLabel(self.tauBox)
-        self.tauTitle.setGeometry(QtCore.QRect(143, 5, 80, 20))
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        font.setBold(True)
-        self.tauTitle.setStyleSheet("background-color: white; border:0px;")
-        self.tauTitle.setFont(font)
-        self.tauTitle.setObjectName("tauTitle")
-        ### relexation time combobox [constant/acoustic/impurity/matthiessen]
-        self.comboBox = QtWidgets.QComboBox(self.tauBox)
-        self.comboBox.setGeometry(QtCore.QRect(204, 5, 115, 20))
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        self.comboBox.setFont(font)
-        self.comboBox.addItem("")
-        self.comboBox.addItem("")
-        self.comboBox.addItem("")
-        self.comboBox.addItem("")
-        # self.comboBox.currentIndexChanged.connect(self.computetau)
-        self.comboBox.setObjectName("comboBox")
-        ### relexation time plot button
-        self.TauplotButton = QtWidgets.QPushButton(self.tauBox)
-        self.TauplotButton.setGeometry(QtCore.QRect(322, 5, 50, 20))
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        self.TauplotButton.setFont(font)
-        self.TauplotButton.setLayoutDirection(QtCore.Qt.LeftToRight)
-        self.TauplotButton.setAutoFillBackground(True)
-        self.TauplotButton.setStyleSheet("QPushButton {background-color: lightgray;} QPushButton:hover{background-color: %s;}" % (header_color))
-        self.TauplotButton.blockSignals(True)
-        self.TauplotButton.clicked.connect(self.computetau)
-        self.TauplotButton.setObjectName("TauplotButton")
-        ### acoustic relexation time coeff
-        #### title
-        self.acTitle = QtWidgets.QLabel(self.tauBox)
-        self.acTitle.setGeometry(QtCore.QRect(295, 28, 75, 20))
-        font = QtGui.QFont()
-        font.setPointSize(7)
-        self.acTitle.setStyleSheet("background-color: white; border:0px;")
-        self.acTitle.setFont(font)
-        self.acTitle.setObjectName("acTitle")
-        #### table
-        font_ac = QtGui.QFont()
-        font_ac.setPointSize(8)
-        self.TauAcousticCoeffTable = QtWidgets.QTableWidget(self.tauBox)
-        self.TauAcousticCoeffTable.setStyleSheet("background-color: white; border:1px solid darkGray;")
-        self.TauAcousticCoeffTable.setGeometry(QtCore.QRect(5, 45, 367, 52))
-        self.TauAcousticCoeffTable.setMinimumSize(QtCore.QSize(0, 0))
-        self.TauAcousticCoeffTable.setFont(font_ac)
-        self.TauAcousticCoeffTable.setFrameShape(QtWidgets.QFrame.Box)
-        self.TauAcousticCoeffTable.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.TauAcousticCoeffTable.setLineWidth(1)
-        self.TauAcousticCoeffTable.setMidLineWidth(1)
-        self.TauAcousticCoeffTable.setAutoFillBackground(False)
-        self.TauAcousticCoeffTable.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.TauAcousticCoeffTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.TauAcousticCoeffTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.TauAcousticCoeffTable.setShowGrid(True)
-        self.TauAcousticCoeffTable.setGridStyle(QtCore.Qt.SolidLine)
-        self.TauAcousticCoeffTable.setCornerButtonEnabled(True)
-        self.TauAcousticCoeffTable.setColumnCount(6)
-        self.TauAcousticCoeffTable.setRowCount(1)
-        item = QtWidgets.QTableWidgetItem()
-        self.TauAcousticCoeffTable.setVerticalHeaderItem(0, item)
-        font_tau = QtGui.QFont()
-        font_tau.setPointSize(8)
-        font_tau.setBold(True)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauAcousticCoeffTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauAcousticCoeffTable.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauAcousticCoeffTable.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauAcousticCoeffTable.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauAcousticCoeffTable.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauAcousticCoeffTable.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauAcousticCoeffTable.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauAcousticCoeffTable.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauAcousticCoeffTable.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauAcousticCoeffTable.setItem(0, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauAcousticCoeffTable.setItem(0, 4, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauAcousticCoeffTable.setItem(0, 5, item)
-        self.TauAcousticCoeffTable.horizontalHeader().setVisible(True)
-        self.TauAcousticCoeffTable.horizontalHeader().setCascadingSectionResizes(True)
-        self.TauAcousticCoeffTable.horizontalHeader().setDefaultSectionSize(15)
-        self.TauAcousticCoeffTable.horizontalHeader().setHighlightSections(True)
-        self.TauAcousticCoeffTable.horizontalHeader().setMinimumSectionSize(15)
-        self.TauAcousticCoeffTable.verticalHeader().setVisible(False)
-        self.TauAcousticCoeffTable.horizontalHeader().setFixedHeight(25)
-        self.TauAcousticCoeffTable.verticalHeader().setSortIndicatorShown(False)
-        self.TauAcousticCoeffTable.verticalHeader().setStretchLastSection(False)
-        self.TauAcousticCoeffTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.TauAcousticCoeffTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.TauAcousticCoeffTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
-        self.TauAcousticCoeffTable.itemChanged.connect(self.computetau)
-        self.TauAcousticCoeffTable.setObjectName("TauAcousticCoeffTable")
-        #### acoustic relaxation time e_min param box
-        self.acousBox = QtWidgets.QComboBox(self.tauBox)
-        self.acousBox.setGeometry(QtCore.QRect(5, 98, 120, 20))
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        self.acousBox.setFont(font)
-        self.acousBox.addItem("")
-        self.acousBox.setObjectName("acousBox")
-        #### update acousbox button
-        self.updateAcousBoxButton = QtWidgets.QPushButton(self.tauBox)
-        self.updateAcousBoxButton.setStyleSheet("QPushButton#updateAcousBoxButton {border-image: url(./images/update.png); background-repeat: no-repeat;} QPushButton#updateAcousBoxButton:hover{border-image: url(./images/updatehover.png); background-repeat: no-repeat;} ")
-        self.updateAcousBoxButton.setGeometry(128, 98, 20, 20)
-        self.updateAcousBoxButton.setObjectName("updateAcousBoxButton")
-        self.updateAcousBoxButton.clicked.connect(self.update_ebandmins)
-        ### impurity relexation time coeff
-        #### title
-        self.imTitle = QtWidgets.QLabel(self.tauBox)
-        self.imTitle.setGeometry(QtCore.QRect(294, 105, 75, 15))
-        font = QtGui.QFont()
-        font.setPointSize(7)
-        self.imTitle.setStyleSheet("background-color: white; border:0px;")
-        self.imTitle.setFont(font)
-        self.imTitle.setObjectName("imTitle")
-        #### table
-        self.TauImpurityCoeffTable = QtWidgets.QTableWidget(self.tauBox)
-        self.TauImpurityCoeffTable.setStyleSheet("background-color: white; border:1px solid darkGray;")
-        self.TauImpurityCoeffTable.setGeometry(QtCore.QRect(187, 120, 185, 52))
-        self.TauImpurityCoeffTable.setMinimumSize(QtCore.QSize(0, 0))
-        self.TauImpurityCoeffTable.setFont(font_ac)
-        self.TauImpurityCoeffTable.setFrameShape(QtWidgets.QFrame.Box)
-        self.TauImpurityCoeffTable.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.TauImpurityCoeffTable.setLineWidth(1)
-        self.TauImpurityCoeffTable.setMidLineWidth(1)
-        self.TauImpurityCoeffTable.setAutoFillBackground(False)
-        self.TauImpurityCoeffTable.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.TauImpurityCoeffTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.TauImpurityCoeffTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.TauImpurityCoeffTable.setShowGrid(True)
-        self.TauImpurityCoeffTable.setGridStyle(QtCore.Qt.SolidLine)
-        self.TauImpurityCoeffTable.setCornerButtonEnabled(True)
-        self.TauImpurityCoeffTable.setColumnCount(3)
-        self.TauImpurityCoeffTable.setRowCount(1)
-        item = QtWidgets.QTableWidgetItem()
-        self.TauImpurityCoeffTable.setVerticalHeaderItem(0, item)
-        font_tau = QtGui.QFont()
-        font_tau.setPointSize(8)
-        font_tau.setBold(True)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauImpurityCoeffTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauImpurityCoeffTable.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        item.setFont(font_tau)
-        self.TauImpurityCoeffTable.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauImpurityCoeffTable.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauImpurityCoeffTable.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.TauImpurityCoeffTable.setItem(0, 2, item)
-        self.TauImpurityCoeffTable.horizontalHeader().setVisible(True)
-        self.TauImpurityCoeffTable.horizontalHeader().setCascadingSectionResizes(True)
-        self.TauImpurityCoeffTable.horizontalHeader().setDefaultSectionSize(15)
-        self.TauImpurityCoeffTable.horizontalHeader().setHighlightSections(True)
-        self.TauImpurityCoeffTable.horizontalHeader().setMinimumSectionSize(15)
-        self.TauImpurityCoeffTable.verticalHeader().setVisible(False)
-        self.TauImpurityCoeffTable.horizontalHeader().setFixedHeight(25)
-        self.TauImpurityCoeffTable.verticalHeader().setSortIndicatorShown(False)
-        self.TauImpurityCoeffTable.verticalHeader().setStretchLastSection(False)
-        self.TauImpurityCoeffTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.TauImpurityCoeffTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.TauImpurityCoeffTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
-        self.TauAcousticCoeffTable.itemChanged.connect(self.computetau)
-        self.TauImpurityCoeffTable.setObjectName("TauImpurityCoeffTable")
-        ### Matthiessen's rule
-        #### title
-        self.mrTitle = QtWidgets.QLabel(self.tauBox)
-        self.mrTitle.setGeometry(QtCore.QRect(297, 180, 72, 20))
-        font = QtGui.QFont()
-        font.setPointSize(7)
-        self.mrTitle.setStyleSheet("background-color: white; border:0px;")
-        self.mrTitle.setFont(font)
-        self.mrTitle.setObjectName("mrTitle")
-        #### check box
-        self.checkBoxRect = QtWidgets.QGroupBox(self.tauBox)
-        self.checkBoxRect.setGeometry(QtCore.QRect(187, 197, 185, 20))
-        self.checkBoxRect.setStyleSheet("background-color: white; border:2px solid {};".format(header_color))
-        self.checkBoxRect.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
-        self.checkBoxRect.setObjectName("checkBoxRect")
-        self.mr_checkBox_const = QtWidgets.QCheckBox(self.checkBoxRect)
-        self.mr_checkBox_const.setGeometry(QtCore.QRect(4, 2, 50, 14))
-        self.mr_checkBox_const.setFont(font_ac)
-        self.mr_checkBox_const.setStyleSheet("border: 0px")
-        self.mr_checkBox_acoust = QtWidgets.QCheckBox(self.checkBoxRect)
-        self.mr_checkBox_acoust.setGeometry(QtCore.QRect(64, 2, 50, 14))
-        self.mr_checkBox_acoust.setFont(font_ac)
-        self.mr_checkBox_acoust.setStyleSheet("border: 0px")
-        self.mr_checkBox_impur = QtWidgets.QCheckBox(self.checkBoxRect)
-        self.mr_checkBox_impur.setGeometry(QtCore.QRect(124, 2, 50, 14))
-        self.mr_checkBox_impur.setFont(font_ac)
-        self.mr_checkBox_impur.setStyleSheet("border: 0px")
-        #### gamma title
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        font.setBold(True)
-        self.mr_gamma_Label = QtWidgets.QLabel(self.tauBox)
-        self.mr_gamma_Label.setGeometry(QtCore.QRect(273, 219, 50, 20))
-        self.mr_gamma_Label.setStyleSheet("Background-color: {}; border-top: 1px solid darkGray; border-bottom: 1px solid darkGray; border-right: 1px solid darkGray; border-left: 1px solid lightGray; color:white".format(header_color))
-        self.mr_gamma_Label.setFont(font)
-        self.mr_gamma_Label.setTextFormat(QtCore.Qt.PlainText)
-        self.mr_gamma_Label.setAlignment(QtCore.Qt.AlignCenter)
-        self.mr_gamma_Label.setObjectName("mr_gamma_Label")
-        #### gamma input
-        font.setBold(False)
-        self.mr_gamma_Input = ClickableLineEdit(self.tauBox)
-        self.mr_gamma_Input.setGeometry(QtCore.QRect(322, 219, 50, 20))
-        self.mr_gamma_Input.setStyleSheet("QLineEdit {Background-color:white; border-top: 1px solid darkGray; border-bottom: 1px solid darkGray; border-right: 1px solid darkGray; border-left: 1px solid lightGray; color: gray}")
-        self.mr_gamma_Input.setFont(font)
-        self.mr_gamma_Input.setAlignment(QtCore.Qt.AlignCenter)
-        self.mr_gamma_Input.setObjectName("muInput")
-        self.mr_gamma_Input.editingFinished.connect(self.computetau)
-        #### error message Matthiessen's rule
-        font = QtGui.QFont()
-        font.setPointSize(7)
-        self.mr_error_msg = QtWidgets.QLabel(self.tauBox)
-        self.mr_error_msg.setGeometry(QtCore.QRect(235, 240, 137, 12))
-        self.mr_error_msg.setStyleSheet("color:red; border:0px")
-        self.mr_error_msg.setFont(font)
-        self.mr_error_msg.setTextFormat(QtCore.Qt.PlainText)
-        self.mr_error_msg.setVisible(False)
-        self.mr_error_msg.setObjectName("mr_error_msg")
-
-        ### relaxation time plot
-        self.tauplot = PlotTau(self.tauBox)
-        self.tauplot.setGeometry(QtCore.QRect(1, 120, 185, 140))
-        self.tauplot.setStyleSheet("background-color: white; border:1px solid {};".format(header_color))
-
-        # import buttons
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        self.tick_icon = QtGui.QIcon()
-        self.tick_icon.addPixmap(QtGui.QPixmap("./images/tick.png"), QtGui.QIcon.Active, QtGui.QIcon.Off)
-        self.error_icon = QtGui.QIcon()
-        self.error_icon.addPixmap(QtGui.QPixmap("./images/error.jpeg"), QtGui.QIcon.Active, QtGui.QIcon.Off)
-        ## import experimental data 
-        self.ImportExpButton = QtWidgets.QPushButton(self.inputBox)
-        self.ImportExpButton.setGeometry(QtCore.QRect(10, 350, 120, 26))
-        self.ImportExpButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.ImportExpButton.setFont(font)
-        self.ImportExpButton.setStyleSheet("QPushButton:hover{background-color: %s;}" % (header_color))
-        self.ImportExpButton.clicked.connect(self.import_exp_data)
-        self.ImportExpButton.setObjectName("ImportButton")
-        ## clear experimental data
-        self.ClearExpButton = QtWidgets.QPushButton(self.inputBox)
-        self.ClearExpButton.setGeometry(QtCore.QRect(10, 375, 120, 26))
-        self.ClearExpButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.ClearExpButton.setFont(font)
-        self.ClearExpButton.setStyleSheet("QPushButton:hover{background-color: %s;}" % (header_color))
-        self.ClearExpButton.clicked.connect(self.clear_exp_data)
-        self.ClearExpButton.setObjectName("ClearExpButton")
-
-        # compute section
-        ## progressbar
-        self.progressBar = QRoundProgressBar(self.centralwidget)
-        self.progressBar.setGeometry(QtCore.QRect(320, 500, 90, 90))
-        self.progressBar.setBarStyle(QRoundProgressBar.StyleDonut)
-        self.progressBar.setDataColors([(0., Qt_gui_color), (0.5, Qt_gui_color), (1., Qt_gui_color)])
-        self.progressBar.setFixedSize(100, 100)
-        self.progressBar.setNullPosition(90)
-        self.progressBar.setValue(0)
-        self.progressBar.setRange(0, 100)
-        self.progressBar.setProperty("value", 0)
-        self.progressBar.setObjectName("progressBar")
-        ## compute button
-        self.ComputeButton = QtWidgets.QPushButton(self.centralwidget)
-        self.ComputeButton.setGeometry(330, 510, 80, 80)
-        self.ComputeButton.setStyleSheet("QPushButton#ComputeButton {border-image: url(./images/grun.PNG); background-repeat: no-repeat;} QPushButton#ComputeButton:hover{border-image: url(./images/yrun.PNG); background-repeat: no-repeat;} ")
-        self.ComputeButton.setObjectName("ComputeButton")
-        self.ComputeButton.blockSignals(True)
-        self.ComputeButton.clicked.connect(self.compute)
-
-        self.retranslateInputUi(self.InputWindow)
-        QtCore.QMetaObject.connectSlotsByName(self.InputWindow)
-
-    def retranslateInputUi(self, InputWindow):
-        _translate = QtCore.QCoreApplication.translate
-        InputWindow.setWindowTitle(_translate("InputWindow", "InputWindow"))
-        self.menuFile.setTitle(_translate("InputWindow", "File"))
-        self.menuHelp.setTitle(_translate("InputWindow", "Help"))
-        self.actionImportData.setText(_translate("InputWindow", "Import data"))
-        self.actionExit.setText(_translate("InputWindow", "Exit"))
-        self.actionAbout.setText(_translate("InputWindow", "About"))
-        self.inputlabel.setText(_translate("InputWindow", "INPUTS"))
-        self.serverLabel.setText(_translate("InputWindow", "Server status: "))
-        self.ValText.setText(_translate("InputWindow", "Valence band #"))
-        # item = self.ValTable.verticalHeaderItem(0)
-        # item.setText(_translate("InputWindow", "New Row"))
-        item = self.ValTable.horizontalHeaderItem(0)
-        item.setText(_translate("InputWindow", "mx"))
-        item = self.ValTable.horizontalHeaderItem(1)
-        item.setText(_translate("InputWindow", "my"))
-        item = self.ValTable.horizontalHeaderItem(2)
-        item.setText(_translate("InputWindow", "mz"))
-        item = self.ValTable.horizontalHeaderItem(3)
-        item.setText(_translate("InputWindow", "E0"))
-        __sortingEnabled = self.ValTable.isSortingEnabled()
-        self.ValTable.setSortingEnabled(False)
-        self.ValTable.setSortingEnabled(__sortingEnabled)
-        self.CondText.setText(_translate("InputWindow", "Conduction band #"))
-        # item = self.CondTable.verticalHeaderItem(0)
-        # item.setText(_translate("InputWindow", "New Row"))
-        item = self.CondTable.horizontalHeaderItem(0)
-        item.setText(_translate("InputWindow", "mx"))
-        item = self.CondTable.horizontalHeaderItem(1)
-        item.setText(_translate("InputWindow", "my"))
-        item = self.CondTable.horizontalHeaderItem(2)
-        item.setText(_translate("InputWindow", "mz"))
-        item = self.CondTable.horizontalHeaderItem(3)
-        item.setText(_translate("InputWindow", "E0"))
-        __sortingEnabled = self.CondTable.isSortingEnabled()
-        self.CondTable.setSortingEnabled(False)
-        self.CondTable.setSortingEnabled(__sortingEnabled)
-        self.tLabel.setText(_translate("InputWindow", "T [K]"))
-        self.tInput.setText(_translate("InputWindow", "[300:1000:100]"))
-        self.muLabel.setText(_translate("InputWindow", "μ [eV]"))
-        self.muInput.setText(_translate("InputWindow", "0.5"))
-        self.tauTitle.setText(_translate("InputWindow", "𝛕 models"))
-        self.comboBox.setItemText(0, _translate("MainWindow", "constant"))
-        self.comboBox.setItemText(1, _translate("MainWindow", "acoustic"))
-        self.comboBox.setItemText(2, _translate("MainWindow", "impurity"))
-        self.comboBox.setItemText(3, _translate("MainWindow", "Matthiessen's rule"))
-        self.TauplotButton.setText(_translate("MainWindow", "PLOT"))
-        self.acTitle.setText(_translate("InputWindow", "Acoustic scattering"))
-        self.acousBox.setItemText(0, _translate("MainWindow", " -empty- "))
-        # self.acousBox.setItemText(1, _translate("MainWindow", "val_1"))
-        self.imTitle.setText(_translate("InputWindow", "Impurity scattering"))
-        self.mrTitle.setText(_translate("InputWindow", "Matthiessen's rule"))
-        self.mr_checkBox_const.setText(_translate("InputWindow", "const"))
-        self.mr_checkBox_acoust.setText(_translate("InputWindow", "acous"))
-        self.mr_checkBox_impur.setText(_translate("InputWindow", "impur"))
-        self.mr_gamma_Label.setText(_translate("InputWindow", "γ"))
-        self.mr_gamma_Input.setText(_translate("InputWindow", "-1"))
-        item = self.TauAcousticCoeffTable.horizontalHeaderItem(0)
-        item.setText(_translate("InputWindow", "ε_min"))
-        item = self.TauAcousticCoeffTable.item(0,0).setText('0.0')
-        item = self.TauAcousticCoeffTable.horizontalHeaderItem(1)
-        item.setText(_translate("InputWindow", "A_sm"))
-        item = self.TauAcousticCoeffTable.item(0,1).setText('1.0')
-        item = self.TauAcousticCoeffTable.horizontalHeaderItem(2)
-        item.setText(_translate("InputWindow", "τm_max"))
-        item = self.TauAcousticCoeffTable.item(0,2).setText('1.0')
-        item = self.TauAcousticCoeffTable.horizontalHeaderItem(3)
-        item.setText(_translate("InputWindow", "T₀"))
-        item = self.TauAcousticCoeffTable.item(0,3).setText('50.0')
-        item = self.TauAcousticCoeffTable.horizontalHeaderItem(4)
-        item.setText(_translate("InputWindow", "μ_min"))
-        item = self.TauAcousticCoeffTable.item(0,4).setText('2.0')
-        item = self.TauAcousticCoeffTable.horizontalHeaderItem(5)
-        item.setText(_translate("InputWindow", "μ_max"))
-        item = self.TauAcousticCoeffTable.item(0,5).setText('2.0')
-        item = self.TauImpurityCoeffTable.horizontalHeaderItem(0)
-        item.setText(_translate("InputWindow", "ε_im"))
-        item = self.TauImpurityCoeffTable.item(0,0).setText('0.0')
-        item = self.TauImpurityCoeffTable.horizontalHeaderItem(1)
-        item.setText(_translate("InputWindow", "A_im"))
-        item = self.TauImpurityCoeffTable.item(0,1).setText('1.0')
-        item = self.TauImpurityCoeffTable.horizontalHeaderItem(2)
-        item.setText(_translate("InputWindow", "γ_im"))
-        item = self.TauImpurityCoeffTable.item(0,2).setText('1.0')
-        self.mr_error_msg.setText(_translate("InputWindow", "Use checkbox to select scatterings."))
-        self.ComputeButton.setText(_translate("InputWindow", ""))
-        self.ImportExpButton.setText(_translate("InputWindow", "IMPORT DATA"))
-        self.ClearExpButton.setText(_translate("InputWindow", "CLEAR DATA"))
-
-    # initial precalculation operations
-    def check_server_status(self):
-        # run first calculation to compile the code (in parallel)
-        self.first_run_thread = threading.Thread(target=self.first_run, args=(), kwargs={})
-        self.first_run_thread.start()
-        
-    # add/remove line in CondTable according to CondSpin
-    @QtCore.Slot()
-    def add_cond_band(self):
-        self.CondTable.setRowCount(self.CondSpin.value())
-        for row in range(self.CondTable.rowCount()):
-            if self.CondTable.item(row, 0):
-                continue
-            else:
-                for column in range(self.CondTable.columnCount()):
-                    item = QtWidgets.QTableWidgetItem()
-                    item.setTextAlignment(QtCore.Qt.AlignCenter)
-                    self.CondTable.setItem(row, column, item)
-
-    # add/remove line in ValTable according to ValSpin
-    @QtCore.Slot()
-    def add_val_band(self):
-        self.ValTable.setRowCount(self.ValSpin.value())
-        for row in range(self.ValTable.rowCount()):
-            if self.ValTable.item(row, 0):
-                continue
-            else:
-                for column in range(self.ValTable.columnCount()):
-                    item = QtWidgets.QTableWidgetItem()
-                    item.setTextAlignment(QtCore.Qt.AlignCenter)
-                    self.ValTable.setItem(row, column, item)
-
-    # update bands position data structure
-    @QtCore.Slot()
-    def update_ebandmins(self):
-        self.data.ebandmins.clear()
-        self.data.num_cbands = self.CondSpin.value()
-        for c in range(self.data.num_cbands):
-            self.data.ebandmins.append(self.CondTable.item(c, 3).text())
-        self.data.num_vbands = self.ValSpin.value()
-        for v in range(self.data.num_vbands):
-            self.data.ebandmins.append(self.ValTable.item(v, 3).text())
-        self.update_acous_box()
-
-    @QtCore.Slot()
-    def insert_new_temperature(self):
-        self.tInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color: black};")
-
-    @QtCore.Slot()
-    def update_temp(self):
-        input_text = self.tInput.text()
-        if input_text == '':
-            self.tInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color: gray};")
-            self.tInput.setText("[300:1000:100]")
-
-    @QtCore.Slot()
-    def insert_new_mu(self):
-        self.muInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color: black};")
-
-    @QtCore.Slot()
-    def update_mu(self):
-        input_text = self.muInput.text()
-        if input_text == '':
-            self.muInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color: gray};")
-            self.muInput.setText("0.5")
-
-
-    # update acousBox with new band params
-    def update_acous_box(self):
-        self.acousBox.clear()
-        num_cond_bands = self.CondSpin.value()
-        num_val_bands = self.ValSpin.value()
-        if num_cond_bands == 0 and num_val_bands == 0:
-            self.acousBox.addItem(" -empty- ")
-        for i in range(num_cond_bands):
-            self.acousBox.addItem("cond_{}, E0 = {}".format(i+1,self.data.ebandmins[i]))
-        for i in range(num_val_bands):
-            self.acousBox.addItem("val_{}, E0 = {}".format(i+1,self.data.ebandmins[num_cond_bands+i]))
-    
-
-    # update all data structures
-    def set_data(self):
-        self.data = Data() # reset 
-        self.data.num_cbands = self.CondSpin.value()
-        self.data.num_vbands = self.ValSpin.value()
-        self.data.num_bands = self.data.num_cbands + self.data.num_vbands
-        # cond bands
-        for c in range(self.data.num_cbands):
-            # ctensor
-            self.data.cTensors.append(self.CondTable.item(c, 0).text() + " " +
-                                      self.CondTable.item(c, 1).text() + " " +
-                                      self.CondTable.item(c, 2).text() + " " +
-                                      "0.0" + " " + "0.0" + " " + "0.0")
-            # ebandmins
-            self.data.ebandmins.append(self.CondTable.item(c, 3).text())
-            # mband
-            self.data.mband.append("1")
-            # TODO: change.This is default value
-            self.data.degeneracies.append("1")
-        # valence bands
-        for v in range(self.data.num_vbands):
-            # ctensor
-            self.data.cTensors.append(self.ValTable.item(v, 0).text() + " " +
-                                      self.ValTable.item(v, 1).text() + " " +
-                                      self.ValTable.item(v, 2).text() + " " +
-                                      "0.0" + " " + "0.0" + " " + "0.0")
-            # ebandmins
-            self.data.ebandmins.append(self.ValTable.item(v, 3).text())
-            # mband
-            self.data.mband.append("-1")
-            # TODO: change.This is default value
-            self.data.degeneracies.append("1")
-
-        self.data.T_str = self.tInput.text()
-        self.data.mu_str = self.muInput.text()
-        
-        # tau model
-        self.update_tau()
-
-
-    # update relaxation time data structures
-    def update_tau(self):
-        self.clear_tau()
-        self.data.tau_model_type = self.comboBox.currentText()
-        if self.data.tau_model_type == "acoustic":
-            for c in range(self.TauAcousticCoeffTable.columnCount()):
-                value = self.TauAcousticCoeffTable.item(0, c).text()
-                if value == "":
-                    self.data.tau_acoustic_coeffs.append(0.0)
-                else:
-                    self.data.tau_acoustic_coeffs.append(float(value))
-        elif self.data.tau_model_type == "impurity":
-            for c in range(self.TauImpurityCoeffTable.columnCount()):
-                value = self.TauImpurityCoeffTable.item(0, c).text()
-                if value == "":
-                    self.data.tau_impurity_coeffs.append(0.0)
-                else:
-                    self.data.tau_impurity_coeffs.append(float(value))
-        elif self.data.tau_model_type == "Matthiessen's rule":
-            for i,tau_checkbox in enumerate([self.mr_checkBox_const,self.mr_checkBox_acoust,self.mr_checkBox_impur]):
-                if tau_checkbox.isChecked():
-                    models_blist = list(self.data.tau_matthiessen_models)
-                    models_blist[i] = '1'
-                    self.data.tau_matthiessen_models = ''.join(models_blist)
-            self.data.tau_matthiessen_gamma = self.mr_gamma_Input.text()
-            for c in range(self.TauAcousticCoeffTable.columnCount()):
-                value = self.TauAcousticCoeffTable.item(0, c).text()
-                if value == "":
-                    self.data.tau_acoustic_coeffs.append(0.0)
-                else:
-                    self.data.tau_acoustic_coeffs.append(float(value))
-            for c in range(self.TauImpurityCoeffTable.columnCount()):
-                value = self.TauImpurityCoeffTable.item(0, c).text()
-                if value == "":
-                    self.data.tau_impurity_coeffs.append(0.0)
-                else:
-                    self.data.tau_impurity_coeffs.append(float(value))
-
-
-    # clear relaxation time data structures
-    def clear_tau(self):
-        self.data.tau_model_type = "constant"
-        self.data.tau_acoustic_coeffs.clear()
-        self.data.tau_impurity_coeffs.clear()
-        self.data.tau_matthiessen_models = "000"
-        self.data.tau_matthiessen_gamma = "0.0"
-
-
-    # plot relaxation time
-    def publish_tau(self, data):
-        print(data)
-        mus = np.array(data["mu"])
-        tau = np.array(data["data"])
-        Ts = np.array(data["T"])
-        self.tauplot.ax.cla()
-        self.tauplot.plot(mus, tau, Ts)
-
-
-    #### CALCULATION methods ####
-    # first run to compile the code
-    def first_run(self):
-        while(True):
-            try:
-                check = requests.get('http://127.0.0.1:1200/api/check')
-                check.raise_for_status() 
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                continue
-            except requests.exceptions.HTTPError:
-                continue
-            else:
-                break
-
-        url_c = 'http://127.0.0.1:1200/api/guicalc'
-        headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
-
-        # write the message
-        message = {"# export all data [true/false]": False,
-                    "# number of bands": 2,
-                    "# Fermi level": "0.5",
-                    "# temperature": '[300:500:100]',
-                    "# bands masses and angles": ["1. 1. 1. 0. 0. 0.", "1. 1. 1. 0. 0. 0."],
-                    "# band type": ["1","-1"],
-                    "# energy extrema": ["1","-1"],
-                    "# degeneracy": ["1","1"],
-                    "# tau model [constant/acoustic/impurity/matthiessen]": "constant",
-                    "# tau acoustic coefficients": [],
-                    "# tau impurity coefficients": [],
-                    "# tau matthiessen models": "000",
-                    "# tau matthiessen gamma": "0.0"}
-
-        for tensor_name in ["conductivity", "seebeck", "thermal", "concentration"]:
-            message["tensor_name"] = tensor_name
-            # send the request
-            requests.post(url_c, json=message, headers=headers)
-
-        # # relaxation time plot
-        # self.computetau()
-
-        # change server status signal
-        self.set_greenstatus()
-        # activate ComputeButton
-        self.ComputeButton.blockSignals(False)
-        self.TauplotButton.blockSignals(False)
-        # first run completed
-        self.is_first_run_completed = True
-
-
-    # send a request to the server to compute the relaxation time over input ranges of temps and Fermi levels
-    @QtCore.Slot()
-    def computetau(self):
-        # wait for the GUI to be ready
-        if self.is_first_run_completed == False:
-            return
-
-        # update data structures
-        self.set_data()
-        self.set_redstatus()
-        url_ctau = 'http://127.0.0.1:1200/api/guitaucalc'
-        self.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
-
-        bandtype,ebandmin = 1,0
-
-        # update acousBox
-        if self.comboBox.currentText() == "acoustic" or (self.comboBox.currentText() == "Matthiessen's rule" and self.mr_checkBox_acoust):
-            self.update_acous_box()
-            if len(self.data.ebandmins) == 0:
-                print("\033[91m[ERROR] Band structure is empty.\[\033[0m\]")
-                self.set_greenstatus()
-                return
-            # get type of band for acoustic scattering
-            acousBox = self.acousBox.currentText()
-            if len(set(acousBox).intersection('cond')) == 4:
-                bandtype = +1
-            elif len(set(acousBox).intersection('val')) == 3:
-                bandtype = -1
-            else:
-                raise(RuntimeError)
-            # get band minimum for acoustic scattering
-            ebandmin = float(acousBox.strip().split(" ")[-1])
-
-        # write the request message
-        self.message = {"# Fermi level": self.muInput.text(),
-                        "# temperature": self.tInput.text(),
-                        "# band type": bandtype,
-                        "# energy extremum": ebandmin,
-                        "# tau model [constant/acoustic/impurity/matthiessen]": self.data.tau_model_type,
-                        "# tau acoustic coefficients": self.data.tau_acoustic_coeffs,
-                        "# tau impurity coefficients": self.data.tau_impurity_coeffs,
-                        "# tau matthiessen models": self.data.tau_matthiessen_models,
-                        "# tau matthiessen gamma": self.data.tau_matthiessen_gamma}
-
-        try:
-            # send the request
-            r_calc = requests.post(url_ctau, json=self.message, headers=self.headers)
-            r_calc.raise_for_status()
-            # check response
-            if r_calc.status_code == 200:   # ok
-                # check if Matthiessen had an error
-                if self.mr_error_msg.isVisible():
-                    self.mr_error_msg.setVisible(False)
-                # plot the relaxatin time
-                self.publish_tau(r_calc.json())
-            # error -> clear GIU
-            elif r_calc.status_code == 210 and r_calc.text == "-40":
-                self.mr_error_msg.setVisible(True)
-                self.clear_gui()
-            elif r_calc.status_code == 210:
-                self.clear_gui()
-            self.set_greenstatus()
-
-        except requests.exceptions.HTTPError as errh:
-            print("Http error:", errh)
-            self.set_greenstatus()
-        except requests.exceptions.ConnectionError as errc:
-            print ("Exception occurred. Check server.")
-            self.set_greenstatus()
-            raise(errc)
-        except requests.exceptions.Timeout as errt:
-            print("Timeout error:", errt)
-            self.set_greenstatus()
-        except requests.exceptions.RequestException as err:
-            print("Exception occurred. Check server.", err)
-            self.set_greenstatus()
-            raise(err)
-
-
-    # function that requests the calculation and exports the results
-    @QtCore.Slot()
-    def compute(self):
-        self.set_redstatus()
-        url_c = 'http://127.0.0.1:1200/api/guicalc'
-        self.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
-
-        # reset progress bar
-        self.progressBar.setValue(0)
-
-        # clean the variables
-        self.clear_gui()
-
-        # update the data structure
-        self.set_data()
-
-        # write the request message
-        self.message = {"# export all data [true/false]": self.data.export_all_data,
-                        "# number of bands": self.data.num_bands,
-                        "# Fermi level": self.data.mu_str,
-                        "# temperature": self.data.T_str,
-                        "# bands masses and angles": self.data.cTensors,
-                        "# band type": self.data.mband,
-                        "# energy extrema": self.data.ebandmins,
-                        "# degeneracy": self.data.degeneracies,
-                        "# tau model [constant/acoustic/impurity/matthiessen]": self.data.tau_model_type,
-                        "# tau acoustic coefficients": self.data.tau_acoustic_coeffs,
-                        "# tau impurity coefficients": self.data.tau_impurity_coeffs,
-                        "# tau matthiessen models": self.data.tau_matthiessen_models,
-                        "# tau matthiessen gamma": self.data.tau_matthiessen_gamma}
-
-        # differently for CLI, GUI version computes all of the four tensors by default
-        self.args = ["conductivity", "seebeck", "thermal", "concentration"]
-
-        if self.is_first_run_thread_active:
-            self.first_run_thread.join()
-            self.is_first_run_thread_active = False
-
-        # loop over electrical cond, Seebeck, thermal cond, carrier conc
-        for idx, tensor_name in enumerate(self.args):
-            self.message["tensor_name"] = tensor_name
-            try:
-                # send request and collect results
-                r_calc = requests.post(url_c, json=self.message, headers=self.headers)
-                r_calc.raise_for_status()
-                # check response
-                if r_calc.status_code == 200:   # ok
-                    # publish results to OUTPUT window
-                    self.publish_output(tensor_name, r_calc.json())
-                    self.update_progress_bar(25*(idx+1))
-                # error -> clear GIU
-                elif r_calc.status_code == 210 and r_calc.text == "-20":
-                    self.clear_gui()
-                    self.ui_out.plots.figure.suptitle("", y=0.97)
-                    self.ui_out.plots.ax1.spines['left'].set_visible(False)
-                    self.ui_out.plots.ax1.spines['bottom'].set_visible(False)
-                    self.ui_out.plots.ax1.get_xaxis().set_visible(False)
-                    self.ui_out.plots.ax1.get_yaxis().set_visible(False)
-                    self.ui_out.plots.ax2.spines['left'].set_visible(False)
-                    self.ui_out.plots.ax2.spines['bottom'].set_visible(False)
-                    self.ui_out.plots.ax2.get_xaxis().set_visible(False)
-                    self.ui_out.plots.ax2.get_yaxis().set_visible(False)
-                    self.ui_out.plots.figure.text(0.05, 0.85, "ERROR: ", ha="left", va="bottom", size="large", color="red", fontfamily="serif")
-                    self.ui_out.plots.figure.text(0.15, 0.85, "Relaxation time functional form identically zero.", ha="left", va="bottom", size="large", fontfamily="serif")
-                    self.ui_out.plots.draw()
-                    self.set_greenstatus()
-                    break
-                elif r_calc.status_code == 210 and r_calc.text == "-30":
-                    self.clear_gui()
-                    self.ui_out.plots.figure.suptitle("", y=0.97)
-                    self.ui_out.plots.ax1.spines['left'].set_visible(False)
-                    self.ui_out.plots.ax1.spines['bottom'].set_visible(False)
-                    self.ui_out.plots.ax1.get_xaxis().set_visible(False)
-                    self.ui_out.plots.ax1.get_yaxis().set_visible(False)
-                    self.ui_out.plots.ax2.spines['left'].set_visible(False)
-                    self.ui_out.plots.ax2.spines['bottom'].set_visible(False)
-                    self.ui_out.plots.ax2.get_xaxis().set_visible(False)
-                    self.ui_out.plots.ax2.get_yaxis().set_visible(False)
-                    self.ui_out.plots.figure.text(0.05, 0.85, "ERROR: ", ha="left", va="bottom", size="large",color="red", fontfamily="serif")
-                    self.ui_out.plots.figure.text(0.15, 0.85, "Domain error in the τ function calculation.", ha="left", va="bottom", size="large", fontfamily="serif")
-                    self.ui_out.plots.figure.text(0.05,0.78, "Hint:", ha="left", va="bottom", size="large",color="blue", fontfamily="serif")
-                    self.ui_out.plots.figure.text(0.11,0.78, "shift the zero value of the chosen temperature or the T₀ parameter of the", ha="left", va="bottom", size="large", fontfamily="serif")
-                    self.ui_out.plots.figure.text(0.11,0.71, "acoustic scattering.", ha="left", va="bottom", size="large", fontfamily="serif")
-                    self.ui_out.plots.draw()
-                    self.set_greenstatus()
-                    break
-                elif r_calc.status_code == 210 and r_calc.text == "-40":
-                    self.clear_gui()
-
-                    self.set_greenstatus()
-                    break
-
-            except requests.exceptions.HTTPError as errh:
-                print("Http error:", errh)
-            except requests.exceptions.ConnectionError as errc:
-                print ("Exception occurred. Check server.")
-                raise(errc)
-            except requests.exceptions.Timeout as errt:
-                print("Timeout error:", errt)
-            except requests.exceptions.RequestException as err:
-                print("Exception occurred. Check server.", err)
-                raise(err)
-
-
-    # publish output in the OUTPUT window
-    def publish_output(self, tensor_name, data):
-
-        # check if output window is visible, if not show it
-        if not self.OutputWindow.isVisible():
-            self.OutputWindow.show()
-
-        # tensor has shape (6, num_mu, num_t)
-        tensor = np.array(data["data"])
-        norm_const = 1/3
-
-        if tensor_name == "conductivity":
-
-            ##### set slider for T and mu #####
-            self.T = np.array(data["T"])
-            self.mus = np.array(data["mu"])
-            if self.T.shape == ():
-                self.T = np.array([self.T])
-            if self.mus.shape == ():
-                self.mus = np.array([self.mus])
-            self.num_t = self.T.size
-            self.num_mu = self.mus.size
-            if not self.out_all_data.isallocated():
-                self.out_all_data.setTmu(self.num_mu, self.num_t)
-            if self.T.size < 2:
-                # set slider according to user inputs
-                self.ui_out.TSlider.setMinimum(self.T[0])
-                self.ui_out.TSlider.setMaximum(self.T[0])
-                self.ui_out.TSlider.setSingleStep(0)
-            else:
-                # set slider according to user inputs
-                self.ui_out.TSlider.setMinimum(0)
-                self.ui_out.TSlider.setMaximum(len(self.T)-1)
-                self.T_step = self.T[1] - self.T[0]
-                self.ui_out.TSlider.setSingleStep(1)
-                self.ui_out.TSlider.setTickInterval(1)
-                self.ui_out.TSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
-            if self.mus.size < 2:
-                # set slider according to user inputs
-                self.ui_out.muSlider.setMinimum(self.mus[0])
-                self.ui_out.muSlider.setMaximum(self.mus[0])
-                self.ui_out.muSlider.setSingleStep(0)
-                self.muStepConv = 0.0
-            else:
-                # set slider according to user inputs
-                self.mu_step = self.data.mu_str.split(":")[-1]
-                self.ui_out.muSlider.setMinimum(0)
-                self.ui_out.muSlider.setMaximum(len(self.mus)-1)
-                self.ui_out.muSlider.setSingleStep(1)
-                self.ui_out.muSlider.setTickInterval(1)
-                self.ui_out.muSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
-
-            # set T mu values in TVal and muVal
-            self.ui_out.TVal.setText(str(int(self.T[0])))
-            self.ui_out.muVal.setText(str(self.mus[0]))
-            # activate sliders
-            self.ui_out.TVal.textChanged.connect(self.ui_out.TValueChanged)
-            self.ui_out.muVal.textChanged.connect(self.ui_out.muValueChanged)
-            self.ui_out.TSlider.valueChanged.connect(self.ui_out.TSliderChanged)
-            self.ui_out.muSlider.valueChanged.connect(self.ui_out.muSliderChanged)
-            
-        ##### compute the trace for each tensor
-            self.out_all_data.setCond(tensor)
-            trace_tensor = np.empty((self.num_mu, self.num_t))
-            for t in range(self.num_t):
-                for m in range(self.num_mu):
-                    trace_tensor[m, t] = np.multiply((tensor[0, m, t]+tensor[1, m, t]+tensor[2, m, t]), norm_const)
-        elif tensor_name == "seebeck":
-            self.out_all_data.setSeebeck(tensor)
-            trace_tensor = np.empty((self.mus.size, self.T.size))
-            for t in range(self.T.size):
-                for m in range(self.mus.size):
-                    trace_tensor[m, t] = np.multiply((tensor[0, m, t] + tensor[1, m, t] + tensor[2, m, t]), norm_const)
-        elif tensor_name == "thermal":
-            self.out_all_data.setThermal(tensor)
-            trace_tensor = np.empty((self.mus.size, self.T.size))
-            for t in range(self.T.size):
-                for m in range(self.mus.size):
-                    trace_tensor[m, t] = np.multiply((tensor[0, m, t]+tensor[1, m, t]+tensor[2, m, t]), norm_const)
-        elif tensor_name == "concentration":
-            self.out_all_data.setConc(tensor)
-            trace_tensor = tensor[0, :, :]
-
-        # plot the results
-        self.ui_out.plots.plot(tensor_name, self.T, trace_tensor, self.mus, self.data.tau_model_type, self.exp_data)
-        
-        self.out_trace_data.data.append(trace_tensor)
-        self.out_trace_data.label.append(tensor_name)
-
-        # after the last tensor is plotted -> green light
-        if tensor_name == "concentration":
-            self.set_greenstatus()
-
-
-    # publish each tensor in the outputTable according to the sliders (or TVal and muVal)
-    def publish_tensor(self):
-        mu = float(self.ui_out.muVal.text())
-        t = float(self.ui_out.TVal.text())
-        if self.T.shape == ():
-            self.T = np.array([self.T])
-        if self.mus.shape == ():
-            self.mus = np.array([self.mus])
-        if t not in self.T or mu not in self.mus:
-            return
-        if (self.ui_out.TVal.text() == "") or (self.ui_out.muVal.text() == "") \
-                or (mu < self.mus[0]) or (mu > self.mus[-1]) \
-                or (t < self.T[0]) or (t > self.T[-1]):
-            return
-        else:
-            mu_idx = np.where(self.mus == mu)[0][0]
-            t_idx = np.where(self.T == t)[0][0]
-
-            tensor_idx = 0
-            if self.out_all_data.conductivity is not None and self.out_all_data.conductivity.size != 0:
-                self.update_row_outputTable(0, self.out_all_data.conductivity[:, mu_idx, t_idx])
-                y = self.out_trace_data.data[tensor_idx][mu_idx][t_idx]
-                if self.ui_out.plots.point1 is not None:
-                    self.ui_out.plots.point1.remove()
-                self.ui_out.plots.point1, = self.ui_out.plots.ax1.plot(t, y, marker='.', color="#1f77b4" if self.mus.size == 1 else 'dimgray', zorder=10)
-                tensor_idx += 1
-            if self.out_all_data.seebeck is not None and self.out_all_data.seebeck.size != 0:
-                self.update_row_outputTable(1, np.multiply(self.out_all_data.seebeck[:, mu_idx, t_idx],1e6))
-                y = self.out_trace_data.data[tensor_idx][mu_idx][t_idx]
-                if self.ui_out.plots.point2 is not None:
-                    self.ui_out.plots.point2.remove()
-                self.ui_out.plots.point2, = self.ui_out.plots.ax2.plot(t, np.multiply(y,1e6), marker='.', color="orange" if self.mus.size == 1 else 'dimgray', zorder=10)
-                tensor_idx += 1
-            if self.out_all_data.thermal is not None and self.out_all_data.thermal.size != 0:
-                self.update_row_outputTable(2, self.out_all_data.thermal[:, mu_idx, t_idx])
-                y = self.out_trace_data.data[tensor_idx][mu_idx][t_idx]
-                if self.ui_out.plots.point3 is not None:
-                    self.ui_out.plots.point3.remove()
-                self.ui_out.plots.point3, = self.ui_out.plots.ax3.plot(t, y, marker='.', color="red" if self.mus.size == 1 else 'dimgray', markersize=3, zorder=10)
-                tensor_idx += 1
-            if self.out_all_data.concentration is not None and self.out_all_data.concentration.size != 0:
-                self.update_n_outputTable(self.out_all_data.concentration[:, mu_idx, t_idx])
-                y = self.out_trace_data.data[tensor_idx][mu_idx][t_idx]
-                if self.ui_out.plots.point4 is not None:
-                    self.ui_out.plots.point4.remove()
-                self.ui_out.plots.point4, = self.ui_out.plots.ax4.plot(t, y, marker='.', color="limegreen" if self.mus.size == 1 else 'dimgray', zorder=10)
-        self.ui_out.plots.draw()
-
-
-    def update_progress_bar(self, perc):
-        self.progressBar.setValue(perc)
-
-
-    # publish conductivities and Seebeck on outputTable
-    def update_row_outputTable(self, row, data):
-        self.ui_out.outputTable.item(row, 0).setText(format(data[0], '.5e'))
-        self.ui_out.outputTable.item(row, 1).setText(format(data[1], '.5e'))
-        self.ui_out.outputTable.item(row, 2).setText(format(data[2], '.5e'))
-        self.ui_out.outputTable.item(row, 3).setText(format(data[3], '.5e'))
-        self.ui_out.outputTable.item(row, 4).setText(format(data[4], '.5e'))
-        self.ui_out.outputTable.item(row, 5).setText(format(data[5], '.5e'))
-
-    # carrier concentration is a scalar 
-    def update_n_outputTable(self, data):
-        self.ui_out.outputTable.item(3, 0).setText(format(data[0], '.5e'))
-        self.ui_out.outputTable.item(3, 1).setText('-')
-        self.ui_out.outputTable.item(3, 2).setText('-')
-        self.ui_out.outputTable.item(3, 3).setText('-')
-        self.ui_out.outputTable.item(3, 4).setText('-')
-        self.ui_out.outputTable.item(3, 5).setText('-')
-
-
-    @QtCore.Slot()
-    def import_exp_data(self):
-        fileName, selectedFilter = QtWidgets.QFileDialog.getOpenFileName(self.InputWindow, 'Import File', str(os.getcwd()),
-                                                             "CSV (Comma delimited) (*.csv);; Excel Workbook (*.xlsx)")
-        try:
-            if selectedFilter == "CSV (Comma delimited) (*.csv)":
-                self.exp_data.set_exp_data(pd.read_csv(fileName, header=None))
-            elif selectedFilter == "Excel Workbook (*.xlsx)":
-                self.exp_data.set_exp_data(pd.read_excel(fileName, header=None))
-            self.ImportExpButton.setIcon(self.tick_icon)
-        except ValueError:
-            self.ImportExpButton.setIcon(self.error_icon)
-        except FileNotFoundError:
-            pass
-        self.ClearExpButton.setIcon(QtGui.QIcon())
-
-
-    @QtCore.Slot()
-    def clear_exp_data(self):
-        self.exp_data.clear()
-        self.ClearExpButton.setIcon(self.tick_icon)
-        self.ImportExpButton.setIcon(QtGui.QIcon())
-
-
-    def export_data(self, filename):
-        hor_header = ['μ']
-        for i in range(self.num_t):
-            hor_header.append('T_'+str(i+1))
-        # list not empty
-        if self.out_trace_data.data:
-            tensor_num = len(self.out_trace_data.data)
-            mu_size, t_size = self.out_trace_data.data[0].shape
-            data_to_write = np.empty((mu_size*tensor_num, len(hor_header)))
-            for t in range(tensor_num):
-                tensor = np.insert(self.out_trace_data.data[t], 0, self.mus, axis=1)
-                data_to_write[mu_size*t:mu_size*(t+1), :] = tensor
-
-            lbs = list(itertools.chain.from_iterable(itertools.repeat(x, mu_size) for x in self.out_trace_data.label))
-            pd.DataFrame(np.asarray(data_to_write), columns=hor_header, index=lbs).to_csv(filename)
-
-
-    # clear all datastructures and plots
-    def clear_gui(self):
-        self.data = Data()
-        self.out_trace_data.clear()
-        self.out_all_data.clear()
-        self.ui_out.plots.ax1.cla(); self.ui_out.plots.ax2.cla(); self.ui_out.plots.ax3.cla(); self.ui_out.plots.ax4.cla();
-        # space for error message. TODO
-        for text in self.ui_out.plots.figure.texts:
-            text.set_visible(False)
-        self.ui_out.plots.ax1.spines['left'].set_visible(True)
-        self.ui_out.plots.ax1.spines['bottom'].set_visible(True)
-        self.ui_out.plots.ax1.get_yaxis().set_visible(True)
-        self.ui_out.plots.ax1.get_yaxis().set_visible(True)
-        self.ui_out.plots.ax2.spines['left'].set_visible(True)
-        self.ui_out.plots.ax2.spines['bottom'].set_visible(True)
-        self.ui_out.plots.ax2.get_xaxis().set_visible(True)
-        self.ui_out.plots.ax2.get_yaxis().set_visible(True)
-        self.ui_out.plots.draw()
-        for r in range(self.ui_out.outputTable.rowCount()):
-            for c in range(self.ui_out.outputTable.columnCount()):
-                item = QtWidgets.QTableWidgetItem()
-                item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.ui_out.outputTable.setItem(r, c, item)
-
-
-    def exit(self):
-        self.ui_out.OutputWindow.close()
-        self.InputWindow.close()
-
-
-    def set_redstatus(self):
-        # down signal to on
-        self.redSignal.setVisible(True)
-        # up signal to off
-        self.greenSignal.setVisible(False)
-        QtWidgets.QApplication.processEvents()
-
-
-    def set_greenstatus(self):
-        # down signal to off
-        self.redSignal.setVisible(False)
-        # activate up signal
-        self.greenSignal.setVisible(True)
-        QtWidgets.QApplication.processEvents()
-
-
-
-# output window
-class UiOutputWindow(object):
-    def __init__(self, parent):
-        self.parent = parent
-
-    def setupUi(self, OutputWindow):
-        self.OutputWindow = OutputWindow
-        self.OutputWindow.setObjectName("OutputWindow")
-        self.OutputWindow.resize(730, 750)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.OutputWindow.sizePolicy().hasHeightForWidth())
-        self.OutputWindow.setSizePolicy(sizePolicy)
-        self.OutputWindow.setAutoFillBackground(False)
-        self.OutputWindow.setWindowIcon(self.parent.appIcon)
-        self.plots = PlotsCanvas(width=20, height=50)
-        self.centralwidget = QtWidgets.QWidget(self.OutputWindow)
-        self.centralwidget.setObjectName("centralwidget")
-        self.OutputWindow.setCentralWidget(self.centralwidget)
-
-        # menubar
-        self.menubar = QtWidgets.QMenuBar(self.OutputWindow)
-        self.menubar.setGeometry(QtCore.QRect(0, 0, 819, 20))
-        self.menubar.setObjectName("menubar")
-        self.menuFile = QtWidgets.QMenu(self.menubar)
-        self.menuFile.setObjectName("menuFile")
-        self.menuHelp = QtWidgets.QMenu(self.menubar)
-        self.menuHelp.setObjectName("menuHelp")
-        self.OutputWindow.setMenuBar(self.menubar)
-        self.statusbar = QtWidgets.QStatusBar(self.OutputWindow)
-        self.statusbar.setObjectName("statusbar")
-        self.OutputWindow.setStatusBar(self.statusbar)
-        self.actionSave_plots = QtWidgets.QAction(self.OutputWindow)
-        self.actionSave_plots.setObjectName("actionSave_plots")
-        self.actionSave_plots.triggered.connect(self.create_saveplot_dialog)
-        self.actionSave_plots.setShortcut("Ctrl+S")
-        self.actionExport_data = QtWidgets.QAction(self.OutputWindow)
-        self.actionExport_data.setObjectName("actionExport_data")
-        self.actionExport_data.setStatusTip('Save File')
-        self.actionExport_data.triggered.connect(self.save_data)
-        self.actionExit = QtWidgets.QAction(self.OutputWindow)
-        self.actionExit.setObjectName("actionExit")
-        self.actionExit.triggered.connect(self.OutputWindow.close)
-        self.actionAbout = QtWidgets.QAction(self.OutputWindow)
-        self.actionAbout.setObjectName("actionAbout")
-        self.menubar.addAction(self.menuFile.menuAction())
-        self.menubar.addAction(self.menuHelp.menuAction())
-        self.menuFile.addAction(self.actionSave_plots)
-        self.menuFile.addAction(self.actionExport_data)
-        self.menuFile.addAction(self.actionExit)
-        self.menuHelp.addAction(self.actionAbout)
-
-        # layout grid to handle outputs
-        self.frameLeft = QtWidgets.QFrame(self.centralwidget)
-        self.frameLeft.setMinimumSize(QtCore.QSize(0, 70))
-        self.frameLeft.setMaximumSize(QtCore.QSize(16777215, 70))
-        self.frameLeft.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.frameLeft.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frameLeft.setObjectName("frameLeft")
-        self.frameTmu = QtWidgets.QFrame(self.centralwidget)
-        self.frameTmu.setMinimumSize(QtCore.QSize(530, 70))
-        self.frameTmu.setMaximumSize(QtCore.QSize(16777215, 70))
-        self.frameTmu.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.frameTmu.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frameTmu.setObjectName("frameTmu")
-        self.gridLayoutPlots = QtWidgets.QGridLayout()
-        self.gridLayoutPlots.setObjectName("gridLayoutPlots")
-        self.TmuLayout = QtWidgets.QHBoxLayout()
-        self.TmuLayout.addWidget(self.frameLeft)
-        self.TmuLayout.setObjectName("TmuLayout")
-        self.TmuLayout.setContentsMargins(0, 20, 0, 0)
-        self.frameRight = QtWidgets.QFrame(self.centralwidget)
-        self.frameRight.setMaximumSize(QtCore.QSize(16777215, 70))
-        self.frameRight.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.frameRight.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frameRight.setObjectName("frameRight")
-        self.TmuLayout.addWidget(self.frameRight)
-        self.gridLayoutTensors = QtWidgets.QGridLayout()
-        self.gridLayoutTensors.setObjectName("gridLayoutTensors")
-        self.gridLayoutTensors.setContentsMargins(50, 0, 50, 50)
-        self.windowLayout = QtWidgets.QGridLayout(self.centralwidget)
-        self.windowLayout.setObjectName("gridLayout_2")
-        self.windowLayout.addLayout(self.gridLayoutPlots, 0, 0, 1, 1)
-        self.windowLayout.addLayout(self.TmuLayout, 1, 0, 1, 1)
-        self.windowLayout.addLayout(self.gridLayoutTensors, 6, 0, 1, 1)
-
-        # title
-        font_title = QtGui.QFont()
-        font_title.setPointSize(15)
-        font_title.setBold(True)
-        font_title.setWeight(75)
-        self.outputlabel = QtWidgets.QLabel(self.centralwidget)
-        self.outputlabel.setFont(font_title)
-        self.outputlabel.setTextFormat(QtCore.Qt.PlainText)
-        self.outputlabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.outputlabel.setMaximumSize(QtCore.QSize(16777215, 30))
-        self.outputlabel.setIndent(0)
-        self.outputlabel.setObjectName("outputlabel")
-        self.gridLayoutPlots.addWidget(self.outputlabel, 0, 0, 1, 1)
-
-        # Plot table
-        self.gridLayoutPlots.addWidget(self.plots, 1, 0, 1, 1)
-
-        ## Thermodynamics params
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        TmuLabelSizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
-        TmuLabelSizePolicy.setHorizontalStretch(0)
-        TmuLabelSizePolicy.setVerticalStretch(0)
-        ### temperature input namebox
-        self.TSym = QtWidgets.QLabel(self.frameTmu)
-        self.TSym.setObjectName("TSym")
-        self.TSym.setGeometry(QtCore.QRect(30, 10, 30, 16))
-        self.TSym.setMaximumSize(QtCore.QSize(16777215, 20))
-        self.TSym.setFont(font)
-        sizePolicy.setHeightForWidth(self.TSym.sizePolicy().hasHeightForWidth())
-        self.TSym.setSizePolicy(sizePolicy)
-        ### temperature input 
-        self.TVal = QtWidgets.QLineEdit(self.frameTmu)
-        self.TVal.setObjectName("TmuVal")
-        self.TVal.setGeometry(QtCore.QRect(70, 10, 71, 16))
-        self.TVal.setFont(font)
-        self.TVal.setAlignment(QtCore.Qt.AlignRight)
-        self.TVal.returnPressed.connect(self.TValueChangedReturn)
-        ### temperature slider
-        self.TSlider = QtWidgets.QSlider(self.frameTmu)
-        self.TSlider.setObjectName("TSlider")
-        self.TSlider.setGeometry(QtCore.QRect(10, 40, 170, 20))
-        self.TSlider.setMaximumSize(QtCore.QSize(16777215, 20))
-        self.TSlider.setOrientation(QtCore.Qt.Horizontal)
-        self.TSlider.setStyleSheet("QSlider::handle:horizontal {background-color: %s;}" % (header_color))
-        ### Fermi level input namebox
-        self.muSym = QtWidgets.QLabel(self.frameTmu)
-        self.muSym.setObjectName("muSym")
-        self.muSym.setGeometry(QtCore.QRect(220, 10, 40, 16))
-        self.muSym.setMaximumSize(QtCore.QSize(16777215, 20))
-        self.muSym.setFont(font)
-        sizePolicy.setHeightForWidth(self.muSym.sizePolicy().hasHeightForWidth())
-        self.muSym.setSizePolicy(sizePolicy)
-        ### Fermi level input 
-        self.muVal = QtWidgets.QLineEdit(self.frameTmu)
-        self.muVal.setObjectName("muVal")
-        self.muVal.setGeometry(QtCore.QRect(270, 10, 71, 16))
-        self.muVal.setFont(font)
-        self.muVal.setAlignment(QtCore.Qt.AlignRight)
-        self.muVal.returnPressed.connect(self.muValueChangedReturn)
-        ### Fermi level slider
-        self.muSlider = QtWidgets.QSlider(self.frameTmu)
-        self.muSlider.setObjectName("muSlider")
-        self.muSlider.setGeometry(QtCore.QRect(200, 40, 170, 20))
-        self.muSlider.setMaximumSize(QtCore.QSize(16777215, 20))
-        self.muSlider.setOrientation(QtCore.Qt.Horizontal)
-        self.muSlider.setStyleSheet("QSlider::handle:horizontal {background-color: %s;}" % (header_color))
-        self.TmuLayout.addWidget(self.frameTmu)
-
-        ## outputs table
-        self.outputTable = QtWidgets.QTableWidget(self.centralwidget)
-        self.outputTable.setObjectName("outputTable")
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.outputTable.sizePolicy().hasHeightForWidth())
-        sizePolicy.setWidthForHeight(self.outputTable.sizePolicy().hasWidthForHeight())
-        self.outputTable.setSizePolicy(sizePolicy)
-        self.outputTable.setMinimumSize(QtCore.QSize(620, 117))
-        self.outputTable.setMaximumSize(QtCore.QSize(620, 117))
-        self.outputTable.horizontalHeader().setDefaultSectionSize(100)
-        self.outputTable.verticalHeader().setDefaultSectionSize(15)
-        self.outputTable.verticalHeader().setMinimumSectionSize(15)
-        self.outputTable.horizontalHeader().setFixedHeight(22)
-        self.outputTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
-        self.outputTable.setShowGrid(True)
-        self.outputTable.setObjectName("outputTable")
-        otfont = QtGui.QFont()
-        otfont.setBold(False)
-        otfont.setPointSize(9)
-        self.outputTable.setFont(otfont)
-        self.outputTable.setColumnCount(6)
-        self.outputTable.setRowCount(4)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        self.outputTable.setHorizontalHeaderItem(5, item)
-        self.outputTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.outputTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.gridLayoutTensors.addWidget(self.outputTable, 0, 0, 1, 1)
-
-        self.retranslateOutputUi(self.OutputWindow)
-        QtCore.QMetaObject.connectSlotsByName(self.OutputWindow)
-
-    def retranslateOutputUi(self, OutputWindow):
-        _translate = QtCore.QCoreApplication.translate
-        OutputWindow.setWindowTitle(_translate("OutputWindow", "OutputWindow"))
-        self.outputlabel.setText(_translate("OutputWindow", "OUTPUTS"))
-        self.TSym.setText(_translate("OutputWindow", "T [K]:"))
-        self.TVal.setText(_translate("OutputWindow", "0"))
-        self.muSym.setText(_translate("OutputWindow", "μ [eV]:")) # TODO
-        self.muVal.setText(_translate("OutputWindow", "0.0"))
-        item = self.outputTable.verticalHeaderItem(0)
-        item.setText(_translate("OutputWindow", "σ"))
-        item = self.outputTable.verticalHeaderItem(1)
-        item.setText(_translate("OutputWindow", "S"))
-        item = self.outputTable.verticalHeaderItem(2)
-        item.setText(_translate("OutputWindow", "κ" + u"\u2091"))
-        item = self.outputTable.verticalHeaderItem(3)
-        item.setText(_translate("OutputWindow", "n"))
-        item = self.outputTable.horizontalHeaderItem(0)
-        item.setText(_translate("OutputWindow", "11"))
-        item = self.outputTable.horizontalHeaderItem(1)
-        item.setText(_translate("OutputWindow", "22"))
-        item = self.outputTable.horizontalHeaderItem(2)
-        item.setText(_translate("OutputWindow", "33"))
-        item = self.outputTable.horizontalHeaderItem(3)
-        item.setText(_translate("OutputWindow", "12"))
-        item = self.outputTable.horizontalHeaderItem(4)
-        item.setText(_translate("OutputWindow", "13"))
-        item = self.outputTable.horizontalHeaderItem(5)
-        item.setText(_translate("OutputWindow", "23"))
-        self.menuFile.setTitle(_translate("OutputWindow", "File"))
-        self.menuHelp.setTitle(_translate("OutputWindow", "Help"))
-        self.actionSave_plots.setText(_translate("OutputWindow", "Save plots"))
-        self.actionExport_data.setText(_translate("OutputWindow", "Export data"))
-        self.actionExit.setText(_translate("InputWindow", "Exit"))
-        self.actionAbout.setText(_translate("OutputWindow", "About"))
-
-
-    @QtCore.Slot()
-    def create_saveplot_dialog(self):
-        self.SavePlotDialog = QtWidgets.QDialog()
-        self.ui_savePlot = UiSavePlotDialog(self)
-        self.ui_savePlot.setupUi(self.SavePlotDialog)
-        self.SavePlotDialog.show()
-
-
-    # save calculations
-    @QtCore.Slot()
-    def save_data(self):
-        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self.OutputWindow, 'Save File', str(os.getcwd()),
-                                                             "CSV Files (*.csv)")
-        if filename[-3:] != "csv":
-            filename = filename + ".csv"
-        self.parent.export_data(filename)
-
-
-    # update outable when T slider changes
-    @QtCore.Slot()
-    def TValueChanged(self):
-        try:
-            if float(self.TVal.text()) not in self.parent.T:
-                return
-            else:
-                self.parent.publish_tensor()
-        except ValueError:
-            print("Wrong input number.")
-
-
-    # update outable when Fermi level slider changes
-    @QtCore.Slot()
-    def muValueChanged(self):
-        try:
-            if float(self.muVal.text()) not in self.parent.mus:
-                return
-            else:
-                self.parent.publish_tensor()
-        except ValueError:
-            print("Wrong input number.")
-
-
-    # update outable when T label changes
-    @QtCore.Slot()
-    def TValueChangedReturn(self):
-        if float(self.TVal.text()) not in self.parent.T:
-            return
-        if self.parent.T.size > 1:
-            value = int(self.TVal.text()-self.parent.T[0])/self.parent.T_step
-            self.TSlider.setValue(int(value))
-        self.parent.publish_tensor()
-
-
-    # update outable when Fermi level label changes
-    @QtCore.Slot()
-    def muValueChangedReturn(self):
-        if float(self.muVal.text()) not in self.parent.mus:
-            return
-        if self.parent.mus.size > 1:
-            rounding_digits = decimal_digits(float(self.parent.mu_step))
-            value = round((float(self.muVal.text()) - self.parent.mus[0]) / float(self.parent.mu_step), rounding_digits)
-            self.muSlider.setValue(int(value))
-        self.parent.publish_tensor()
-
-    # update T label when slider changes
-    @QtCore.Slot()
-    def TSliderChanged(self):
-        value = int(self.TSlider.value()*self.parent.T_step + self.parent.T[0])
-        self.TVal.setText(str(value))
-
-    # udapte Fermi level labels when slider changes
-    @QtCore.Slot()
-    def muSliderChanged(self):
-        rounding_digits = decimal_digits(self.parent.mu_step)
-        value = round(self.muSlider.value()*float(self.parent.mu_step) + self.parent.mus[0], rounding_digits)
-        self.muVal.setText(str(value))
-
-
-    @QtCore.Slot()
-    def set_last_tick(self):
-        self.TSlider.last_tick_pos = self.TSlider.value()
-
-
-    @QtCore.Slot()
-    def check_values(self):
-        self.TSlider.check_values(self.TSlider.value())
-
-
-# save plot dialog
-class UiSavePlotDialog(object):
-    def __init__(self, parent):
-        self.parent = parent
-
-    def setupUi(self, saveDialog):
-        self.saveDialog = saveDialog
-        self.saveDialog.setObjectName("Dialog")
-        self.saveDialog.resize(536, 164)
-        self.gridLayoutSave = QtWidgets.QGridLayout(self.saveDialog)
-        self.gridLayoutSave.setObjectName("gridLayoutSave")
-
-        # set font
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        # set common policy
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        # export path label
-        self.pathLabel = QtWidgets.QLabel(self.saveDialog)
-        self.pathLabel.setObjectName("pathLabel")
-        self.pathLabel.setFont(font)
-        self.pathLabel.setMaximumSize(QtCore.QSize(75, 16777215))
-        sizePolicy.setHeightForWidth(self.pathLabel.sizePolicy().hasHeightForWidth())
-        self.pathLabel.setSizePolicy(sizePolicy)
-        self.pathLabel.setFrameShape(QtWidgets.QFrame.Box)
-        self.pathLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.gridLayoutSave.addWidget(self.pathLabel, 0, 0, 1, 1)
-        # export path input box
-        self.pathInput = QtWidgets.QLineEdit(self.saveDialog)
-        self.pathInput.setFont(font)
-        self.pathInput.setObjectName("lineEdit_3")
-        self.gridLayoutSave.addWidget(self.pathInput, 0, 1, 1, 1)
-        # browse button
-        self.browseButton = QtWidgets.QPushButton(self.saveDialog)
-        self.browseButton.setObjectName("BrowseButton")
-        self.browseButton.setFont(font)
-        self.browseButton.setMaximumSize(QtCore.QSize(50, 16777215))
-        self.browseButton.setLayoutDirection(QtCore.Qt.LeftToRight)
-        self.browseButton.clicked.connect(self.browse)
-        self.gridLayoutSave.addWidget(self.browseButton, 0, 2, 1, 1)
-        # filename label
-        self.filenameLabel = QtWidgets.QLabel(self.saveDialog)
-        self.filenameLabel.setObjectName("filenameLabel")
-        self.filenameLabel.setFont(font)
-        self.filenameLabel.setMaximumSize(QtCore.QSize(75, 16777215))
-        sizePolicy.setHeightForWidth(self.filenameLabel.sizePolicy().hasHeightForWidth())
-        self.filenameLabel.setSizePolicy(sizePolicy)
-        self.filenameLabel.setFrameShape(QtWidgets.QFrame.Box)
-        self.filenameLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.gridLayoutSave.addWidget(self.filenameLabel, 2, 0, 1, 1)
-        # filename inputbox
-        self.filenameInput = QtWidgets.QLineEdit(self.saveDialog)
-        self.filenameInput.setFont(font)
-        self.filenameInput.setObjectName("lineEdit_2")
-        self.gridLayoutSave.addWidget(self.filenameInput, 2, 1, 1, 1)
-        # format
-        self.formatBox = QtWidgets.QComboBox(self.saveDialog)
-        self.formatBox.setObjectName("formatBox")
-        self.formatBox.setFont(font)
-        self.formatBox.addItem("jpg")
-        self.formatBox.addItem("png")
-        self.formatBox.addItem("pdf")
-        self.formatBox.setMaximumSize(QtCore.QSize(50, 16777215))
-        self.gridLayoutSave.addWidget(self.formatBox, 2, 2, 1, 1)
-        # dpi label
-        self.dpiLabel = QtWidgets.QLabel(self.saveDialog)
-        self.dpiLabel.setObjectName("dpiLabel")
-        self.dpiLabel.setFont(font)
-        self.dpiLabel.setMaximumSize(QtCore.QSize(75, 16777215))
-        sizePolicy.setHeightForWidth(self.dpiLabel.sizePolicy().hasHeightForWidth())
-        self.dpiLabel.setSizePolicy(sizePolicy)
-        self.dpiLabel.setFrameShape(QtWidgets.QFrame.Box)
-        self.dpiLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.gridLayoutSave.addWidget(self.dpiLabel, 3, 0, 1, 1)
-        # dpi input box
-        self.dpiInput = ClickableLineEdit(self.saveDialog)
-        self.dpiInput.setObjectName("lineEdit")
-        self.dpiInput.setStyleSheet("color: gray")
-        self.dpiInput.setFont(font)
-        self.dpiInput.clicked.connect(self.insert_new_dpi)
-        self.dpiInput.editingFinished.connect(self.update_dpi)
-        self.gridLayoutSave.addWidget(self.dpiInput, 3, 1, 1, 1)
-        # save button
-        self.saveButton = QtWidgets.QPushButton(self.saveDialog)
-        font = QtGui.QFont()
-        font.setPointSize(9)
-        font.setBold(True)
-        self.saveButton.setFont(font)
-        self.saveButton.setLayoutDirection(QtCore.Qt.LeftToRight)
-        self.saveButton.setObjectName("SaveButton")
-        self.saveButton.clicked.connect(self.save_plots)
-        self.gridLayoutSave.addWidget(self.saveButton, 4, 0, 1, 3)
-
-        self.retranslateUi(self.saveDialog)
-        QtCore.QMetaObject.connectSlotsByName(self.saveDialog)
-
-    def retranslateUi(self, Dialog):
-        _translate = QtCore.QCoreApplication.translate
-        Dialog.setWindowTitle(_translate("Dialog", "Save plots"))
-        self.pathLabel.setText(_translate("Dialog", "Path"))
-        self.filenameLabel.setText(_translate("Dialog", "Filename"))
-        self.browseButton.setText(_translate("Dialog", "..."))
-        self.dpiLabel.setText(_translate("Dialog", "dpi"))
-        self.dpiInput.setText(_translate("Dialog", "300"))
-        self.saveButton.setText(_translate("Dialog", "Save"))
-
-    @QtCore.Slot()
-    def save_plots(self):
-        self.path = self.pathInput.text()
-        self.filename = self.filenameInput.text()
-        self.dpi = float(self.dpiInput.text())
-        self.format = self.formatBox.currentText()
-        if (self.filename[-3:] != "jpg") or (self.filename[-3:] != "png") or (self.filename[-3:] != "pdf"):
-            self.filename = self.filename + "." + self.format
-        self.fullpath = self.path + "/" + self.filename
-        self.parent.plots.save(self.fullpath, self.dpi)
-        self.saveDialog.close()
-
-    @QtCore.Slot()
-    def browse(self):
-        path = QtWidgets.QFileDialog.getExistingDirectory(self.parent.OutputWindow, 'Save File', str(os.getcwd()))
-        self.pathInput.setText(path)
-
-    @QtCore.Slot()
-    def insert_new_dpi(self):
-        self.dpiInput.setStyleSheet("color: black")
-
-    @QtCore.Slot()
-    def update_dpi(self):
-        input_text = self.dpiInput.text()
-        if input_text == '':
-            self.dpiInput.setStyleSheet("color: gray")
-            self.dpiInput.setText("300")
-
-
-# class to handle relaxation time plot
-class PlotTau(FigureCanvasQTAgg):
-    def __init__(self, parent=None, width=15, height=15, dpi=55):
-        super(PlotTau, self).__init__(Figure())
-
-        self.setParent(parent)
-        with plt.rc_context({'lines.linewidth': 1, 'lines.linestyle': ':',
-                                'xtick.labelsize': 10, 'xtick.major.size': 2,
-                                'ytick.labelsize': 10, 'ytick.major.size': 2,
-                                'axes.labelsize': 10, 'font.size': 10}):
-
-            self.figure, self.ax = plt.subplots(1, 1, figsize=(width, height), dpi=dpi)
-            self.figure.subplots_adjust(left=0.2,bottom=0.2)
-            self.canvas = FigureCanvasQTAgg(self.figure)
-            FigureCanvasQTAgg.setSizePolicy(self,QtWidgets.QSizePolicy.Expanding,QtWidgets.QSizePolicy.Expanding)
-            FigureCanvasQTAgg.updateGeometry(self)
-            self.colorbar = None
-
-    def plot(self, mu, tau, T):
-        tau = np.transpose(tau) # python - julia compatibility
-        sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=T.min(), vmax=T.max()))
-        # single line
-        if mu.size == 1:
-            self.ax.plot(T,tau,color=tuple(item / 255 for item in gui_color))
-            self.ax.set_xlabel(r"$T\ [K]$", fontsize=12)
-            self.ax.set_ylabel(r"$\tau$", fontsize=12)
-            self.ax.grid(linewidth=0.5)
-        # one line for each T
-        else:
-            sm.set_array([])
-            for i in range(T.size):
-                self.ax.plot(mu,tau[i,:], color = sm.to_rgba(T[i]))
-            if self.colorbar is None:
-                self.colorbar = plt.colorbar(sm)
-            else:
-                self.colorbar.update_normal(sm)
-            self.ax.set_xlabel(r"$\mu\ [eV]$", fontsize=12)
-            self.ax.set_ylabel(r"$\tau$", fontsize=12)
-            self.ax.grid(linewidth=0.5)
-        self.draw()
-
-
-# class to handle transport coefficients plots
-class PlotsCanvas(FigureCanvasQTAgg):
-    def __init__(self, parent=None, width=5, height=5, dpi=100):
-        super(PlotsCanvas, self).__init__(Figure())
-
-        self.setParent(parent)
-        self.figure, self.ax = plt.subplots(2, 2, figsize=(width, height), dpi=dpi)
-        plt.subplots_adjust(wspace=0.5, hspace=0.5, bottom=0.15)
-        self.ax1 = self.ax[0, 0]; self.ax2 = self.ax[0, 1]; self.ax3 = self.ax[1, 0]; self.ax4 = self.ax[1, 1]
-        self.canvas = FigureCanvasQTAgg(self.figure)
-        FigureCanvasQTAgg.setSizePolicy(self,
-                                   QtWidgets.QSizePolicy.Expanding,
-                                   QtWidgets.QSizePolicy.Expanding)
-        FigureCanvasQTAgg.updateGeometry(self)
-        self.point1 = None; self.point2 = None; self.point3 = None; self.point4 = None
-        self.colorbar1 = None; self.colorbar2 = None; self.colorbar3 = None; self.colorbar4 = None
-
-
-    def plot(self, tensor_name, x, y, z, tau_model, exp_data):
-        self.figure.suptitle(r"$\tau\ $"+tau_model, y=0.97)
-        # plot1: sigma
-        if tensor_name == "conductivity":
-            # single curve
-            if z.size == 1:
-                self.ax1.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color='#1f77b4', label="mu=" + str(np.round(z, 4)), zorder=0)
-            # one curve for each value of Fermi level
-            else:
-                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
-                for i in range(z.size):
-                    self.ax1.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
-                if self.colorbar1 is None:
-                    self.colorbar1 = plt.colorbar(sm,ax=self.ax1)
-                else:
-                    self.colorbar1.update_normal(sm)
-            # plot experimental data (if imported)
-            if exp_data.df is not None:
-                self.ax1.plot(exp_data['temperature'], exp_data[tensor_name], "--", color='dimgray', label="exp")
-            self.ax1.ticklabel_format(style="sci", axis='y', scilimits=(3,0))
-            # self.ax1.set_xlabel(r"$T\ [K]$")
-            self.ax1.set_ylabel(r"$\sigma\ [(\Omega m)^{-1}]$")
-            self.ax1.grid(linewidth=0.3)
-
-        # plot2: seebeck
-        if tensor_name == "seebeck":
-            # single curve
-            if z.size == 1:
-                self.ax2.plot(x, np.multiply(np.squeeze(y), 1e6), "-.", marker='.', fillstyle='none', color="orange", label="mu=" + str(np.round(z, 4)), zorder=0)
-            # one curve for each value of Fermi level
-            else:
-                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
-                for i in range(z.size):
-                    self.ax2.plot(x, np.multiply(y[i,:], 1e6), color=sm.to_rgba(z[i]), linewidth=0.5)
-                if self.colorbar2 is None:
-                    self.colorbar2 = plt.colorbar(sm,ax=self.ax2)
-                else:
-                    self.colorbar2.update_normal(sm)
-            if exp_data.df is not None:
-                self.ax2.plot(exp_data['temperature'], np.multiply(exp_data[tensor_name], 1e6), "--", color='dimgray', label="exp")
-            # self.ax2.set_xlabel(r"$T\ [K]$")
-            self.ax2.set_ylabel(r"$S\ [\mu VK^{-1}]$")
-            self.ax2.grid(linewidth=0.3)
-
-        # plot3: thermal
-        if tensor_name == "thermal":
-            # single curve
-            if z.size == 1:
-                self.ax3.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color="red", label="mu=" + str(np.round(z, 4)), zorder=0)
-            else:
-                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
-                for i in range(z.size):
-                    self.ax3.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
-                if self.colorbar3 is None:
-                    self.colorbar3 = plt.colorbar(sm,ax=self.ax3)
-                else:
-                    self.colorbar3.update_normal(sm)
-            if exp_data.df is not None:
-                self.ax3.plot(exp_data['temperature'], exp_data[tensor_name], "--", color='dimgray', label="exp")
-            self.ax3.set_xlabel(r"$T\ [K]$")
-            self.ax3.set_ylabel(r"$\kappa_{e}\ [WK^{-1}]$")
-            self.ax3.grid(linewidth=0.3)
-
-        # plot4: concentration
-        if tensor_name == "concentration":
-            # single curve
-            if z.size == 1:
-                self.ax4.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color="limegreen", label="mu=" + str(np.round(z, 4)), zorder=0)
-            # one curve for each value of Fermi level
-            else:
-                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
-                for i in range(z.size):
-                    self.ax4.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
-                if self.colorbar4 is None:
-                    self.colorbar4 = plt.colorbar(sm,ax=self.ax4)
-                else:
-                    self.colorbar4.update_normal(sm)
-            if exp_data.df is not None:
-                self.ax4.plot(exp_data['temperature'], exp_data[tensor_name], "--", color='dimgray', label="exp")
-            self.ax4.set_xlabel(r"$T\ [K]$")
-            self.ax4.set_ylabel("n")
-            self.ax4.grid(linewidth=0.3)
-
-        self.draw()
-
-    # save the plots
-    def save(self, fullpath, dpi):
-        self.ax1.set_title(""); self.ax2.set_title(""); self.ax3.set_title(""); self.ax4.set_title("")
-        plt.savefig(fullpath, dpi=dpi)
-
-
-if __name__ == "__main__":
-    import subprocess
-
-    import platform
-    if platform.system() == "Windows":
-        import ctypes
-        myappid = 'Mstar2t.bonal1l@cmich.edu' # arbitrary string
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-
-    # display
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
-
-    # server
-    server = subprocess.Popen(['julia', '../run_server.jl'])
-
-    # logo
-    app = QtWidgets.QApplication(sys.argv)
-    screen = app.primaryScreen()
-    loading = LoadingScreen(screen.size())
-    app.exec_()
-
-    # GUI
-    app = QtWidgets.QApplication.instance()
-    app.setStyleSheet(mySetStyleSheet)  # design
-    InputWindow = MainWindow(server)
-    ui_in = UiInputWindow()
-    ui_in.setupUi(InputWindow)
-    InputWindow.show()
-    ui_in.check_server_status()
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #                        
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import os
+import sys
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+import pandas as pd
+import itertools
+
+import requests
+from PySide2 import QtCore, QtGui, QtWidgets
+
+import matplotlib
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+import matplotlib.pyplot as plt
+import matplotlib.cm     as cm
+matplotlib.use('Qt5Agg')
+
+from utils.utils import LoadingScreen, ClickableLineEdit, QRoundProgressBar
+from utils.exp_loader import EXP_LABELS, ExpDataLoader, check_labels
+from utils.mu_fit import METRICS, fit_mu, trace_at_mu
+from utils.fitting import FitParameter, ServerEngine, Objective, BoundedLeastSquares, FitWorker
+
+# shared Interface modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.server_pool import ServerPool, STUB_SERVER
+from common.result_cache import GridResultCache
+from common.adaptive_grid import AdaptiveMuGrid
+from common.profiler import Profiler
+from common.bands import BandError, normalize_bands
+from utils.tau_models import ERR_TAU_MODEL, ERR_TAU_DOMAIN, ERR_MATTHIESSEN, TauEvaluator, TauPreview, preflight
+from utils.progressive import ProgressiveCompute
+from utils.plot_export import EXPORT_FORMATS, PlotExportQueue, export_targets
+from utils.data_browser import TENSORS, ResultTableModel
+from utils.tensors import COMPONENTS, MERITS, figures_of_merit, principal, anisotropy, directional, plane_directions
+
+
+############ DESIGN PARAMETERS ############
+# matplotlib params
+plt.rcParams['font.size'] = 9
+plt.rcParams['axes.titlesize'] = 14
+plt.rcParams['axes.linewidth'] = 0.5
+plt.rcParams['axes.labelsize'] = 9
+plt.rcParams['axes.titlepad'] = 11
+plt.rcParams['axes.spines.bottom'] = True
+plt.rcParams['axes.spines.left'] = True
+plt.rcParams['axes.spines.top'] = False
+plt.rcParams['axes.spines.right'] = False
+plt.rcParams['xtick.major.size'] = 2
+plt.rcParams['xtick.labelsize'] = 7
+plt.rcParams['ytick.major.size'] = 2
+plt.rcParams['ytick.labelsize'] = 7
+plt.rcParams['legend.fontsize'] = 7
+plt.rcParams["legend.loc"] = "upper left"
+plt.rcParams["lines.linewidth"] = 1
+plt.rcParams['lines.markersize'] = 5
+
+# general design params
+gui_color = (31,161,135)
+Qt_gui_color = QtGui.QColor(gui_color[0],gui_color[1],gui_color[2])
+header_color = "rgb({}, {}, {})".format(gui_color[0],gui_color[1],gui_color[2])
+mySetStyleSheet = """QHeaderView::section{
+border-top:0px solid #D8D8D8;
+border-left:0px solid #D8D8D8;
+border-right:1px solid #D8D8D8;
+border-bottom:1px solid #D8D8D8;
+background-color: %s;
+color:white;
+padding:4px;}
+QTableCornerButton::section{
+border-top:0px solid #D8D8D8;
+border-left:0px solid #D8D8D8;
+border-right:1px solid #D8D8D8;
+border-bottom: 1px solid #D8D8D8;
+background-color:white;}""" % (header_color)
+
+# error codes of the relaxation time as shown in place of the τ plot
+TAU_ERRORS = {ERR_TAU_MODEL: "τ identically zero", ERR_TAU_DOMAIN: "domain error in the τ function",
+              ERR_MATTHIESSEN: "no model selected for Matthiessen's rule"}
+
+# tensors of the GUI, in the order of the panels and of the rows of the outputTable
+TENSOR_NAMES = ("conductivity", "seebeck", "thermal", "concentration")
+TENSOR_SYMBOLS = {"conductivity": ("σ", "electrical conductivity"), "seebeck": ("S", "Seebeck coefficient"),
+                  "thermal": ("κₑ", "electronic thermal conductivity"), "concentration": ("n", "carrier concentration")}
+
+###########################################
+
+
+############# DATA STRUCTURES #############
+# class to store input params 
+class Data(object):
+    def __init__(self):
+        self.export_all_data = False # TODO: implement button
+        self.num_cbands = 0
+        self.num_vbands = 0
+        self.num_bands = 0
+        self.cTensors = list()
+        self.mband = list()
+        self.ebandmins = list()
+        self.degeneracies = list()
+        self.T_str = "[300:1000:100]"
+        self.mu_str = "0.5"
+        self.T = 0
+        self.mu = 0
+        self.tau_model_type = "constant"
+        self.tau_acoustic_coeffs = list()
+        self.tau_impurity_coeffs = list()
+        self.tau_matthiessen_models = "000"
+        self.tau_matthiessen_gamma = "0.0"
+
+# class to store experimental data (one dataset for each imported file)
+class ExpDataDB(object):
+    def __init__(self):
+        self.datasets = dict()
+        self.selected = None
+        self.verHeader = list(EXP_LABELS)
+
+    def __getitem__(self, key):
+        return self.datasets[self.selected][key]
+
+    def __contains__(self, key):
+        return self.isloaded() and key in self.datasets[self.selected]
+
+    def set_exp_data(self, name, rows):
+        check_labels(rows)
+        self.datasets[name] = rows
+        self.selected = name
+
+    def select(self, name):
+        self.selected = name if name in self.datasets else None
+
+    def isloaded(self):
+        return self.selected is not None
+
+    def clear(self):
+        self.datasets.clear()
+        self.selected = None
+
+
+# class to store output data
+class ResultAllCompData(object):
+    def __init__(self):
+        self.num_t = None
+        self.num_mu = None
+        self.conductivity = None
+        self.seebeck = None
+        self.thermal = None
+        self.concentration = None
+        # figures of merit of the tensors above, for one lattice thermal conductivity
+        self.merits = None
+        self.kappa_lattice = None
+
+    def setTmu(self, num_mu, num_t):
+        self.num_mu = num_mu
+        self.num_t = num_t
+        self.preallocate_tensors()
+
+    def preallocate_tensors(self):
+        self.conductivity = np.empty((6, self.num_mu, self.num_t))
+        self.seebeck = np.empty((6, self.num_mu, self.num_t))
+        self.thermal = np.empty((6, self.num_mu, self.num_t))
+        self.concentration = np.empty((1, self.num_mu, self.num_t))
+
+    def setCond(self, tensor):
+        self.conductivity = tensor
+        self.merits = None
+
+    def setSeebeck(self, tensor):
+        self.seebeck = tensor
+        self.merits = None
+
+    def setThermal(self, tensor):
+        self.thermal = tensor
+        self.merits = None
+
+    def setConc(self, tensor):
+        self.concentration = tensor
+
+    # tensor not computed (or no longer selected)
+    def drop(self, tensor_name):
+        setattr(self, tensor_name, None)
+        self.merits = None
+
+    def clear(self):
+        self.conductivity = None
+        self.seebeck = None
+        self.thermal = None
+        self.concentration = None
+        self.merits = None
+
+    # (traces, tensors) of the figures of merit, computed once for each kappa_lattice
+    def figuresOfMerit(self, T, kappa_lattice=0.0):
+        if self.merits is None or self.kappa_lattice != kappa_lattice:
+            self.merits = figures_of_merit(self.conductivity, self.seebeck, self.thermal, T, kappa_lattice)
+            self.kappa_lattice = kappa_lattice
+        return self.merits
+
+    def isallocated(self):
+        return True if ((self.num_mu is not None) or (self.num_t is not None)) else False
+
+
+# class to store output data (trace of each matrix)
+class ResultTraceData(object):
+    def __init__(self):
+        self.data = []
+        self.label = []
+
+    def clear(self):
+        self.data = []
+        self.label = []
+
+###########################################
+
+# pyqt main window
+class MainWindow(QtWidgets.QMainWindow):
+    def __init__(self, server=None):
+        super(MainWindow, self).__init__()
+        self.server = server
+
+    def closeEvent(self, event):
+        if self.server is not None:
+            self.server.terminate()
+        event.accept()
+
+# input window
+class UiInputWindow(object):
+    def __init__(self):
+        self.is_first_run_thread_active = True
+        self.is_first_run_completed = False
+        self.data = Data()
+        self.exp_data = ExpDataDB()
+        self.exp_loaders = list()
+        self.out_trace_data = ResultTraceData()
+        self.out_all_data = ResultAllCompData()
+        self.profiler = Profiler()
+        self.grid_cache = GridResultCache()
+        self.adaptive_grid = AdaptiveMuGrid()
+        self.adaptive_responses = dict()
+        self.run_adaptive = False
+        self.run_message = None
+        self.args = list()
+        self.progressive = None
+        self.progressive_run = 0
+        self.stopped_runs = list()
+        self.sliders_connected = False
+        self.tau_evaluator = TauEvaluator()
+        self.tau_generation = 0
+        self.tau_preview_message = None
+
+    def setupUi(self, InputWindow):
+        self.InputWindow = InputWindow
+        # pool of computing servers (the default server if the window does not own one)
+        self.server = InputWindow.server if InputWindow.server is not None else ServerPool(launch=False).start()
+        self.InputWindow.setObjectName("InputWindow")
+        self.InputWindow.resize(730, 642)
+        self.InputWindow.setAutoFillBackground(False)
+        self.appIcon = QtGui.QIcon("./images/icon.png")
+        self.InputWindow.setWindowIcon(self.appIcon)
+        self.OutputWindow = QtWidgets.QMainWindow()
+        self.ui_out = UiOutputWindow(self)
+        self.ui_out.setupUi(self.OutputWindow)
+        self.OutputWindow.show()
+        self.centralwidget = QtWidgets.QWidget(self.InputWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridFrame = QtWidgets.QFrame(self.centralwidget)
+        self.gridFrame.setGeometry(QtCore.QRect(280, 5, 211, 41))
+        self.gridFrame.setObjectName("gridFrame")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridFrame)
+        self.gridLayout.setContentsMargins(-1, 1, -1, -1)
+        self.gridLayout.setObjectName("gridLayout")
+        self.InputWindow.setCentralWidget(self.centralwidget)
+
+        # menubar
+        self.menubar = QtWidgets.QMenuBar(self.InputWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 819, 20))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuHelp = QtWidgets.QMenu(self.menubar)
+        self.menuHelp.setObjectName("menuHelp")
+        self.InputWindow.setMenuBar(self.menubar)
+        # status bar
+        self.statusbar = QtWidgets.QStatusBar(self.InputWindow)
+        self.statusbar.setObjectName("statusbar")
+        self.InputWindow.setStatusBar(self.statusbar)
+
+        # bars actions
+        self.actionImportData = QtWidgets.QAction(self.InputWindow)
+        self.actionImportData.setObjectName("actionImportData")
+        self.actionImportData.triggered.connect(self.import_exp_data)
+        self.actionExit = QtWidgets.QAction(self.InputWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionExit.triggered.connect(self.exit)
+        self.actionAbout = QtWidgets.QAction(self.InputWindow)
+        self.actionAbout.setObjectName("actionAbout")
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addAction(self.actionImportData)
+        self.menuFile.addAction(self.actionExit)
+        self.menuHelp.addAction(self.actionAbout)
+
+        # header
+        ## title
+        font_title = QtGui.QFont()
+        font_title.setPointSize(12)
+        font_title.setBold(True)
+        self.inputlabel = QtWidgets.QLabel(self.centralwidget)
+        self.inputlabel.setGeometry(QtCore.QRect(269, 20, 193, 40))
+        self.inputlabel.setFont(font_title)
+        self.inputlabel.setTextFormat(QtCore.Qt.PlainText)
+        self.inputlabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.inputlabel.setIndent(0)
+        self.inputlabel.setObjectName("inputlabel")
+        ## server status
+        ### server box
+        self.serverBox = QtWidgets.QGroupBox(self.centralwidget)
+        self.serverBox.setGeometry(QtCore.QRect(537, 25, 150, 60))
+        self.serverBox.setStyleSheet("QGroupBox#serverBox {background-color: none; border:0px;}")
+        self.serverBox.setTitle("")
+        self.serverBox.setObjectName("serverBox")
+        ### server label
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.serverLabel = QtWidgets.QLabel(self.serverBox)
+        self.serverLabel.setGeometry(QtCore.QRect(0, 5, 90, 20))
+        self.serverLabel.setFont(font)
+        self.serverLabel.setObjectName("serverLabel")
+        ### down signal
+        self.redSignal = QtWidgets.QLabel(self.serverBox)
+        self.redSignal.setGeometry(QtCore.QRect(90, 5, 32, 20))
+        self.redSignal.setScaledContents(True)
+        self.redSignal.setPixmap(QtGui.QPixmap('./images/down.png'))
+        self.redSignal.setObjectName('redSignal')
+        ### up signal
+        self.greenSignal = QtWidgets.QLabel(self.serverBox)
+        self.greenSignal.setGeometry(QtCore.QRect(110, 5, 32, 20))
+        self.greenSignal.setScaledContents(True)
+        self.greenSignal.setPixmap(QtGui.QPixmap('./images/up.png'))
+        self.greenSignal.setVisible(False)
+        self.greenSignal.setObjectName('greenSignal')
+
+        # INPUT section
+        ## input box
+        self.inputBox = QtWidgets.QGroupBox(self.centralwidget)
+        self.inputBox.setGeometry(QtCore.QRect(55, 60, 620, 435))
+        self.inputBox.setStyleSheet("QGroupBox{background-color: white}")
+        self.inputBox.setTitle("")
+        self.inputBox.setObjectName("inputGroupBox")
+
+        ## conduction bands
+        ### title
+        self.CondText = QtWidgets.QLabel(self.inputBox)
+        self.CondText.setGeometry(QtCore.QRect(9, 10, 235, 25))
+        self.CondText.setStyleSheet("Background-color:white;border: 0.8px solid black;")
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.CondText.setFont(font)
+        self.CondText.setObjectName("CondText")
+        ### font
+        ctfont = QtGui.QFont()
+        ctfont.setBold(False)
+        ctfont.setPointSize(8)
+        ### spin box -> number of conduction bands
+        self.CondSpin = QtWidgets.QSpinBox(self.inputBox)
+        self.CondSpin.setGeometry(QtCore.QRect(243, 10, 62, 25))
+        self.CondSpin.setObjectName("CondSpin")
+        self.CondSpin.setValue(0)
+        self.CondSpin.setFont(ctfont)
+        self.CondSpin.valueChanged.connect(self.add_cond_band)
+        ### conduction bands params table
+        self.CondTable = QtWidgets.QTableWidget(self.inputBox)
+        self.CondTable.setGeometry(QtCore.QRect(8, 33, 297, 120))
+        self.CondTable.setMinimumSize(QtCore.QSize(201, 71))
+        self.CondTable.setFont(ctfont)
+        self.CondTable.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+        self.CondTable.setAutoFillBackground(False)
+        self.CondTable.setFrameShape(QtWidgets.QFrame.Box)
+        self.CondTable.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.CondTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.CondTable.setLineWidth(1)
+        self.CondTable.setMidLineWidth(1)
+        self.CondTable.setTabKeyNavigation(True)
+        self.CondTable.setDragDropOverwriteMode(False)
+        self.CondTable.setAlternatingRowColors(True)
+        self.CondTable.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.CondTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.CondTable.setIconSize(QtCore.QSize(1, 1))
+        self.CondTable.setShowGrid(True)
+        self.CondTable.setGridStyle(QtCore.Qt.SolidLine)
+        self.CondTable.setRowCount(0)
+        self.CondTable.setColumnCount(4)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 255))
+        brush.setStyle(QtCore.Qt.NoBrush)
+        item.setForeground(brush)
+        self.CondTable.setVerticalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.CondTable.setVerticalHeaderItem(1, item)
+        font_hh = QtGui.QFont()
+        font_hh.setPointSize(8)
+        font_hh.setBold(True)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.CondTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.CondTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.CondTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.CondTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.CondTable.setItem(0, 0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.CondTable.setItem(0, 1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.CondTable.setItem(0, 2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.CondTable.setItem(0, 3, item)
+        self.CondTable.horizontalHeader().setVisible(True)
+        self.CondTable.horizontalHeader().setCascadingSectionResizes(True)
+        self.CondTable.horizontalHeader().setDefaultSectionSize(73)
+        self.CondTable.horizontalHeader().setHighlightSections(True)
+        self.CondTable.horizontalHeader().setMinimumSectionSize(49)
+        self.CondTable.horizontalHeader().setSortIndicatorShown(True)
+        self.CondTable.horizontalHeader().setStretchLastSection(False)
+        self.CondTable.horizontalHeader().setFixedHeight(28)
+        self.CondTable.verticalHeader().setVisible(False)
+        self.CondTable.verticalHeader().setHighlightSections(True)
+        self.CondTable.verticalHeader().setSortIndicatorShown(False)
+        self.CondTable.verticalHeader().setStretchLastSection(False)
+        self.CondTable.setObjectName("CondTable")
+
+        ## valence bands
+        ### title
+        self.ValText = QtWidgets.QLabel(self.inputBox)
+        self.ValText.setGeometry(QtCore.QRect(314, 10, 245, 25))
+        self.ValText.setStyleSheet("Background-color:white;border: 0.8px solid black;")
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.ValText.setFont(font)
+        self.ValText.setObjectName("ValText")
+        ### font
+        vtfont = QtGui.QFont()
+        vtfont.setPointSize(8)
+        vtfont.setBold(False)
+        ### spin box -> number of valence bands
+        self.ValSpin = QtWidgets.QSpinBox(self.inputBox)
+        self.ValSpin.setGeometry(QtCore.QRect(550, 10, 60, 25))
+        self.ValSpin.setObjectName("ValSpin")
+        self.ValSpin.setValue(0)
+        self.ValSpin.setFont(vtfont)
+        self.ValSpin.valueChanged.connect(self.add_val_band)
+        ### valence bands params table
+        self.ValTable = QtWidgets.QTableWidget(self.inputBox)
+        self.ValTable.setGeometry(QtCore.QRect(313, 33, 297, 120))
+        self.ValTable.setMinimumSize(QtCore.QSize(201, 72))
+        self.ValTable.setFont(vtfont)
+        self.ValTable.setMouseTracking(False)
+        self.ValTable.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+        self.ValTable.setAutoFillBackground(False)
+        self.ValTable.setFrameShape(QtWidgets.QFrame.Box)
+        self.ValTable.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.ValTable.setLineWidth(1)
+        self.ValTable.setMidLineWidth(1)
+        self.ValTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.ValTable.setTabKeyNavigation(True)
+        self.ValTable.setDragDropOverwriteMode(False)
+        self.ValTable.setAlternatingRowColors(True)
+        self.ValTable.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.ValTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.ValTable.setIconSize(QtCore.QSize(1, 1))
+        self.ValTable.setShowGrid(True)
+        self.ValTable.setGridStyle(QtCore.Qt.SolidLine)
+        self.ValTable.setRowCount(0)
+        self.ValTable.setColumnCount(4)
+        self.ValTable.horizontalHeader().setFont(font)
+        font = self.ValTable.horizontalHeader().font()
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.ValTable.setVerticalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.ValTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setFont(font_hh)
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.ValTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.ValTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_hh)
+        self.ValTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.ValTable.setItem(0, 0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.ValTable.setItem(0, 1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.ValTable.setItem(0, 2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.ValTable.setItem(0, 3, item)
+        self.ValTable.horizontalHeader().setVisible(True)
+        self.ValTable.horizontalHeader().setCascadingSectionResizes(True)
+        self.ValTable.horizontalHeader().setDefaultSectionSize(73)
+        self.ValTable.horizontalHeader().setHighlightSections(True)
+        self.ValTable.horizontalHeader().setMinimumSectionSize(49)
+        self.ValTable.horizontalHeader().setSortIndicatorShown(True)
+        self.ValTable.horizontalHeader().setStretchLastSection(False)
+        self.ValTable.horizontalHeader().setFixedHeight(25)
+        self.ValTable.verticalHeader().setVisible(False)
+        self.ValTable.verticalHeader().setHighlightSections(True)
+        self.ValTable.verticalHeader().setSortIndicatorShown(False)
+        self.ValTable.verticalHeader().setStretchLastSection(False)
+        self.ValTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.ValTable.setObjectName("ValTable")
+
+        ## Thermodynamics params
+        self.tmuBox = QtWidgets.QGroupBox(self.inputBox)
+        self.tmuBox.setGeometry(QtCore.QRect(10, 205, 200, 54))
+        self.tmuBox.setStyleSheet("Background-color:white")
+        self.tmuBox.setTitle("")
+        self.tmuBox.setObjectName("tmuBox")
+        ### temperature title
+        self.tLabel = QtWidgets.QLabel(self.tmuBox)
+        self.tLabel.setGeometry(QtCore.QRect(0, 0, 100, 28))
+        self.tLabel.setStyleSheet("Background-color: {}; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color:white".format(header_color))
+        self.tLabel.setFont(font_hh)
+        self.tLabel.setTextFormat(QtCore.Qt.PlainText)
+        self.tLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.tLabel.setIndent(0)
+        self.tLabel.setObjectName("tLabel")
+        ### temperature input 
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.tInput = ClickableLineEdit(self.tmuBox)
+        self.tInput.setGeometry(QtCore.QRect(0, 25, 100, 28))
+        self.tInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color: gray}")        
+        self.tInput.clicked.connect(self.insert_new_temperature)
+        self.tInput.editingFinished.connect(self.update_temp)
+        self.tInput.setFont(font)
+        self.tInput.setAlignment(QtCore.Qt.AlignCenter)
+        self.tInput.setObjectName("tInput")
+        ### Fermi level title
+        self.muLabel = QtWidgets.QLabel(self.tmuBox)
+        self.muLabel.setGeometry(QtCore.QRect(99, 0, 100, 28))
+        self.muLabel.setStyleSheet("Background-color: {}; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color:white".format(header_color))
+        self.muLabel.setFont(font_hh)
+        self.muLabel.setTextFormat(QtCore.Qt.PlainText)
+        self.muLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.muLabel.setIndent(0)
+        self.muLabel.setObjectName("muLabel")
+        ### Fermi level input
+        self.muInput = ClickableLineEdit(self.tmuBox)
+        self.muInput.setGeometry(QtCore.QRect(99, 25, 100, 28))
+        self.muInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color: gray}")
+        self.muInput.clicked.connect(self.insert_new_mu)
+        self.muInput.editingFinished.connect(self.update_mu)
+        self.muInput.setFont(font)
+        self.muInput.setAlignment(QtCore.Qt.AlignCenter)
+        self.muInput.setObjectName("muInput")
+        ### adaptive Fermi level grid: the μ step is the finest resolution
+        self.adaptiveBox = QtWidgets.QCheckBox(self.inputBox)
+        self.adaptiveBox.setGeometry(QtCore.QRect(12, 262, 198, 16))
+        self.adaptiveBox.setFont(font)
+        self.adaptiveBox.setStyleSheet("border: 0px")
+        self.adaptiveBox.setObjectName("adaptiveBox")
+        ### coarse-to-fine passes: plots after the first strided subset of the grid
+        self.progressiveBox = QtWidgets.QCheckBox(self.inputBox)
+        self.progressiveBox.setGeometry(QtCore.QRect(12, 280, 198, 16))
+        self.progressiveBox.setFont(font)
+        self.progressiveBox.setStyleSheet("border: 0px")
+        self.progressiveBox.setObjectName("progressiveBox")
+        ### tensors requested to the server, the others are computed when ticked
+        self.tensorBoxes = dict()
+        for i, tensor_name in enumerate(TENSOR_NAMES):
+            checkBox = QtWidgets.QCheckBox(self.inputBox)
+            checkBox.setGeometry(QtCore.QRect(12 + 48*i, 300, 44, 16))
+            checkBox.setFont(font)
+            checkBox.setStyleSheet("border: 0px")
+            checkBox.setChecked(True)
+            checkBox.setObjectName(tensor_name + "Box")
+            checkBox.toggled.connect(self.tensor_toggled)
+            self.tensorBoxes[tensor_name] = checkBox
+
+        ## Relexation time box
+        self.tauBox = QtWidgets.QGroupBox(self.inputBox)
+        self.tauBox.setGeometry(QtCore.QRect(233, 160, 377, 265))
+        self.tauBox.setStyleSheet("background-color: white; border:1px solid darkGray;")
+        self.tauBox.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.tauBox.setObjectName("tauBox")
+        ### relexation time title
+        self.tauTitle = QtWidgets.QLabel(self.tauBox)
+        self.tauTitle.setGeometry(QtCore.QRect(143, 5, 80, 20))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.tauTitle.setStyleSheet("background-color: white; border:0px;")
+        self.tauTitle.setFont(font)
+        self.tauTitle.setObjectName("tauTitle")
+        ### relexation time combobox [constant/acoustic/impurity/matthiessen]
+        self.comboBox = QtWidgets.QComboBox(self.tauBox)
+        self.comboBox.setGeometry(QtCore.QRect(204, 5, 115, 20))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.comboBox.setFont(font)
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        # self.comboBox.currentIndexChanged.connect(self.computetau)
+        self.comboBox.setObjectName("comboBox")
+        ### relexation time plot button
+        self.TauplotButton = QtWidgets.QPushButton(self.tauBox)
+        self.TauplotButton.setGeometry(QtCore.QRect(322, 5, 50, 20))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        self.TauplotButton.setFont(font)
+        self.TauplotButton.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.TauplotButton.setAutoFillBackground(True)
+        self.TauplotButton.setStyleSheet("QPushButton {background-color: lightgray;} QPushButton:hover{background-color: %s;}" % (header_color))
+        self.TauplotButton.blockSignals(True)
+        self.TauplotButton.clicked.connect(self.computetau)
+        self.TauplotButton.setObjectName("TauplotButton")
+        ### acoustic relexation time coeff
+        #### title
+        self.acTitle = QtWidgets.QLabel(self.tauBox)
+        self.acTitle.setGeometry(QtCore.QRect(295, 28, 75, 20))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.acTitle.setStyleSheet("background-color: white; border:0px;")
+        self.acTitle.setFont(font)
+        self.acTitle.setObjectName("acTitle")
+        #### table
+        font_ac = QtGui.QFont()
+        font_ac.setPointSize(8)
+        self.TauAcousticCoeffTable = QtWidgets.QTableWidget(self.tauBox)
+        self.TauAcousticCoeffTable.setStyleSheet("background-color: white; border:1px solid darkGray;")
+        self.TauAcousticCoeffTable.setGeometry(QtCore.QRect(5, 45, 367, 52))
+        self.TauAcousticCoeffTable.setMinimumSize(QtCore.QSize(0, 0))
+        self.TauAcousticCoeffTable.setFont(font_ac)
+        self.TauAcousticCoeffTable.setFrameShape(QtWidgets.QFrame.Box)
+        self.TauAcousticCoeffTable.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.TauAcousticCoeffTable.setLineWidth(1)
+        self.TauAcousticCoeffTable.setMidLineWidth(1)
+        self.TauAcousticCoeffTable.setAutoFillBackground(False)
+        self.TauAcousticCoeffTable.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.TauAcousticCoeffTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.TauAcousticCoeffTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.TauAcousticCoeffTable.setShowGrid(True)
+        self.TauAcousticCoeffTable.setGridStyle(QtCore.Qt.SolidLine)
+        self.TauAcousticCoeffTable.setCornerButtonEnabled(True)
+        self.TauAcousticCoeffTable.setColumnCount(6)
+        self.TauAcousticCoeffTable.setRowCount(1)
+        item = QtWidgets.QTableWidgetItem()
+        self.TauAcousticCoeffTable.setVerticalHeaderItem(0, item)
+        font_tau = QtGui.QFont()
+        font_tau.setPointSize(8)
+        font_tau.setBold(True)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauAcousticCoeffTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauAcousticCoeffTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauAcousticCoeffTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauAcousticCoeffTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauAcousticCoeffTable.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauAcousticCoeffTable.setHorizontalHeaderItem(5, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauAcousticCoeffTable.setItem(0, 0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauAcousticCoeffTable.setItem(0, 1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauAcousticCoeffTable.setItem(0, 2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauAcousticCoeffTable.setItem(0, 3, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauAcousticCoeffTable.setItem(0, 4, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauAcousticCoeffTable.setItem(0, 5, item)
+        self.TauAcousticCoeffTable.horizontalHeader().setVisible(True)
+        self.TauAcousticCoeffTable.horizontalHeader().setCascadingSectionResizes(True)
+        self.TauAcousticCoeffTable.horizontalHeader().setDefaultSectionSize(15)
+        self.TauAcousticCoeffTable.horizontalHeader().setHighlightSections(True)
+        self.TauAcousticCoeffTable.horizontalHeader().setMinimumSectionSize(15)
+        self.TauAcousticCoeffTable.verticalHeader().setVisible(False)
+        self.TauAcousticCoeffTable.horizontalHeader().setFixedHeight(25)
+        self.TauAcousticCoeffTable.verticalHeader().setSortIndicatorShown(False)
+        self.TauAcousticCoeffTable.verticalHeader().setStretchLastSection(False)
+        self.TauAcousticCoeffTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.TauAcousticCoeffTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.TauAcousticCoeffTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
+        self.TauAcousticCoeffTable.itemChanged.connect(self.schedule_tau_preview)
+        self.TauAcousticCoeffTable.setObjectName("TauAcousticCoeffTable")
+        #### acoustic relaxation time e_min param box
+        self.acousBox = QtWidgets.QComboBox(self.tauBox)
+        self.acousBox.setGeometry(QtCore.QRect(5, 98, 120, 20))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.acousBox.setFont(font)
+        self.acousBox.addItem("")
+        self.acousBox.setObjectName("acousBox")
+        #### update acousbox button
+        self.updateAcousBoxButton = QtWidgets.QPushButton(self.tauBox)
+        self.updateAcousBoxButton.setStyleSheet("QPushButton#updateAcousBoxButton {border-image: url(./images/update.png); background-repeat: no-repeat;} QPushButton#updateAcousBoxButton:hover{border-image: url(./images/updatehover.png); background-repeat: no-repeat;} ")
+        self.updateAcousBoxButton.setGeometry(128, 98, 20, 20)
+        self.updateAcousBoxButton.setObjectName("updateAcousBoxButton")
+        self.updateAcousBoxButton.clicked.connect(self.update_ebandmins)
+        ### impurity relexation time coeff
+        #### title
+        self.imTitle = QtWidgets.QLabel(self.tauBox)
+        self.imTitle.setGeometry(QtCore.QRect(294, 105, 75, 15))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.imTitle.setStyleSheet("background-color: white; border:0px;")
+        self.imTitle.setFont(font)
+        self.imTitle.setObjectName("imTitle")
+        #### table
+        self.TauImpurityCoeffTable = QtWidgets.QTableWidget(self.tauBox)
+        self.TauImpurityCoeffTable.setStyleSheet("background-color: white; border:1px solid darkGray;")
+        self.TauImpurityCoeffTable.setGeometry(QtCore.QRect(187, 120, 185, 52))
+        self.TauImpurityCoeffTable.setMinimumSize(QtCore.QSize(0, 0))
+        self.TauImpurityCoeffTable.setFont(font_ac)
+        self.TauImpurityCoeffTable.setFrameShape(QtWidgets.QFrame.Box)
+        self.TauImpurityCoeffTable.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.TauImpurityCoeffTable.setLineWidth(1)
+        self.TauImpurityCoeffTable.setMidLineWidth(1)
+        self.TauImpurityCoeffTable.setAutoFillBackground(False)
+        self.TauImpurityCoeffTable.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.TauImpurityCoeffTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.TauImpurityCoeffTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.TauImpurityCoeffTable.setShowGrid(True)
+        self.TauImpurityCoeffTable.setGridStyle(QtCore.Qt.SolidLine)
+        self.TauImpurityCoeffTable.setCornerButtonEnabled(True)
+        self.TauImpurityCoeffTable.setColumnCount(3)
+        self.TauImpurityCoeffTable.setRowCount(1)
+        item = QtWidgets.QTableWidgetItem()
+        self.TauImpurityCoeffTable.setVerticalHeaderItem(0, item)
+        font_tau = QtGui.QFont()
+        font_tau.setPointSize(8)
+        font_tau.setBold(True)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauImpurityCoeffTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauImpurityCoeffTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        item.setFont(font_tau)
+        self.TauImpurityCoeffTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauImpurityCoeffTable.setItem(0, 0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauImpurityCoeffTable.setItem(0, 1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.TauImpurityCoeffTable.setItem(0, 2, item)
+        self.TauImpurityCoeffTable.horizontalHeader().setVisible(True)
+        self.TauImpurityCoeffTable.horizontalHeader().setCascadingSectionResizes(True)
+        self.TauImpurityCoeffTable.horizontalHeader().setDefaultSectionSize(15)
+        self.TauImpurityCoeffTable.horizontalHeader().setHighlightSections(True)
+        self.TauImpurityCoeffTable.horizontalHeader().setMinimumSectionSize(15)
+        self.TauImpurityCoeffTable.verticalHeader().setVisible(False)
+        self.TauImpurityCoeffTable.horizontalHeader().setFixedHeight(25)
+        self.TauImpurityCoeffTable.verticalHeader().setSortIndicatorShown(False)
+        self.TauImpurityCoeffTable.verticalHeader().setStretchLastSection(False)
+        self.TauImpurityCoeffTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.TauImpurityCoeffTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.TauImpurityCoeffTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
+        self.TauImpurityCoeffTable.itemChanged.connect(self.schedule_tau_preview)
+        self.TauImpurityCoeffTable.setObjectName("TauImpurityCoeffTable")
+        ### Matthiessen's rule
+        #### title
+        self.mrTitle = QtWidgets.QLabel(self.tauBox)
+        self.mrTitle.setGeometry(QtCore.QRect(297, 180, 72, 20))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.mrTitle.setStyleSheet("background-color: white; border:0px;")
+        self.mrTitle.setFont(font)
+        self.mrTitle.setObjectName("mrTitle")
+        #### check box
+        self.checkBoxRect = QtWidgets.QGroupBox(self.tauBox)
+        self.checkBoxRect.setGeometry(QtCore.QRect(187, 197, 185, 20))
+        self.checkBoxRect.setStyleSheet("background-color: white; border:2px solid {};".format(header_color))
+        self.checkBoxRect.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.checkBoxRect.setObjectName("checkBoxRect")
+        self.mr_checkBox_const = QtWidgets.QCheckBox(self.checkBoxRect)
+        self.mr_checkBox_const.setGeometry(QtCore.QRect(4, 2, 50, 14))
+        self.mr_checkBox_const.setFont(font_ac)
+        self.mr_checkBox_const.setStyleSheet("border: 0px")
+        self.mr_checkBox_acoust = QtWidgets.QCheckBox(self.checkBoxRect)
+        self.mr_checkBox_acoust.setGeometry(QtCore.QRect(64, 2, 50, 14))
+        self.mr_checkBox_acoust.setFont(font_ac)
+        self.mr_checkBox_acoust.setStyleSheet("border: 0px")
+        self.mr_checkBox_impur = QtWidgets.QCheckBox(self.checkBoxRect)
+        self.mr_checkBox_impur.setGeometry(QtCore.QRect(124, 2, 50, 14))
+        self.mr_checkBox_impur.setFont(font_ac)
+        self.mr_checkBox_impur.setStyleSheet("border: 0px")
+        #### gamma title
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.mr_gamma_Label = QtWidgets.QLabel(self.tauBox)
+        self.mr_gamma_Label.setGeometry(QtCore.QRect(273, 219, 50, 20))
+        self.mr_gamma_Label.setStyleSheet("Background-color: {}; border-top: 1px solid darkGray; border-bottom: 1px solid darkGray; border-right: 1px solid darkGray; border-left: 1px solid lightGray; color:white".format(header_color))
+        self.mr_gamma_Label.setFont(font)
+        self.mr_gamma_Label.setTextFormat(QtCore.Qt.PlainText)
+        self.mr_gamma_Label.setAlignment(QtCore.Qt.AlignCenter)
+        self.mr_gamma_Label.setObjectName("mr_gamma_Label")
+        #### gamma input
+        font.setBold(False)
+        self.mr_gamma_Input = ClickableLineEdit(self.tauBox)
+        self.mr_gamma_Input.setGeometry(QtCore.QRect(322, 219, 50, 20))
+        self.mr_gamma_Input.setStyleSheet("QLineEdit {Background-color:white; border-top: 1px solid darkGray; border-bottom: 1px solid darkGray; border-right: 1px solid darkGray; border-left: 1px solid lightGray; color: gray}")
+        self.mr_gamma_Input.setFont(font)
+        self.mr_gamma_Input.setAlignment(QtCore.Qt.AlignCenter)
+        self.mr_gamma_Input.setObjectName("muInput")
+        self.mr_gamma_Input.editingFinished.connect(self.computetau)
+        #### error message Matthiessen's rule
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.mr_error_msg = QtWidgets.QLabel(self.tauBox)
+        self.mr_error_msg.setGeometry(QtCore.QRect(235, 240, 137, 12))
+        self.mr_error_msg.setStyleSheet("color:red; border:0px")
+        self.mr_error_msg.setFont(font)
+        self.mr_error_msg.setTextFormat(QtCore.Qt.PlainText)
+        self.mr_error_msg.setVisible(False)
+        self.mr_error_msg.setObjectName("mr_error_msg")
+        #### live preview of the relaxation time while editing
+        self.liveTauBox = QtWidgets.QCheckBox(self.tauBox)
+        self.liveTauBox.setGeometry(QtCore.QRect(189, 240, 45, 14))
+        self.liveTauBox.setFont(font)
+        self.liveTauBox.setStyleSheet("border: 0px")
+        self.liveTauBox.setChecked(True)
+        self.liveTauBox.setObjectName("liveTauBox")
+        # edits restart the timer: one evaluation when the typing pauses
+        self.tau_timer = QtCore.QTimer(self.tauBox)
+        self.tau_timer.setSingleShot(True)
+        self.tau_timer.setInterval(150)
+        self.tau_timer.timeout.connect(self.preview_tau)
+        self.tau_preview = TauPreview()
+        self.tau_preview.ready.connect(self.tau_preview_answer)
+        self.comboBox.currentIndexChanged.connect(self.schedule_tau_preview)
+        self.mr_checkBox_const.stateChanged.connect(self.schedule_tau_preview)
+        self.mr_checkBox_acoust.stateChanged.connect(self.schedule_tau_preview)
+        self.mr_checkBox_impur.stateChanged.connect(self.schedule_tau_preview)
+        self.mr_gamma_Input.textChanged.connect(self.schedule_tau_preview)
+        self.tInput.textChanged.connect(self.schedule_tau_preview)
+        self.muInput.textChanged.connect(self.schedule_tau_preview)
+
+        ### relaxation time plot
+        self.tauplot = PlotTau(self.tauBox)
+        self.tauplot.setGeometry(QtCore.QRect(1, 120, 185, 140))
+        self.tauplot.setStyleSheet("background-color: white; border:1px solid {};".format(header_color))
+
+        # import buttons
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        self.tick_icon = QtGui.QIcon()
+        self.tick_icon.addPixmap(QtGui.QPixmap("./images/tick.png"), QtGui.QIcon.Active, QtGui.QIcon.Off)
+        self.error_icon = QtGui.QIcon()
+        self.error_icon.addPixmap(QtGui.QPixmap("./images/error.jpeg"), QtGui.QIcon.Active, QtGui.QIcon.Off)
+        ## import experimental data 
+        self.ImportExpButton = QtWidgets.QPushButton(self.inputBox)
+        self.ImportExpButton.setGeometry(QtCore.QRect(10, 350, 120, 26))
+        self.ImportExpButton.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.ImportExpButton.setFont(font)
+        self.ImportExpButton.setStyleSheet("QPushButton:hover{background-color: %s;}" % (header_color))
+        self.ImportExpButton.clicked.connect(self.import_exp_data)
+        self.ImportExpButton.setObjectName("ImportButton")
+        ## clear experimental data
+        self.ClearExpButton = QtWidgets.QPushButton(self.inputBox)
+        self.ClearExpButton.setGeometry(QtCore.QRect(10, 375, 120, 26))
+        self.ClearExpButton.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.ClearExpButton.setFont(font)
+        self.ClearExpButton.setStyleSheet("QPushButton:hover{background-color: %s;}" % (header_color))
+        self.ClearExpButton.clicked.connect(self.clear_exp_data)
+        self.ClearExpButton.setObjectName("ClearExpButton")
+        ## select experimental dataset
+        self.ExpDataBox = QtWidgets.QComboBox(self.inputBox)
+        self.ExpDataBox.setGeometry(QtCore.QRect(10, 403, 120, 22))
+        self.ExpDataBox.setFont(font)
+        self.ExpDataBox.currentTextChanged.connect(self.select_exp_data)
+        self.ExpDataBox.setObjectName("ExpDataBox")
+
+        # compute section
+        ## progressbar
+        self.progressBar = QRoundProgressBar(self.centralwidget)
+        self.progressBar.setGeometry(QtCore.QRect(320, 500, 90, 90))
+        self.progressBar.setBarStyle(QRoundProgressBar.StyleDonut)
+        self.progressBar.setDataColors([(0., Qt_gui_color), (0.5, Qt_gui_color), (1., Qt_gui_color)])
+        self.progressBar.setFixedSize(100, 100)
+        self.progressBar.setNullPosition(90)
+        self.progressBar.setValue(0)
+        self.progressBar.setRange(0, 100)
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setObjectName("progressBar")
+        ## compute button
+        self.ComputeButton = QtWidgets.QPushButton(self.centralwidget)
+        self.ComputeButton.setGeometry(330, 510, 80, 80)
+        self.ComputeButton.setStyleSheet("QPushButton#ComputeButton {border-image: url(./images/grun.PNG); background-repeat: no-repeat;} QPushButton#ComputeButton:hover{border-image: url(./images/yrun.PNG); background-repeat: no-repeat;} ")
+        self.ComputeButton.setObjectName("ComputeButton")
+        self.ComputeButton.blockSignals(True)
+        self.ComputeButton.clicked.connect(self.compute)
+        ## stop button of the progressive calculations
+        self.StopButton = QtWidgets.QPushButton(self.centralwidget)
+        self.StopButton.setGeometry(QtCore.QRect(425, 540, 50, 22))
+        self.StopButton.setObjectName("StopButton")
+        self.StopButton.setVisible(False)
+        self.StopButton.clicked.connect(self.stop_compute)
+
+        self.retranslateInputUi(self.InputWindow)
+        QtCore.QMetaObject.connectSlotsByName(self.InputWindow)
+
+    def retranslateInputUi(self, InputWindow):
+        _translate = QtCore.QCoreApplication.translate
+        InputWindow.setWindowTitle(_translate("InputWindow", "InputWindow"))
+        self.menuFile.setTitle(_translate("InputWindow", "File"))
+        self.menuHelp.setTitle(_translate("InputWindow", "Help"))
+        self.actionImportData.setText(_translate("InputWindow", "Import data"))
+        self.actionExit.setText(_translate("InputWindow", "Exit"))
+        self.actionAbout.setText(_translate("InputWindow", "About"))
+        self.inputlabel.setText(_translate("InputWindow", "INPUTS"))
+        self.serverLabel.setText(_translate("InputWindow", "Server status: "))
+        self.ValText.setText(_translate("InputWindow", "Valence band #"))
+        # item = self.ValTable.verticalHeaderItem(0)
+        # item.setText(_translate("InputWindow", "New Row"))
+        item = self.ValTable.horizontalHeaderItem(0)
+        item.setText(_translate("InputWindow", "mx"))
+        item = self.ValTable.horizontalHeaderItem(1)
+        item.setText(_translate("InputWindow", "my"))
+        item = self.ValTable.horizontalHeaderItem(2)
+        item.setText(_translate("InputWindow", "mz"))
+        item = self.ValTable.horizontalHeaderItem(3)
+        item.setText(_translate("InputWindow", "E0"))
+        __sortingEnabled = self.ValTable.isSortingEnabled()
+        self.ValTable.setSortingEnabled(False)
+        self.ValTable.setSortingEnabled(__sortingEnabled)
+        self.CondText.setText(_translate("InputWindow", "Conduction band #"))
+        # item = self.CondTable.verticalHeaderItem(0)
+        # item.setText(_translate("InputWindow", "New Row"))
+        item = self.CondTable.horizontalHeaderItem(0)
+        item.setText(_translate("InputWindow", "mx"))
+        item = self.CondTable.horizontalHeaderItem(1)
+        item.setText(_translate("InputWindow", "my"))
+        item = self.CondTable.horizontalHeaderItem(2)
+        item.setText(_translate("InputWindow", "mz"))
+        item = self.CondTable.horizontalHeaderItem(3)
+        item.setText(_translate("InputWindow", "E0"))
+        __sortingEnabled = self.CondTable.isSortingEnabled()
+        self.CondTable.setSortingEnabled(False)
+        self.CondTable.setSortingEnabled(__sortingEnabled)
+        self.tLabel.setText(_translate("InputWindow", "T [K]"))
+        self.tInput.setText(_translate("InputWindow", "[300:1000:100]"))
+        self.muLabel.setText(_translate("InputWindow", "μ [eV]"))
+        self.muInput.setText(_translate("InputWindow", "0.5"))
+        self.adaptiveBox.setText(_translate("InputWindow", "adaptive μ grid"))
+        self.progressiveBox.setText(_translate("InputWindow", "progressive display"))
+        for tensor_name, (symbol, tooltip) in TENSOR_SYMBOLS.items():
+            self.tensorBoxes[tensor_name].setText(_translate("InputWindow", symbol))
+            self.tensorBoxes[tensor_name].setToolTip(_translate("InputWindow", tooltip))
+        self.StopButton.setText(_translate("InputWindow", "Stop"))
+        self.tauTitle.setText(_translate("InputWindow", "𝛕 models"))
+        self.comboBox.setItemText(0, _translate("MainWindow", "constant"))
+        self.comboBox.setItemText(1, _translate("MainWindow", "acoustic"))
+        self.comboBox.setItemText(2, _translate("MainWindow", "impurity"))
+        self.comboBox.setItemText(3, _translate("MainWindow", "Matthiessen's rule"))
+        self.TauplotButton.setText(_translate("MainWindow", "PLOT"))
+        self.liveTauBox.setText(_translate("MainWindow", "live"))
+        self.acTitle.setText(_translate("InputWindow", "Acoustic scattering"))
+        self.acousBox.setItemText(0, _translate("MainWindow", " -empty- "))
+        # self.acousBox.setItemText(1, _translate("MainWindow", "val_1"))
+        self.imTitle.setText(_translate("InputWindow", "Impurity scattering"))
+        self.mrTitle.setText(_translate("InputWindow", "Matthiessen's rule"))
+        self.mr_checkBox_const.setText(_translate("InputWindow", "const"))
+        self.mr_checkBox_acoust.setText(_translate("InputWindow", "acous"))
+        self.mr_checkBox_impur.setText(_translate("InputWindow", "impur"))
+        self.mr_gamma_Label.setText(_translate("InputWindow", "γ"))
+        self.mr_gamma_Input.setText(_translate("InputWindow", "-1"))
+        item = self.TauAcousticCoeffTable.horizontalHeaderItem(0)
+        item.setText(_translate("InputWindow", "ε_min"))
+        item = self.TauAcousticCoeffTable.item(0,0).setText('0.0')
+        item = self.TauAcousticCoeffTable.horizontalHeaderItem(1)
+        item.setText(_translate("InputWindow", "A_sm"))
+        item = self.TauAcousticCoeffTable.item(0,1).setText('1.0')
+        item = self.TauAcousticCoeffTable.horizontalHeaderItem(2)
+        item.setText(_translate("InputWindow", "τm_max"))
+        item = self.TauAcousticCoeffTable.item(0,2).setText('1.0')
+        item = self.TauAcousticCoeffTable.horizontalHeaderItem(3)
+        item.setText(_translate("InputWindow", "T₀"))
+        item = self.TauAcousticCoeffTable.item(0,3).setText('50.0')
+        item = self.TauAcousticCoeffTable.horizontalHeaderItem(4)
+        item.setText(_translate("InputWindow", "μ_min"))
+        item = self.TauAcousticCoeffTable.item(0,4).setText('2.0')
+        item = self.TauAcousticCoeffTable.horizontalHeaderItem(5)
+        item.setText(_translate("InputWindow", "μ_max"))
+        item = self.TauAcousticCoeffTable.item(0,5).setText('2.0')
+        item = self.TauImpurityCoeffTable.horizontalHeaderItem(0)
+        item.setText(_translate("InputWindow", "ε_im"))
+        item = self.TauImpurityCoeffTable.item(0,0).setText('0.0')
+        item = self.TauImpurityCoeffTable.horizontalHeaderItem(1)
+        item.setText(_translate("InputWindow", "A_im"))
+        item = self.TauImpurityCoeffTable.item(0,1).setText('1.0')
+        item = self.TauImpurityCoeffTable.horizontalHeaderItem(2)
+        item.setText(_translate("InputWindow", "γ_im"))
+        item = self.TauImpurityCoeffTable.item(0,2).setText('1.0')
+        self.mr_error_msg.setText(_translate("InputWindow", "Use checkbox to select scatterings."))
+        self.ComputeButton.setText(_translate("InputWindow", ""))
+        self.ImportExpButton.setText(_translate("InputWindow", "IMPORT DATA"))
+        self.ClearExpButton.setText(_translate("InputWindow", "CLEAR DATA"))
+
+    # initial precalculation operations
+    def check_server_status(self):
+        # run first calculation to compile the code (in parallel)
+        self.first_run_thread = threading.Thread(target=self.first_run, args=(), kwargs={})
+        self.first_run_thread.start()
+        
+    # add/remove line in CondTable according to CondSpin
+    @QtCore.Slot()
+    def add_cond_band(self):
+        self.CondTable.setRowCount(self.CondSpin.value())
+        for row in range(self.CondTable.rowCount()):
+            if self.CondTable.item(row, 0):
+                continue
+            else:
+                for column in range(self.CondTable.columnCount()):
+                    item = QtWidgets.QTableWidgetItem()
+                    item.setTextAlignment(QtCore.Qt.AlignCenter)
+                    self.CondTable.setItem(row, column, item)
+
+    # add/remove line in ValTable according to ValSpin
+    @QtCore.Slot()
+    def add_val_band(self):
+        self.ValTable.setRowCount(self.ValSpin.value())
+        for row in range(self.ValTable.rowCount()):
+            if self.ValTable.item(row, 0):
+                continue
+            else:
+                for column in range(self.ValTable.columnCount()):
+                    item = QtWidgets.QTableWidgetItem()
+                    item.setTextAlignment(QtCore.Qt.AlignCenter)
+                    self.ValTable.setItem(row, column, item)
+
+    # update bands position data structure
+    @QtCore.Slot()
+    def update_ebandmins(self):
+        self.data.ebandmins.clear()
+        self.data.num_cbands = self.CondSpin.value()
+        for c in range(self.data.num_cbands):
+            self.data.ebandmins.append(self.CondTable.item(c, 3).text())
+        self.data.num_vbands = self.ValSpin.value()
+        for v in range(self.data.num_vbands):
+            self.data.ebandmins.append(self.ValTable.item(v, 3).text())
+        self.update_acous_box()
+
+    @QtCore.Slot()
+    def insert_new_temperature(self):
+        self.tInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color: black};")
+
+    @QtCore.Slot()
+    def update_temp(self):
+        input_text = self.tInput.text()
+        if input_text == '':
+            self.tInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-left: 2px solid darkGray; border-right: 1px solid lightGray; color: gray};")
+            self.tInput.setText("[300:1000:100]")
+
+    @QtCore.Slot()
+    def insert_new_mu(self):
+        self.muInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color: black};")
+
+    @QtCore.Slot()
+    def update_mu(self):
+        input_text = self.muInput.text()
+        if input_text == '':
+            self.muInput.setStyleSheet("QLineEdit {Background-color:white; border-top: 2px solid darkGray; border-top: 2px solid darkGray; border-bottom: 2px solid darkGray; border-right: 2px solid darkGray; border-left: 1px solid lightGray; color: gray};")
+            self.muInput.setText("0.5")
+
+
+    # update acousBox with new band params
+    def update_acous_box(self):
+        self.acousBox.clear()
+        num_cond_bands = self.CondSpin.value()
+        num_val_bands = self.ValSpin.value()
+        if num_cond_bands == 0 and num_val_bands == 0:
+            self.acousBox.addItem(" -empty- ")
+        for i in range(num_cond_bands):
+            self.acousBox.addItem("cond_{}, E0 = {}".format(i+1,self.data.ebandmins[i]))
+        for i in range(num_val_bands):
+            self.acousBox.addItem("val_{}, E0 = {}".format(i+1,self.data.ebandmins[num_cond_bands+i]))
+    
+
+    # update all data structures
+    def set_data(self):
+        self.data = Data() # reset 
+        self.data.num_cbands = self.CondSpin.value()
+        self.data.num_vbands = self.ValSpin.value()
+        self.data.num_bands = self.data.num_cbands + self.data.num_vbands
+        # cond bands
+        for c in range(self.data.num_cbands):
+            # ctensor
+            self.data.cTensors.append(self.CondTable.item(c, 0).text() + " " +
+                                      self.CondTable.item(c, 1).text() + " " +
+                                      self.CondTable.item(c, 2).text() + " " +
+                                      "0.0" + " " + "0.0" + " " + "0.0")
+            # ebandmins
+            self.data.ebandmins.append(self.CondTable.item(c, 3).text())
+            # mband
+            self.data.mband.append("1")
+            # TODO: change.This is default value
+            self.data.degeneracies.append("1")
+        # valence bands
+        for v in range(self.data.num_vbands):
+            # ctensor
+            self.data.cTensors.append(self.ValTable.item(v, 0).text() + " " +
+                                      self.ValTable.item(v, 1).text() + " " +
+                                      self.ValTable.item(v, 2).text() + " " +
+                                      "0.0" + " " + "0.0" + " " + "0.0")
+            # ebandmins
+            self.data.ebandmins.append(self.ValTable.item(v, 3).text())
+            # mband
+            self.data.mband.append("-1")
+            # TODO: change.This is default value
+            self.data.degeneracies.append("1")
+
+        self.data.T_str = self.tInput.text()
+        self.data.mu_str = self.muInput.text()
+        
+        # tau model
+        self.update_tau()
+
+
+    # request message of a calculation with the current data structures
+    def get_message(self):
+        return {"# export all data [true/false]": self.data.export_all_data,
+                "# number of bands": self.data.num_bands,
+                "# Fermi level": self.data.mu_str,
+                "# temperature": self.data.T_str,
+                "# bands masses and angles": self.data.cTensors,
+                "# band type": self.data.mband,
+                "# energy extrema": self.data.ebandmins,
+                "# degeneracy": self.data.degeneracies,
+                "# tau model [constant/acoustic/impurity/matthiessen]": self.data.tau_model_type,
+                "# tau acoustic coefficients": self.data.tau_acoustic_coeffs,
+                "# tau impurity coefficients": self.data.tau_impurity_coeffs,
+                "# tau matthiessen models": self.data.tau_matthiessen_models,
+                "# tau matthiessen gamma": self.data.tau_matthiessen_gamma}
+
+
+    # parameters that can be fitted to experimental data, with default bounds,
+    # and the labels of the cells that are not numbers (left out of the fit)
+    def get_fit_params(self):
+        self.set_data()
+        params = list()
+        wrong = list()
+        candidates = [("mass", (b, axis), m) for b, ctensor in enumerate(self.data.cTensors) for axis, m in enumerate(ctensor.split()[:3])]
+        candidates += [("energy", b, e) for b, e in enumerate(self.data.ebandmins)]
+        candidates += [(kind, i, c) for kind, coeffs in (("acoustic", self.data.tau_acoustic_coeffs), ("impurity", self.data.tau_impurity_coeffs))
+                       for i, c in enumerate(coeffs)]
+        for kind, index, text in candidates:
+            try:
+                value = float(text)
+            except ValueError:
+                value = float("nan")
+            if not np.isfinite(value):
+                wrong.append(FitParameter(kind, index, 0.0, 0.0, 0.0).label())
+            elif kind == "energy":
+                params.append(FitParameter(kind, index, value, value-0.2, value+0.2))
+            else:
+                # factor two around the value, whatever its sign
+                lower, upper = sorted((0.5*value, 2.0*value)) if value != 0 else (-1.0, 1.0)
+                params.append(FitParameter(kind, index, value, lower, upper))
+        return params, wrong
+
+
+    # write fitted parameters back into the input tables
+    def set_fit_params(self, params, x):
+        self.TauAcousticCoeffTable.blockSignals(True)
+        self.TauImpurityCoeffTable.blockSignals(True)
+        for p, value in zip(params, x):
+            text = format(value, '.6g')
+            if p.kind == "mass" or p.kind == "energy":
+                band = p.index[0] if p.kind == "mass" else p.index
+                column = p.index[1] if p.kind == "mass" else 3
+                if band < self.CondSpin.value():
+                    self.CondTable.item(band, column).setText(text)
+                else:
+                    self.ValTable.item(band - self.CondSpin.value(), column).setText(text)
+            elif p.kind == "acoustic":
+                self.TauAcousticCoeffTable.item(0, p.index).setText(text)
+            elif p.kind == "impurity":
+                self.TauImpurityCoeffTable.item(0, p.index).setText(text)
+        self.TauAcousticCoeffTable.blockSignals(False)
+        self.TauImpurityCoeffTable.blockSignals(False)
+        self.set_data()
+
+
+    # update relaxation time data structures
+    def update_tau(self):
+        self.clear_tau()
+        self.data.tau_model_type = self.comboBox.currentText()
+        if self.data.tau_model_type == "acoustic":
+            for c in range(self.TauAcousticCoeffTable.columnCount()):
+                value = self.TauAcousticCoeffTable.item(0, c).text()
+                if value == "":
+                    self.data.tau_acoustic_coeffs.append(0.0)
+                else:
+                    self.data.tau_acoustic_coeffs.append(float(value))
+        elif self.data.tau_model_type == "impurity":
+            for c in range(self.TauImpurityCoeffTable.columnCount()):
+                value = self.TauImpurityCoeffTable.item(0, c).text()
+                if value == "":
+                    self.data.tau_impurity_coeffs.append(0.0)
+                else:
+                    self.data.tau_impurity_coeffs.append(float(value))
+        elif self.data.tau_model_type == "Matthiessen's rule":
+            for i,tau_checkbox in enumerate([self.mr_checkBox_const,self.mr_checkBox_acoust,self.mr_checkBox_impur]):
+                if tau_checkbox.isChecked():
+                    models_blist = list(self.data.tau_matthiessen_models)
+                    models_blist[i] = '1'
+                    self.data.tau_matthiessen_models = ''.join(models_blist)
+            self.data.tau_matthiessen_gamma = self.mr_gamma_Input.text()
+            for c in range(self.TauAcousticCoeffTable.columnCount()):
+                value = self.TauAcousticCoeffTable.item(0, c).text()
+                if value == "":
+                    self.data.tau_acoustic_coeffs.append(0.0)
+                else:
+                    self.data.tau_acoustic_coeffs.append(float(value))
+            for c in range(self.TauImpurityCoeffTable.columnCount()):
+                value = self.TauImpurityCoeffTable.item(0, c).text()
+                if value == "":
+                    self.data.tau_impurity_coeffs.append(0.0)
+                else:
+                    self.data.tau_impurity_coeffs.append(float(value))
+
+
+    # clear relaxation time data structures
+    def clear_tau(self):
+        self.data.tau_model_type = "constant"
+        self.data.tau_acoustic_coeffs.clear()
+        self.data.tau_impurity_coeffs.clear()
+        self.data.tau_matthiessen_models = "000"
+        self.data.tau_matthiessen_gamma = "0.0"
+
+
+    # plot relaxation time
+    def publish_tau(self, data):
+        print(data)
+        mus = np.array(data["mu"])
+        tau = np.array(data["data"])
+        Ts = np.array(data["T"])
+        self.tauplot.ax.cla()
+        self.tauplot.plot(mus, tau, Ts)
+
+
+    #### CALCULATION methods ####
+    # first run to compile the code (on every server of the pool)
+    def first_run(self):
+        executor = ThreadPoolExecutor(max_workers=len(self.server))
+        futures = [executor.submit(self.warm_up, worker) for worker in self.server.workers]
+        # the GUI is ready with the first server, the others keep compiling in background
+        wait(futures, return_when=FIRST_COMPLETED)
+        executor.shutdown(wait=False)
+
+        # change server status signal
+        self.set_greenstatus()
+        # activate ComputeButton
+        self.ComputeButton.blockSignals(False)
+        self.TauplotButton.blockSignals(False)
+        # first run completed
+        self.is_first_run_completed = True
+
+
+    # one calculation of each tensor on a server, as soon as it is up
+    def warm_up(self, worker):
+        while self.server.check(worker) != "ok":
+            if self.server.stopped.wait(1.0):
+                return
+
+        headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+        # write the message
+        message = {"# export all data [true/false]": False,
+                    "# number of bands": 2,
+                    "# Fermi level": "0.5",
+                    "# temperature": '[300:500:100]',
+                    "# bands masses and angles": ["1. 1. 1. 0. 0. 0.", "1. 1. 1. 0. 0. 0."],
+                    "# band type": ["1","-1"],
+                    "# energy extrema": ["1","-1"],
+                    "# degeneracy": ["1","1"],
+                    "# tau model [constant/acoustic/impurity/matthiessen]": "constant",
+                    "# tau acoustic coefficients": [],
+                    "# tau impurity coefficients": [],
+                    "# tau matthiessen models": "000",
+                    "# tau matthiessen gamma": "0.0"}
+
+        for tensor_name in ["conductivity", "seebeck", "thermal", "concentration"]:
+            message["tensor_name"] = tensor_name
+            # send the request
+            try:
+                requests.post(worker.url + '/api/guicalc', json=message, headers=headers)
+            except requests.exceptions.RequestException:
+                return
+
+
+    # send a request to the server to compute the relaxation time over input ranges of temps and Fermi levels
+    @QtCore.Slot()
+    def computetau(self):
+        # wait for the GUI to be ready
+        if self.is_first_run_completed == False:
+            return
+
+        # update data structures
+        self.set_data()
+        self.set_redstatus()
+        self.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+        # write the request message
+        self.message = self.get_tau_message()
+        if self.message is None:
+            self.set_greenstatus()
+            return
+
+        # constant and impurity models (and their Matthiessen combination) without the server,
+        # once the local formula has been checked against a first answer of the server
+        if self.tau_evaluator.islocal(self.message) and self.tau_evaluator.isverified(self.message):
+            self.computetau_local()
+            return
+
+        # failures known in advance are not sent
+        check = self.preflight(self.message)
+        if check is not None:
+            self.publish_tau_answer(check.code, None)
+            self.set_greenstatus()
+            return
+
+        self.profiler.start("guitaucalc")
+        try:
+            # send the request
+            t0 = time.perf_counter()
+            r_calc = self.server.post('/api/guitaucalc', json=self.message, headers=self.headers)
+            self.profiler.add_response(r_calc, time.perf_counter() - t0)
+            r_calc.raise_for_status()
+            # check response
+            if r_calc.status_code == 200:   # ok
+                # check if Matthiessen had an error
+                if self.mr_error_msg.isVisible():
+                    self.mr_error_msg.setVisible(False)
+                # plot the relaxatin time
+                with self.profiler.span("decode"):
+                    data = r_calc.json()
+                with self.profiler.span("plot"):
+                    self.publish_tau(data)
+                self.verify_tau(self.message, (None, data))
+            # error -> clear GIU
+            elif r_calc.status_code == 210 and r_calc.text == "-40":
+                self.mr_error_msg.setVisible(True)
+                self.clear_gui()
+                self.verify_tau(self.message, (r_calc.text, None))
+            elif r_calc.status_code == 210:
+                self.clear_gui()
+                self.verify_tau(self.message, (r_calc.text, None))
+            self.profiler.stop()
+            self.show_timings()
+            self.set_greenstatus()
+
+        except requests.exceptions.HTTPError as errh:
+            print("Http error:", errh)
+            self.set_greenstatus()
+        except requests.exceptions.ConnectionError as errc:
+            print ("Exception occurred. Check server.")
+            self.set_greenstatus()
+            raise(errc)
+        except requests.exceptions.Timeout as errt:
+            print("Timeout error:", errt)
+            self.set_greenstatus()
+        except requests.exceptions.RequestException as err:
+            print("Exception occurred. Check server.", err)
+            self.set_greenstatus()
+            raise(err)
+
+
+    # request message of the relaxation time plot (None if the band structure is empty)
+    def get_tau_message(self):
+        bandtype,ebandmin = 1,0
+
+        # update acousBox
+        if self.comboBox.currentText() == "acoustic" or (self.comboBox.currentText() == "Matthiessen's rule" and self.mr_checkBox_acoust):
+            self.update_acous_box()
+            if len(self.data.ebandmins) == 0:
+                print("\033[91m[ERROR] Band structure is empty.\[\033[0m\]")
+                return None
+            # get type of band for acoustic scattering
+            acousBox = self.acousBox.currentText()
+            if len(set(acousBox).intersection('cond')) == 4:
+                bandtype = +1
+            elif len(set(acousBox).intersection('val')) == 3:
+                bandtype = -1
+            else:
+                raise(RuntimeError)
+            # get band minimum for acoustic scattering
+            ebandmin = float(acousBox.strip().split(" ")[-1])
+
+        return {"# Fermi level": self.muInput.text(),
+                "# temperature": self.tInput.text(),
+                "# band type": bandtype,
+                "# energy extremum": ebandmin,
+                "# tau model [constant/acoustic/impurity/matthiessen]": self.data.tau_model_type,
+                "# tau acoustic coefficients": self.data.tau_acoustic_coeffs,
+                "# tau impurity coefficients": self.data.tau_impurity_coeffs,
+                "# tau matthiessen models": self.data.tau_matthiessen_models,
+                "# tau matthiessen gamma": self.data.tau_matthiessen_gamma}
+
+
+    # restart the debounce timer of the live relaxation time plot
+    @QtCore.Slot()
+    def schedule_tau_preview(self):
+        if self.liveTauBox.isChecked():
+            self.tau_timer.start()
+
+
+    # live relaxation time plot: verified local models at once, the others on the server
+    # (a newer edit supersedes the answers still pending)
+    @QtCore.Slot()
+    def preview_tau(self):
+        try:
+            self.set_data()
+            message = self.get_tau_message()
+        except (ValueError, AttributeError, RuntimeError):
+            # cell being edited or incomplete band structure
+            return
+        if message is None:
+            return
+        self.tau_generation += 1
+        if self.tau_evaluator.islocal(message) and self.tau_evaluator.isverified(message):
+            try:
+                code, data = self.tau_evaluator.evaluate(message)
+            except ValueError:
+                return
+            self.show_tau_preview(self.tau_generation, code, data)
+            return
+        check = self.preflight(message, verbose=False)
+        if check is not None:
+            self.show_tau_preview(self.tau_generation, check.code, None)
+        elif self.is_first_run_completed:
+            self.tau_preview_message = (self.tau_generation, message)
+            self.tau_preview.submit(self.tau_generation, self.server, message)
+
+
+    # answer of the server to the live preview, also used to check the local formula
+    @QtCore.Slot(int, object, object)
+    def tau_preview_answer(self, generation, code, data):
+        if self.tau_preview_message is not None and self.tau_preview_message[0] == generation:
+            self.verify_tau(self.tau_preview_message[1], (code, data))
+        self.show_tau_preview(generation, code, data)
+
+
+    @QtCore.Slot(int, object, object)
+    def show_tau_preview(self, generation, code, data):
+        if generation != self.tau_generation:
+            return
+        if code is None:
+            self.mr_error_msg.setVisible(False)
+            self.tauplot.update_curves(np.atleast_1d(np.array(data["mu"])), np.array(data["data"]), np.atleast_1d(np.array(data["T"])))
+            return
+        # no curve of the previous input is left on screen
+        self.mr_error_msg.setVisible(code == ERR_MATTHIESSEN)
+        self.tauplot.show_error(TAU_ERRORS.get(code, "error {}".format(code)))
+
+
+    # relaxation time evaluated in the GUI (models already checked against the server)
+    def computetau_local(self):
+        self.profiler.start("local tau")
+        try:
+            with self.profiler.span("tau"):
+                local = self.tau_evaluator.evaluate(self.message)
+        except ValueError as err:
+            print("\033[91m[ERROR] {}\033[0m".format(err))
+            self.set_greenstatus()
+            return
+        self.publish_tau_answer(*local)
+        self.profiler.stop()
+        self.show_timings()
+        self.set_greenstatus()
+
+
+    # plot an answer of the relaxation time, or the error it reports
+    def publish_tau_answer(self, code, data):
+        if code is None:
+            if self.mr_error_msg.isVisible():
+                self.mr_error_msg.setVisible(False)
+            with self.profiler.span("plot"):
+                self.publish_tau(data)
+        elif code == ERR_MATTHIESSEN:
+            self.mr_error_msg.setVisible(True)
+            self.clear_gui()
+        else:
+            self.clear_gui()
+
+
+    # an answer of the server for a model with a local formula not yet checked: the formula
+    # is used from now on if it agrees, the server keeps the model otherwise
+    def verify_tau(self, message, remote):
+        if not self.tau_evaluator.islocal(message) or self.tau_evaluator.isverified(message):
+            return
+        try:
+            local = self.tau_evaluator.evaluate(message)
+        except ValueError:
+            return
+        if not self.tau_evaluator.compare(message, local, remote):
+            print("\033[93m[WARNING] Local relaxation time differs from the server, using the server.\033[0m")
+
+
+    # function that requests the calculation and exports the results
+    @QtCore.Slot()
+    def compute(self):
+        self.set_redstatus()
+        self.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+        # no complete run until the last tensor is published
+        self.run_message = None
+
+        # reset progress bar
+        self.progressBar.setValue(0)
+
+        # a progressive calculation still running is replaced by the new one
+        self.stop_compute()
+
+        # clean the variables
+        self.clear_gui()
+
+        self.profiler.start("guicalc")
+        with self.profiler.span("input"):
+            # update the data structure
+            self.set_data()
+
+            # write the request message, with the band structure checked before anything is sent
+            try:
+                self.message = normalize_bands(self.get_message())
+            except BandError as err:
+                self.profiler.stop()
+                self.publish_band_error(err)
+                return
+            # failures of the τ model known in advance (unknown model, empty Matthiessen
+            # selection): no tensor is computed if the server is bound to answer with an error code
+            check = self.preflight(self.message, formula=False)
+            if check is not None:
+                self.profiler.stop()
+                self.publish_error(check.code)
+                if check.code == ERR_MATTHIESSEN:
+                    self.mr_error_msg.setVisible(True)
+                return
+
+        # only the selected tensors, the others are requested when ticked
+        self.args = [tensor_name for tensor_name in TENSOR_NAMES if self.tensorBoxes[tensor_name].isChecked()]
+        if not self.args:
+            self.profiler.stop()
+            print("\033[93m[WARNING] No tensor selected.\033[0m")
+            self.set_greenstatus()
+            return
+        self.run_adaptive = self.adaptiveBox.isChecked()
+        for tensor_name in TENSOR_NAMES:
+            if tensor_name not in self.args:
+                self.ui_out.plots.placeholder(tensor_name)
+
+        if self.is_first_run_thread_active:
+            self.first_run_thread.join()
+            self.is_first_run_thread_active = False
+
+        if self.progressiveBox.isChecked() and not self.adaptiveBox.isChecked():
+            self.start_progressive()
+            return
+
+        # loop over electrical cond, Seebeck, thermal cond, carrier conc
+        for idx, tensor_name in enumerate(self.args):
+            self.message["tensor_name"] = tensor_name
+            try:
+                # send request and collect results: only the points missing from a previous
+                # calculation with the same parameters, split over all the servers of the pool
+                t0 = time.perf_counter()
+                if self.adaptiveBox.isChecked():
+                    # extra Fermi levels only where S and σ vary quickly, then the
+                    # selected tensors on the same non-uniform grid
+                    if idx == 0:
+                        self.adaptive_responses = self.adaptive_grid.post(self.server, '/api/guicalc', self.message, self.args, headers=self.headers)
+                    r_calc = self.adaptive_responses[tensor_name]
+                else:
+                    r_calc = self.grid_cache.post(self.server, '/api/guicalc', self.message, headers=self.headers)
+                self.profiler.add_response(r_calc, time.perf_counter() - t0)
+                r_calc.raise_for_status()
+                # check response
+                if r_calc.status_code == 200:   # ok
+                    # publish results to OUTPUT window
+                    with self.profiler.span("decode"):
+                        data = r_calc.json()
+                    self.publish_output(tensor_name, data)
+                    self.update_progress_bar(int(100 * (idx+1) / len(self.args)))
+                # error -> clear GIU
+                elif r_calc.status_code == 210 and r_calc.text in ("-20", "-30", "-40"):
+                    self.publish_error(r_calc.text)
+                    break
+
+            except requests.exceptions.HTTPError as errh:
+                print("Http error:", errh)
+            except requests.exceptions.ConnectionError as errc:
+                print ("Exception occurred. Check server.")
+                raise(errc)
+            except requests.exceptions.Timeout as errt:
+                print("Timeout error:", errt)
+            except requests.exceptions.RequestException as err:
+                print("Exception occurred. Check server.", err)
+                raise(err)
+
+        self.profiler.stop()
+        self.show_timings()
+
+
+    # error code the server would answer to a message, None if no failure is predicted
+    # (models that disagreed with the server are left to it). The predictions of the local
+    # τ formula (formula=True) concern τ at ϵ = μ, i.e. /api/guitaucalc, and block the τ plot
+    # only once the model has been checked against the server; /api/guicalc evaluates τ over
+    # the band energies and is checked with formula=False (grid-independent failures only)
+    def preflight(self, message, verbose=True, formula=True):
+        if self.tau_evaluator.model_key(message) in self.tau_evaluator.disabled:
+            return None
+        try:
+            check = preflight(message)
+        except (KeyError, ValueError):
+            # incomplete input: the server reports it
+            return None
+        if check is not None and check.formula:
+            if not formula:
+                return None
+            if not self.tau_evaluator.isverified(message):
+                if verbose:
+                    print("\033[93m[WARNING] {} (code {} expected, sent anyway).\033[0m".format(check, check.code))
+                return None
+        if check is not None and verbose:
+            print("\033[91m[ERROR] {} (code {}, not sent).\033[0m".format(check, check.code))
+        return check
+
+
+    # error codes of the server (status 210) in place of the plots
+    def publish_error(self, code):
+        if code == "-20":
+            self.clear_gui()
+            self.ui_out.plots.figure.suptitle("", y=0.97)
+            self.ui_out.plots.ax1.spines['left'].set_visible(False)
+            self.ui_out.plots.ax1.spines['bottom'].set_visible(False)
+            self.ui_out.plots.ax1.get_xaxis().set_visible(False)
+            self.ui_out.plots.ax1.get_yaxis().set_visible(False)
+            self.ui_out.plots.ax2.spines['left'].set_visible(False)
+            self.ui_out.plots.ax2.spines['bottom'].set_visible(False)
+            self.ui_out.plots.ax2.get_xaxis().set_visible(False)
+            self.ui_out.plots.ax2.get_yaxis().set_visible(False)
+            self.ui_out.plots.figure.text(0.05, 0.85, "ERROR: ", ha="left", va="bottom", size="large", color="red", fontfamily="serif")
+            self.ui_out.plots.figure.text(0.15, 0.85, "Relaxation time functional form identically zero.", ha="left", va="bottom", size="large", fontfamily="serif")
+            self.ui_out.plots.draw()
+            self.set_greenstatus()
+        elif code == "-30":
+            self.clear_gui()
+            self.ui_out.plots.figure.suptitle("", y=0.97)
+            self.ui_out.plots.ax1.spines['left'].set_visible(False)
+            self.ui_out.plots.ax1.spines['bottom'].set_visible(False)
+            self.ui_out.plots.ax1.get_xaxis().set_visible(False)
+            self.ui_out.plots.ax1.get_yaxis().set_visible(False)
+            self.ui_out.plots.ax2.spines['left'].set_visible(False)
+            self.ui_out.plots.ax2.spines['bottom'].set_visible(False)
+            self.ui_out.plots.ax2.get_xaxis().set_visible(False)
+            self.ui_out.plots.ax2.get_yaxis().set_visible(False)
+            self.ui_out.plots.figure.text(0.05, 0.85, "ERROR: ", ha="left", va="bottom", size="large",color="red", fontfamily="serif")
+            self.ui_out.plots.figure.text(0.15, 0.85, "Domain error in the τ function calculation.", ha="left", va="bottom", size="large", fontfamily="serif")
+            self.ui_out.plots.figure.text(0.05,0.78, "Hint:", ha="left", va="bottom", size="large",color="blue", fontfamily="serif")
+            self.ui_out.plots.figure.text(0.11,0.78, "shift the zero value of the chosen temperature or the T₀ parameter of the", ha="left", va="bottom", size="large", fontfamily="serif")
+            self.ui_out.plots.figure.text(0.11,0.71, "acoustic scattering.", ha="left", va="bottom", size="large", fontfamily="serif")
+            self.ui_out.plots.draw()
+            self.set_greenstatus()
+        elif code == "-40":
+            self.clear_gui()
+
+            self.set_greenstatus()
+
+
+    # band structure rejected before the request, in place of the plots
+    def publish_band_error(self, err):
+        self.clear_gui()
+        self.ui_out.plots.figure.suptitle("", y=0.97)
+        for ax in (self.ui_out.plots.ax1, self.ui_out.plots.ax2):
+            ax.spines['left'].set_visible(False)
+            ax.spines['bottom'].set_visible(False)
+            ax.get_xaxis().set_visible(False)
+            ax.get_yaxis().set_visible(False)
+        self.ui_out.plots.figure.text(0.05, 0.85, "ERROR: ", ha="left", va="bottom", size="large", color="red", fontfamily="serif")
+        self.ui_out.plots.figure.text(0.15, 0.85, "Invalid band structure.", ha="left", va="bottom", size="large", fontfamily="serif")
+        for i, problem in enumerate(err.problems[:6]):
+            self.ui_out.plots.figure.text(0.11, 0.78 - 0.07*i, problem, ha="left", va="bottom", size="large", fontfamily="serif")
+        if not self.OutputWindow.isVisible():
+            self.OutputWindow.show()
+        self.ui_out.plots.draw()
+        self.set_greenstatus()
+
+
+    # coarse-to-fine calculation in background, the plots are replaced after each pass
+    def start_progressive(self):
+        self.progressive_run += 1
+        self.progressive = ProgressiveCompute(self.progressive_run, self.server, self.grid_cache, dict(self.message), self.args, self.headers, profiler=self.profiler)
+        self.progressive.result.connect(self.publish_pass)
+        self.progressive.failed.connect(self.progressive_failed)
+        self.progressive.error.connect(self.progressive_error)
+        self.progressive.finished.connect(self.progressive_finished)
+        self.StopButton.setVisible(True)
+        self.progressive.start()
+
+    @QtCore.Slot()
+    def stop_compute(self):
+        if self.progressive is not None and self.progressive.isRunning():
+            # the request in flight is left to finish in background
+            self.progressive.stop()
+            self.stopped_runs = [t for t in self.stopped_runs if t.isRunning()] + [self.progressive]
+            self.progressive_run += 1
+            self.StopButton.setVisible(False)
+            self.set_greenstatus()
+
+    @QtCore.Slot(int, int, int, str, object)
+    def publish_pass(self, run_id, index, num_passes, tensor_name, data):
+        # answer of a stopped calculation
+        if run_id != self.progressive_run:
+            return
+        # a new pass replaces the values and the curves of the previous one
+        if tensor_name == self.args[0]:
+            self.out_trace_data.clear()
+        self.ui_out.plots.clear_tensor(tensor_name)
+        self.publish_output(tensor_name, data, last=index == num_passes - 1)
+        done = index * len(self.args) + self.args.index(tensor_name) + 1
+        self.update_progress_bar(int(100 * done / (num_passes * len(self.args))))
+
+    @QtCore.Slot(int, object)
+    def progressive_failed(self, run_id, r_calc):
+        if run_id != self.progressive_run:
+            return
+        if r_calc.text in ("-20", "-30", "-40"):
+            self.publish_error(r_calc.text)
+        self.set_greenstatus()
+
+    @QtCore.Slot(int, str)
+    def progressive_error(self, run_id, err):
+        if run_id != self.progressive_run:
+            return
+        print("Exception occurred. Check server.", err)
+        self.set_greenstatus()
+
+    @QtCore.Slot()
+    def progressive_finished(self):
+        # end of a stopped calculation, a newer one is running
+        if self.progressive is not None and self.progressive.isRunning():
+            return
+        self.StopButton.setVisible(False)
+        self.profiler.stop()
+        self.show_timings()
+        # tensors ticked while the calculation was running
+        self.fetch_missing()
+
+
+    # timings of the last calculation in the status bar of the OUTPUT window
+    def show_timings(self):
+        if self.profiler.enabled:
+            self.ui_out.statusbar.showMessage(self.profiler.summary())
+
+
+    # a tensor unticked after the calculation leaves its panel, a ticked one is computed
+    # on the Fermi levels and temperatures of the run
+    @QtCore.Slot()
+    def tensor_toggled(self):
+        if self.run_message is None or (self.progressive is not None and self.progressive.isRunning()):
+            return
+        for tensor_name, checkBox in self.tensorBoxes.items():
+            if not checkBox.isChecked() and tensor_name in self.args:
+                self.drop_tensor(tensor_name)
+        self.fetch_missing()
+
+    def drop_tensor(self, tensor_name):
+        self.args.remove(tensor_name)
+        if tensor_name in self.out_trace_data.label:
+            idx = self.out_trace_data.label.index(tensor_name)
+            del self.out_trace_data.data[idx]
+            del self.out_trace_data.label[idx]
+        self.out_all_data.drop(tensor_name)
+        self.ui_out.plots.placeholder(tensor_name)
+        self.clear_row_outputTable(TENSOR_NAMES.index(tensor_name))
+        self.ui_out.plots.draw()
+
+    def fetch_missing(self):
+        if self.run_message is None:
+            return
+        for tensor_name in TENSOR_NAMES:
+            if self.tensorBoxes[tensor_name].isChecked() and tensor_name not in self.args:
+                if not self.fetch_tensor(tensor_name):
+                    break
+        self.publish_tensor()
+
+    # one more tensor of the last run: the result caches answer the ones already computed
+    def fetch_tensor(self, tensor_name):
+        message = dict(self.run_message, tensor_name=tensor_name)
+        self.set_redstatus()
+        try:
+            if self.run_adaptive:
+                if tensor_name not in self.adaptive_responses:
+                    self.adaptive_responses[tensor_name] = self.adaptive_grid.post_more(self.server, '/api/guicalc', message, tensor_name, headers=self.headers)
+                r_calc = self.adaptive_responses[tensor_name]
+            else:
+                r_calc = self.grid_cache.post(self.server, '/api/guicalc', message, headers=self.headers)
+            r_calc.raise_for_status()
+        except requests.exceptions.RequestException as err:
+            print("Exception occurred. Check server.", err)
+            self.set_greenstatus()
+            return False
+        if r_calc.status_code != 200:
+            if r_calc.status_code == 210 and r_calc.text in ("-20", "-30", "-40"):
+                self.publish_error(r_calc.text)
+            self.set_greenstatus()
+            return False
+        self.args.append(tensor_name)
+        self.ui_out.plots.clear_tensor(tensor_name)
+        self.publish_output(tensor_name, r_calc.json())
+        return True
+
+
+    # publish output in the OUTPUT window
+    def publish_output(self, tensor_name, data, last=True):
+
+        # check if output window is visible, if not show it
+        if not self.OutputWindow.isVisible():
+            self.OutputWindow.show()
+
+        # tensor has shape (6, num_mu, num_t)
+        t0 = time.perf_counter()
+        tensor = np.array(data["data"])
+        norm_const = 1/3
+
+        # first tensor of the run (or of the pass): no trace published yet
+        if not self.out_trace_data.label:
+
+            ##### set slider for T and mu #####
+            self.T = np.array(data["T"])
+            self.mus = np.array(data["mu"])
+            if self.T.shape == ():
+                self.T = np.array([self.T])
+            if self.mus.shape == ():
+                self.mus = np.array([self.mus])
+            self.num_t = self.T.size
+            self.num_mu = self.mus.size
+            if not self.out_all_data.isallocated():
+                self.out_all_data.setTmu(self.num_mu, self.num_t)
+            # tensors not requested (all of them are, without a selection)
+            for name in TENSOR_NAMES:
+                if self.args and name not in self.args:
+                    self.out_all_data.drop(name)
+            if self.T.size < 2:
+                # set slider according to user inputs
+                self.ui_out.TSlider.setMinimum(self.T[0])
+                self.ui_out.TSlider.setMaximum(self.T[0])
+                self.ui_out.TSlider.setSingleStep(0)
+            else:
+                # set slider according to user inputs
+                self.ui_out.TSlider.setMinimum(0)
+                self.ui_out.TSlider.setMaximum(len(self.T)-1)
+                self.T_step = self.T[1] - self.T[0]
+                self.ui_out.TSlider.setSingleStep(1)
+                self.ui_out.TSlider.setTickInterval(1)
+                self.ui_out.TSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+            if self.mus.size < 2:
+                # set slider according to user inputs
+                self.ui_out.muSlider.setMinimum(self.mus[0])
+                self.ui_out.muSlider.setMaximum(self.mus[0])
+                self.ui_out.muSlider.setSingleStep(0)
+                self.muStepConv = 0.0
+            else:
+                # slider positions are indices of the (possibly non-uniform) Fermi levels
+                self.ui_out.muSlider.setMinimum(0)
+                self.ui_out.muSlider.setMaximum(len(self.mus)-1)
+                self.ui_out.muSlider.setSingleStep(1)
+                self.ui_out.muSlider.setTickInterval(1)
+                self.ui_out.muSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+
+            # set T mu values in TVal and muVal
+            self.ui_out.TVal.setText(str(int(self.T[0])))
+            self.ui_out.muVal.setText(str(self.mus[0]))
+            # activate sliders (once, every calculation reuses them)
+            if not self.sliders_connected:
+                self.ui_out.TVal.textChanged.connect(self.ui_out.TValueChanged)
+                self.ui_out.muVal.textChanged.connect(self.ui_out.muValueChanged)
+                self.ui_out.TSlider.valueChanged.connect(self.ui_out.TSliderChanged)
+                self.ui_out.muSlider.valueChanged.connect(self.ui_out.muSliderChanged)
+                self.sliders_connected = True
+            
+        ##### compute the trace for each tensor
+        if tensor_name == "conductivity":
+            self.out_all_data.setCond(tensor)
+            trace_tensor = np.empty((self.num_mu, self.num_t))
+            for t in range(self.num_t):
+                for m in range(self.num_mu):
+                    trace_tensor[m, t] = np.multiply((tensor[0, m, t]+tensor[1, m, t]+tensor[2, m, t]), norm_const)
+        elif tensor_name == "seebeck":
+            self.out_all_data.setSeebeck(tensor)
+            trace_tensor = np.empty((self.mus.size, self.T.size))
+            for t in range(self.T.size):
+                for m in range(self.mus.size):
+                    trace_tensor[m, t] = np.multiply((tensor[0, m, t] + tensor[1, m, t] + tensor[2, m, t]), norm_const)
+        elif tensor_name == "thermal":
+            self.out_all_data.setThermal(tensor)
+            trace_tensor = np.empty((self.mus.size, self.T.size))
+            for t in range(self.T.size):
+                for m in range(self.mus.size):
+                    trace_tensor[m, t] = np.multiply((tensor[0, m, t]+tensor[1, m, t]+tensor[2, m, t]), norm_const)
+        elif tensor_name == "concentration":
+            self.out_all_data.setConc(tensor)
+            trace_tensor = tensor[0, :, :]
+        self.profiler.add("trace reduction", time.perf_counter() - t0)
+
+        # plot the results
+        with self.profiler.span("plot"):
+            self.ui_out.plots.plot(tensor_name, self.T, trace_tensor, self.mus, self.data.tau_model_type, self.exp_data)
+        
+        self.out_trace_data.data.append(trace_tensor)
+        self.out_trace_data.label.append(tensor_name)
+
+        # after the last requested tensor is plotted -> green light
+        if last and (tensor_name == self.args[-1] if self.args else tensor_name == TENSOR_NAMES[-1]):
+            if self.run_message is None:
+                self.run_message = dict(self.message)
+            self.set_greenstatus()
+
+
+    # publish each tensor in the outputTable according to the sliders (or TVal and muVal)
+    def publish_tensor(self):
+        mu = float(self.ui_out.muVal.text())
+        t = float(self.ui_out.TVal.text())
+        if self.T.shape == ():
+            self.T = np.array([self.T])
+        if self.mus.shape == ():
+            self.mus = np.array([self.mus])
+        if t not in self.T or mu not in self.mus:
+            return
+        if (self.ui_out.TVal.text() == "") or (self.ui_out.muVal.text() == "") \
+                or (mu < self.mus[0]) or (mu > self.mus[-1]) \
+                or (t < self.T[0]) or (t > self.T[-1]):
+            return
+        else:
+            mu_idx = np.where(self.mus == mu)[0][0]
+            t_idx = np.where(self.T == t)[0][0]
+
+            labels = self.out_trace_data.label
+            if "conductivity" in labels and self.out_all_data.conductivity is not None:
+                self.update_row_outputTable(0, self.out_all_data.conductivity[:, mu_idx, t_idx])
+                y = self.out_trace_data.data[labels.index("conductivity")][mu_idx][t_idx]
+                if self.ui_out.plots.point1 is not None:
+                    self.ui_out.plots.point1.remove()
+                self.ui_out.plots.point1, = self.ui_out.plots.ax1.plot(t, y, marker='.', color="#1f77b4" if self.mus.size == 1 else 'dimgray', zorder=10)
+            if "seebeck" in labels and self.out_all_data.seebeck is not None:
+                self.update_row_outputTable(1, np.multiply(self.out_all_data.seebeck[:, mu_idx, t_idx],1e6))
+                y = self.out_trace_data.data[labels.index("seebeck")][mu_idx][t_idx]
+                if self.ui_out.plots.point2 is not None:
+                    self.ui_out.plots.point2.remove()
+                self.ui_out.plots.point2, = self.ui_out.plots.ax2.plot(t, np.multiply(y,1e6), marker='.', color="orange" if self.mus.size == 1 else 'dimgray', zorder=10)
+            if "thermal" in labels and self.out_all_data.thermal is not None:
+                self.update_row_outputTable(2, self.out_all_data.thermal[:, mu_idx, t_idx])
+                y = self.out_trace_data.data[labels.index("thermal")][mu_idx][t_idx]
+                if self.ui_out.plots.point3 is not None:
+                    self.ui_out.plots.point3.remove()
+                self.ui_out.plots.point3, = self.ui_out.plots.ax3.plot(t, y, marker='.', color="red" if self.mus.size == 1 else 'dimgray', markersize=3, zorder=10)
+            if "concentration" in labels and self.out_all_data.concentration is not None:
+                self.update_n_outputTable(self.out_all_data.concentration[:, mu_idx, t_idx])
+                y = self.out_trace_data.data[labels.index("concentration")][mu_idx][t_idx]
+                if self.ui_out.plots.point4 is not None:
+                    self.ui_out.plots.point4.remove()
+                self.ui_out.plots.point4, = self.ui_out.plots.ax4.plot(t, y, marker='.', color="limegreen" if self.mus.size == 1 else 'dimgray', zorder=10)
+        self.ui_out.plots.draw()
+
+
+    def update_progress_bar(self, perc):
+        self.progressBar.setValue(perc)
+
+
+    # publish conductivities and Seebeck on outputTable
+    def update_row_outputTable(self, row, data):
+        self.ui_out.outputTable.item(row, 0).setText(format(data[0], '.5e'))
+        self.ui_out.outputTable.item(row, 1).setText(format(data[1], '.5e'))
+        self.ui_out.outputTable.item(row, 2).setText(format(data[2], '.5e'))
+        self.ui_out.outputTable.item(row, 3).setText(format(data[3], '.5e'))
+        self.ui_out.outputTable.item(row, 4).setText(format(data[4], '.5e'))
+        self.ui_out.outputTable.item(row, 5).setText(format(data[5], '.5e'))
+
+    # row of a tensor that is not computed
+    def clear_row_outputTable(self, row):
+        for c in range(self.ui_out.outputTable.columnCount()):
+            self.ui_out.outputTable.item(row, c).setText('-')
+
+    # carrier concentration is a scalar 
+    def update_n_outputTable(self, data):
+        self.ui_out.outputTable.item(3, 0).setText(format(data[0], '.5e'))
+        self.ui_out.outputTable.item(3, 1).setText('-')
+        self.ui_out.outputTable.item(3, 2).setText('-')
+        self.ui_out.outputTable.item(3, 3).setText('-')
+        self.ui_out.outputTable.item(3, 4).setText('-')
+        self.ui_out.outputTable.item(3, 5).setText('-')
+
+
+    @QtCore.Slot()
+    def import_exp_data(self):
+        fileNames, selectedFilter = QtWidgets.QFileDialog.getOpenFileNames(self.InputWindow, 'Import Files', str(os.getcwd()),
+                                                             "CSV (Comma delimited) (*.csv);; Excel Workbook (*.xlsx)")
+        if not fileNames:
+            return
+        self.ClearExpButton.setIcon(QtGui.QIcon())
+        self.ImportExpButton.setIcon(QtGui.QIcon())
+        # parse the files in background, each dataset is published as soon as it is ready
+        loader = ExpDataLoader(fileNames)
+        loader.loaded.connect(self.add_exp_data)
+        loader.failed.connect(self.exp_data_error)
+        # keep a reference to the running loaders until they finish
+        self.exp_loaders = [l for l in self.exp_loaders if l.isRunning()] + [loader]
+        loader.start()
+
+
+    @QtCore.Slot(str, object)
+    def add_exp_data(self, fileName, rows):
+        name = os.path.basename(fileName)
+        self.exp_data.set_exp_data(name, rows)
+        if self.ExpDataBox.findText(name) == -1:
+            self.ExpDataBox.addItem(name)
+        self.ExpDataBox.setCurrentText(name)
+        self.ImportExpButton.setIcon(self.tick_icon)
+
+
+    @QtCore.Slot(str, str)
+    def exp_data_error(self, fileName, error):
+        print("\033[91m[ERROR] {}: {}\033[0m".format(os.path.basename(fileName), error))
+        self.ImportExpButton.setIcon(self.error_icon)
+
+
+    @QtCore.Slot(str)
+    def select_exp_data(self, name):
+        self.exp_data.select(name)
+
+
+    @QtCore.Slot()
+    def clear_exp_data(self):
+        self.exp_data.clear()
+        self.ExpDataBox.clear()
+        self.ClearExpButton.setIcon(self.tick_icon)
+        self.ImportExpButton.setIcon(QtGui.QIcon())
+
+
+    def export_data(self, filename):
+        hor_header = ['μ']
+        for i in range(self.num_t):
+            hor_header.append('T_'+str(i+1))
+        # list not empty
+        if self.out_trace_data.data:
+            tensor_num = len(self.out_trace_data.data)
+            mu_size, t_size = self.out_trace_data.data[0].shape
+            data_to_write = np.empty((mu_size*tensor_num, len(hor_header)))
+            for t in range(tensor_num):
+                tensor = np.insert(self.out_trace_data.data[t], 0, self.mus, axis=1)
+                data_to_write[mu_size*t:mu_size*(t+1), :] = tensor
+
+            labels = list(self.out_trace_data.label)
+            # figures of merit, when computed
+            if self.out_all_data.merits is not None:
+                traces = self.out_all_data.merits[0]
+                data_to_write = np.concatenate([data_to_write] + [np.insert(traces[m], 0, self.mus, axis=1) for m in MERITS])
+                labels += list(MERITS)
+            lbs = list(itertools.chain.from_iterable(itertools.repeat(x, mu_size) for x in labels))
+            pd.DataFrame(np.asarray(data_to_write), columns=hor_header, index=lbs).to_csv(filename)
+
+
+    # clear all datastructures and plots
+    def clear_gui(self):
+        self.data = Data()
+        self.out_trace_data.clear()
+        self.out_all_data.clear()
+        self.ui_out.plots.ax1.cla(); self.ui_out.plots.ax2.cla(); self.ui_out.plots.ax3.cla(); self.ui_out.plots.ax4.cla();
+        # space for error message. TODO
+        for text in self.ui_out.plots.figure.texts:
+            text.set_visible(False)
+        self.ui_out.plots.ax1.spines['left'].set_visible(True)
+        self.ui_out.plots.ax1.spines['bottom'].set_visible(True)
+        self.ui_out.plots.ax1.get_yaxis().set_visible(True)
+        self.ui_out.plots.ax1.get_yaxis().set_visible(True)
+        self.ui_out.plots.ax2.spines['left'].set_visible(True)
+        self.ui_out.plots.ax2.spines['bottom'].set_visible(True)
+        self.ui_out.plots.ax2.get_xaxis().set_visible(True)
+        self.ui_out.plots.ax2.get_yaxis().set_visible(True)
+        self.ui_out.plots.draw()
+        for r in range(self.ui_out.outputTable.rowCount()):
+            for c in range(self.ui_out.outputTable.columnCount()):
+                item = QtWidgets.QTableWidgetItem()
+                item.setTextAlignment(QtCore.Qt.AlignCenter)
+                self.ui_out.outputTable.setItem(r, c, item)
+
+
+    def exit(self):
+        self.ui_out.OutputWindow.close()
+        self.InputWindow.close()
+
+
+    def set_redstatus(self):
+        # down signal to on
+        self.redSignal.setVisible(True)
+        # up signal to off
+        self.greenSignal.setVisible(False)
+        QtWidgets.QApplication.processEvents()
+
+
+    def set_greenstatus(self):
+        # down signal to off
+        self.redSignal.setVisible(False)
+        # activate up signal
+        self.greenSignal.setVisible(True)
+        QtWidgets.QApplication.processEvents()
+
+
+
+# output window
+class UiOutputWindow(object):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def setupUi(self, OutputWindow):
+        self.OutputWindow = OutputWindow
+        self.OutputWindow.setObjectName("OutputWindow")
+        self.OutputWindow.resize(730, 750)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.OutputWindow.sizePolicy().hasHeightForWidth())
+        self.OutputWindow.setSizePolicy(sizePolicy)
+        self.OutputWindow.setAutoFillBackground(False)
+        self.OutputWindow.setWindowIcon(self.parent.appIcon)
+        self.plots = PlotsCanvas(width=20, height=50)
+        self.centralwidget = QtWidgets.QWidget(self.OutputWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.OutputWindow.setCentralWidget(self.centralwidget)
+
+        # menubar
+        self.menubar = QtWidgets.QMenuBar(self.OutputWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 819, 20))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuAnalysis = QtWidgets.QMenu(self.menubar)
+        self.menuAnalysis.setObjectName("menuAnalysis")
+        self.menuHelp = QtWidgets.QMenu(self.menubar)
+        self.menuHelp.setObjectName("menuHelp")
+        self.OutputWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(self.OutputWindow)
+        self.statusbar.setObjectName("statusbar")
+        self.OutputWindow.setStatusBar(self.statusbar)
+        # plots are exported in background from a snapshot of the figure
+        self.export_queue = PlotExportQueue()
+        self.export_queue.progress.connect(self.show_export_progress)
+        self.export_queue.failed.connect(self.show_export_error)
+        self.actionSave_plots = QtWidgets.QAction(self.OutputWindow)
+        self.actionSave_plots.setObjectName("actionSave_plots")
+        self.actionSave_plots.triggered.connect(self.create_saveplot_dialog)
+        self.actionSave_plots.setShortcut("Ctrl+S")
+        self.actionExport_data = QtWidgets.QAction(self.OutputWindow)
+        self.actionExport_data.setObjectName("actionExport_data")
+        self.actionExport_data.setStatusTip('Save File')
+        self.actionExport_data.triggered.connect(self.save_data)
+        self.actionExit = QtWidgets.QAction(self.OutputWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionExit.triggered.connect(self.OutputWindow.close)
+        self.actionMerits = QtWidgets.QAction(self.OutputWindow)
+        self.actionMerits.setObjectName("actionMerits")
+        self.actionMerits.triggered.connect(self.create_merits_dialog)
+        self.actionTensors = QtWidgets.QAction(self.OutputWindow)
+        self.actionTensors.setObjectName("actionTensors")
+        self.actionTensors.triggered.connect(self.create_tensors_dialog)
+        self.actionBrowser = QtWidgets.QAction(self.OutputWindow)
+        self.actionBrowser.setObjectName("actionBrowser")
+        self.actionBrowser.triggered.connect(self.create_browser_dialog)
+        self.actionFit_mu = QtWidgets.QAction(self.OutputWindow)
+        self.actionFit_mu.setObjectName("actionFit_mu")
+        self.actionFit_mu.triggered.connect(self.create_mufit_dialog)
+        self.actionFit_params = QtWidgets.QAction(self.OutputWindow)
+        self.actionFit_params.setObjectName("actionFit_params")
+        self.actionFit_params.triggered.connect(self.create_fit_dialog)
+        self.actionTimings = QtWidgets.QAction(self.OutputWindow)
+        self.actionTimings.setObjectName("actionTimings")
+        self.actionTimings.setCheckable(True)
+        self.actionTimings.setChecked(self.parent.profiler.enabled)
+        self.actionTimings.toggled.connect(self.show_timings)
+        self.actionAbout = QtWidgets.QAction(self.OutputWindow)
+        self.actionAbout.setObjectName("actionAbout")
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuAnalysis.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuAnalysis.addAction(self.actionMerits)
+        self.menuAnalysis.addAction(self.actionTensors)
+        self.menuAnalysis.addAction(self.actionBrowser)
+        self.menuAnalysis.addAction(self.actionFit_mu)
+        self.menuAnalysis.addAction(self.actionFit_params)
+        self.menuAnalysis.addSeparator()
+        self.menuAnalysis.addAction(self.actionTimings)
+        self.menuFile.addAction(self.actionSave_plots)
+        self.menuFile.addAction(self.actionExport_data)
+        self.menuFile.addAction(self.actionExit)
+        self.menuHelp.addAction(self.actionAbout)
+
+        # layout grid to handle outputs
+        self.frameLeft = QtWidgets.QFrame(self.centralwidget)
+        self.frameLeft.setMinimumSize(QtCore.QSize(0, 70))
+        self.frameLeft.setMaximumSize(QtCore.QSize(16777215, 70))
+        self.frameLeft.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frameLeft.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.frameLeft.setObjectName("frameLeft")
+        self.frameTmu = QtWidgets.QFrame(self.centralwidget)
+        self.frameTmu.setMinimumSize(QtCore.QSize(530, 70))
+        self.frameTmu.setMaximumSize(QtCore.QSize(16777215, 70))
+        self.frameTmu.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frameTmu.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.frameTmu.setObjectName("frameTmu")
+        self.gridLayoutPlots = QtWidgets.QGridLayout()
+        self.gridLayoutPlots.setObjectName("gridLayoutPlots")
+        self.TmuLayout = QtWidgets.QHBoxLayout()
+        self.TmuLayout.addWidget(self.frameLeft)
+        self.TmuLayout.setObjectName("TmuLayout")
+        self.TmuLayout.setContentsMargins(0, 20, 0, 0)
+        self.frameRight = QtWidgets.QFrame(self.centralwidget)
+        self.frameRight.setMaximumSize(QtCore.QSize(16777215, 70))
+        self.frameRight.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frameRight.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.frameRight.setObjectName("frameRight")
+        self.TmuLayout.addWidget(self.frameRight)
+        self.gridLayoutTensors = QtWidgets.QGridLayout()
+        self.gridLayoutTensors.setObjectName("gridLayoutTensors")
+        self.gridLayoutTensors.setContentsMargins(50, 0, 50, 50)
+        self.windowLayout = QtWidgets.QGridLayout(self.centralwidget)
+        self.windowLayout.setObjectName("gridLayout_2")
+        self.windowLayout.addLayout(self.gridLayoutPlots, 0, 0, 1, 1)
+        self.windowLayout.addLayout(self.TmuLayout, 1, 0, 1, 1)
+        self.windowLayout.addLayout(self.gridLayoutTensors, 6, 0, 1, 1)
+
+        # title
+        font_title = QtGui.QFont()
+        font_title.setPointSize(15)
+        font_title.setBold(True)
+        font_title.setWeight(75)
+        self.outputlabel = QtWidgets.QLabel(self.centralwidget)
+        self.outputlabel.setFont(font_title)
+        self.outputlabel.setTextFormat(QtCore.Qt.PlainText)
+        self.outputlabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.outputlabel.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.outputlabel.setIndent(0)
+        self.outputlabel.setObjectName("outputlabel")
+        self.gridLayoutPlots.addWidget(self.outputlabel, 0, 0, 1, 1)
+
+        # Plot table
+        self.gridLayoutPlots.addWidget(self.plots, 1, 0, 1, 1)
+
+        ## Thermodynamics params
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        TmuLabelSizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        TmuLabelSizePolicy.setHorizontalStretch(0)
+        TmuLabelSizePolicy.setVerticalStretch(0)
+        ### temperature input namebox
+        self.TSym = QtWidgets.QLabel(self.frameTmu)
+        self.TSym.setObjectName("TSym")
+        self.TSym.setGeometry(QtCore.QRect(30, 10, 30, 16))
+        self.TSym.setMaximumSize(QtCore.QSize(16777215, 20))
+        self.TSym.setFont(font)
+        sizePolicy.setHeightForWidth(self.TSym.sizePolicy().hasHeightForWidth())
+        self.TSym.setSizePolicy(sizePolicy)
+        ### temperature input 
+        self.TVal = QtWidgets.QLineEdit(self.frameTmu)
+        self.TVal.setObjectName("TmuVal")
+        self.TVal.setGeometry(QtCore.QRect(70, 10, 71, 16))
+        self.TVal.setFont(font)
+        self.TVal.setAlignment(QtCore.Qt.AlignRight)
+        self.TVal.returnPressed.connect(self.TValueChangedReturn)
+        ### temperature slider
+        self.TSlider = QtWidgets.QSlider(self.frameTmu)
+        self.TSlider.setObjectName("TSlider")
+        self.TSlider.setGeometry(QtCore.QRect(10, 40, 170, 20))
+        self.TSlider.setMaximumSize(QtCore.QSize(16777215, 20))
+        self.TSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.TSlider.setStyleSheet("QSlider::handle:horizontal {background-color: %s;}" % (header_color))
+        ### Fermi level input namebox
+        self.muSym = QtWidgets.QLabel(self.frameTmu)
+        self.muSym.setObjectName("muSym")
+        self.muSym.setGeometry(QtCore.QRect(220, 10, 40, 16))
+        self.muSym.setMaximumSize(QtCore.QSize(16777215, 20))
+        self.muSym.setFont(font)
+        sizePolicy.setHeightForWidth(self.muSym.sizePolicy().hasHeightForWidth())
+        self.muSym.setSizePolicy(sizePolicy)
+        ### Fermi level input 
+        self.muVal = QtWidgets.QLineEdit(self.frameTmu)
+        self.muVal.setObjectName("muVal")
+        self.muVal.setGeometry(QtCore.QRect(270, 10, 71, 16))
+        self.muVal.setFont(font)
+        self.muVal.setAlignment(QtCore.Qt.AlignRight)
+        self.muVal.returnPressed.connect(self.muValueChangedReturn)
+        ### Fermi level slider
+        self.muSlider = QtWidgets.QSlider(self.frameTmu)
+        self.muSlider.setObjectName("muSlider")
+        self.muSlider.setGeometry(QtCore.QRect(200, 40, 170, 20))
+        self.muSlider.setMaximumSize(QtCore.QSize(16777215, 20))
+        self.muSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.muSlider.setStyleSheet("QSlider::handle:horizontal {background-color: %s;}" % (header_color))
+        self.TmuLayout.addWidget(self.frameTmu)
+
+        ## outputs table
+        self.outputTable = QtWidgets.QTableWidget(self.centralwidget)
+        self.outputTable.setObjectName("outputTable")
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.outputTable.sizePolicy().hasHeightForWidth())
+        sizePolicy.setWidthForHeight(self.outputTable.sizePolicy().hasWidthForHeight())
+        self.outputTable.setSizePolicy(sizePolicy)
+        self.outputTable.setMinimumSize(QtCore.QSize(620, 117))
+        self.outputTable.setMaximumSize(QtCore.QSize(620, 117))
+        self.outputTable.horizontalHeader().setDefaultSectionSize(100)
+        self.outputTable.verticalHeader().setDefaultSectionSize(15)
+        self.outputTable.verticalHeader().setMinimumSectionSize(15)
+        self.outputTable.horizontalHeader().setFixedHeight(22)
+        self.outputTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
+        self.outputTable.setShowGrid(True)
+        self.outputTable.setObjectName("outputTable")
+        otfont = QtGui.QFont()
+        otfont.setBold(False)
+        otfont.setPointSize(9)
+        self.outputTable.setFont(otfont)
+        self.outputTable.setColumnCount(6)
+        self.outputTable.setRowCount(4)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setVerticalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setVerticalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setVerticalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setVerticalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.outputTable.setHorizontalHeaderItem(5, item)
+        self.outputTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.outputTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.gridLayoutTensors.addWidget(self.outputTable, 0, 0, 1, 1)
+
+        self.retranslateOutputUi(self.OutputWindow)
+        QtCore.QMetaObject.connectSlotsByName(self.OutputWindow)
+
+    def retranslateOutputUi(self, OutputWindow):
+        _translate = QtCore.QCoreApplication.translate
+        OutputWindow.setWindowTitle(_translate("OutputWindow", "OutputWindow"))
+        self.outputlabel.setText(_translate("OutputWindow", "OUTPUTS"))
+        self.TSym.setText(_translate("OutputWindow", "T [K]:"))
+        self.TVal.setText(_translate("OutputWindow", "0"))
+        self.muSym.setText(_translate("OutputWindow", "μ [eV]:")) # TODO
+        self.muVal.setText(_translate("OutputWindow", "0.0"))
+        item = self.outputTable.verticalHeaderItem(0)
+        item.setText(_translate("OutputWindow", "σ"))
+        item = self.outputTable.verticalHeaderItem(1)
+        item.setText(_translate("OutputWindow", "S"))
+        item = self.outputTable.verticalHeaderItem(2)
+        item.setText(_translate("OutputWindow", "κ" + u"\u2091"))
+        item = self.outputTable.verticalHeaderItem(3)
+        item.setText(_translate("OutputWindow", "n"))
+        item = self.outputTable.horizontalHeaderItem(0)
+        item.setText(_translate("OutputWindow", "11"))
+        item = self.outputTable.horizontalHeaderItem(1)
+        item.setText(_translate("OutputWindow", "22"))
+        item = self.outputTable.horizontalHeaderItem(2)
+        item.setText(_translate("OutputWindow", "33"))
+        item = self.outputTable.horizontalHeaderItem(3)
+        item.setText(_translate("OutputWindow", "12"))
+        item = self.outputTable.horizontalHeaderItem(4)
+        item.setText(_translate("OutputWindow", "13"))
+        item = self.outputTable.horizontalHeaderItem(5)
+        item.setText(_translate("OutputWindow", "23"))
+        self.menuFile.setTitle(_translate("OutputWindow", "File"))
+        self.menuAnalysis.setTitle(_translate("OutputWindow", "Analysis"))
+        self.menuHelp.setTitle(_translate("OutputWindow", "Help"))
+        self.actionSave_plots.setText(_translate("OutputWindow", "Save plots"))
+        self.actionExport_data.setText(_translate("OutputWindow", "Export data"))
+        self.actionMerits.setText(_translate("OutputWindow", "Figures of merit"))
+        self.actionTensors.setText(_translate("OutputWindow", "Principal values and directions"))
+        self.actionBrowser.setText(_translate("OutputWindow", "All data table"))
+        self.actionFit_mu.setText(_translate("OutputWindow", "Best-fit Fermi level"))
+        self.actionFit_params.setText(_translate("OutputWindow", "Fit parameters"))
+        self.actionTimings.setText(_translate("OutputWindow", "Show timings"))
+        self.actionExit.setText(_translate("InputWindow", "Exit"))
+        self.actionAbout.setText(_translate("OutputWindow", "About"))
+
+
+    # time each step of the next calculations (status bar)
+    @QtCore.Slot(bool)
+    def show_timings(self, checked):
+        self.parent.profiler.enabled = checked
+        if not checked:
+            self.statusbar.clearMessage()
+
+    @QtCore.Slot(int, int, str)
+    def show_export_progress(self, written, queued, fullpath):
+        self.statusbar.showMessage("Saved plots {}/{}: {}".format(written, queued, fullpath), 5000)
+
+    @QtCore.Slot(str, str)
+    def show_export_error(self, fullpath, error):
+        print("Plots not saved to {}: {}".format(fullpath, error))
+
+    @QtCore.Slot()
+    def create_saveplot_dialog(self):
+        self.SavePlotDialog = QtWidgets.QDialog()
+        self.ui_savePlot = UiSavePlotDialog(self)
+        self.ui_savePlot.setupUi(self.SavePlotDialog)
+        self.SavePlotDialog.show()
+
+
+    @QtCore.Slot()
+    def create_merits_dialog(self):
+        self.MeritsDialog = QtWidgets.QDialog()
+        self.ui_merits = UiMeritsDialog(self)
+        self.ui_merits.setupUi(self.MeritsDialog)
+        self.MeritsDialog.show()
+
+
+    @QtCore.Slot()
+    def create_browser_dialog(self):
+        self.BrowserDialog = QtWidgets.QDialog()
+        self.ui_browser = UiBrowserDialog(self)
+        self.ui_browser.setupUi(self.BrowserDialog)
+        self.BrowserDialog.show()
+
+
+    @QtCore.Slot()
+    def create_tensors_dialog(self):
+        self.TensorsDialog = QtWidgets.QDialog()
+        self.ui_tensors = UiTensorsDialog(self)
+        self.ui_tensors.setupUi(self.TensorsDialog)
+        self.TensorsDialog.show()
+
+
+    @QtCore.Slot()
+    def create_mufit_dialog(self):
+        self.MuFitDialog = QtWidgets.QDialog()
+        self.ui_muFit = UiMuFitDialog(self)
+        self.ui_muFit.setupUi(self.MuFitDialog)
+        self.MuFitDialog.show()
+
+
+    @QtCore.Slot()
+    def create_fit_dialog(self):
+        self.FitDialog = QtWidgets.QDialog()
+        self.ui_fit = UiFitDialog(self)
+        self.ui_fit.setupUi(self.FitDialog)
+        self.FitDialog.show()
+
+
+    # save calculations
+    @QtCore.Slot()
+    def save_data(self):
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self.OutputWindow, 'Save File', str(os.getcwd()),
+                                                             "CSV Files (*.csv)")
+        if filename[-3:] != "csv":
+            filename = filename + ".csv"
+        self.parent.export_data(filename)
+
+
+    # update outable when T slider changes
+    @QtCore.Slot()
+    def TValueChanged(self):
+        try:
+            if float(self.TVal.text()) not in self.parent.T:
+                return
+            else:
+                self.parent.publish_tensor()
+        except ValueError:
+            print("Wrong input number.")
+
+
+    # update outable when Fermi level slider changes
+    @QtCore.Slot()
+    def muValueChanged(self):
+        try:
+            if float(self.muVal.text()) not in self.parent.mus:
+                return
+            else:
+                self.parent.publish_tensor()
+        except ValueError:
+            print("Wrong input number.")
+
+
+    # update outable when T label changes
+    @QtCore.Slot()
+    def TValueChangedReturn(self):
+        if float(self.TVal.text()) not in self.parent.T:
+            return
+        if self.parent.T.size > 1:
+            value = int(self.TVal.text()-self.parent.T[0])/self.parent.T_step
+            self.TSlider.setValue(int(value))
+        self.parent.publish_tensor()
+
+
+    # update outable when Fermi level label changes
+    @QtCore.Slot()
+    def muValueChangedReturn(self):
+        if float(self.muVal.text()) not in self.parent.mus:
+            return
+        if self.parent.mus.size > 1:
+            value = np.nonzero(self.parent.mus == float(self.muVal.text()))[0][0]
+            self.muSlider.setValue(int(value))
+        self.parent.publish_tensor()
+
+    # update T label when slider changes
+    @QtCore.Slot()
+    def TSliderChanged(self):
+        value = int(self.TSlider.value()*self.parent.T_step + self.parent.T[0])
+        self.TVal.setText(str(value))
+
+    # udapte Fermi level labels when slider changes
+    @QtCore.Slot()
+    def muSliderChanged(self):
+        value = self.parent.mus[self.muSlider.value()]
+        self.muVal.setText(str(value))
+
+
+    @QtCore.Slot()
+    def set_last_tick(self):
+        self.TSlider.last_tick_pos = self.TSlider.value()
+
+
+    @QtCore.Slot()
+    def check_values(self):
+        self.TSlider.check_values(self.TSlider.value())
+
+
+# save plot dialog
+class UiSavePlotDialog(object):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def setupUi(self, saveDialog):
+        self.saveDialog = saveDialog
+        self.saveDialog.setObjectName("Dialog")
+        self.saveDialog.resize(536, 190)
+        self.gridLayoutSave = QtWidgets.QGridLayout(self.saveDialog)
+        self.gridLayoutSave.setObjectName("gridLayoutSave")
+
+        # set font
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        # set common policy
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        # export path label
+        self.pathLabel = QtWidgets.QLabel(self.saveDialog)
+        self.pathLabel.setObjectName("pathLabel")
+        self.pathLabel.setFont(font)
+        self.pathLabel.setMaximumSize(QtCore.QSize(75, 16777215))
+        sizePolicy.setHeightForWidth(self.pathLabel.sizePolicy().hasHeightForWidth())
+        self.pathLabel.setSizePolicy(sizePolicy)
+        self.pathLabel.setFrameShape(QtWidgets.QFrame.Box)
+        self.pathLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.gridLayoutSave.addWidget(self.pathLabel, 0, 0, 1, 1)
+        # export path input box
+        self.pathInput = QtWidgets.QLineEdit(self.saveDialog)
+        self.pathInput.setFont(font)
+        self.pathInput.setObjectName("lineEdit_3")
+        self.gridLayoutSave.addWidget(self.pathInput, 0, 1, 1, 1)
+        # browse button
+        self.browseButton = QtWidgets.QPushButton(self.saveDialog)
+        self.browseButton.setObjectName("BrowseButton")
+        self.browseButton.setFont(font)
+        self.browseButton.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.browseButton.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.browseButton.clicked.connect(self.browse)
+        self.gridLayoutSave.addWidget(self.browseButton, 0, 2, 1, 1)
+        # filename label
+        self.filenameLabel = QtWidgets.QLabel(self.saveDialog)
+        self.filenameLabel.setObjectName("filenameLabel")
+        self.filenameLabel.setFont(font)
+        self.filenameLabel.setMaximumSize(QtCore.QSize(75, 16777215))
+        sizePolicy.setHeightForWidth(self.filenameLabel.sizePolicy().hasHeightForWidth())
+        self.filenameLabel.setSizePolicy(sizePolicy)
+        self.filenameLabel.setFrameShape(QtWidgets.QFrame.Box)
+        self.filenameLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.gridLayoutSave.addWidget(self.filenameLabel, 2, 0, 1, 1)
+        # filename inputbox
+        self.filenameInput = QtWidgets.QLineEdit(self.saveDialog)
+        self.filenameInput.setFont(font)
+        self.filenameInput.setObjectName("lineEdit_2")
+        self.gridLayoutSave.addWidget(self.filenameInput, 2, 1, 1, 1)
+        # formats (one file for each checked format)
+        self.formatLayout = QtWidgets.QHBoxLayout()
+        self.formatLayout.setObjectName("formatLayout")
+        self.formatBoxes = dict()
+        for fmt in EXPORT_FORMATS:
+            box = QtWidgets.QCheckBox(self.saveDialog)
+            box.setObjectName(fmt + "Box")
+            box.setFont(font)
+            box.setChecked(fmt == "png")
+            self.formatLayout.addWidget(box)
+            self.formatBoxes[fmt] = box
+        self.gridLayoutSave.addLayout(self.formatLayout, 4, 1, 1, 2)
+        # formats label
+        self.formatLabel = QtWidgets.QLabel(self.saveDialog)
+        self.formatLabel.setObjectName("formatLabel")
+        self.formatLabel.setFont(font)
+        self.formatLabel.setMaximumSize(QtCore.QSize(75, 16777215))
+        sizePolicy.setHeightForWidth(self.formatLabel.sizePolicy().hasHeightForWidth())
+        self.formatLabel.setSizePolicy(sizePolicy)
+        self.formatLabel.setFrameShape(QtWidgets.QFrame.Box)
+        self.formatLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.gridLayoutSave.addWidget(self.formatLabel, 4, 0, 1, 1)
+        # dpi label
+        self.dpiLabel = QtWidgets.QLabel(self.saveDialog)
+        self.dpiLabel.setObjectName("dpiLabel")
+        self.dpiLabel.setFont(font)
+        self.dpiLabel.setMaximumSize(QtCore.QSize(75, 16777215))
+        sizePolicy.setHeightForWidth(self.dpiLabel.sizePolicy().hasHeightForWidth())
+        self.dpiLabel.setSizePolicy(sizePolicy)
+        self.dpiLabel.setFrameShape(QtWidgets.QFrame.Box)
+        self.dpiLabel.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.gridLayoutSave.addWidget(self.dpiLabel, 3, 0, 1, 1)
+        # dpi input box
+        self.dpiInput = ClickableLineEdit(self.saveDialog)
+        self.dpiInput.setObjectName("lineEdit")
+        self.dpiInput.setStyleSheet("color: gray")
+        self.dpiInput.setFont(font)
+        self.dpiInput.clicked.connect(self.insert_new_dpi)
+        self.dpiInput.editingFinished.connect(self.update_dpi)
+        self.gridLayoutSave.addWidget(self.dpiInput, 3, 1, 1, 1)
+        # save button
+        self.saveButton = QtWidgets.QPushButton(self.saveDialog)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.saveButton.setFont(font)
+        self.saveButton.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.saveButton.setObjectName("SaveButton")
+        self.saveButton.clicked.connect(self.save_plots)
+        self.gridLayoutSave.addWidget(self.saveButton, 5, 0, 1, 3)
+
+        self.retranslateUi(self.saveDialog)
+        QtCore.QMetaObject.connectSlotsByName(self.saveDialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Save plots"))
+        self.pathLabel.setText(_translate("Dialog", "Path"))
+        self.filenameLabel.setText(_translate("Dialog", "Filename"))
+        self.browseButton.setText(_translate("Dialog", "..."))
+        self.dpiLabel.setText(_translate("Dialog", "dpi"))
+        self.formatLabel.setText(_translate("Dialog", "Formats"))
+        for fmt, box in self.formatBoxes.items():
+            box.setText(_translate("Dialog", fmt))
+        self.dpiInput.setText(_translate("Dialog", "300"))
+        self.saveButton.setText(_translate("Dialog", "Save"))
+
+    @QtCore.Slot()
+    def save_plots(self):
+        self.path = self.pathInput.text()
+        self.filename = self.filenameInput.text()
+        # several resolutions separated by commas, e.g. "150, 300"
+        try:
+            self.dpis = [float(d) for d in self.dpiInput.text().split(",") if d.strip() != ""]
+        except ValueError:
+            print("Wrong input number.")
+            return
+        self.formats = [fmt for fmt, box in self.formatBoxes.items() if box.isChecked()]
+        if not self.dpis or not self.formats:
+            return
+        targets = export_targets(self.path, self.filename, self.formats, self.dpis)
+        self.parent.export_queue.submit(self.parent.plots.figure, targets)
+        self.saveDialog.close()
+
+    @QtCore.Slot()
+    def browse(self):
+        path = QtWidgets.QFileDialog.getExistingDirectory(self.parent.OutputWindow, 'Save File', str(os.getcwd()))
+        self.pathInput.setText(path)
+
+    @QtCore.Slot()
+    def insert_new_dpi(self):
+        self.dpiInput.setStyleSheet("color: black")
+
+    @QtCore.Slot()
+    def update_dpi(self):
+        input_text = self.dpiInput.text()
+        if input_text == '':
+            self.dpiInput.setStyleSheet("color: gray")
+            self.dpiInput.setText("300")
+
+
+# figures of merit dialog
+class UiMeritsDialog(object):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def setupUi(self, meritsDialog):
+        self.meritsDialog = meritsDialog
+        self.meritsDialog.setObjectName("MeritsDialog")
+        self.meritsDialog.resize(700, 560)
+        self.gridLayoutMerits = QtWidgets.QGridLayout(self.meritsDialog)
+        self.gridLayoutMerits.setObjectName("gridLayoutMerits")
+
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        # lattice thermal conductivity
+        self.kappaLabel = QtWidgets.QLabel(self.meritsDialog)
+        self.kappaLabel.setObjectName("kappaLabel")
+        self.kappaLabel.setFont(font)
+        self.gridLayoutMerits.addWidget(self.kappaLabel, 0, 0, 1, 1)
+        self.kappaInput = QtWidgets.QLineEdit(self.meritsDialog)
+        self.kappaInput.setObjectName("kappaInput")
+        self.kappaInput.setFont(font)
+        self.gridLayoutMerits.addWidget(self.kappaInput, 0, 1, 1, 1)
+        # trace or one component of the tensors
+        self.componentBox = QtWidgets.QComboBox(self.meritsDialog)
+        self.componentBox.setObjectName("componentBox")
+        self.componentBox.setFont(font)
+        self.componentBox.addItem("trace")
+        for c in COMPONENTS:
+            self.componentBox.addItem(c)
+        self.gridLayoutMerits.addWidget(self.componentBox, 0, 2, 1, 1)
+        # compute button
+        self.computeButton = QtWidgets.QPushButton(self.meritsDialog)
+        self.computeButton.setObjectName("ComputeButton")
+        self.computeButton.setFont(font)
+        self.computeButton.clicked.connect(self.compute)
+        self.gridLayoutMerits.addWidget(self.computeButton, 0, 3, 1, 1)
+        # result
+        self.resultLabel = QtWidgets.QLabel(self.meritsDialog)
+        self.resultLabel.setObjectName("resultLabel")
+        self.resultLabel.setFont(font)
+        self.gridLayoutMerits.addWidget(self.resultLabel, 1, 0, 1, 4)
+        # same layout as the output plots
+        self.plots = PlotsCanvas(self.meritsDialog)
+        self.gridLayoutMerits.addWidget(self.plots, 2, 0, 1, 4)
+
+        self.retranslateUi(self.meritsDialog)
+        QtCore.QMetaObject.connectSlotsByName(self.meritsDialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Figures of merit"))
+        self.kappaLabel.setText(_translate("Dialog", "κ" + u"\u2097" + " [W/(m K)]"))
+        self.kappaInput.setText(_translate("Dialog", "0.0"))
+        self.computeButton.setText(_translate("Dialog", "Compute"))
+        self.componentBox.currentIndexChanged.connect(self.compute)
+        ui_in = self.parent.parent
+        if ui_in.out_all_data.conductivity is None or ui_in.out_all_data.seebeck is None or ui_in.out_all_data.thermal is None:
+            self.resultLabel.setText(_translate("Dialog", "Compute the tensors first."))
+            self.computeButton.setEnabled(False)
+            self.componentBox.setEnabled(False)
+
+    @QtCore.Slot()
+    def compute(self):
+        ui_in = self.parent.parent
+        try:
+            kappa_lattice = float(self.kappaInput.text())
+        except ValueError:
+            self.resultLabel.setText("Wrong input number.")
+            return
+        # stored with the tensors: also written by File > Export data
+        traces, tensors = ui_in.out_all_data.figuresOfMerit(ui_in.T, kappa_lattice)
+        component = self.componentBox.currentIndex() - 1
+        for name in MERITS:
+            y = traces[name] if component < 0 else tensors[name][component]
+            self.plots.clear_tensor(name)
+            self.plots.plot(name, ui_in.T, y, ui_in.mus, ui_in.data.tau_model_type, {})
+        zt = traces["zt"]
+        if np.isfinite(zt).any():
+            i, j = np.unravel_index(np.nanargmax(zt), zt.shape)
+            self.resultLabel.setText("max zT = {:.4f} at μ = {:.5f} eV, T = {:g} K".format(zt[i, j], ui_in.mus[i], ui_in.T[j]))
+
+
+# table of every (μ, T) point of the results
+class UiBrowserDialog(object):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def setupUi(self, browserDialog):
+        self.browserDialog = browserDialog
+        self.browserDialog.setObjectName("BrowserDialog")
+        self.browserDialog.resize(900, 560)
+        self.gridLayoutBrowser = QtWidgets.QGridLayout(self.browserDialog)
+        self.gridLayoutBrowser.setObjectName("gridLayoutBrowser")
+
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        # ranges of Fermi levels and temperatures (empty: no limit)
+        self.rangeInputs = list()
+        self.rangeLabels = list()
+        for i in range(4):
+            label = QtWidgets.QLabel(self.browserDialog)
+            label.setFont(font)
+            self.gridLayoutBrowser.addWidget(label, 0, 2*i, 1, 1)
+            lineEdit = QtWidgets.QLineEdit(self.browserDialog)
+            lineEdit.setFont(font)
+            lineEdit.returnPressed.connect(self.update)
+            self.gridLayoutBrowser.addWidget(lineEdit, 0, 2*i+1, 1, 1)
+            self.rangeLabels.append(label)
+            self.rangeInputs.append(lineEdit)
+        self.filterButton = QtWidgets.QPushButton(self.browserDialog)
+        self.filterButton.setObjectName("FilterButton")
+        self.filterButton.setFont(font)
+        self.filterButton.clicked.connect(self.update)
+        self.gridLayoutBrowser.addWidget(self.filterButton, 0, 8, 1, 1)
+        # tensors and components shown
+        self.tensorBoxes = list()
+        for i, (name, header, scale) in enumerate(TENSORS):
+            checkBox = QtWidgets.QCheckBox(self.browserDialog)
+            checkBox.setFont(font)
+            checkBox.setChecked(True)
+            self.gridLayoutBrowser.addWidget(checkBox, 1, i, 1, 1)
+            self.tensorBoxes.append(checkBox)
+        self.componentBoxes = list()
+        for i, component in enumerate(("trace",) + COMPONENTS):
+            checkBox = QtWidgets.QCheckBox(self.browserDialog)
+            checkBox.setFont(font)
+            checkBox.setChecked(component == "trace")
+            self.gridLayoutBrowser.addWidget(checkBox, 2, i, 1, 1)
+            self.componentBoxes.append((component, checkBox))
+        # only the visible rows are formatted, whatever the size of the grid
+        self.model = ResultTableModel(self.browserDialog)
+        self.tableView = QtWidgets.QTableView(self.browserDialog)
+        self.tableView.setObjectName("tableView")
+        self.tableView.setFont(font)
+        self.tableView.setModel(self.model)
+        self.tableView.setSortingEnabled(True)
+        self.tableView.setAlternatingRowColors(True)
+        self.tableView.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.tableView.verticalHeader().setDefaultSectionSize(20)
+        self.tableView.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.gridLayoutBrowser.addWidget(self.tableView, 3, 0, 1, 9)
+        self.countLabel = QtWidgets.QLabel(self.browserDialog)
+        self.countLabel.setObjectName("countLabel")
+        self.countLabel.setFont(font)
+        self.gridLayoutBrowser.addWidget(self.countLabel, 4, 0, 1, 9)
+
+        self.retranslateUi(self.browserDialog)
+        QtCore.QMetaObject.connectSlotsByName(self.browserDialog)
+        for checkBox in self.tensorBoxes + [checkBox for component, checkBox in self.componentBoxes]:
+            checkBox.toggled.connect(self.update)
+        self.update()
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "All data"))
+        for label, text in zip(self.rangeLabels, ("μ min [eV]", "μ max [eV]", "T min [K]", "T max [K]")):
+            label.setText(_translate("Dialog", text))
+        self.filterButton.setText(_translate("Dialog", "Filter"))
+        for checkBox, (name, header, scale) in zip(self.tensorBoxes, TENSORS):
+            checkBox.setText(_translate("Dialog", header))
+        for component, checkBox in self.componentBoxes:
+            checkBox.setText(_translate("Dialog", component))
+
+    # read the result arrays again (no copy) with the current selection and ranges
+    @QtCore.Slot()
+    def update(self):
+        ui_in = self.parent.parent
+        try:
+            bounds = [float(w.text()) if w.text().strip() != "" else None for w in self.rangeInputs]
+        except ValueError:
+            self.countLabel.setText("Write the ranges as numbers.")
+            return
+        tensors = dict()
+        for checkBox, (name, header, scale) in zip(self.tensorBoxes, TENSORS):
+            if checkBox.isChecked() and getattr(ui_in.out_all_data, name) is not None:
+                tensors[name] = getattr(ui_in.out_all_data, name)
+        components = [component for component, checkBox in self.componentBoxes if checkBox.isChecked()]
+        if not tensors and all(getattr(ui_in.out_all_data, name) is None for name, header, scale in TENSORS):
+            self.countLabel.setText("Compute the tensors first.")
+            return
+        self.model.mu_range, self.model.T_range = tuple(bounds[:2]), tuple(bounds[2:])
+        self.model.set_data(ui_in.mus, ui_in.T, tensors, components)
+        self.countLabel.setText("{} of {} points".format(self.model.rowCount(), self.model.total()))
+
+
+# principal values and directional values of the tensors dialog
+class UiTensorsDialog(object):
+    # tensors of the output window: attribute of ResultAllCompData, label and y scale
+    TENSORS = (("conductivity", "σ", 1.0), ("seebeck", "S [μV/K]", 1e6), ("thermal", "κ" + u"\u2091", 1.0))
+    QUANTITIES = ("λ min", "λ mid", "λ max", "anisotropy", "direction")
+
+    def __init__(self, parent):
+        self.parent = parent
+
+    def setupUi(self, tensorsDialog):
+        self.tensorsDialog = tensorsDialog
+        self.tensorsDialog.setObjectName("TensorsDialog")
+        self.tensorsDialog.resize(760, 400)
+        self.gridLayoutTensors = QtWidgets.QGridLayout(self.tensorsDialog)
+        self.gridLayoutTensors.setObjectName("gridLayoutTensors")
+
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        # tensor
+        self.tensorBox = QtWidgets.QComboBox(self.tensorsDialog)
+        self.tensorBox.setObjectName("tensorBox")
+        self.tensorBox.setFont(font)
+        for name, label, scale in self.TENSORS:
+            self.tensorBox.addItem(label)
+        self.gridLayoutTensors.addWidget(self.tensorBox, 0, 0, 1, 1)
+        # quantity of the (T, mu) map
+        self.quantityBox = QtWidgets.QComboBox(self.tensorsDialog)
+        self.quantityBox.setObjectName("quantityBox")
+        self.quantityBox.setFont(font)
+        for quantity in self.QUANTITIES:
+            self.quantityBox.addItem(quantity)
+        self.gridLayoutTensors.addWidget(self.quantityBox, 0, 1, 1, 1)
+        # crystal direction of the map, e.g. "1 1 0"
+        self.directionInput = QtWidgets.QLineEdit(self.tensorsDialog)
+        self.directionInput.setObjectName("directionInput")
+        self.directionInput.setFont(font)
+        self.gridLayoutTensors.addWidget(self.directionInput, 0, 2, 1, 1)
+        # plane of the polar plot
+        self.planeBox = QtWidgets.QComboBox(self.tensorsDialog)
+        self.planeBox.setObjectName("planeBox")
+        self.planeBox.setFont(font)
+        for plane in ("12", "13", "23"):
+            self.planeBox.addItem(plane)
+        self.gridLayoutTensors.addWidget(self.planeBox, 0, 3, 1, 1)
+        # plot button
+        self.plotButton = QtWidgets.QPushButton(self.tensorsDialog)
+        self.plotButton.setObjectName("PlotButton")
+        self.plotButton.setFont(font)
+        self.plotButton.clicked.connect(self.plot)
+        self.gridLayoutTensors.addWidget(self.plotButton, 0, 4, 1, 1)
+        # result
+        self.resultLabel = QtWidgets.QLabel(self.tensorsDialog)
+        self.resultLabel.setObjectName("resultLabel")
+        self.resultLabel.setFont(font)
+        self.gridLayoutTensors.addWidget(self.resultLabel, 1, 0, 1, 5)
+        # (T, mu) map and polar plot at the Fermi level and temperature of the output window
+        self.canvas = FigureCanvasQTAgg(Figure(figsize=(8, 3.5), dpi=80))
+        self.ax_map = self.canvas.figure.add_subplot(1, 2, 1)
+        self.ax_polar = self.canvas.figure.add_subplot(1, 2, 2, projection="polar")
+        self.canvas.figure.subplots_adjust(wspace=0.4, bottom=0.15)
+        self.colorbar = None
+        self.gridLayoutTensors.addWidget(self.canvas, 2, 0, 1, 5)
+
+        self.retranslateUi(self.tensorsDialog)
+        QtCore.QMetaObject.connectSlotsByName(self.tensorsDialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Principal values and directions"))
+        self.directionInput.setText(_translate("Dialog", "1 1 0"))
+        self.plotButton.setText(_translate("Dialog", "Plot"))
+        if all(getattr(self.parent.parent.out_all_data, name) is None for name, label, scale in self.TENSORS):
+            self.resultLabel.setText(_translate("Dialog", "Compute the tensors first."))
+            self.plotButton.setEnabled(False)
+
+    @QtCore.Slot()
+    def plot(self):
+        ui_in = self.parent.parent
+        name, label, scale = self.TENSORS[self.tensorBox.currentIndex()]
+        tensor = getattr(ui_in.out_all_data, name)
+        if tensor is None:
+            return
+        tensor = np.multiply(tensor, scale)
+        quantity = self.quantityBox.currentText()
+        try:
+            direction = [float(v) for v in self.directionInput.text().replace(",", " ").split()]
+            if len(direction) != 3:
+                raise ValueError("Write the direction as three numbers, e.g. 1 1 0.")
+            along = directional(tensor, [direction])[0]
+        except ValueError as err:
+            self.resultLabel.setText(str(err))
+            return
+
+        # one batched eigh over the whole grid
+        values, vectors = principal(tensor)
+        if quantity == "direction":
+            z, title = along, "{} along [{}]".format(label, self.directionInput.text().strip())
+        elif quantity == "anisotropy":
+            z, title = anisotropy(values), "{} anisotropy".format(label)
+        else:
+            z, title = values[..., self.QUANTITIES.index(quantity)], "{} {}".format(label, quantity)
+
+        self.ax_map.cla()
+        if ui_in.mus.size > 1 and ui_in.T.size > 1:
+            mesh = self.ax_map.pcolormesh(ui_in.T, ui_in.mus, z, shading="nearest", cmap=cm.viridis)
+            if self.colorbar is None:
+                self.colorbar = self.canvas.figure.colorbar(mesh, ax=self.ax_map)
+            else:
+                self.colorbar.update_normal(mesh)
+            self.ax_map.set_ylabel(r"$\mu\ [eV]$")
+        else:
+            self.ax_map.plot(ui_in.T if ui_in.mus.size == 1 else ui_in.mus, np.ravel(z), marker='.')
+        self.ax_map.set_xlabel(r"$T\ [K]$" if ui_in.mus.size == 1 or ui_in.T.size > 1 else r"$\mu\ [eV]$")
+        self.ax_map.set_title(title, fontsize=9)
+
+        # polar plot at the point of the sliders
+        try:
+            mu_idx = int(np.argmin(np.abs(ui_in.mus - float(self.parent.muVal.text()))))
+            t_idx = int(np.argmin(np.abs(ui_in.T - float(self.parent.TVal.text()))))
+        except ValueError:
+            mu_idx = t_idx = 0
+        plane = self.planeBox.currentText()
+        angles, directions = plane_directions(plane)
+        r = directional(tensor[:, mu_idx:mu_idx+1, t_idx:t_idx+1], directions)[:, 0, 0]
+        self.ax_polar.cla()
+        # magnitude: Seebeck may be negative
+        self.ax_polar.plot(angles, np.abs(r), color=tuple(item / 255 for item in gui_color))
+        self.ax_polar.set_title("|{}| in plane {}".format(label, plane), fontsize=9)
+        self.canvas.draw()
+
+        v = vectors[mu_idx, t_idx]
+        self.resultLabel.setText("μ = {:.5f} eV, T = {:g} K:   λ = {}   directions = {}".format(
+            ui_in.mus[mu_idx], ui_in.T[t_idx],
+            ", ".join("{:.4e}".format(x) for x in values[mu_idx, t_idx]),
+            ", ".join("[{}]".format(" ".join("{:.3f}".format(c) for c in v[:, k])) for k in range(3))))
+
+
+# best-fit Fermi level dialog
+class UiMuFitDialog(object):
+    def __init__(self, parent):
+        self.parent = parent
+
+    def setupUi(self, fitDialog):
+        self.fitDialog = fitDialog
+        self.fitDialog.setObjectName("MuFitDialog")
+        self.fitDialog.resize(640, 360)
+        self.gridLayoutFit = QtWidgets.QGridLayout(self.fitDialog)
+        self.gridLayoutFit.setObjectName("gridLayoutFit")
+
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        # tensors computed and measured
+        ui_in = self.parent.parent
+        self.tensorBox = QtWidgets.QComboBox(self.fitDialog)
+        self.tensorBox.setObjectName("tensorBox")
+        self.tensorBox.setFont(font)
+        for label in ui_in.out_trace_data.label:
+            if label in ui_in.exp_data:
+                self.tensorBox.addItem(label)
+        self.gridLayoutFit.addWidget(self.tensorBox, 0, 0, 1, 1)
+        # error metric
+        self.metricBox = QtWidgets.QComboBox(self.fitDialog)
+        self.metricBox.setObjectName("metricBox")
+        self.metricBox.setFont(font)
+        for metric in METRICS:
+            self.metricBox.addItem(metric)
+        self.gridLayoutFit.addWidget(self.metricBox, 0, 1, 1, 1)
+        # fit button
+        self.fitButton = QtWidgets.QPushButton(self.fitDialog)
+        self.fitButton.setObjectName("FitButton")
+        self.fitButton.setFont(font)
+        self.fitButton.clicked.connect(self.fit)
+        self.gridLayoutFit.addWidget(self.fitButton, 0, 2, 1, 1)
+        # result
+        self.resultLabel = QtWidgets.QLabel(self.fitDialog)
+        self.resultLabel.setObjectName("resultLabel")
+        self.resultLabel.setFont(font)
+        self.gridLayoutFit.addWidget(self.resultLabel, 1, 0, 1, 3)
+        # mu(T) and error landscape
+        self.canvas = FigureCanvasQTAgg(Figure(figsize=(6, 3), dpi=80))
+        self.ax_mu, self.ax_err = self.canvas.figure.subplots(1, 2)
+        self.canvas.figure.subplots_adjust(wspace=0.4, bottom=0.18)
+        self.gridLayoutFit.addWidget(self.canvas, 2, 0, 1, 3)
+
+        self.retranslateUi(self.fitDialog)
+        QtCore.QMetaObject.connectSlotsByName(self.fitDialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Best-fit Fermi level"))
+        self.fitButton.setText(_translate("Dialog", "Fit"))
+        if self.tensorBox.count() == 0:
+            self.resultLabel.setText(_translate("Dialog", "Import experimental data and compute the tensors first."))
+            self.fitButton.setEnabled(False)
+
+    @QtCore.Slot()
+    def fit(self):
+        ui_in = self.parent.parent
+        tensor_name = self.tensorBox.currentText()
+        trace = ui_in.out_trace_data.data[ui_in.out_trace_data.label.index(tensor_name)]
+        try:
+            result = fit_mu(ui_in.mus, ui_in.T, trace, ui_in.exp_data['temperature'], ui_in.exp_data[tensor_name],
+                            metric=self.metricBox.currentText())
+        except ValueError as err:
+            self.resultLabel.setText(str(err))
+            return
+        self.resultLabel.setText("best μ = {:.5f} eV    error ({}) = {:.4e}".format(result.mu_best, result.metric, result.error_best))
+
+        # mu(T)
+        self.ax_mu.cla()
+        self.ax_mu.plot(ui_in.T, result.mu_T, marker='.', color=tuple(item / 255 for item in gui_color))
+        self.ax_mu.axhline(result.mu_best, linestyle="--", color="dimgray", linewidth=0.5)
+        self.ax_mu.set_xlabel(r"$T\ [K]$")
+        self.ax_mu.set_ylabel(r"$\mu\ [eV]$")
+        self.ax_mu.grid(linewidth=0.3)
+        # error landscape
+        self.ax_err.cla()
+        if ui_in.mus.size > 1 and ui_in.T.size > 1:
+            with np.errstate(divide="ignore"):
+                self.ax_err.pcolormesh(ui_in.T, ui_in.mus, np.log10(result.landscape), shading="nearest", cmap=cm.viridis)
+            self.ax_err.plot(ui_in.T, result.mu_T, color="white", linewidth=0.8)
+        else:
+            self.ax_err.plot(ui_in.mus, result.score, marker='.')
+        self.ax_err.set_xlabel(r"$T\ [K]$")
+        self.ax_err.set_ylabel(r"$\mu\ [eV]$")
+        self.ax_err.set_title("log10 error", fontsize=9)
+        self.canvas.draw()
+
+        # best curve on the output plots
+        self.parent.plots.plot_fit(tensor_name, ui_in.T, trace_at_mu(ui_in.mus, trace, result.mu_best), result.mu_best)
+
+
+# band and scattering parameters fit dialog
+class UiFitDialog(object):
+    def __init__(self, parent):
+        self.parent = parent
+        self.worker = None
+        self.history = dict()
+
+    def setupUi(self, fitDialog):
+        self.fitDialog = fitDialog
+        self.fitDialog.setObjectName("FitDialog")
+        self.fitDialog.resize(520, 560)
+        self.gridLayoutFit = QtWidgets.QGridLayout(self.fitDialog)
+        self.gridLayoutFit.setObjectName("gridLayoutFit")
+
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        ui_in = self.parent.parent
+        self.params, wrong = ui_in.get_fit_params()
+        # parameters table: fit checkbox, value, min, max
+        self.paramTable = QtWidgets.QTableWidget(self.fitDialog)
+        self.paramTable.setObjectName("paramTable")
+        self.paramTable.setFont(font)
+        self.paramTable.setColumnCount(4)
+        self.paramTable.setRowCount(len(self.params))
+        self.paramTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        for row, p in enumerate(self.params):
+            self.paramTable.setVerticalHeaderItem(row, QtWidgets.QTableWidgetItem(p.label()))
+            item = QtWidgets.QTableWidgetItem()
+            item.setFlags(QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled)
+            item.setCheckState(QtCore.Qt.Unchecked)
+            self.paramTable.setItem(row, 0, item)
+            for column, value in enumerate((p.value, p.lower, p.upper)):
+                item = QtWidgets.QTableWidgetItem(format(value, '.6g'))
+                item.setTextAlignment(QtCore.Qt.AlignCenter)
+                self.paramTable.setItem(row, column+1, item)
+        self.gridLayoutFit.addWidget(self.paramTable, 0, 0, 1, 6)
+        # options
+        self.startsLabel = QtWidgets.QLabel(self.fitDialog)
+        self.startsLabel.setFont(font)
+        self.gridLayoutFit.addWidget(self.startsLabel, 1, 0, 1, 1)
+        self.startsSpin = QtWidgets.QSpinBox(self.fitDialog)
+        self.startsSpin.setRange(1, 64)
+        self.startsSpin.setValue(1)
+        self.gridLayoutFit.addWidget(self.startsSpin, 1, 1, 1, 1)
+        self.workersLabel = QtWidgets.QLabel(self.fitDialog)
+        self.workersLabel.setFont(font)
+        self.gridLayoutFit.addWidget(self.workersLabel, 1, 2, 1, 1)
+        self.workersSpin = QtWidgets.QSpinBox(self.fitDialog)
+        self.workersSpin.setRange(1, 256)
+        self.workersSpin.setValue(os.cpu_count() or 1)
+        self.gridLayoutFit.addWidget(self.workersSpin, 1, 3, 1, 1)
+        self.metricBox = QtWidgets.QComboBox(self.fitDialog)
+        self.metricBox.setFont(font)
+        for metric in METRICS:
+            self.metricBox.addItem(metric)
+        self.gridLayoutFit.addWidget(self.metricBox, 1, 4, 1, 1)
+        self.fitButton = QtWidgets.QPushButton(self.fitDialog)
+        self.fitButton.setObjectName("FitButton")
+        self.fitButton.setFont(font)
+        self.fitButton.clicked.connect(self.fit)
+        self.gridLayoutFit.addWidget(self.fitButton, 1, 5, 1, 1)
+        # live convergence
+        self.statusLabel = QtWidgets.QLabel(self.fitDialog)
+        self.statusLabel.setFont(font)
+        self.gridLayoutFit.addWidget(self.statusLabel, 2, 0, 1, 6)
+        if wrong:
+            self.statusLabel.setText("Wrong input number for {}: not in the fit.".format(", ".join(wrong)))
+        self.canvas = FigureCanvasQTAgg(Figure(figsize=(5, 2.5), dpi=80))
+        self.ax = self.canvas.figure.subplots(1, 1)
+        self.canvas.figure.subplots_adjust(bottom=0.2)
+        self.gridLayoutFit.addWidget(self.canvas, 3, 0, 1, 6)
+
+        self.retranslateUi(self.fitDialog)
+        QtCore.QMetaObject.connectSlotsByName(self.fitDialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Fit parameters"))
+        self.paramTable.setHorizontalHeaderLabels(["fit", "value", "min", "max"])
+        self.startsLabel.setText(_translate("Dialog", "starts"))
+        self.workersLabel.setText(_translate("Dialog", "workers"))
+        self.fitButton.setText(_translate("Dialog", "Fit"))
+
+    # parameters checked for the fit, with the values in the table
+    # (ValueError with the message for the status label on a wrong cell)
+    def selected_params(self):
+        selected = list()
+        for row, p in enumerate(self.params):
+            if self.paramTable.item(row, 0).checkState() != QtCore.Qt.Checked:
+                continue
+            try:
+                value, lower, upper = (float(self.paramTable.item(row, column).text()) for column in (1, 2, 3))
+            except ValueError:
+                raise ValueError("Wrong input number for {}.".format(p.label()))
+            if not np.all(np.isfinite((value, lower, upper))):
+                raise ValueError("Wrong input number for {}.".format(p.label()))
+            if not lower < upper:
+                raise ValueError("Min must be lower than max for {}.".format(p.label()))
+            p.value, p.lower, p.upper = value, lower, upper
+            selected.append(p)
+        return selected
+
+    @QtCore.Slot()
+    def fit(self):
+        # second click stops the running fit
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.stop()
+            return
+        ui_in = self.parent.parent
+        try:
+            params = self.selected_params()
+        except ValueError as err:
+            self.statusLabel.setText(str(err))
+            return
+        tensors = [t for t in ("conductivity", "seebeck", "thermal", "concentration") if t in ui_in.exp_data]
+        if not params or not tensors:
+            self.statusLabel.setText("Select parameters and import experimental data first.")
+            return
+        exp_curves = {t: (ui_in.exp_data['temperature'], ui_in.exp_data[t]) for t in tensors}
+        objective = Objective(ServerEngine(tensors, ui_in.server), ui_in.get_message(), params, exp_curves, metric=self.metricBox.currentText())
+        optimizer = BoundedLeastSquares(objective, max_workers=self.workersSpin.value())
+
+        self.history = dict()
+        self.ax.cla()
+        self.worker = FitWorker(optimizer, [p.value for p in params], num_starts=self.startsSpin.value())
+        self.worker.progress.connect(self.update_progress)
+        self.worker.done.connect(self.finish)
+        self.fit_params = params
+        self.objective = objective
+        self.fitButton.setText("Stop")
+        self.worker.start()
+
+    # one point of the convergence curve for each improvement
+    @QtCore.Slot(int, int, float, object)
+    def update_progress(self, start, iteration, cost, x):
+        self.history.setdefault(start, []).append(cost)
+        self.ax.cla()
+        for s, costs in self.history.items():
+            self.ax.semilogy(np.arange(1, len(costs)+1), costs, marker='.', label="start {}".format(s+1))
+        self.ax.set_xlabel("iteration")
+        self.ax.set_ylabel("cost")
+        self.ax.grid(linewidth=0.3)
+        self.canvas.draw()
+        self.statusLabel.setText("start {}  iteration {}  cost {:.4e}  evaluations {}".format(start+1, iteration, cost, self.objective.num_evals))
+        for p, value in zip(self.fit_params, x):
+            self.paramTable.item(self.params.index(p), 1).setText(format(value, '.6g'))
+
+    @QtCore.Slot(object, str)
+    def finish(self, result, error):
+        self.fitButton.setText("Fit")
+        if error:
+            # the table keeps the best parameters reported before the failure
+            best = "" if result is None else ", best cost {:.4e} (start {})".format(result.cost, result.start+1)
+            self.statusLabel.setText("Fit stopped: server error{}. {}".format(best, error))
+            return
+        if result is None or not np.isfinite(result.cost):
+            self.statusLabel.setText("Fit failed: the server could not compute the initial parameters.")
+            return
+        self.statusLabel.setText("best cost {:.4e} (start {}, {} evaluations)".format(result.cost, result.start+1, self.objective.num_evals))
+        for p, value in zip(self.fit_params, result.x):
+            self.paramTable.item(self.params.index(p), 1).setText(format(value, '.6g'))
+        self.parent.parent.set_fit_params(self.fit_params, result.x)
+
+
+# class to handle relaxation time plot
+class PlotTau(FigureCanvasQTAgg):
+    def __init__(self, parent=None, width=15, height=15, dpi=55):
+        super(PlotTau, self).__init__(Figure())
+
+        self.setParent(parent)
+        with plt.rc_context({'lines.linewidth': 1, 'lines.linestyle': ':',
+                                'xtick.labelsize': 10, 'xtick.major.size': 2,
+                                'ytick.labelsize': 10, 'ytick.major.size': 2,
+                                'axes.labelsize': 10, 'font.size': 10}):
+
+            self.figure, self.ax = plt.subplots(1, 1, figsize=(width, height), dpi=dpi)
+            self.figure.subplots_adjust(left=0.2,bottom=0.2)
+            self.canvas = FigureCanvasQTAgg(self.figure)
+            FigureCanvasQTAgg.setSizePolicy(self,QtWidgets.QSizePolicy.Expanding,QtWidgets.QSizePolicy.Expanding)
+            FigureCanvasQTAgg.updateGeometry(self)
+            self.colorbar = None
+            self.grid = None
+
+    def plot(self, mu, tau, T):
+        self.grid = (np.array(mu, copy=True), np.array(T, copy=True))
+        tau = np.transpose(tau) # python - julia compatibility
+        sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=T.min(), vmax=T.max()))
+        # single line
+        if mu.size == 1:
+            self.ax.plot(T,tau,color=tuple(item / 255 for item in gui_color))
+            self.ax.set_xlabel(r"$T\ [K]$", fontsize=12)
+            self.ax.set_ylabel(r"$\tau$", fontsize=12)
+            self.ax.grid(linewidth=0.5)
+        # one line for each T
+        else:
+            sm.set_array([])
+            for i in range(T.size):
+                self.ax.plot(mu,tau[i,:], color = sm.to_rgba(T[i]))
+            if self.colorbar is None:
+                self.colorbar = plt.colorbar(sm)
+            else:
+                self.colorbar.update_normal(sm)
+            self.ax.set_xlabel(r"$\mu\ [eV]$", fontsize=12)
+            self.ax.set_ylabel(r"$\tau$", fontsize=12)
+            self.ax.grid(linewidth=0.5)
+        self.draw()
+
+    # error code in place of the curves
+    def show_error(self, text):
+        self.ax.cla()
+        self.grid = None
+        self.ax.text(0.5, 0.5, text, transform=self.ax.transAxes, ha="center", va="center", color="gray", fontsize=12)
+        self.draw_idle()
+
+    # new values on the same grid: move the existing curves instead of redrawing the axes
+    def update_curves(self, mu, tau, T):
+        lines = self.ax.get_lines()
+        same_grid = self.grid is not None and np.array_equal(self.grid[0], mu) and np.array_equal(self.grid[1], T)
+        if not same_grid or len(lines) != (1 if mu.size == 1 else T.size):
+            self.ax.cla()
+            self.plot(mu, tau, T)
+            return
+        tau = np.transpose(tau) # python - julia compatibility
+        if mu.size == 1:
+            lines[0].set_ydata(np.ravel(tau))
+        else:
+            for i, line in enumerate(lines):
+                line.set_ydata(tau[i, :])
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.draw_idle()
+
+
+# class to handle transport coefficients plots
+class PlotsCanvas(FigureCanvasQTAgg):
+    # panels of the figures of merit: axes, color of a single curve, y scale and label
+    MERIT_PANELS = {"power factor": (0, "#1f77b4", 1e3, r"$S^2\sigma\ [mW m^{-1}K^{-2}]$"),
+                    "zt": (1, "orange", 1.0, r"$zT$"),
+                    "lorenz": (2, "red", 1e8, r"$L\ [10^{-8} W\Omega K^{-2}]$"),
+                    "kappa": (3, "limegreen", 1.0, r"$\kappa_{e}+\kappa_{l}\ [W m^{-1}K^{-1}]$")}
+
+    def __init__(self, parent=None, width=5, height=5, dpi=100):
+        super(PlotsCanvas, self).__init__(Figure())
+
+        self.setParent(parent)
+        self.figure, self.ax = plt.subplots(2, 2, figsize=(width, height), dpi=dpi)
+        plt.subplots_adjust(wspace=0.5, hspace=0.5, bottom=0.15)
+        self.ax1 = self.ax[0, 0]; self.ax2 = self.ax[0, 1]; self.ax3 = self.ax[1, 0]; self.ax4 = self.ax[1, 1]
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        FigureCanvasQTAgg.setSizePolicy(self,
+                                   QtWidgets.QSizePolicy.Expanding,
+                                   QtWidgets.QSizePolicy.Expanding)
+        FigureCanvasQTAgg.updateGeometry(self)
+        self.point1 = None; self.point2 = None; self.point3 = None; self.point4 = None
+        self.colorbar1 = None; self.colorbar2 = None; self.colorbar3 = None; self.colorbar4 = None
+        self.fitline = None
+
+
+    def plot(self, tensor_name, x, y, z, tau_model, exp_data):
+        self.figure.suptitle(r"$\tau\ $"+tau_model, y=0.97)
+        # plot1: sigma
+        if tensor_name == "conductivity":
+            # single curve
+            if z.size == 1:
+                self.ax1.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color='#1f77b4', label="mu=" + str(np.round(z, 4)), zorder=0)
+            # one curve for each value of Fermi level
+            else:
+                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
+                for i in range(z.size):
+                    self.ax1.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
+                if self.colorbar1 is None:
+                    self.colorbar1 = plt.colorbar(sm,ax=self.ax1)
+                else:
+                    self.colorbar1.update_normal(sm)
+            # plot experimental data (if imported)
+            if tensor_name in exp_data:
+                self.ax1.plot(exp_data['temperature'], exp_data[tensor_name], "--", color='dimgray', label="exp")
+            self.ax1.ticklabel_format(style="sci", axis='y', scilimits=(3,0))
+            # self.ax1.set_xlabel(r"$T\ [K]$")
+            self.ax1.set_ylabel(r"$\sigma\ [(\Omega m)^{-1}]$")
+            self.ax1.grid(linewidth=0.3)
+
+        # plot2: seebeck
+        if tensor_name == "seebeck":
+            # single curve
+            if z.size == 1:
+                self.ax2.plot(x, np.multiply(np.squeeze(y), 1e6), "-.", marker='.', fillstyle='none', color="orange", label="mu=" + str(np.round(z, 4)), zorder=0)
+            # one curve for each value of Fermi level
+            else:
+                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
+                for i in range(z.size):
+                    self.ax2.plot(x, np.multiply(y[i,:], 1e6), color=sm.to_rgba(z[i]), linewidth=0.5)
+                if self.colorbar2 is None:
+                    self.colorbar2 = plt.colorbar(sm,ax=self.ax2)
+                else:
+                    self.colorbar2.update_normal(sm)
+            if tensor_name in exp_data:
+                self.ax2.plot(exp_data['temperature'], np.multiply(exp_data[tensor_name], 1e6), "--", color='dimgray', label="exp")
+            # self.ax2.set_xlabel(r"$T\ [K]$")
+            self.ax2.set_ylabel(r"$S\ [\mu VK^{-1}]$")
+            self.ax2.grid(linewidth=0.3)
+
+        # plot3: thermal
+        if tensor_name == "thermal":
+            # single curve
+            if z.size == 1:
+                self.ax3.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color="red", label="mu=" + str(np.round(z, 4)), zorder=0)
+            else:
+                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
+                for i in range(z.size):
+                    self.ax3.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
+                if self.colorbar3 is None:
+                    self.colorbar3 = plt.colorbar(sm,ax=self.ax3)
+                else:
+                    self.colorbar3.update_normal(sm)
+            if tensor_name in exp_data:
+                self.ax3.plot(exp_data['temperature'], exp_data[tensor_name], "--", color='dimgray', label="exp")
+            self.ax3.set_xlabel(r"$T\ [K]$")
+            self.ax3.set_ylabel(r"$\kappa_{e}\ [WK^{-1}]$")
+            self.ax3.grid(linewidth=0.3)
+
+        # plot4: concentration
+        if tensor_name == "concentration":
+            # single curve
+            if z.size == 1:
+                self.ax4.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color="limegreen", label="mu=" + str(np.round(z, 4)), zorder=0)
+            # one curve for each value of Fermi level
+            else:
+                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
+                for i in range(z.size):
+                    self.ax4.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
+                if self.colorbar4 is None:
+                    self.colorbar4 = plt.colorbar(sm,ax=self.ax4)
+                else:
+                    self.colorbar4.update_normal(sm)
+            if tensor_name in exp_data:
+                self.ax4.plot(exp_data['temperature'], exp_data[tensor_name], "--", color='dimgray', label="exp")
+            self.ax4.set_xlabel(r"$T\ [K]$")
+            self.ax4.set_ylabel("n")
+            self.ax4.grid(linewidth=0.3)
+
+        # figures of merit, in the same layout
+        if tensor_name in self.MERIT_PANELS:
+            index, color, scale, ylabel = self.MERIT_PANELS[tensor_name]
+            ax = (self.ax1, self.ax2, self.ax3, self.ax4)[index]
+            y = np.multiply(y, scale)
+            if z.size == 1:
+                ax.plot(x, np.squeeze(y), "-.", marker='.', fillstyle='none', color=color, label="mu=" + str(np.round(z, 4)), zorder=0)
+            else:
+                sm = plt.cm.ScalarMappable(cmap=cm.viridis, norm=plt.Normalize(vmin=z.min(), vmax=z.max()))
+                for i in range(z.size):
+                    ax.plot(x, y[i,:], color=sm.to_rgba(z[i]), linewidth=0.5)
+                name = "colorbar{}".format(index + 1)
+                if getattr(self, name) is None:
+                    setattr(self, name, plt.colorbar(sm, ax=ax))
+                else:
+                    getattr(self, name).update_normal(sm)
+            if index > 1:
+                ax.set_xlabel(r"$T\ [K]$")
+            ax.set_ylabel(ylabel)
+            ax.grid(linewidth=0.3)
+
+        self.draw()
+
+    # remove the curves of one tensor before it is plotted again
+    def clear_tensor(self, tensor_name):
+        if tensor_name in self.MERIT_PANELS:
+            (self.ax1, self.ax2, self.ax3, self.ax4)[self.MERIT_PANELS[tensor_name][0]].cla()
+            return
+        ax = {"conductivity": self.ax1, "seebeck": self.ax2, "thermal": self.ax3, "concentration": self.ax4}[tensor_name]
+        ax.cla()
+        if tensor_name == "conductivity":
+            self.point1 = None
+        elif tensor_name == "seebeck":
+            self.point2 = None
+        elif tensor_name == "thermal":
+            self.point3 = None
+        else:
+            self.point4 = None
+
+    # empty panel of a tensor that was not computed
+    def placeholder(self, tensor_name):
+        self.clear_tensor(tensor_name)
+        ax = {"conductivity": self.ax1, "seebeck": self.ax2, "thermal": self.ax3, "concentration": self.ax4}[tensor_name]
+        ax.text(0.5, 0.5, "not computed, tick it in the input window", transform=ax.transAxes, ha="center", va="center", color="gray")
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+    # plot the curve of the best-fit Fermi level
+    def plot_fit(self, tensor_name, x, y, mu):
+        if self.fitline is not None and self.fitline.axes is not None:
+            self.fitline.remove()
+        ax = {"conductivity": self.ax1, "seebeck": self.ax2, "thermal": self.ax3, "concentration": self.ax4}[tensor_name]
+        if tensor_name == "seebeck":
+            y = np.multiply(y, 1e6)
+        self.fitline, = ax.plot(x, y, ":", color="black", label="fit mu=" + str(np.round(mu, 4)), zorder=5)
+        self.draw()
+
+    # save the plots
+    def save(self, fullpath, dpi):
+        self.ax1.set_title(""); self.ax2.set_title(""); self.ax3.set_title(""); self.ax4.set_title("")
+        plt.savefig(fullpath, dpi=dpi)
+
+
+if __name__ == "__main__":
+    import platform
+    if platform.system() == "Windows":
+        import ctypes
+        myappid = 'Mstar2t.bonal1l@cmich.edu' # arbitrary string
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+
+    # display
+    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", "-w",
+                        help="number of computing servers (0: one for each core)",
+                        type=int, default=1)
+    parser.add_argument("--port",
+                        help="port of the first server, the others use the next ones",
+                        type=int, default=1200)
+    parser.add_argument("--stub",
+                        help="run the python stand-in servers with synthetic results (client benchmarks)",
+                        action='store_true')
+    parser.add_argument("--mu-tol",
+                        help="tolerance of the adaptive Fermi level grid (fraction of the range of S and σ)",
+                        type=float, default=5e-3)
+    parser.add_argument("--profile",
+                        help="show the time spent in each step of a calculation",
+                        action='store_true')
+    parser.add_argument("--profile-log",
+                        help="append the timings to this file (one JSON line per calculation)",
+                        default=None)
+    args, qt_args = parser.parse_known_args()
+
+    # servers
+    server = ServerPool(args.workers, base_port=args.port, command=STUB_SERVER if args.stub else None).start()
+
+    # logo
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    screen = app.primaryScreen()
+    loading = LoadingScreen(screen.size())
+    app.exec_()
+
+    # GUI
+    app = QtWidgets.QApplication.instance()
+    app.setStyleSheet(mySetStyleSheet)  # design
+    InputWindow = MainWindow(server)
+    ui_in = UiInputWindow()
+    ui_in.profiler = Profiler(args.profile, args.profile_log)
+    ui_in.adaptive_grid.tol = args.mu_tol
+    ui_in.setupUi(InputWindow)
+    InputWindow.show()
+    ui_in.check_server_status()
     sys.exit(app.exec_())
\ No newline at end of file
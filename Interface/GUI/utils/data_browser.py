@@ -0,0 +1,146 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import numpy as np
+from PySide2 import QtCore
+
+from utils.tensors import COMPONENTS
+
+
+# tensors of the output window: attribute of ResultAllCompData, header and scale of the values
+TENSORS = (("conductivity", "σ", 1.0), ("seebeck", "S [μV/K]", 1e6), ("thermal", "κ" + u"ₑ", 1.0), ("concentration", "n", 1.0))
+
+
+# Table of every (μ, T) point of the results, read straight from the result arrays:
+# rows are flat grid indices (μ index * num_t + T index) and a cell is formatted only
+# when the view draws it. Filtering and sorting permute the index array, never the data.
+class ResultTableModel(QtCore.QAbstractTableModel):
+    def __init__(self, parent=None):
+        super(ResultTableModel, self).__init__(parent)
+        self.mus = np.empty(0)
+        self.T = np.empty(0)
+        # (header, (num_mu, num_t) array, scale) of each value column
+        self.columns = list()
+        # flat indices of the rows shown, in display order
+        self.rows = np.empty(0, dtype=np.int64)
+        # (low, high) bounds of the rows shown, None for an open end
+        self.mu_range = (None, None)
+        self.T_range = (None, None)
+        self.sort_column = None
+        self.sort_order = QtCore.Qt.AscendingOrder
+
+    # mus, T: grid axes; tensors: {name: (6 | 1, num_mu, num_t) array}; components: names of
+    # COMPONENTS and/or "trace" shown for each tensor
+    def set_data(self, mus, T, tensors, components):
+        self.beginResetModel()
+        self.mus = np.atleast_1d(np.asarray(mus, dtype=np.float64))
+        self.T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+        self.columns = list()
+        for name, header, scale in TENSORS:
+            tensor = tensors.get(name)
+            if tensor is None:
+                continue
+            if tensor.shape[0] == 1:
+                self.columns.append((header, tensor[0], scale))
+                continue
+            for c in components:
+                if c == "trace":
+                    self.columns.append((header + " trace", tensor[:3].mean(axis=0), scale))
+                else:
+                    self.columns.append((header + " " + c, tensor[COMPONENTS.index(c)], scale))
+        self.rows = self.selection()
+        self.sort_rows()
+        self.endResetModel()
+
+    @staticmethod
+    def inside(values, bounds):
+        low, high = bounds
+        mask = np.ones(values.size, dtype=bool)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    # flat indices of the grid points inside the μ and T ranges
+    def selection(self):
+        mask = self.inside(self.mus, self.mu_range)[:, np.newaxis] & self.inside(self.T, self.T_range)[np.newaxis, :]
+        return np.flatnonzero(mask)
+
+    def total(self):
+        return self.mus.size * self.T.size
+
+    # values of a column at the given flat indices
+    def values(self, column, flat):
+        if column == 0:
+            return self.mus[flat // self.T.size]
+        if column == 1:
+            return self.T[flat % self.T.size]
+        header, array, scale = self.columns[column - 2]
+        return array.reshape(-1)[flat] * scale
+
+    def sort_rows(self):
+        if self.sort_column is None or self.rows.size == 0:
+            return
+        order = np.argsort(self.values(self.sort_column, self.rows), kind="stable")
+        if self.sort_order == QtCore.Qt.DescendingOrder:
+            order = order[::-1]
+        self.rows = self.rows[order]
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column, self.sort_order = column, order
+        self.sort_rows()
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self.rows.size
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else 2 + len(self.columns)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            value = self.values(index.column(), self.rows[index.row()])
+            if index.column() == 0:
+                return format(value, '.5f')
+            if index.column() == 1:
+                return format(value, 'g')
+            return format(value, '.5e')
+        if role == QtCore.Qt.TextAlignmentRole:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Vertical:
+            return str(section + 1)
+        if section == 0:
+            return "μ [eV]"
+        if section == 1:
+            return "T [K]"
+        return self.columns[section - 2][0]
@@ -0,0 +1,164 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import os
+import zipfile
+import hashlib
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from PySide2 import QtCore
+
+
+# row labels accepted in an experimental data file
+EXP_LABELS = ('temperature', 'conductivity', 'seebeck', 'thermal', 'concentration')
+
+# key of the file hash inside the binary sidecar
+HASH_KEY = "__hash__"
+
+
+# function that hashes a file in chunks (the key of its sidecar)
+def file_hash(path, chunk_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# binary sidecar of a data file: hidden .npz next to it
+def sidecar_path(path):
+    dirname, basename = os.path.split(os.path.abspath(path))
+    return os.path.join(dirname, "." + basename + ".npz")
+
+
+# parse one row of values, empty cells become NaN as in pd.read_csv
+def parse_row(values):
+    values = values.strip().rstrip(",")
+    if values == "":
+        return np.empty(0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            # fast path: numpy parses the whole row in C
+            row = np.fromstring(values, dtype=np.float64, sep=",")
+            if row.size == values.count(",") + 1:
+                return row
+        except (ValueError, DeprecationWarning):
+            pass
+    return np.array([float(v) if v.strip() != "" else np.nan for v in values.split(",")])
+
+
+# read a CSV file with one labelled row per quantity (label,v1,v2,...)
+def read_csv_rows(path):
+    rows = dict()
+    with open(path, "r") as f:
+        for line in f:
+            label, _, values = line.partition(",")
+            label = label.strip().strip('"')
+            if label == "":
+                continue
+            rows[label] = parse_row(values)
+    return rows
+
+
+# read an Excel workbook with the same layout as the CSV files
+def read_excel_rows(path):
+    df = pd.read_excel(path, header=None, index_col=0)
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    return {str(label).strip(): values[i] for i, label in enumerate(df.index)}
+
+
+# pad rows of different length with NaN, so that each quantity matches the temperatures
+def pad_rows(rows):
+    size = max((row.size for row in rows.values()), default=0)
+    for label, row in rows.items():
+        if row.size < size:
+            rows[label] = np.concatenate((row, np.full(size - row.size, np.nan)))
+    return rows
+
+
+# check that every row label is known
+def check_labels(rows):
+    unknown = set(rows).difference(EXP_LABELS)
+    if unknown or 'temperature' not in rows:
+        raise ValueError("Unknown or missing rows in experimental data: {}".format(sorted(unknown)))
+
+
+# load an experimental data file, using its binary sidecar when the file did not change
+def load_exp_file(path, use_cache=True):
+    key = file_hash(path)
+    cache = sidecar_path(path)
+    if use_cache and os.path.isfile(cache):
+        try:
+            with np.load(cache, allow_pickle=False) as npz:
+                if str(npz[HASH_KEY]) == key:
+                    return {label: npz[label] for label in npz.files if label != HASH_KEY}
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # broken sidecar: read the file again and rewrite it
+            pass
+
+    if path.lower().endswith((".xlsx", ".xls")):
+        rows = read_excel_rows(path)
+    else:
+        rows = read_csv_rows(path)
+    check_labels(rows)
+    rows = pad_rows(rows)
+
+    if use_cache:
+        try:
+            # write to a temporary file first, a crash never leaves a broken sidecar
+            tmp = cache + ".tmp.npz"
+            np.savez(tmp, **rows, **{HASH_KEY: np.array(key)})
+            os.replace(tmp, cache)
+        except OSError:
+            # read-only folder: no caching
+            pass
+    return rows
+
+
+# load many experimental data files in background (outside the UI thread)
+class ExpDataLoader(QtCore.QThread):
+    loaded = QtCore.Signal(str, object)
+    failed = QtCore.Signal(str, str)
+
+    def __init__(self, filenames, max_workers=4, use_cache=True, parent=None):
+        super(ExpDataLoader, self).__init__(parent)
+        self.filenames = list(filenames)
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(load_exp_file, f, self.use_cache): f for f in self.filenames}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as err:
+                    # any broken file (or missing Excel reader) is reported, the others still load
+                    self.failed.emit(filename, "{}: {}".format(type(err).__name__, err))
+                    continue
+                self.loaded.emit(filename, rows)
@@ -0,0 +1,305 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from PySide2 import QtCore
+
+from utils.mu_fit import exp_on_grid, residuals, parabola_vertex
+
+
+# keys of the request message touched by the fit
+MASS_KEY = "# bands masses and angles"
+ENERGY_KEY = "# energy extrema"
+ACOUSTIC_KEY = "# tau acoustic coefficients"
+IMPURITY_KEY = "# tau impurity coefficients"
+
+ACOUSTIC_NAMES = ("ϵ_min", "A_sm", "τm_max", "T₀", "μ_min", "μ_max")
+IMPURITY_NAMES = ("ϵ_im", "A_im", "γ_im")
+
+
+# raised when the server cannot compute a candidate (e.g. τ domain error)
+class EvaluationError(Exception):
+    pass
+
+
+# one fitted parameter: kind is "mass", "energy", "acoustic" or "impurity",
+# index is (band, axis) for masses, band for energies, coefficient position for τ
+class FitParameter(object):
+    def __init__(self, kind, index, value, lower, upper):
+        self.kind = kind
+        self.index = index
+        self.value = float(value)
+        self.lower = float(lower)
+        self.upper = float(upper)
+
+    def label(self):
+        if self.kind == "mass":
+            return "band{} m{}".format(self.index[0]+1, "xyz"[self.index[1]])
+        elif self.kind == "energy":
+            return "band{} E0".format(self.index+1)
+        elif self.kind == "acoustic":
+            return ACOUSTIC_NAMES[self.index]
+        return IMPURITY_NAMES[self.index]
+
+
+# write the parameter values x into a copy of the request message
+def apply_params(message, params, x):
+    message = copy.deepcopy(message)
+    for p, value in zip(params, x):
+        if p.kind == "mass":
+            band, axis = p.index
+            components = message[MASS_KEY][band].split()
+            components[axis] = repr(float(value))
+            message[MASS_KEY][band] = " ".join(components)
+        elif p.kind == "energy":
+            message[ENERGY_KEY][p.index] = repr(float(value))
+        elif p.kind == "acoustic":
+            message[ACOUSTIC_KEY][p.index] = float(value)
+        elif p.kind == "impurity":
+            message[IMPURITY_KEY][p.index] = float(value)
+    return message
+
+
+# evaluate a request message on the computing servers, returns the trace of each tensor
+class ServerEngine(object):
+    def __init__(self, tensors, server):
+        self.tensors = list(tensors)
+        self.server = server
+        self.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+
+    def post(self, message):
+        # the pool keeps one keep-alive session for each worker thread
+        r_calc = self.server.post('/api/guicalc', json=message, headers=self.headers)
+        r_calc.raise_for_status()
+        if r_calc.status_code != 200:
+            raise EvaluationError(r_calc.text)
+        return r_calc.json()
+
+    def __call__(self, message):
+        out = dict()
+        for tensor_name in self.tensors:
+            data = self.post(dict(message, tensor_name=tensor_name))
+            tensor = np.array(data["data"])
+            out[tensor_name] = tensor[0] if tensor.shape[0] == 1 else tensor[:3].mean(axis=0)
+        out["T"] = np.atleast_1d(np.array(data["T"], dtype=np.float64))
+        out["mu"] = np.atleast_1d(np.array(data["mu"], dtype=np.float64))
+        return out
+
+
+# least-squares objective: residuals of all tensors at the best common Fermi level
+#   engine: callable message -> {"T", "mu", tensor_name: trace (num_mu, num_t)}, either
+#           ServerEngine or any local python function with the same signature
+#   exp_curves: {tensor_name: (exp_T, exp_y)}
+class Objective(object):
+    def __init__(self, engine, message, params, exp_curves, metric="rmse"):
+        self.engine = engine
+        self.message = message
+        self.params = params
+        self.exp_curves = exp_curves
+        self.metric = metric
+        self.cache = dict()
+        self.lock = threading.Lock()
+        self.num_evals = 0
+
+    def key(self, x):
+        return tuple(np.round(x, 12))
+
+    def residual(self, x):
+        key = self.key(x)
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+        try:
+            out = self.engine(apply_params(self.message, self.params, x))
+            res = self.profile_mu(out)
+        except EvaluationError:
+            res = None
+        with self.lock:
+            self.cache[key] = res
+            self.num_evals += 1
+        return res
+
+    # residual rows of every tensor, then the Fermi level minimizing their sum of squares
+    def profile_mu(self, out):
+        rows = list()
+        for tensor_name, (exp_T, exp_y) in self.exp_curves.items():
+            target = exp_on_grid(out["T"], exp_T, exp_y)
+            valid = np.isfinite(target)
+            res = residuals(out[tensor_name].reshape(out["mu"].size, -1)[:, valid], target[valid], self.metric)
+            if self.metric == "rmse":
+                # relative units, so that tensors with different scales are comparable
+                res = res / np.sqrt(np.mean(target[valid]**2))
+            rows.append(np.where(np.isfinite(res), res, 1e3))
+        rows = np.concatenate(rows, axis=1)
+        cost = np.sum(rows**2, axis=1)
+        i = int(np.argmin(cost))
+        if 0 < i < cost.size - 1:
+            mus = out["mu"]
+            mu_ref = parabola_vertex(mus[i-1], mus[i], mus[i+1], cost[i-1], cost[i], cost[i+1])
+            frac = np.interp(mu_ref, mus, np.arange(mus.size))
+            lo = int(np.floor(frac)); hi = min(lo + 1, mus.size - 1)
+            return rows[lo] + (frac - lo) * (rows[hi] - rows[lo])
+        return rows[i]
+
+
+# class to store the result of a fit
+class FitResult(object):
+    def __init__(self, x, cost, start, iterations):
+        self.x = x
+        self.cost = cost
+        self.start = start
+        self.iterations = iterations
+
+
+# bounded Levenberg-Marquardt: the n+1 evaluations of the Jacobian and the trial
+# steps of each iteration are independent and run as parallel batches
+class BoundedLeastSquares(object):
+    def __init__(self, objective, max_workers=4, max_iter=50, ftol=1e-6, xtol=1e-8, diff_step=1e-3):
+        self.objective = objective
+        self.max_workers = max_workers
+        self.max_iter = max_iter
+        self.ftol = ftol
+        self.xtol = xtol
+        self.diff_step = diff_step
+        self.lower = np.array([p.lower for p in objective.params])
+        self.upper = np.array([p.upper for p in objective.params])
+        self.span = np.where(self.upper > self.lower, self.upper - self.lower, 1.0)
+
+    # work in normalized coordinates u in [0, 1]
+    def to_x(self, u):
+        return self.lower + np.clip(u, 0.0, 1.0) * self.span
+
+    def to_u(self, x):
+        return np.clip((np.asarray(x, dtype=np.float64) - self.lower) / self.span, 0.0, 1.0)
+
+    def batch(self, executor, us):
+        return list(executor.map(lambda u: self.objective.residual(self.to_x(u)), us))
+
+    @staticmethod
+    def cost(res):
+        return np.inf if res is None else 0.5 * float(np.dot(res, res))
+
+    def minimize(self, x0, start=0, callback=None, should_stop=None):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            u = self.to_u(x0)
+            r = self.batch(executor, [u])[0]
+            f = self.cost(r)
+            if r is None:
+                return FitResult(self.to_x(u), f, start, 0)
+            lam = 1e-2
+            n = u.size
+            it = 0
+            for it in range(1, self.max_iter + 1):
+                if should_stop is not None and should_stop():
+                    break
+                # forward differences, stepping inside the box
+                h = np.where(u + self.diff_step <= 1.0, self.diff_step, -self.diff_step)
+                probes = [u + h[j] * np.eye(n)[j] for j in range(n)]
+                rs = self.batch(executor, probes)
+                if any(rj is None for rj in rs):
+                    J = np.column_stack([(rj - r) / h[j] if rj is not None else np.zeros_like(r) for j, rj in enumerate(rs)])
+                else:
+                    J = np.column_stack([(rj - r) / h[j] for j, rj in enumerate(rs)])
+                g = J.T @ r
+                A = J.T @ J
+                # three damping values tried at once
+                lams = (lam / 10, lam, lam * 10)
+                trials = list()
+                for l in lams:
+                    try:
+                        step = np.linalg.solve(A + l * np.diag(np.diag(A) + 1e-12), -g)
+                    except np.linalg.LinAlgError:
+                        step = -g / (np.diag(A) + l + 1e-12)
+                    trials.append(np.clip(u + step, 0.0, 1.0))
+                rts = self.batch(executor, trials)
+                fts = [self.cost(rt) for rt in rts]
+                k = int(np.argmin(fts))
+                if fts[k] < f:
+                    df = f - fts[k]
+                    dx = np.linalg.norm(trials[k] - u)
+                    u, r, f, lam = trials[k], rts[k], fts[k], lams[k]
+                    if callback is not None:
+                        callback(start, it, f, self.to_x(u))
+                    if df <= self.ftol * f or dx <= self.xtol:
+                        break
+                else:
+                    lam *= 100
+                    if lam > 1e10:
+                        break
+        return FitResult(self.to_x(u), f, start, it)
+
+    # multi-start: the initial guess plus Latin hypercube samples of the box
+    def multistart(self, x0, num_starts=1, seed=0, callback=None, should_stop=None):
+        rng = np.random.default_rng(seed)
+        starts = [np.asarray(x0, dtype=np.float64)]
+        if num_starts > 1:
+            n = len(self.lower)
+            lhs = (rng.permuted(np.tile(np.arange(num_starts - 1), (n, 1)), axis=1).T
+                   + rng.random((num_starts - 1, n))) / (num_starts - 1)
+            starts += [self.to_x(s) for s in lhs]
+        best = None
+        for i, x in enumerate(starts):
+            if should_stop is not None and should_stop():
+                break
+            result = self.minimize(x, start=i, callback=callback, should_stop=should_stop)
+            if best is None or result.cost < best.cost:
+                best = result
+        return best
+
+
+# run a fit outside the UI thread and report each improvement; done carries the
+# result and an error message (empty, or the server failure that ended the fit early)
+class FitWorker(QtCore.QThread):
+    progress = QtCore.Signal(int, int, float, object)
+    done = QtCore.Signal(object, str)
+
+    def __init__(self, optimizer, x0, num_starts=1, parent=None):
+        super(FitWorker, self).__init__(parent)
+        self.optimizer = optimizer
+        self.x0 = x0
+        self.num_starts = num_starts
+        self.stopped = False
+        # best point reported so far, what is left when the server fails
+        self.best = None
+
+    def stop(self):
+        self.stopped = True
+
+    def report(self, start, iteration, cost, x):
+        if self.best is None or cost < self.best.cost:
+            self.best = FitResult(x, cost, start, iteration)
+        self.progress.emit(start, iteration, cost, x)
+
+    def run(self):
+        try:
+            result = self.optimizer.multistart(self.x0, self.num_starts, callback=self.report,
+                                               should_stop=lambda: self.stopped)
+        except requests.exceptions.RequestException as err:
+            self.done.emit(self.best, str(err))
+            return
+        self.done.emit(result, "")
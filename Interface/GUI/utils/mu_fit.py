@@ -0,0 +1,157 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import numpy as np
+
+
+METRICS = ("rmse", "log")
+
+
+# class to store the result of the Fermi level fit
+class MuFitResult(object):
+    def __init__(self):
+        self.metric = "rmse"
+        self.mu_best = None      # single Fermi level for all temperatures
+        self.error_best = None
+        self.score = None        # error of each grid Fermi level, shape (num_mu,)
+        self.mu_T = None         # best Fermi level at each temperature, shape (num_t,)
+        self.error_T = None
+        self.landscape = None    # pointwise error, shape (num_mu, num_t)
+
+
+# interpolate an experimental curve on the computed temperatures (NaN outside the measured range)
+def exp_on_grid(T, exp_T, exp_y):
+    exp_T = np.asarray(exp_T, dtype=np.float64)
+    exp_y = np.asarray(exp_y, dtype=np.float64)
+    mask = np.isfinite(exp_T) & np.isfinite(exp_y)
+    if not mask.any():
+        return np.full(np.size(T), np.nan)
+    order = np.argsort(exp_T[mask])
+    return np.interp(T, exp_T[mask][order], exp_y[mask][order], left=np.nan, right=np.nan)
+
+
+# signed residuals of every (mu, T) point, shape (num_mu, num_t)
+def residuals(trace, target, metric="rmse"):
+    if metric == "rmse":
+        return trace - target[np.newaxis, :]
+    elif metric == "log":
+        # Seebeck changes sign with the carrier type: compare magnitudes
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = np.log(np.abs(trace)) - np.log(np.abs(target))[np.newaxis, :]
+        res[~np.isfinite(res)] = np.nan
+        return res
+    raise ValueError("Unknown metric '{}', use one of {}.".format(metric, METRICS))
+
+
+# abscissa of the vertex of the parabola through three points (grid may be non-uniform)
+def parabola_vertex(x0, x1, x2, y0, y1, y2):
+    d01 = (y1 - y0) / (x1 - x0)
+    d12 = (y2 - y1) / (x2 - x1)
+    curv = (d12 - d01) / (x2 - x0)
+    if curv <= 0:
+        return x1
+    return 0.5 * (x0 + x1) - d01 / (2 * curv)
+
+
+# score every Fermi level of the grid against an experimental curve
+#   mus:    (num_mu,) Fermi levels of the calculation
+#   T:      (num_t,) temperatures of the calculation
+#   trace:  (num_mu, num_t) trace of the computed tensor
+#   exp_T, exp_y: experimental curve; weights: optional, one per experimental point
+def fit_mu(mus, T, trace, exp_T, exp_y, metric="rmse", weights=None):
+    mus = np.atleast_1d(np.asarray(mus, dtype=np.float64))
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+    trace = np.asarray(trace, dtype=np.float64).reshape(mus.size, T.size)
+
+    target = exp_on_grid(T, exp_T, exp_y)
+    res = residuals(trace, target, metric)
+    valid = np.isfinite(res)
+    if not valid.any():
+        raise ValueError("Experimental and computed temperatures do not overlap.")
+
+    # weights on the temperature grid
+    if weights is None:
+        w = np.ones(T.size)
+    else:
+        w = exp_on_grid(T, exp_T, weights)
+    w = np.where(np.isfinite(target) & np.isfinite(w), w, 0.0)
+    W = np.where(valid, w[np.newaxis, :], 0.0)
+    res0 = np.where(valid, res, 0.0)
+
+    result = MuFitResult()
+    result.metric = metric
+    result.landscape = np.abs(np.where(valid, res, np.nan))
+
+    # 1. one Fermi level for all temperatures: weighted RMS over T for every mu at once
+    with np.errstate(invalid="ignore", divide="ignore"):
+        score = np.sqrt(np.sum(W * res0**2, axis=1) / np.sum(W, axis=1))
+    result.score = score
+    i = int(np.nanargmin(score))
+    result.mu_best, result.error_best = mus[i], score[i]
+    if 0 < i < mus.size - 1 and np.all(np.isfinite(score[i-1:i+2])):
+        # refine between grid points: mean square error is locally quadratic in mu
+        mu_ref = parabola_vertex(mus[i-1], mus[i], mus[i+1], score[i-1]**2, score[i]**2, score[i+1]**2)
+        if mus[i-1] < mu_ref < mus[i+1]:
+            frac = np.interp(mu_ref, mus, np.arange(mus.size))
+            lo = int(np.floor(frac)); hi = min(lo + 1, mus.size - 1)
+            row = res0[lo] + (frac - lo) * (res0[hi] - res0[lo])
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result.error_best = np.sqrt(np.sum(W[lo] * row**2) / np.sum(W[lo]))
+            result.mu_best = mu_ref
+
+    # 2. best Fermi level at each temperature: zero of the residual along mu (linear interpolation)
+    if mus.size > 1:
+        d0 = res[:-1, :]; d1 = res[1:, :]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cross = (d0 * d1 <= 0) & (d0 != d1)
+            frac = np.where(cross, d0 / (d0 - d1), np.nan)
+        roots = mus[:-1, np.newaxis] + frac * np.diff(mus)[:, np.newaxis]
+        # more than one crossing: keep the one closest to the global best
+        dist = np.where(cross, np.abs(roots - result.mu_best), np.inf)
+        k = np.argmin(dist, axis=0)
+        cols = np.arange(T.size)
+        has_root = np.isfinite(dist[k, cols])
+    else:
+        roots = np.full((1, T.size), np.nan)
+        k = np.zeros(T.size, dtype=int)
+        cols = np.arange(T.size)
+        has_root = np.zeros(T.size, dtype=bool)
+    abs_res = np.where(valid, np.abs(res), np.inf)
+    j = np.argmin(abs_res, axis=0)
+    result.mu_T = np.where(has_root, roots[k, cols], mus[j])
+    result.error_T = np.where(has_root, 0.0, abs_res[j, cols])
+    # temperatures outside the experimental range
+    outside = ~np.isfinite(target)
+    result.mu_T[outside] = np.nan
+    result.error_T[outside] = np.nan
+    return result
+
+
+# computed curve at any Fermi level inside the grid (linear interpolation along mu)
+def trace_at_mu(mus, trace, mu):
+    mus = np.atleast_1d(mus)
+    if mus.size == 1:
+        return np.asarray(trace).reshape(1, -1)[0]
+    frac = np.interp(mu, mus, np.arange(mus.size))
+    lo = int(np.floor(frac)); hi = min(lo + 1, mus.size - 1)
+    return trace[lo] + (frac - lo) * (trace[hi] - trace[lo])
@@ -0,0 +1,92 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PySide2 import QtCore
+
+
+EXPORT_FORMATS = ("jpg", "png", "pdf", "svg")
+
+
+# frozen copy of a figure: later changes of the interactive canvas do not reach it
+def snapshot(figure):
+    return pickle.dumps(figure)
+
+
+# output files of one export: one per format and dpi, the dpi is added to the
+# name only when the same format is written at several resolutions
+def export_targets(path, filename, formats, dpis):
+    stem, ext = os.path.splitext(filename)
+    if ext.lstrip(".").lower() not in EXPORT_FORMATS:
+        stem = filename
+    targets = list()
+    for fmt in formats:
+        for dpi in dpis:
+            name = stem + ("_{}dpi".format(int(dpi)) if len(dpis) > 1 else "") + "." + fmt
+            targets.append((os.path.join(path, name), fmt, dpi))
+    return targets
+
+
+# Plots exported outside the UI thread, one job after the other: each job renders a
+# snapshot of the figure (taken when it is queued) to all of its formats and resolutions
+class PlotExportQueue(QtCore.QObject):
+    progress = QtCore.Signal(int, int, str)   # files written, files queued, last file
+    failed = QtCore.Signal(str, str)          # file, error
+
+    def __init__(self, parent=None):
+        super(PlotExportQueue, self).__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.lock = threading.Lock()
+        self.queued = 0
+        self.written = 0
+
+    # the titles of the axes are not exported, as in PlotsCanvas.save
+    def submit(self, figure, targets):
+        data = snapshot(figure)
+        with self.lock:
+            self.queued += len(targets)
+        self.executor.submit(self.render, data, targets)
+
+    def render(self, data, targets):
+        figure = pickle.loads(data)
+        FigureCanvasAgg(figure)
+        for ax in figure.axes:
+            ax.set_title("")
+        for fullpath, fmt, dpi in targets:
+            try:
+                figure.savefig(fullpath, dpi=dpi, format=fmt)
+            except (OSError, ValueError) as err:
+                self.failed.emit(fullpath, str(err))
+            with self.lock:
+                self.written += 1
+                written, queued = self.written, self.queued
+                # queue empty: the next exports count from zero
+                if written == queued:
+                    self.written = self.queued = 0
+            self.progress.emit(written, queued, fullpath)
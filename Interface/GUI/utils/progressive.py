@@ -0,0 +1,113 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import time
+
+import requests
+from PySide2 import QtCore
+
+from common.grid import Grid
+from common.sharding import MU_KEY, T_KEY
+
+
+# stride of one axis, reduced so that a pass keeps at least min_points of it
+def axis_stride(n, k, min_points=3):
+    while k > 1 and (n - 1) // k + 1 < min(n, min_points):
+        k //= 2
+    return k
+
+
+# (mu, T) grids of the passes, coarse to fine: the first one has at most about
+# first_points points, each next pass halves the strides, the last one is the full grid
+def pass_grids(mu_text, T_text, first_points=256, min_points=3):
+    mu_grid, T_grid = Grid.parse(mu_text), Grid.parse(T_text)
+    n_mu, n_T = len(mu_grid), len(T_grid)
+
+    def strides(k):
+        return axis_stride(n_mu, k, min_points), axis_stride(n_T, k, min_points)
+
+    def size(k):
+        k_mu, k_T = strides(k)
+        return ((n_mu - 1) // k_mu + 1) * ((n_T - 1) // k_T + 1)
+
+    k = 1
+    while size(k) > first_points and strides(2 * k) != strides(k):
+        k *= 2
+    passes = list()
+    while k >= 1:
+        k_mu, k_T = strides(k)
+        grids = (str(mu_grid.stride(k_mu)), str(T_grid.stride(k_T)))
+        if not passes or passes[-1] != grids:
+            passes.append(grids)
+        k //= 2
+    return passes
+
+
+# Calculation of the four tensors in coarse-to-fine passes outside the UI thread.
+# Each pass asks the result cache for a finer strided grid, so only the points added
+# by the pass are computed; every tensor is emitted as soon as it is ready. Signals
+# carry the run number, answers of a stopped run still queued can be told apart.
+class ProgressiveCompute(QtCore.QThread):
+    result = QtCore.Signal(int, int, int, str, object)   # run, pass, number of passes, tensor name, answer
+    failed = QtCore.Signal(int, object)                   # answer with an error code (status 210)
+    error = QtCore.Signal(int, str)                       # the request could not be completed
+
+    def __init__(self, run_id, server, cache, message, tensors, headers, first_points=256, profiler=None, parent=None):
+        super(ProgressiveCompute, self).__init__(parent)
+        self.run_id = run_id
+        self.server = server
+        self.cache = cache
+        self.message = message
+        self.tensors = list(tensors)
+        self.headers = headers
+        self.passes = pass_grids(message[MU_KEY], message[T_KEY], first_points)
+        self.profiler = profiler
+        self.stopped = False
+
+    # the request in flight still completes, nothing is emitted after it
+    def stop(self):
+        self.stopped = True
+
+    def run(self):
+        for i, (mu_text, T_text) in enumerate(self.passes):
+            for tensor_name in self.tensors:
+                if self.stopped:
+                    return
+                message = dict(self.message, **{MU_KEY: mu_text, T_KEY: T_text, "tensor_name": tensor_name})
+                try:
+                    t0 = time.perf_counter()
+                    r_calc = self.cache.post(self.server, '/api/guicalc', message, headers=self.headers)
+                    if self.profiler is not None:
+                        self.profiler.add_response(r_calc, time.perf_counter() - t0)
+                    r_calc.raise_for_status()
+                except requests.exceptions.RequestException as err:
+                    if not self.stopped:
+                        self.error.emit(self.run_id, str(err))
+                    return
+                if self.stopped:
+                    return
+                if r_calc.status_code != 200:
+                    self.failed.emit(self.run_id, r_calc)
+                    return
+                self.result.emit(self.run_id, i, len(self.passes), tensor_name, r_calc.json())
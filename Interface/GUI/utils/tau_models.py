@@ -0,0 +1,239 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from PySide2 import QtCore
+
+from common.grid import Grid
+
+
+# error codes of /api/guitaucalc
+ERR_TAU_MODEL = "-20"
+ERR_TAU_DOMAIN = "-30"
+ERR_MATTHIESSEN = "-40"
+
+MODEL_KEY = "# tau model [constant/acoustic/impurity/matthiessen]"
+MATTHIESSEN = ("matthiessen", "Matthiessen's rule")
+TAU_MODELS = ("constant", "acoustic", "impurity") + MATTHIESSEN
+
+
+# raised where the server reports a domain error (e.g. negative base, fractional power)
+class TauDomainError(ValueError):
+    pass
+
+
+# τ = 1 at every (μ, T)
+def tau_constant(mus, T):
+    return np.ones((mus.size, T.size))
+
+
+# Fermi levels where τ_im is not defined: negative base with a fractional exponent
+def impurity_domain(mus, coeffs):
+    e_im, A_im, g_im = (float(c) for c in coeffs)
+    if g_im.is_integer():
+        return np.zeros(mus.size, dtype=bool)
+    return mus - e_im < 0
+
+
+# τ_im = A_im (ϵ - ϵ_im)^γ_im at ϵ = μ, the same at every temperature
+def tau_impurity(mus, T, coeffs):
+    e_im, A_im, g_im = (float(c) for c in coeffs)
+    x = mus - e_im
+    if impurity_domain(mus, coeffs).any():
+        raise TauDomainError("negative base with exponent γ_im = {}".format(g_im))
+    with np.errstate(divide="ignore"):
+        tau = A_im * np.power(x, g_im)
+    return np.repeat(tau[:, np.newaxis], T.size, axis=1)
+
+
+# Matthiessen's rule: 1/τ = Σ 1/τ_i over the selected models
+def tau_matthiessen(mus, T, components):
+    with np.errstate(divide="ignore"):
+        rate = sum(1.0 / tau for tau in components)
+        return 1.0 / rate
+
+
+# failure of a request predicted before sending it: error code of the server and the
+# (μ, T) points responsible for it (mask of shape (num_mu, num_t), None for the whole grid).
+# formula is True when the prediction relies on the local τ formula (see TauEvaluator)
+class Preflight(object):
+    def __init__(self, code, reason, mus=None, T=None, mask=None, formula=False):
+        self.code = code
+        self.reason = reason
+        self.mus = mus
+        self.T = T
+        self.mask = mask
+        self.formula = formula
+
+    # offending part of the grid as text
+    def region(self):
+        if self.mask is None:
+            return "whole grid"
+        rows = np.flatnonzero(self.mask.any(axis=1))
+        cols = np.flatnonzero(self.mask.any(axis=0))
+        return "μ from {:g} to {:g} eV ({} of {} Fermi levels), T from {:g} to {:g} K".format(
+            self.mus[rows[0]], self.mus[rows[-1]], rows.size, self.mus.size, self.T[cols[0]], self.T[cols[-1]])
+
+    def __str__(self):
+        return "{} ({})".format(self.reason, self.region())
+
+
+# Domain conditions of the relaxation time checked over the whole requested grid, so that a
+# calculation bound to fail (error codes -20, -30, -40) is never sent. Only failures known for
+# sure are reported: the acoustic model is defined in the Mstar2t package and is left to the
+# server. The checks on the impurity formula (formula=True) evaluate τ at ϵ = μ, as
+# /api/guitaucalc does; /api/guicalc evaluates τ over the band energies, in Mstar2t, so they
+# do not apply to it, and the band extrema are not checked. Returns None if no failure is predicted.
+def preflight(message):
+    model = message.get(MODEL_KEY, "constant")
+    if model not in TAU_MODELS:
+        return Preflight(ERR_TAU_MODEL, "unknown relaxation time model '{}'".format(model))
+    if model in MATTHIESSEN:
+        flags = str(message.get("# tau matthiessen models", "000"))
+        if "1" not in flags:
+            return Preflight(ERR_MATTHIESSEN, "no scattering mechanism selected for Matthiessen's rule")
+        with_impurity = flags[2:3] == "1"
+    else:
+        with_impurity = model == "impurity"
+    if not with_impurity:
+        return None
+
+    mus = Grid.parse(message["# Fermi level"]).values()
+    T = Grid.parse(message["# temperature"]).values()
+    coeffs = message["# tau impurity coefficients"]
+    bad = impurity_domain(mus, coeffs)
+    if bad.any():
+        return Preflight(ERR_TAU_DOMAIN, "negative base of τ_im with exponent γ_im = {:g}".format(float(coeffs[2])),
+                         mus, T, np.repeat(bad[:, np.newaxis], T.size, axis=1), formula=True)
+    # a zero impurity τ also zeroes the Matthiessen combination
+    e_im, A_im, g_im = (float(c) for c in coeffs)
+    if A_im == 0.0 or (g_im > 0 and np.all(mus == e_im)):
+        return Preflight(ERR_TAU_MODEL, "τ_im identically zero", formula=True)
+    return None
+
+
+# Local evaluation of the relaxation time for the τ plot, same message and answer as
+# /api/guitaucalc. The acoustic model (and any Matthiessen combination including it
+# or a γ correction) is defined in the Mstar2t package and stays on the server.
+# A local model is used only after a first answer of the server agreed with it: on a
+# mismatch the server keeps that model for the rest of the session.
+class TauEvaluator(object):
+    def __init__(self):
+        self.verified = set()
+        self.disabled = set()
+
+    # identifier of the model of a message, None if it needs the server
+    @staticmethod
+    def model_key(message):
+        model = message.get(MODEL_KEY, "constant")
+        if model in ("constant", "impurity"):
+            return model
+        if model in MATTHIESSEN:
+            flags = str(message.get("# tau matthiessen models", "000"))
+            try:
+                gamma = float(message.get("# tau matthiessen gamma", "0.0"))
+            except ValueError:
+                return None
+            if flags[1:2] == "1" or gamma != 0.0:
+                return None
+            return "matthiessen:" + flags
+        return None
+
+    def islocal(self, message):
+        key = self.model_key(message)
+        return key is not None and key not in self.disabled
+
+    # (error code or None, answer) as /api/guitaucalc would return them
+    def evaluate(self, message):
+        mus = Grid.parse(message["# Fermi level"]).values()
+        T = Grid.parse(message["# temperature"]).values()
+        model = message.get(MODEL_KEY, "constant")
+        try:
+            if model == "constant":
+                tau = tau_constant(mus, T)
+            elif model == "impurity":
+                tau = tau_impurity(mus, T, message["# tau impurity coefficients"])
+            else:
+                flags = str(message.get("# tau matthiessen models", "000"))
+                if "1" not in flags:
+                    return ERR_MATTHIESSEN, None
+                components = list()
+                if flags[0] == "1":
+                    components.append(tau_constant(mus, T))
+                if flags[2:3] == "1":
+                    components.append(tau_impurity(mus, T, message["# tau impurity coefficients"]))
+                tau = tau_matthiessen(mus, T, components)
+        except TauDomainError:
+            return ERR_TAU_DOMAIN, None
+        return None, {"data": tau, "T": T, "mu": mus}
+
+    def isverified(self, message):
+        return self.model_key(message) in self.verified
+
+    # compare a local answer with the server one, disable the model if they differ
+    def compare(self, message, local, remote):
+        key = self.model_key(message)
+        code, data = local
+        remote_code, remote_data = remote
+        if code is not None or remote_code is not None:
+            agree = code == remote_code
+        else:
+            tau = np.asarray(remote_data["data"], dtype=np.float64).reshape(data["data"].shape)
+            agree = np.allclose(data["data"], tau, rtol=1e-6, atol=0.0, equal_nan=True)
+        if agree:
+            self.verified.add(key)
+        else:
+            self.disabled.add(key)
+        return agree
+
+
+# relaxation time of the live preview on the server: one request at a time, the one
+# waiting is replaced by each newer edit and answers are tagged with their edit number
+class TauPreview(QtCore.QObject):
+    ready = QtCore.Signal(int, object, object)
+
+    def __init__(self, parent=None):
+        super(TauPreview, self).__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending = None
+
+    def submit(self, generation, server, message):
+        if self.pending is not None:
+            self.pending.cancel()
+        self.pending = self.executor.submit(self.run, generation, server, message)
+
+    def run(self, generation, server, message):
+        headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+        try:
+            r_calc = server.post('/api/guitaucalc', json=message, headers=headers)
+            r_calc.raise_for_status()
+        except requests.exceptions.RequestException:
+            return
+        if r_calc.status_code == 200:
+            self.ready.emit(generation, None, r_calc.json())
+        else:
+            self.ready.emit(generation, r_calc.text, None)
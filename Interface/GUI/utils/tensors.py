@@ -0,0 +1,120 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import numpy as np
+
+
+# order of the 6 components of the symmetric tensors sent by the server
+COMPONENTS = ("11", "22", "33", "12", "13", "23")
+INDEX = ((0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (1, 2))
+
+# figures of merit: power factor S²σ, zT, Lorenz number κe/(σT), total thermal conductivity
+MERITS = ("power factor", "zt", "lorenz", "kappa")
+
+
+# (6, num_mu, num_t) components -> (num_mu, num_t, 3, 3) symmetric matrices
+def to_matrix(tensor):
+    tensor = np.asarray(tensor, dtype=np.float64)
+    m = np.empty(tensor.shape[1:] + (3, 3))
+    for k, (i, j) in enumerate(INDEX):
+        m[..., i, j] = tensor[k]
+        m[..., j, i] = tensor[k]
+    return m
+
+
+# (num_mu, num_t, 3, 3) -> (6, num_mu, num_t) components of the symmetric part
+def to_components(m):
+    m = 0.5 * (m + np.swapaxes(m, -1, -2))
+    return np.stack([m[..., i, j] for i, j in INDEX])
+
+
+# trace/3 of the tensor at every (mu, T), as plotted in the output window
+def trace(tensor):
+    tensor = np.asarray(tensor, dtype=np.float64)
+    return tensor[0] if tensor.shape[0] == 1 else tensor[:3].mean(axis=0)
+
+
+# figures of merit at every (mu, T) point, from the (6, num_mu, num_t) tensors and the temperatures
+#   kappa_lattice: lattice thermal conductivity, isotropic, same units as kappa_e
+#   returns ({name: (num_mu, num_t) from the traces}, {name: (6, num_mu, num_t) tensors})
+def figures_of_merit(sigma, seebeck, kappa_e, T, kappa_lattice=0.0):
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+    s, S, k = trace(sigma), trace(seebeck), trace(kappa_e)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        traces = {"power factor": S**2 * s,
+                  "lorenz": k / (s * T[np.newaxis, :]),
+                  "kappa": k + kappa_lattice}
+        traces["zt"] = traces["power factor"] * T[np.newaxis, :] / traces["kappa"]
+    for value in traces.values():
+        value[~np.isfinite(value)] = np.nan
+
+    # tensor versions: PF = Sᵀ σ S, L = κe σ⁻¹ / T, zT = T PF (κe + κL)⁻¹, all points at once;
+    # pseudo-inverses keep the points with a singular tensor (e.g. σ = 0) finite
+    sig, see, kap = to_matrix(sigma), to_matrix(seebeck), to_matrix(kappa_e)
+    TT = T[np.newaxis, :, np.newaxis, np.newaxis]
+    pf = np.swapaxes(see, -1, -2) @ sig @ see
+    kappa = kap + kappa_lattice * np.eye(3)
+    tensors = {"power factor": to_components(pf),
+               "lorenz": to_components(kap @ np.linalg.pinv(sig) / TT),
+               "kappa": to_components(kappa),
+               "zt": to_components(TT * pf @ np.linalg.pinv(kappa))}
+    return traces, tensors
+
+
+# principal values (ascending) and directions (columns) at every (mu, T) point:
+# shapes (num_mu, num_t, 3) and (num_mu, num_t, 3, 3)
+def principal(tensor):
+    return np.linalg.eigh(to_matrix(tensor))
+
+
+# largest over smallest principal value in magnitude (1 for an isotropic tensor)
+def anisotropy(values):
+    magnitude = np.abs(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return magnitude.max(axis=-1) / magnitude.min(axis=-1)
+
+
+def unit(directions):
+    d = np.atleast_2d(np.asarray(directions, dtype=np.float64))
+    norm = np.linalg.norm(d, axis=-1, keepdims=True)
+    if (norm == 0).any():
+        raise ValueError("Null direction.")
+    return d / norm
+
+
+# value n̂ᵀ M n̂ of the tensor along each direction at every (mu, T) point:
+# directions (num_dir, 3) in crystal axes -> (num_dir, num_mu, num_t)
+def directional(tensor, directions):
+    n = unit(directions)
+    return np.einsum("ki,mtij,kj->kmt", n, to_matrix(tensor), n)
+
+
+# directions in a coordinate plane ("12", "13" or "23"), for polar plots
+def plane_directions(plane, num=181):
+    angles = np.linspace(0.0, 2.0 * np.pi, num)
+    directions = np.zeros((num, 3))
+    i, j = int(plane[0]) - 1, int(plane[1]) - 1
+    directions[:, i] = np.cos(angles)
+    directions[:, j] = np.sin(angles)
+    return angles, directions
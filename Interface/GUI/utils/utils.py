@@ -1,266 +1,266 @@
-# *************************************************************************** #
-# *                                                                         * #
-# *         Mstar2t - Central Michigan University University, 2023          * #
-# *                                                                         * #
-# *************************************************************************** #
-#  This file is part of Mstar2t.                                              #                        
-#                                                                             #
-#  Mstar2t is free software: you can redistribute it and/or modify it under   #
-#  the terms of the GNU General Public License as published by the Free       #
-#  Software Foundation, either version 3 of the License, or (at your option)  #
-#  any later version.                                                         #
-#                                                                             #
-#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
-#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
-#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
-#  more details.                                                              #
-#                                                                             #
-#  You should have received a copy of the GNU General Public License along    #
-#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
-#                                                                             #
-# *************************************************************************** #
-
-
-
-from PySide2 import QtCore, QtGui, QtWidgets
-
-
-# function to get number of decimal digits
-def decimal_digits(x):
-    var = str(x)
-    if not '.' in var:
-        return 0
-    return len(var) - var.index('.') - 1
-
-
-# show Mstar2t logo at launch
-class LoadingScreen(QtWidgets.QMainWindow):
-    def __init__(self, size):
-        super().__init__()
-        screen_width = size.width()
-        screen_height = size.height()
-        window_width = 280
-        window_height = 160
-        window_posx = (screen_width/2) - (window_width/2)
-        window_posy = (screen_height/2) - (window_height/2)
-        self.setWindowFlag(QtCore.Qt.FramelessWindowHint)
-        self.setWindowTitle("")
-        self.setGeometry(window_posx, window_posy, window_width, window_height)
-        self.setWindowFlags(self.windowFlags() | QtCore.Qt.FramelessWindowHint)
-        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        self.setWindowIcon(QtGui.QIcon("./images/icon.png"))
-        self.label = QtWidgets.QLabel(self)
-        self.label.setGeometry(QtCore.QRect(0, 0, 186, 106))
-        self.label.setText("")
-        self.label.setPixmap(QtGui.QPixmap("./images/logo.png"))
-        self.label.setScaledContents(True)
-        self.label.setAlignment(QtCore.Qt.AlignCenter)
-        self.label.setObjectName("label")
-        QtCore.QTimer.singleShot(5000, self.close)
-        self.show()
-
-
-# custom line edit with changing color
-class ClickableLineEdit(QtWidgets.QLineEdit):
-    clicked = QtCore.Signal()
-
-    def mousePressEvent(self, event):
-        super(ClickableLineEdit, self).mousePressEvent(event)
-        self.clicked.emit()
-
-
-# class adapted from original source https://github.com/ozmartian/QRoundProgressBar
-# author Pete Alexandrou, Apache License, Version 2.0
-class QRoundProgressBar(QtWidgets.QWidget):
-
-    StyleDonut = 1
-    StylePie = 2
-    StyleLine = 3
-
-    PositionLeft = 180
-    PositionTop = 90
-    PositionRight = 0
-    PositionBottom = -90
-
-    UF_VALUE = 1
-    UF_PERCENT = 2
-    UF_MAX = 4
-
-    def __init__(self, parent=None):
-        super(QRoundProgressBar, self).__init__(parent)
-        self.min = 0
-        self.max = 100
-        self.value = 25
-
-        self.nullPosition = self.PositionTop
-        self.barStyle = self.StyleDonut
-        self.outlinePenWidth =1
-        self.dataPenWidth = 1
-        self.rebuildBrush = False
-        self.format = "%p%"
-        self.decimals = 1
-        self.updateFlags = self.UF_PERCENT
-        self.gradientData = []
-        self.donutThicknessRatio = 0.8
-
-
-    def setBarStyle(self, style):
-        if style != self.barStyle:
-            self.barStyle = style
-            self.update()
-
-    def setDataColors(self, stopPoints):
-        if stopPoints != self.gradientData:
-            self.gradientData = stopPoints
-            self.rebuildBrush = True
-            self.update()
-
-    def setRange(self, min, max):
-        self.min = min
-        self.max = max
-
-        if self.max < self.min:
-            self.max, self.min = self.min, self.max
-
-        if self.value < self.min:
-            self.value = self.min
-        elif self.value > self.max:
-            self.value = self.max
-
-        if not self.gradientData:
-            self.rebuildBrush = True
-        self.update()
-
-    def setValue(self, val):
-        if self.value != val:
-            if val < self.min:
-                self.value = self.min
-            elif val > self.max:
-                self.value = self.max
-            else:
-                self.value = val
-            self.update()
-
-    def setNullPosition(self, position):
-        if position != self.nullPosition:
-            self.nullPosition = position
-            if not self.gradientData:
-                self.rebuildBrush = True
-            self.update()
-
-
-    def paintEvent(self, event):
-        outerRadius = min(self.width(), self.height())
-        baseRect = QtCore.QRectF(1, 1, outerRadius-2, outerRadius-2)
-
-        buffer = QtGui.QImage(outerRadius, outerRadius, QtGui.QImage.Format_ARGB32)
-        buffer.fill(0)
-
-        p = QtGui.QPainter(buffer)
-        p.setRenderHint(QtGui.QPainter.Antialiasing)
-
-        # data brush
-        self.rebuildDataBrushIfNeeded()
-
-        # background
-        self.drawBackground(p, buffer.rect())
-
-        # base circle
-        self.drawBase(p, baseRect)
-
-        # data circle
-        arcStep = 360.0 / (self.max - self.min) * self.value
-        self.drawValue(p, baseRect, self.value, arcStep)
-
-        # center circle
-        innerRect, innerRadius = self.calculateInnerRect(baseRect, outerRadius)
-        self.drawInnerBackground(p, innerRect)
-
-        # finally draw the bar
-        p.end()
-
-        painter = QtGui.QPainter(self)
-        painter.drawImage(0, 0, buffer)
-
-    def drawBackground(self, p, baseRect):
-        p.fillRect(baseRect, self.palette().window())
-
-    def drawBase(self, p, baseRect):
-        bs = self.barStyle
-        if bs == self.StyleDonut:
-            p.setPen(QtGui.QPen(self.palette().highlight().color(), self.outlinePenWidth))
-            p.setBrush(self.palette().base())
-            p.drawEllipse(baseRect)
-        elif bs == self.StylePie:
-            p.setPen(QtGui.QPen(self.palette().base().color(), self.outlinePenWidth))
-            p.setBrush(self.palette().base())
-            p.drawEllipse(baseRect)
-        elif bs == self.StyleLine:
-            p.setPen(QtGui.QPen(self.palette().base().color(), self.outlinePenWidth))
-            p.setBrush(QtCore.Qt.NoBrush)
-            p.drawEllipse(baseRect.adjusted(self.outlinePenWidth/2, self.outlinePenWidth/2, -self.outlinePenWidth/2, -self.outlinePenWidth/2))
-
-    def drawValue(self, p, baseRect, value, arcLength):
-        # nothing to draw
-        if value == self.min:
-            return
-
-        # for Line style
-        if self.barStyle == self.StyleLine:
-            p.setPen(QtGui.QPen(self.palette().highlight().color(), self.dataPenWidth))
-            p.setBrush(QtCore.Qt.NoBrush)
-            p.drawArc(baseRect.adjusted(self.outlinePenWidth/2, self.outlinePenWidth/2, -self.outlinePenWidth/2, -self.outlinePenWidth/2),
-                      self.nullPosition * 16,
-                      -arcLength * 16)
-            return
-
-        # for Pie and Donut styles
-        dataPath = QtGui.QPainterPath()
-        dataPath.setFillRule(QtCore.Qt.WindingFill)
-
-        # pie segment outer
-        dataPath.moveTo(baseRect.center())
-        dataPath.arcTo(baseRect, self.nullPosition, -arcLength)
-        dataPath.lineTo(baseRect.center())
-
-        p.setBrush(self.palette().highlight())
-        p.setPen(QtGui.QPen(self.palette().highlight().color(), self.dataPenWidth))
-        p.drawPath(dataPath)
-
-    def calculateInnerRect(self, baseRect, outerRadius):
-        # for Line style
-        if self.barStyle == self.StyleLine:
-            innerRadius = outerRadius - self.outlinePenWidth
-        else:    # for Pie and Donut styles
-            innerRadius = outerRadius * self.donutThicknessRatio
-
-        delta = (outerRadius - innerRadius) / 2.
-        innerRect = QtCore.QRectF(delta, delta, innerRadius, innerRadius)
-        return innerRect, innerRadius
-
-    def drawInnerBackground(self, p, innerRect):
-        if self.barStyle == self.StyleDonut:
-            p.setBrush(self.palette().alternateBase())
-
-            cmod = p.compositionMode()
-            p.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
-
-            p.drawEllipse(innerRect)
-
-    def rebuildDataBrushIfNeeded(self):
-        if self.rebuildBrush:
-            self.rebuildBrush = False
-
-            dataBrush = QtGui.QConicalGradient()
-            dataBrush.setCenter(0.5,0.5)
-            dataBrush.setCoordinateMode(QtGui.QGradient.StretchToDeviceMode)
-
-            for pos, color in self.gradientData:
-                dataBrush.setColorAt(1.0 - pos, color)
-
-            # angle
-            dataBrush.setAngle(self.nullPosition)
-
-            p = self.palette()
-            p.setBrush(QtGui.QPalette.Highlight, dataBrush)
-            self.setPalette(p)
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #                        
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+
+# function to get number of decimal digits
+def decimal_digits(x):
+    var = str(x)
+    if not '.' in var:
+        return 0
+    return len(var) - var.index('.') - 1
+
+
+# show Mstar2t logo at launch
+class LoadingScreen(QtWidgets.QMainWindow):
+    def __init__(self, size):
+        super().__init__()
+        screen_width = size.width()
+        screen_height = size.height()
+        window_width = 280
+        window_height = 160
+        window_posx = (screen_width/2) - (window_width/2)
+        window_posy = (screen_height/2) - (window_height/2)
+        self.setWindowFlag(QtCore.Qt.FramelessWindowHint)
+        self.setWindowTitle("")
+        self.setGeometry(window_posx, window_posy, window_width, window_height)
+        self.setWindowFlags(self.windowFlags() | QtCore.Qt.FramelessWindowHint)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.setWindowIcon(QtGui.QIcon("./images/icon.png"))
+        self.label = QtWidgets.QLabel(self)
+        self.label.setGeometry(QtCore.QRect(0, 0, 186, 106))
+        self.label.setText("")
+        self.label.setPixmap(QtGui.QPixmap("./images/logo.png"))
+        self.label.setScaledContents(True)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        QtCore.QTimer.singleShot(5000, self.close)
+        self.show()
+
+
+# custom line edit with changing color
+class ClickableLineEdit(QtWidgets.QLineEdit):
+    clicked = QtCore.Signal()
+
+    def mousePressEvent(self, event):
+        super(ClickableLineEdit, self).mousePressEvent(event)
+        self.clicked.emit()
+
+
+# class adapted from original source https://github.com/ozmartian/QRoundProgressBar
+# author Pete Alexandrou, Apache License, Version 2.0
+class QRoundProgressBar(QtWidgets.QWidget):
+
+    StyleDonut = 1
+    StylePie = 2
+    StyleLine = 3
+
+    PositionLeft = 180
+    PositionTop = 90
+    PositionRight = 0
+    PositionBottom = -90
+
+    UF_VALUE = 1
+    UF_PERCENT = 2
+    UF_MAX = 4
+
+    def __init__(self, parent=None):
+        super(QRoundProgressBar, self).__init__(parent)
+        self.min = 0
+        self.max = 100
+        self.value = 25
+
+        self.nullPosition = self.PositionTop
+        self.barStyle = self.StyleDonut
+        self.outlinePenWidth =1
+        self.dataPenWidth = 1
+        self.rebuildBrush = False
+        self.format = "%p%"
+        self.decimals = 1
+        self.updateFlags = self.UF_PERCENT
+        self.gradientData = []
+        self.donutThicknessRatio = 0.8
+
+
+    def setBarStyle(self, style):
+        if style != self.barStyle:
+            self.barStyle = style
+            self.update()
+
+    def setDataColors(self, stopPoints):
+        if stopPoints != self.gradientData:
+            self.gradientData = stopPoints
+            self.rebuildBrush = True
+            self.update()
+
+    def setRange(self, min, max):
+        self.min = min
+        self.max = max
+
+        if self.max < self.min:
+            self.max, self.min = self.min, self.max
+
+        if self.value < self.min:
+            self.value = self.min
+        elif self.value > self.max:
+            self.value = self.max
+
+        if not self.gradientData:
+            self.rebuildBrush = True
+        self.update()
+
+    def setValue(self, val):
+        if self.value != val:
+            if val < self.min:
+                self.value = self.min
+            elif val > self.max:
+                self.value = self.max
+            else:
+                self.value = val
+            self.update()
+
+    def setNullPosition(self, position):
+        if position != self.nullPosition:
+            self.nullPosition = position
+            if not self.gradientData:
+                self.rebuildBrush = True
+            self.update()
+
+
+    def paintEvent(self, event):
+        outerRadius = min(self.width(), self.height())
+        baseRect = QtCore.QRectF(1, 1, outerRadius-2, outerRadius-2)
+
+        buffer = QtGui.QImage(outerRadius, outerRadius, QtGui.QImage.Format_ARGB32)
+        buffer.fill(0)
+
+        p = QtGui.QPainter(buffer)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        # data brush
+        self.rebuildDataBrushIfNeeded()
+
+        # background
+        self.drawBackground(p, buffer.rect())
+
+        # base circle
+        self.drawBase(p, baseRect)
+
+        # data circle
+        arcStep = 360.0 / (self.max - self.min) * self.value
+        self.drawValue(p, baseRect, self.value, arcStep)
+
+        # center circle
+        innerRect, innerRadius = self.calculateInnerRect(baseRect, outerRadius)
+        self.drawInnerBackground(p, innerRect)
+
+        # finally draw the bar
+        p.end()
+
+        painter = QtGui.QPainter(self)
+        painter.drawImage(0, 0, buffer)
+
+    def drawBackground(self, p, baseRect):
+        p.fillRect(baseRect, self.palette().window())
+
+    def drawBase(self, p, baseRect):
+        bs = self.barStyle
+        if bs == self.StyleDonut:
+            p.setPen(QtGui.QPen(self.palette().highlight().color(), self.outlinePenWidth))
+            p.setBrush(self.palette().base())
+            p.drawEllipse(baseRect)
+        elif bs == self.StylePie:
+            p.setPen(QtGui.QPen(self.palette().base().color(), self.outlinePenWidth))
+            p.setBrush(self.palette().base())
+            p.drawEllipse(baseRect)
+        elif bs == self.StyleLine:
+            p.setPen(QtGui.QPen(self.palette().base().color(), self.outlinePenWidth))
+            p.setBrush(QtCore.Qt.NoBrush)
+            p.drawEllipse(baseRect.adjusted(self.outlinePenWidth/2, self.outlinePenWidth/2, -self.outlinePenWidth/2, -self.outlinePenWidth/2))
+
+    def drawValue(self, p, baseRect, value, arcLength):
+        # nothing to draw
+        if value == self.min:
+            return
+
+        # for Line style
+        if self.barStyle == self.StyleLine:
+            p.setPen(QtGui.QPen(self.palette().highlight().color(), self.dataPenWidth))
+            p.setBrush(QtCore.Qt.NoBrush)
+            p.drawArc(baseRect.adjusted(self.outlinePenWidth/2, self.outlinePenWidth/2, -self.outlinePenWidth/2, -self.outlinePenWidth/2),
+                      self.nullPosition * 16,
+                      -arcLength * 16)
+            return
+
+        # for Pie and Donut styles
+        dataPath = QtGui.QPainterPath()
+        dataPath.setFillRule(QtCore.Qt.WindingFill)
+
+        # pie segment outer
+        dataPath.moveTo(baseRect.center())
+        dataPath.arcTo(baseRect, self.nullPosition, -arcLength)
+        dataPath.lineTo(baseRect.center())
+
+        p.setBrush(self.palette().highlight())
+        p.setPen(QtGui.QPen(self.palette().highlight().color(), self.dataPenWidth))
+        p.drawPath(dataPath)
+
+    def calculateInnerRect(self, baseRect, outerRadius):
+        # for Line style
+        if self.barStyle == self.StyleLine:
+            innerRadius = outerRadius - self.outlinePenWidth
+        else:    # for Pie and Donut styles
+            innerRadius = outerRadius * self.donutThicknessRatio
+
+        delta = (outerRadius - innerRadius) / 2.
+        innerRect = QtCore.QRectF(delta, delta, innerRadius, innerRadius)
+        return innerRect, innerRadius
+
+    def drawInnerBackground(self, p, innerRect):
+        if self.barStyle == self.StyleDonut:
+            p.setBrush(self.palette().alternateBase())
+
+            cmod = p.compositionMode()
+            p.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+
+            p.drawEllipse(innerRect)
+
+    def rebuildDataBrushIfNeeded(self):
+        if self.rebuildBrush:
+            self.rebuildBrush = False
+
+            dataBrush = QtGui.QConicalGradient()
+            dataBrush.setCenter(0.5,0.5)
+            dataBrush.setCoordinateMode(QtGui.QGradient.StretchToDeviceMode)
+
+            for pos, color in self.gradientData:
+                dataBrush.setColorAt(1.0 - pos, color)
+
+            # angle
+            dataBrush.setAngle(self.nullPosition)
+
+            p = self.palette()
+            p.setBrush(QtGui.QPalette.Highlight, dataBrush)
+            self.setPalette(p)
@@ -0,0 +1,277 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+# End-to-end benchmark of the Python interface against the stand-in server
+# (run_stub_server.py): every stage of a GUI calculation is timed headless for a
+# sweep of grid sizes and band counts, the results are saved as JSON and compared
+# with a stored baseline.
+#   python run_bench.py                     # compare with baseline.json
+#   python run_bench.py --update-baseline   # store the current timings
+
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import importlib.util
+from datetime import datetime
+
+# headless Qt and matplotlib, before any import of the GUI
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+INTERFACE_DIR = os.path.dirname(BENCH_DIR)
+GUI_DIR = os.path.join(INTERFACE_DIR, "GUI")
+sys.path.insert(0, GUI_DIR)
+sys.path.append(INTERFACE_DIR)
+# the GUI loads its icons and starts the servers with paths relative to its folder
+os.chdir(GUI_DIR)
+
+import numpy as np
+import matplotlib
+from PySide2 import QtWidgets
+
+import run_gui
+from common.grid import Grid
+from common.server_pool import ServerPool, STUB_SERVER
+
+STAGES = ("read_input", "message", "http", "json_decode", "trace_reduction", "plot", "draw", "publish_tensor", "export")
+TENSORS = ("conductivity", "seebeck", "thermal", "concentration")
+
+
+# the CLI reader, loaded from its file (the GUI and the CLI both have a `utils` package)
+def load_read_input():
+    spec = importlib.util.spec_from_file_location("reading_class", os.path.join(INTERFACE_DIR, "CLI", "utils", "reading_class.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ReadInput
+
+
+# ranges of num_mu Fermi levels and num_t temperatures
+def grid_strings(num_mu, num_t):
+    mu_str = str(Grid(-0.1, -0.1 + (num_mu - 1) * 0.001, 0.001 if num_mu > 1 else 0.0))
+    T_str = str(Grid(300, 300 + (num_t - 1), 1 if num_t > 1 else 0.0, integer=True, bracketed=True))
+    return mu_str, T_str
+
+
+# CLI input file of the case, same layout as CLI/data.txt
+def write_input_file(path, mu_str, T_str, num_bands):
+    lines = ["# results fullpath", tempfile.gettempdir(),
+             "# export all data [true/false]", "false",
+             "# number of bands", str(num_bands),
+             "# Fermi level", mu_str,
+             "# temperature", T_str.strip("[]"),
+             "# bands masses and angles"] + [".5 .5 .5 0.0 0.0 0.0"] * num_bands + \
+            ["# band type"] + ["1"] * num_bands + \
+            ["# energy extrema"] + ["{:.2f}".format(0.1 * b) for b in range(num_bands)] + \
+            ["# degeneracy"] + ["1"] * num_bands + \
+            ["# tau model [constant/acoustic/impurity]", "constant",
+             "# tau acoustic coefficients", "ϵ_min = 0.0", "A_sm = 1.0", "τm_max = 1.0", "T₀ = 250.0", "μ_min = 5", "μ_max = 5",
+             "# tau impurity coefficients", "ϵ_im = 1.0", "A_im = 1.0", "γ_im = 1.0"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+# fill the band tables and the ranges of the input window
+def set_inputs(ui, mu_str, T_str, num_bands):
+    ui.CondSpin.setValue(num_bands)
+    ui.ValSpin.setValue(0)
+    for b in range(num_bands):
+        for column, text in enumerate((".5", ".5", ".5", "{:.2f}".format(0.1 * b))):
+            ui.CondTable.item(b, column).setText(text)
+    ui.muInput.setText(mu_str)
+    ui.tInput.setText(T_str)
+
+
+class Timer(object):
+    def __init__(self):
+        self.times = dict()
+
+    def add(self, stage, seconds):
+        self.times[stage] = self.times.get(stage, 0.0) + seconds
+
+
+# one calculation of the four tensors, timed stage by stage
+def run_case(ui, ReadInput, num_mu, num_t, num_bands, workdir, scrub_points=20):
+    timer = Timer()
+    mu_str, T_str = grid_strings(num_mu, num_t)
+
+    input_file = os.path.join(workdir, "input.txt")
+    write_input_file(input_file, mu_str, T_str, num_bands)
+    t0 = time.perf_counter()
+    ReadInput(input_file).read_params()
+    timer.add("read_input", time.perf_counter() - t0)
+
+    ui.clear_gui()
+    ui.args = list(TENSORS)
+    set_inputs(ui, mu_str, T_str, num_bands)
+    t0 = time.perf_counter()
+    ui.set_data()
+    message = ui.get_message()
+    timer.add("message", time.perf_counter() - t0)
+
+    # time spent in PlotsCanvas.plot, the rest of publish_output is the trace reduction
+    plots = ui.ui_out.plots
+    plot = plots.plot
+    def timed_plot(*args, **kwargs):
+        t = time.perf_counter()
+        plot(*args, **kwargs)
+        timer.add("plot", time.perf_counter() - t)
+    plots.plot = timed_plot
+
+    headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+    try:
+        for tensor_name in TENSORS:
+            message["tensor_name"] = tensor_name
+            t0 = time.perf_counter()
+            r_calc = ui.server.post('/api/guicalc', json=message, headers=headers)
+            r_calc.raise_for_status()
+            timer.add("http", time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            data = r_calc.json()
+            timer.add("json_decode", time.perf_counter() - t0)
+
+            plot_before = timer.times.get("plot", 0.0)
+            t0 = time.perf_counter()
+            ui.publish_output(tensor_name, data)
+            timer.add("trace_reduction", time.perf_counter() - t0 - (timer.times.get("plot", 0.0) - plot_before))
+    finally:
+        plots.plot = plot
+
+    t0 = time.perf_counter()
+    plots.draw()
+    timer.add("draw", time.perf_counter() - t0)
+
+    # scrub the sliders over the grid: the mean cost of one update of the tensor table
+    ui.ui_out.TVal.blockSignals(True); ui.ui_out.muVal.blockSignals(True)
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    for _ in range(scrub_points):
+        ui.ui_out.TVal.setText(str(int(ui.T[rng.integers(ui.T.size)])))
+        ui.ui_out.muVal.setText(str(ui.mus[rng.integers(ui.mus.size)]))
+        ui.publish_tensor()
+    timer.add("publish_tensor", (time.perf_counter() - t0) / scrub_points)
+    ui.ui_out.TVal.blockSignals(False); ui.ui_out.muVal.blockSignals(False)
+
+    t0 = time.perf_counter()
+    ui.export_data(os.path.join(workdir, "export.csv"))
+    timer.add("export", time.perf_counter() - t0)
+    return timer.times
+
+
+# best of the repetitions (the least disturbed by the rest of the machine)
+def run_suite(ui, grids, bands, repeat):
+    ReadInput = load_read_input()
+    results = dict()
+    with tempfile.TemporaryDirectory() as workdir:
+        for num_mu, num_t in grids:
+            for num_bands in bands:
+                case = "mu{}_t{}_b{}".format(num_mu, num_t, num_bands)
+                runs = [run_case(ui, ReadInput, num_mu, num_t, num_bands, workdir) for _ in range(repeat)]
+                results[case] = {stage: min(run[stage] for run in runs) for stage in STAGES}
+                print(case.ljust(20) + "  ".join("{}={:.4f}".format(s, results[case][s]) for s in STAGES))
+    return results
+
+
+# stages slower than the baseline by more than the tolerance (and more than min_seconds)
+def compare(results, baseline, tolerance, min_seconds):
+    regressions = list()
+    for case, stages in results.items():
+        for stage, seconds in stages.items():
+            reference = baseline.get(case, {}).get(stage)
+            if reference is None:
+                continue
+            if seconds > reference * (1.0 + tolerance) and seconds - reference > min_seconds:
+                regressions.append((case, stage, reference, seconds))
+    return regressions
+
+
+def parse_grids(text):
+    return [tuple(int(n) for n in g.split("x")) for g in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark of the Interface pipeline against the stand-in server")
+    parser.add_argument("--grids", default="1x50,20x50,50x200,200x200",
+                        help="comma separated NUM_MUxNUM_T grid sizes")
+    parser.add_argument("--bands", default="1,4", help="comma separated band counts")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--port", type=int, default=1290)
+    parser.add_argument("--output", default=None, help="JSON file of the results (default: results_<date>.json)")
+    parser.add_argument("--baseline", default=os.path.join(BENCH_DIR, "baseline.json"))
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown of a stage")
+    parser.add_argument("--min-seconds", type=float, default=1e-3, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    server = ServerPool(1, base_port=args.port, command=STUB_SERVER, check_interval=0.5).start()
+    try:
+        if not server.wait_ready(timeout=30):
+            sys.exit("Stand-in server did not start.")
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+        InputWindow = run_gui.MainWindow(server)
+        ui = run_gui.UiInputWindow()
+        ui.setupUi(InputWindow)
+        # no warm-up of the julia code is needed
+        ui.is_first_run_thread_active = False
+        ui.is_first_run_completed = True
+        results = run_suite(ui, parse_grids(args.grids), [int(b) for b in args.bands.split(",")], args.repeat)
+    finally:
+        server.terminate()
+
+    report = {"meta": {"date": datetime.now().isoformat(timespec="seconds"),
+                       "python": platform.python_version(),
+                       "platform": platform.platform(),
+                       "numpy": np.__version__,
+                       "matplotlib": matplotlib.__version__},
+              "results": results}
+    output = args.output or os.path.join(BENCH_DIR, "results_{}.json".format(datetime.now().strftime("%Y%m%d_%H%M%S")))
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print("Results written to " + output)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print("Baseline updated: " + args.baseline)
+        return
+    if not os.path.isfile(args.baseline):
+        print("No baseline to compare with, create it with --update-baseline.")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+    for case, stage, reference, seconds in regressions:
+        print("\033[91m[REGRESSION] {} {}: {:.4f} s -> {:.4f} s ({:+.0%})\033[0m".format(case, stage, reference, seconds, seconds / reference - 1.0))
+    if regressions:
+        sys.exit(1)
+    print("No regression against " + args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .grid import Grid
+from .sharding import MU_KEY, MergedResponse, sharded_post
+from .result_cache import match
+
+
+# tensors whose trace spans orders of magnitude along mu: refined on a log scale
+LOG_TENSORS = ("conductivity", "thermal", "concentration")
+
+
+# sorted fine-grid indices split into maximal arithmetic runs (first, last, stride)
+def index_runs(indices):
+    out = list()
+    i, n = 0, len(indices)
+    while i < n:
+        if i + 1 == n:
+            out.append((indices[i], indices[i], 1))
+            break
+        stride = indices[i+1] - indices[i]
+        j = i + 1
+        while j + 1 < n and indices[j+1] - indices[j] == stride:
+            j += 1
+        out.append((indices[i], indices[j], stride))
+        i = j + 1
+    return out
+
+
+# value at x of the parabola through three points
+def quadratic_at(x0, x1, x2, y0, y1, y2, x):
+    return (y0 * (x - x1) * (x - x2) / ((x0 - x1) * (x0 - x2))
+            + y1 * (x - x0) * (x - x2) / ((x1 - x0) * (x1 - x2))
+            + y2 * (x - x0) * (x - x1) / ((x2 - x0) * (x2 - x1)))
+
+
+# error of the linear interpolation at the midpoint xm of each interval of a sampled
+# curve y (num_mu, num_t), estimated with the parabolas through the neighbouring points
+# and relative to the range of the curve; the largest over the temperatures
+def interval_error(x, y, xm):
+    n = x.size
+    scale = np.ptp(y, axis=0)
+    scale = np.where(scale > 0, scale, 1.0)
+    err = np.zeros(n - 1)
+    for k in range(n - 1):
+        linear = y[k] + (y[k+1] - y[k]) * (xm[k] - x[k]) / (x[k+1] - x[k])
+        for a in (k - 1, k):
+            if a < 0 or a + 2 >= n:
+                continue
+            quad = quadratic_at(x[a], x[a+1], x[a+2], y[a], y[a+1], y[a+2], xm[k])
+            err[k] = max(err[k], np.nanmax(np.abs(quad - linear) / scale))
+    return err
+
+
+# Non-uniform Fermi level grid: the user grid is the finest resolution. A coarse
+# subset of it is computed first, then the intervals where the traces of the refined
+# tensors (Seebeck and conductivity by default) are not linear within tol are
+# bisected, until every interval passes or reaches the user step. The other tensors
+# are computed once on the final Fermi levels.
+class AdaptiveMuGrid(object):
+    def __init__(self, tol=5e-3, levels=4, min_points=5, refine=("conductivity", "seebeck")):
+        self.tol = tol
+        self.levels = levels
+        self.min_points = min_points
+        self.refine = refine
+        self.num_points = 0
+        # fine-grid indices of the last calculation, None if it was not adaptive
+        self.indices = None
+
+    # indices of the first coarse grid, 2**levels apart (fewer levels on short grids)
+    def coarse(self, n):
+        stride = 2**self.levels
+        while stride > 1 and (n - 1) // stride + 1 < self.min_points:
+            stride //= 2
+        return sorted(set(range(0, n, stride)) | {n - 1})
+
+    # midpoints of the intervals whose interpolation error is above tol
+    def bisect(self, fine, indices, traces):
+        x = fine[indices]
+        mids = [(a + b) // 2 for a, b in zip(indices[:-1], indices[1:])]
+        errors = [interval_error(x, y, fine[mids]) for y in traces]
+        err = np.max(errors, axis=0)
+        return [m for m, a, b, e in zip(mids, indices[:-1], indices[1:], err) if b - a > 1 and e > self.tol]
+
+    @staticmethod
+    def trace(tensor_name, columns, indices):
+        data = np.stack([columns[i] for i in indices], axis=1)
+        trace = data[0] if data.shape[0] == 1 else data[:3].mean(axis=0)
+        if tensor_name in LOG_TENSORS:
+            with np.errstate(divide="ignore"):
+                trace = np.log10(np.abs(trace))
+            trace[~np.isfinite(trace)] = np.nan
+        return trace
+
+    # compute the Fermi levels at the given fine-grid indices, one request per arithmetic
+    # run (each one sharded over the pool), and store the (channels, num_t) columns
+    def fetch(self, server, route, message, tensor_name, grid, fine, indices, columns, mus, **kwargs):
+        messages = list()
+        for first, last, stride in index_runs(indices):
+            run = Grid(fine[first], fine[last], grid.step * stride if last > first else 0.0, grid.integer, grid.bracketed)
+            messages.append(dict(message, **{MU_KEY: str(run), "tensor_name": tensor_name}))
+        with ThreadPoolExecutor(max_workers=max(1, min(len(messages), len(server)))) as executor:
+            responses = list(executor.map(lambda m: sharded_post(server, route, m, **kwargs), messages))
+        T = None
+        for r in responses:
+            if r.status_code != 200:
+                return r, None
+            block = r.json()
+            block_mus = np.atleast_1d(np.asarray(block["mu"], dtype=np.float64))
+            T = np.atleast_1d(np.asarray(block["T"], dtype=np.float64))
+            block_data = np.asarray(block["data"], dtype=np.float64).reshape(-1, block_mus.size, T.size)
+            for i, j in enumerate(match(block_mus, fine)):
+                if j < 0:
+                    raise ValueError("Fermi level {} is not on the requested grid.".format(block_mus[i]))
+                columns[j] = block_data[:, i, :]
+                mus[j] = block_mus[i]
+        return None, T
+
+    # {tensor_name: response} in the order of tensors; after an error code every
+    # tensor gets the failed response
+    def post(self, server, route, message, tensors, **kwargs):
+        try:
+            grid = Grid.parse(message[MU_KEY])
+        except (KeyError, ValueError):
+            grid = None
+        if grid is None or len(grid) < 3 or grid.step <= 0:
+            self.indices = None
+            return {t: sharded_post(server, route, dict(message, tensor_name=t), **kwargs) for t in tensors}
+
+        fine = grid.values()
+        refine = [t for t in tensors if t in self.refine]
+        columns = {t: dict() for t in tensors}
+        mus = dict()
+        T = None
+        indices = self.coarse(fine.size) if refine else list(range(fine.size))
+        new = indices
+        while new:
+            for tensor_name in refine:
+                failed, T = self.fetch(server, route, message, tensor_name, grid, fine, new, columns[tensor_name], mus, **kwargs)
+                if failed is not None:
+                    return {t: failed for t in tensors}
+            if not refine:
+                break
+            new = self.bisect(fine, indices, [self.trace(t, columns[t], indices) for t in refine])
+            indices = sorted(indices + new)
+        for tensor_name in tensors:
+            if tensor_name in refine:
+                continue
+            failed, T = self.fetch(server, route, message, tensor_name, grid, fine, indices, columns[tensor_name], mus, **kwargs)
+            if failed is not None:
+                return {t: failed for t in tensors}
+
+        self.num_points = len(indices)
+        self.indices = indices
+        mu_axis = np.array([mus[i] for i in indices])
+        return {t: MergedResponse({"data": np.stack([columns[t][i] for i in indices], axis=1), "T": T, "mu": mu_axis})
+                for t in tensors}
+
+    # one more tensor on the Fermi levels chosen by the last post (same message)
+    def post_more(self, server, route, message, tensor_name, **kwargs):
+        if self.indices is None:
+            return sharded_post(server, route, dict(message, tensor_name=tensor_name), **kwargs)
+        grid = Grid.parse(message[MU_KEY])
+        columns, mus = dict(), dict()
+        failed, T = self.fetch(server, route, message, tensor_name, grid, grid.values(), self.indices, columns, mus, **kwargs)
+        if failed is not None:
+            return failed
+        return MergedResponse({"data": np.stack([columns[i] for i in self.indices], axis=1), "T": T,
+                               "mu": np.array([mus[i] for i in self.indices])})
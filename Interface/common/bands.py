@@ -0,0 +1,161 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import copy
+
+import numpy as np
+
+
+# keys of the band structure in the request message (one entry for each band)
+NUM_KEY = "# number of bands"
+MASS_KEY = "# bands masses and angles"
+TYPE_KEY = "# band type"
+ENERGY_KEY = "# energy extrema"
+DEGENERACY_KEY = "# degeneracy"
+
+# largest ratio between the masses of one band, beyond it the tensor is numerically singular
+MAX_MASS_RATIO = 1e8
+
+
+# raised when the band structure cannot be computed, holds one message for each problem
+class BandError(ValueError):
+    def __init__(self, problems):
+        super(BandError, self).__init__("; ".join(problems))
+        self.problems = list(problems)
+
+
+# arrays of the band structure of a request message:
+#   masses (n, 3), angles (n, 3), types (n,), energies (n,), degeneracies (n,)
+class Bands(object):
+    def __init__(self, masses, angles, types, energies, degeneracies):
+        self.masses = masses
+        self.angles = angles
+        self.types = types
+        self.energies = energies
+        self.degeneracies = degeneracies
+
+    def __len__(self):
+        return self.masses.shape[0]
+
+
+# numbers of one entry, NaN where the text is not a number (reported by check_bands)
+def to_floats(values, size):
+    out = np.full(size, np.nan)
+    tokens = values.split() if isinstance(values, str) else list(np.atleast_1d(values))
+    for i, token in enumerate(tokens[:size]):
+        try:
+            out[i] = float(token)
+        except (TypeError, ValueError):
+            pass
+    return out, len(tokens)
+
+
+# parse the band entries of a request message (strings, as written by the GUI and the input files)
+def parse_bands(message):
+    problems = list()
+    try:
+        num_bands = int(message[NUM_KEY])
+    except (KeyError, TypeError, ValueError):
+        raise BandError(["number of bands missing or not an integer"])
+    if num_bands < 1:
+        raise BandError(["at least one band is needed"])
+    for key in (MASS_KEY, TYPE_KEY, ENERGY_KEY, DEGENERACY_KEY):
+        if len(message.get(key) or ()) != num_bands:
+            problems.append("'{}' has {} entries for {} bands".format(key.lstrip("# "), len(message.get(key) or ()), num_bands))
+    if problems:
+        raise BandError(problems)
+
+    tensors = np.empty((num_bands, 6))
+    for b, text in enumerate(message[MASS_KEY]):
+        tensors[b], count = to_floats(text, 6)
+        if count != 6:
+            problems.append("band {}: {} values instead of three masses and three angles".format(b+1, count))
+    columns = [np.array([to_floats(v, 1)[0][0] for v in message[key]]) for key in (TYPE_KEY, ENERGY_KEY, DEGENERACY_KEY)]
+    if problems:
+        raise BandError(problems)
+    return Bands(tensors[:, :3], tensors[:, 3:], *columns)
+
+
+# rotation matrices of the x-y-z Euler angles (radians) of all the bands, shape (n, 3, 3)
+def rotations(angles):
+    angles = np.atleast_2d(angles)
+    c, s = np.cos(angles), np.sin(angles)
+    one, zero = np.ones(len(angles)), np.zeros(len(angles))
+    Rx = np.stack([one, zero, zero, zero, c[:, 0], -s[:, 0], zero, s[:, 0], c[:, 0]], axis=-1).reshape(-1, 3, 3)
+    Ry = np.stack([c[:, 1], zero, s[:, 1], zero, one, zero, -s[:, 1], zero, c[:, 1]], axis=-1).reshape(-1, 3, 3)
+    Rz = np.stack([c[:, 2], -s[:, 2], zero, s[:, 2], c[:, 2], zero, zero, zero, one], axis=-1).reshape(-1, 3, 3)
+    return Rz @ Ry @ Rx
+
+
+# inverse mass tensors R diag(1/m) R^T of all the bands, shape (n, 3, 3)
+def inverse_mass_tensors(masses, angles):
+    R = rotations(angles)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv = 1.0 / np.atleast_2d(masses)
+    return np.einsum("nij,nj,nkj->nik", R, inv, R)
+
+
+# every problem of the band structure, empty list if it can be computed
+def check_bands(bands):
+    problems = list()
+    for b in np.flatnonzero(~np.isfinite(np.hstack([bands.masses, bands.angles])).all(axis=1)):
+        problems.append("band {}: masses and angles must be numbers".format(b+1))
+    for b in np.flatnonzero(~np.isin(bands.types, (1, -1))):
+        problems.append("band {}: band type must be 1 (conduction) or -1 (valence)".format(b+1))
+    for b in np.flatnonzero(~np.isfinite(bands.energies)):
+        problems.append("band {}: energy extremum must be a number".format(b+1))
+    deg = bands.degeneracies
+    with np.errstate(invalid="ignore"):
+        bad = ~np.isfinite(deg) | (deg < 1) | (deg != np.round(deg))
+    for b in np.flatnonzero(bad):
+        problems.append("band {}: degeneracy must be a positive integer".format(b+1))
+
+    # positive-definite inverse mass tensors, checked on all the bands at once
+    valid = np.isfinite(bands.masses).all(axis=1) & np.isfinite(bands.angles).all(axis=1) & (bands.masses != 0).all(axis=1)
+    eig = np.full((len(bands), 3), np.nan)
+    if valid.any():
+        eig[valid] = np.linalg.eigvalsh(inverse_mass_tensors(bands.masses[valid], bands.angles[valid]))
+    for b in np.flatnonzero(np.isfinite(bands.masses).all(axis=1) & ~(eig[:, 0] > 0)):
+        problems.append("band {}: masses must be positive (mass tensor not positive-definite)".format(b+1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = eig[:, 2] / eig[:, 0]
+    for b in np.flatnonzero((eig[:, 0] > 0) & (ratio > MAX_MASS_RATIO)):
+        problems.append("band {}: mass ratio {:.3g} too large".format(b+1, ratio[b]))
+    return problems
+
+
+# request message with a checked band structure written in a canonical form,
+# raises BandError before anything is sent to the server
+def normalize_bands(message):
+    bands = parse_bands(message)
+    problems = check_bands(bands)
+    if problems:
+        raise BandError(problems)
+    message = copy.copy(message)
+    message[NUM_KEY] = len(bands)
+    message[MASS_KEY] = [" ".join(repr(float(v)) for v in row) for row in np.hstack([bands.masses, bands.angles])]
+    message[TYPE_KEY] = [str(int(t)) for t in bands.types]
+    message[ENERGY_KEY] = [repr(float(e)) for e in bands.energies]
+    message[DEGENERACY_KEY] = [str(int(d)) for d in bands.degeneracies]
+    return message
@@ -0,0 +1,66 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import gzip
+import zlib
+
+
+# bodies below this size are sent as they are: compressing them costs more than it saves
+MIN_SIZE = 16384
+# fastest level: the JSON of the tensors compresses well already
+LEVEL = 1
+
+
+# whether an Accept-Encoding header lists gzip (with a non-zero quality)
+def accepts_gzip(header):
+    for coding in (header or "").lower().split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+# gzip a body of at least min_size bytes: (body, content encoding or None)
+def encode(body, min_size=MIN_SIZE):
+    if min_size is None or min_size < 0 or len(body) < min_size:
+        return body, None
+    return gzip.compress(body, compresslevel=LEVEL), "gzip"
+
+
+def decode(body, encoding):
+    if (encoding or "").lower() == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+# incremental gzip decoder, for bodies read in chunks
+class GzipDecoder(object):
+    def __init__(self):
+        self.decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def feed(self, chunk):
+        return self.decoder.decompress(chunk)
+
+    def flush(self):
+        return self.decoder.flush()
@@ -0,0 +1,95 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import re
+
+import numpy as np
+
+
+RANGE_RE = re.compile(r"^\s*(\[?)\s*([^:\[\]]+):([^:\[\]]+):([^:\[\]]+?)\s*(\]?)\s*$")
+
+
+# grid of temperatures or Fermi levels written as "start:stop:step" (stop included,
+# optionally in brackets as in the GUI) or as a single value
+class Grid(object):
+    def __init__(self, start, stop, step, integer=False, bracketed=False):
+        self.start = start
+        self.stop = stop
+        self.step = step
+        self.integer = integer
+        self.bracketed = bracketed
+
+    @classmethod
+    def parse(cls, text):
+        text = str(text)
+        match = RANGE_RE.match(text)
+        if match is None:
+            value = float(text.strip().strip("[]"))
+            return cls(value, value, 0.0, integer=value.is_integer() and "." not in text, bracketed="[" in text)
+        tokens = [t.strip() for t in match.group(2, 3, 4)]
+        start, stop, step = (float(t) for t in tokens)
+        integer = all(re.match(r"^[+-]?\d+$", t) for t in tokens)
+        return cls(start, stop, step, integer=integer, bracketed=match.group(1) == "[")
+
+    def __len__(self):
+        if self.step == 0:
+            return 1
+        # same tolerance as a float range in Julia
+        return max(0, int(np.floor((self.stop - self.start) / self.step + 1e-8)) + 1)
+
+    def values(self):
+        return self.start + self.step * np.arange(len(self))
+
+    def format_value(self, value):
+        if self.integer:
+            return str(int(round(value)))
+        # drop the rounding noise of start + i*step, keep a float literal
+        text = "{:.12g}".format(round(value, 12) + 0.0)
+        return text if any(c in text for c in ".en") else text + ".0"
+
+    def __str__(self):
+        if self.step == 0:
+            text = self.format_value(self.start)
+        else:
+            text = ":".join(self.format_value(v) for v in (self.start, self.stop, self.step))
+        return "[" + text + "]" if self.bracketed else text
+
+    # sub-grid of the points [i, j)
+    def slice(self, i, j):
+        last = self.start + (j - 1) * self.step
+        return Grid(self.start + i * self.step, last, self.step if j - i > 1 else 0.0, self.integer, self.bracketed)
+
+    # every k-th point, starting from the first one
+    def stride(self, k):
+        n = len(self)
+        if k <= 1 or n <= 1:
+            return self
+        return Grid(self.start, self.start + ((n - 1) // k) * k * self.step, self.step * k, self.integer, self.bracketed)
+
+    # contiguous sub-grids of nearly equal size, at least min_size points each
+    def split(self, num, min_size=1):
+        n = len(self)
+        num = max(1, min(num, n // max(1, min_size)))
+        bounds = np.linspace(0, n, num + 1).round().astype(int)
+        return [self.slice(i, j) for i, j in zip(bounds[:-1], bounds[1:]) if j > i]
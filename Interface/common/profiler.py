@@ -0,0 +1,118 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+
+# shared no-op span: a disabled profiler costs one attribute test per step
+NULL_SPAN = nullcontext()
+
+
+# timing of the steps of a calculation (spans with the same name are summed).
+# Disabled by default; with log_path every run is appended as one JSON line.
+class Profiler(object):
+    def __init__(self, enabled=False, log_path=None):
+        self.enabled = enabled or log_path is not None
+        self.log_path = log_path
+        self.lock = threading.Lock()
+        self.run_name = None
+        self.spans = dict()
+        self.t_start = None
+        self.wall = 0.0
+
+    def start(self, run_name):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.run_name = run_name
+            self.spans = dict()
+            self.t_start = time.perf_counter()
+
+    def span(self, name):
+        if not self.enabled:
+            return NULL_SPAN
+        return self.timed(name)
+
+    @contextmanager
+    def timed(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t0)
+
+    def add(self, name, seconds):
+        if not self.enabled:
+            return
+        with self.lock:
+            total, count = self.spans.get(name, (0.0, 0))
+            self.spans[name] = (total + seconds, count + 1)
+
+    # HTTP request: time until the answer headers (server + latency) and download of the body
+    def add_response(self, response, seconds):
+        if not self.enabled:
+            return
+        elapsed = getattr(response, "elapsed", None)
+        if elapsed is None:
+            self.add("request", seconds)
+            return
+        server = min(elapsed.total_seconds(), seconds)
+        self.add("server", server)
+        self.add("transfer", seconds - server)
+
+    # end of the run: wall time and log line
+    def stop(self):
+        if not self.enabled or self.t_start is None:
+            return
+        self.wall = time.perf_counter() - self.t_start
+        self.t_start = None
+        if self.log_path is not None:
+            self.write_log()
+
+    def write_log(self):
+        line = {"time": datetime.now().isoformat(timespec="milliseconds"),
+                "run": self.run_name,
+                "wall": round(self.wall, 6),
+                "spans": {name: {"seconds": round(total, 6), "count": count} for name, (total, count) in self.spans.items()}}
+        with self.lock, open(self.log_path, "a") as f:
+            f.write(json.dumps(line) + "\n")
+
+    # one line for a status bar
+    def summary(self):
+        items = ["{} {:.3f} s".format(name, total) for name, (total, _) in self.spans.items()]
+        return "  |  ".join(items + ["total {:.3f} s".format(self.wall)])
+
+    # table for the terminal
+    def report(self):
+        width = max([len(name) for name in self.spans] + [5])
+        lines = ["{}  {:>10}  {:>6}  {:>6}".format("step".ljust(width), "seconds", "calls", "%")]
+        for name, (total, count) in self.spans.items():
+            share = 100.0 * total / self.wall if self.wall > 0 else 0.0
+            lines.append("{}  {:>10.4f}  {:>6d}  {:>6.1f}".format(name.ljust(width), total, count, share))
+        lines.append("{}  {:>10.4f}".format("total".ljust(width), self.wall))
+        return "\n".join(lines)
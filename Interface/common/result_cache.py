@@ -0,0 +1,149 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .grid import Grid
+from .sharding import MU_KEY, T_KEY, MergedResponse, sharded_post
+
+
+# positions of values in a reference axis (-1 when missing)
+def match(values, reference, decimals=9):
+    index = {round(float(v), decimals): i for i, v in enumerate(reference)}
+    return np.array([index.get(round(float(v), decimals), -1) for v in values], dtype=int)
+
+
+# split sorted values into maximal arithmetic runs, written as grids like the template
+def runs(values, template):
+    out = list()
+    i, n = 0, len(values)
+    while i < n:
+        if i + 1 == n:
+            out.append(Grid(values[i], values[i], 0.0, template.integer, template.bracketed))
+            break
+        step = values[i+1] - values[i]
+        j = i + 1
+        while j + 1 < n and abs(values[j+1] - values[j] - step) <= 1e-9 * max(1.0, abs(step)):
+            j += 1
+        out.append(Grid(values[i], values[j], step, template.integer, template.bracketed))
+        i = j + 1
+    return out
+
+
+# Results of previous calculations, one per set of physics parameters (everything
+# but the two grids). A request whose grid overlaps a cached one only asks the
+# servers for the missing (mu, T) points, then merges the old and new values.
+class GridResultCache(object):
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        # a background calculation may still store its answer
+        self.lock = threading.Lock()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    @staticmethod
+    def key(message):
+        return json.dumps({k: v for k, v in message.items() if k not in (MU_KEY, T_KEY)}, sort_keys=True, default=str)
+
+    def store(self, key, mus, T, data):
+        with self.lock:
+            self.entries[key] = (mus, T, data)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    # blocks of missing points: every Fermi level at the new temperatures, then
+    # the new Fermi levels at the cached temperatures
+    @staticmethod
+    def missing_blocks(mu_grid, T_grid, mu_idx, T_idx, mus, T):
+        blocks = list()
+        for T_run in runs(T[T_idx < 0], T_grid):
+            blocks.append((str(mu_grid), str(T_run)))
+        if (T_idx >= 0).any():
+            for mu_run in runs(mus[mu_idx < 0], mu_grid):
+                for T_run in runs(T[T_idx >= 0], T_grid):
+                    blocks.append((str(mu_run), str(T_run)))
+        return blocks
+
+    def post(self, server, route, message, **kwargs):
+        try:
+            mu_grid = Grid.parse(message[MU_KEY])
+            T_grid = Grid.parse(message[T_KEY])
+        except (KeyError, ValueError):
+            return sharded_post(server, route, message, **kwargs)
+        key = self.key(message)
+        mus, T = mu_grid.values(), T_grid.values()
+
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return self.full_request(server, route, message, key, **kwargs)
+        old_mus, old_T, old_data = entry
+        mu_idx, T_idx = match(mus, old_mus), match(T, old_T)
+        # nothing to reuse
+        if not ((mu_idx >= 0).any() and (T_idx >= 0).any()):
+            return self.full_request(server, route, message, key, **kwargs)
+
+        data = np.full((old_data.shape[0], mus.size, T.size), np.nan)
+        filled = np.zeros((mus.size, T.size), dtype=bool)
+        channels = range(data.shape[0])
+        rows, cols = np.nonzero(mu_idx >= 0)[0], np.nonzero(T_idx >= 0)[0]
+        data[np.ix_(channels, rows, cols)] = old_data[np.ix_(channels, mu_idx[rows], T_idx[cols])]
+        filled[np.ix_(rows, cols)] = True
+
+        for mu_str, T_str in self.missing_blocks(mu_grid, T_grid, mu_idx, T_idx, mus, T):
+            r = sharded_post(server, route, dict(message, **{MU_KEY: mu_str, T_KEY: T_str}), **kwargs)
+            if r.status_code != 200:
+                return r
+            block = r.json()
+            block_mus = np.atleast_1d(np.asarray(block["mu"], dtype=np.float64))
+            block_T = np.atleast_1d(np.asarray(block["T"], dtype=np.float64))
+            block_data = np.asarray(block["data"], dtype=np.float64).reshape(-1, block_mus.size, block_T.size)
+            rows, cols = match(block_mus, mus), match(block_T, T)
+            if (rows < 0).any() or (cols < 0).any():
+                # the server grid does not line up with the requested one
+                return self.full_request(server, route, message, key, **kwargs)
+            data[np.ix_(channels, rows, cols)] = block_data
+            filled[np.ix_(rows, cols)] = True
+
+        if not filled.all():
+            return self.full_request(server, route, message, key, **kwargs)
+        self.store(key, mus, T, data)
+        return MergedResponse({"data": data, "T": T, "mu": mus})
+
+    def full_request(self, server, route, message, key, **kwargs):
+        r = sharded_post(server, route, message, **kwargs)
+        if r.status_code == 200:
+            result = r.json()
+            mus = np.atleast_1d(np.asarray(result["mu"], dtype=np.float64))
+            T = np.atleast_1d(np.asarray(result["T"], dtype=np.float64))
+            self.store(key, mus, T, np.asarray(result["data"], dtype=np.float64).reshape(-1, mus.size, T.size))
+        return r
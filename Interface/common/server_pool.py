@@ -0,0 +1,242 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+import os
+import sys
+import json
+import time
+import threading
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .single_flight import SingleFlight, SharedResponse, payload_key
+from . import compression
+
+
+# default command of a computing server, {port} is replaced by the worker port
+JULIA_SERVER = ['julia', '../run_server.jl', '{port}']
+# stand-in python server with synthetic results, for client benchmarks
+STUB_SERVER = [sys.executable, '../run_stub_server.py', '{port}']
+
+
+# one computing server of the pool
+class Worker(object):
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.url = "http://{}:{}".format(host, port)
+        self.process = None
+        self.healthy = False
+        self.outstanding = 0
+        self.launched = None
+        self.last_ok = None
+        self.restarts = 0
+        # the server takes gzipped requests (listed in the Accept-Encoding of its answers)
+        self.gzip_requests = False
+
+    def __repr__(self):
+        return "Worker({}, healthy={}, outstanding={}, restarts={})".format(self.url, self.healthy, self.outstanding, self.restarts)
+
+
+# pool of computing servers on consecutive ports.
+# With launch=True the pool starts the servers, checks them through /api/check
+# and restarts the ones that crashed or stopped answering; with launch=False it
+# only balances requests over servers started elsewhere (e.g. by run_cli.py).
+# Requests go to the healthy server with the fewest outstanding requests; a JSON request
+# identical to one still in flight (from any thread) waits for its answer instead.
+# Without a healthy server a request fails after wait seconds (default check_timeout + 1).
+# A server that does not answer the checks while computing is busy, not hung: it is restarted
+# only when it has no request outstanding. request_timeout (seconds, or a requests
+# (connect, read) tuple) bounds each request; None, the default, never aborts a calculation.
+# JSON bodies of at least min_gzip_size bytes are gzipped both ways when the server
+# supports it (None: never; the answers are negotiated with Accept-Encoding).
+class ServerPool(object):
+    def __init__(self, num_workers=1, host="127.0.0.1", base_port=1200, command=None, launch=True,
+                 check_interval=5.0, check_timeout=2.0, startup_timeout=900.0, hang_timeout=3600.0,
+                 single_flight=True, min_gzip_size=compression.MIN_SIZE, request_timeout=None):
+        if num_workers is None or num_workers < 1:
+            num_workers = os.cpu_count() or 1
+        self.workers = [Worker(host, base_port + i) for i in range(num_workers)]
+        self.command = JULIA_SERVER if command is None else command
+        self.launch = launch
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.startup_timeout = startup_timeout
+        self.hang_timeout = hang_timeout
+        self.cond = threading.Condition()
+        self.stopped = threading.Event()
+        self.monitor_thread = None
+        self.local = threading.local()
+        self.next = 0
+        self.flights = SingleFlight() if single_flight else None
+        self.min_gzip_size = min_gzip_size
+        self.request_timeout = request_timeout
+
+    def __len__(self):
+        return len(self.workers)
+
+    def start(self):
+        if self.launch:
+            for worker in self.workers:
+                self.spawn(worker)
+        self.monitor_thread = threading.Thread(target=self.monitor, daemon=True)
+        self.monitor_thread.start()
+        return self
+
+    def spawn(self, worker):
+        worker.process = subprocess.Popen([c.format(port=worker.port) for c in self.command])
+        worker.launched = time.monotonic()
+        worker.last_ok = None
+
+    def restart(self, worker, reason):
+        print("\033[93m[WARNING] Server {} {}, restarting.\033[0m".format(worker.url, reason))
+        if worker.process is not None and worker.process.poll() is None:
+            worker.process.kill()
+            worker.process.wait()
+        with self.cond:
+            worker.healthy = False
+        worker.restarts += 1
+        self.spawn(worker)
+
+    # "ok", "busy" (connected, but no answer in time: the server is computing) or "down"
+    def check(self, worker):
+        try:
+            r = requests.get(worker.url + '/api/check', timeout=self.check_timeout)
+            r.raise_for_status()
+            worker.gzip_requests = compression.accepts_gzip(r.headers.get("Accept-Encoding"))
+            return "ok"
+        except requests.exceptions.ReadTimeout:
+            return "busy"
+        except requests.exceptions.RequestException:
+            return "down"
+
+    # health checks of all the workers (in parallel) every check_interval seconds
+    def monitor(self):
+        with ThreadPoolExecutor(max_workers=min(32, len(self.workers))) as executor:
+            while not self.stopped.is_set():
+                states = list(executor.map(self.check, self.workers))
+                now = time.monotonic()
+                for worker, state in zip(self.workers, states):
+                    if self.stopped.is_set():
+                        break
+                    if state == "ok":
+                        worker.last_ok = now
+                    with self.cond:
+                        worker.healthy = state != "down"
+                        self.cond.notify_all()
+                    if not self.launch:
+                        continue
+                    if worker.process.poll() is not None:
+                        self.restart(worker, "exited with code {}".format(worker.process.returncode))
+                    elif worker.last_ok is None and now - worker.launched > self.startup_timeout:
+                        self.restart(worker, "did not start")
+                    elif state != "ok" and worker.last_ok is not None and worker.outstanding == 0 \
+                            and now - worker.last_ok > self.hang_timeout:
+                        self.restart(worker, "is not responding")
+                self.stopped.wait(self.check_interval)
+
+    # block until at least num healthy workers (all by default)
+    def wait_ready(self, num=None, timeout=None):
+        num = len(self.workers) if num is None else num
+        with self.cond:
+            return self.cond.wait_for(lambda: sum(w.healthy for w in self.workers) >= num, timeout)
+
+    # least-outstanding healthy worker, blocking up to wait seconds if none is up
+    def acquire(self, wait=None):
+        wait = self.check_timeout + 1 if wait is None else wait
+        with self.cond:
+            if not self.cond.wait_for(lambda: any(w.healthy for w in self.workers), wait):
+                raise requests.exceptions.ConnectionError("No computing server available.")
+            # rotate the starting point so that ties are spread over the pool
+            n = len(self.workers)
+            order = [self.workers[(self.next + i) % n] for i in range(n)]
+            worker = min((w for w in order if w.healthy), key=lambda w: w.outstanding)
+            self.next = (self.workers.index(worker) + 1) % n
+            worker.outstanding += 1
+            return worker
+
+    def release(self, worker):
+        with self.cond:
+            worker.outstanding -= 1
+
+    @contextmanager
+    def endpoint(self, wait=None):
+        worker = self.acquire(wait)
+        try:
+            yield worker.url
+        finally:
+            self.release(worker)
+
+    # keep-alive session for each calling thread
+    def session(self):
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+            # gzipped answers are decompressed by urllib3 while they are read
+            self.local.session.headers["Accept-Encoding"] = "gzip" if self.min_gzip_size is not None else "identity"
+        return self.local.session
+
+    def post(self, route, wait=None, **kwargs):
+        if self.flights is None or "json" not in kwargs:
+            return self.send(route, wait, **kwargs)
+        return self.flights.do(payload_key(route, kwargs["json"]), lambda: SharedResponse(self.send(route, wait, **kwargs)))
+
+    def send(self, route, wait=None, **kwargs):
+        worker = self.acquire(wait)
+        try:
+            if "json" in kwargs and worker.gzip_requests and self.min_gzip_size is not None:
+                body, encoding = compression.encode(json.dumps(kwargs["json"]).encode("utf-8"), self.min_gzip_size)
+                if encoding is not None:
+                    headers = dict(kwargs.pop("headers", None) or {}, **{"Content-Type": "application/json", "Content-Encoding": encoding})
+                    kwargs.pop("json")
+                    kwargs.update(data=body, headers=headers)
+            if self.request_timeout is not None:
+                kwargs.setdefault("timeout", self.request_timeout)
+            return self.session().post(worker.url + route, **kwargs)
+        finally:
+            self.release(worker)
+
+    def get(self, route, wait=None, **kwargs):
+        if self.request_timeout is not None:
+            kwargs.setdefault("timeout", self.request_timeout)
+        with self.endpoint(wait) as url:
+            return self.session().get(url + route, **kwargs)
+
+    # wait for the supervised servers (e.g. from a launcher script)
+    def join(self):
+        while self.monitor_thread is not None and self.monitor_thread.is_alive():
+            self.monitor_thread.join(1.0)
+
+    def terminate(self):
+        self.stopped.set()
+        for worker in self.workers:
+            if worker.process is not None and worker.process.poll() is None:
+                worker.process.terminate()
+        for worker in self.workers:
+            if worker.process is not None:
+                try:
+                    worker.process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    worker.process.kill()
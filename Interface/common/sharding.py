@@ -0,0 +1,114 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+from .grid import Grid
+
+
+# message keys of the two grid axes, in the order of the tensor axes (6, num_mu, num_t)
+MU_KEY = "# Fermi level"
+T_KEY = "# temperature"
+AXES = ((MU_KEY, 1), (T_KEY, 2))
+
+
+# answer of a sharded calculation, same interface as the server response used by the clients
+class MergedResponse(object):
+    def __init__(self, data):
+        self.status_code = 200
+        self.data = data
+
+    @property
+    def text(self):
+        return json.dumps({k: np.asarray(v).tolist() for k, v in self.data.items()})
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+# split the longest grid axis of a message into contiguous shards
+# returns (axis, [message, ...]), axis is None when the grid cannot be split
+def shard_message(message, num_shards, min_size=2):
+    best = None
+    for key, axis in AXES:
+        try:
+            grid = Grid.parse(message[key])
+        except (KeyError, ValueError):
+            continue
+        if grid.step > 0 and (best is None or len(grid) > len(best[1])):
+            best = (key, grid, axis)
+    if best is None:
+        return None, [message]
+    key, grid, axis = best
+    shards = grid.split(num_shards, min_size)
+    if len(shards) < 2:
+        return None, [message]
+    return axis, [dict(message, **{key: str(shard)}) for shard in shards]
+
+
+# concatenate the shard results along the split axis, in shard order
+def merge_results(results, axis):
+    mus = [np.atleast_1d(np.asarray(r["mu"], dtype=np.float64)) for r in results]
+    Ts = [np.atleast_1d(np.asarray(r["T"], dtype=np.float64)) for r in results]
+    tensors = [np.asarray(r["data"], dtype=np.float64).reshape(-1, m.size, t.size) for r, m, t in zip(results, mus, Ts)]
+    merged = dict(results[0])
+    merged["data"] = np.concatenate(tensors, axis=axis)
+    merged["mu"] = np.concatenate(mus) if axis == 1 else mus[0]
+    merged["T"] = np.concatenate(Ts) if axis == 2 else Ts[0]
+    return merged
+
+
+# send one shard, trying again on another server when it fails
+def post_shard(server, route, message, retries, **kwargs):
+    for attempt in range(retries + 1):
+        try:
+            r = server.post(route, json=message, **kwargs)
+            r.raise_for_status()
+            return r
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.HTTPError):
+            if attempt == retries:
+                raise
+
+
+# compute one request on all the servers of the pool: the (mu, T) grid is cut in
+# contiguous shards computed in parallel, then the (6, mu, T) tensors are reassembled.
+# An error code of any shard (status 210) is returned as the answer of the whole grid.
+def sharded_post(server, route, message, num_shards=None, min_size=2, retries=2, **kwargs):
+    num_shards = len(server) if num_shards is None else num_shards
+    axis, messages = shard_message(message, num_shards, min_size)
+    if axis is None:
+        return post_shard(server, route, message, retries, **kwargs)
+    with ThreadPoolExecutor(max_workers=len(messages)) as executor:
+        responses = list(executor.map(lambda m: post_shard(server, route, m, retries, **kwargs), messages))
+    for r in responses:
+        if r.status_code != 200:
+            return r
+    return MergedResponse(merge_results([r.json() for r in responses], axis))
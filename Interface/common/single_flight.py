@@ -0,0 +1,92 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+import json
+import hashlib
+import threading
+
+
+# canonical key of a request: the same for the same route and payload whatever the key order
+def payload_key(route, payload):
+    text = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return route + " " + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# server answer handed to every caller of a coalesced request: the body is decoded
+# once and all of them get the same object (to be read, not modified)
+class SharedResponse(object):
+    def __init__(self, response):
+        self.response = response
+        self.decoded = None
+        self.lock = threading.Lock()
+
+    def json(self):
+        with self.lock:
+            if self.decoded is None:
+                self.decoded = self.response.json()
+            return self.decoded
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+
+# one request in flight and the callers waiting for it
+class Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# Identical requests issued while the first one is in flight wait for its answer
+# instead of reaching the server: the first caller sends it, the others share the
+# result (or the exception). Nothing is kept once the request is answered.
+class SingleFlight(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = dict()
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = Call()
+            else:
+                self.coalesced += 1
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as err:
+                call.error = err
+            finally:
+                with self.lock:
+                    del self.calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
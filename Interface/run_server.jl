@@ -26,6 +26,16 @@ using Pkg; Pkg.activate(".")
 import HTTP
 using Mstar2t: ComputingUnit
 
+# optional gzip transport: enabled when CodecZlib is installed in the environment
+const GZIP = try
+    import CodecZlib
+    true
+catch
+    false
+end
+# smallest answer sent gzipped (bytes), small interactive answers are sent as they are
+const GZIP_MIN_SIZE = 16384
+
 
 # create server with all the methods
 const ROUTER = HTTP.Router()
@@ -34,5 +44,30 @@ HTTP.register!(ROUTER, "POST", "/api/guicalc", ComputingUnit.GUIcalc)
 HTTP.register!(ROUTER, "POST", "/api/guitaucalc", ComputingUnit.GUItaucalc)
 HTTP.register!(ROUTER, "GET", "/api/check", ComputingUnit.check)
 
+# gzipped requests are decompressed before the handlers, answers of at least
+# GZIP_MIN_SIZE bytes are gzipped for the clients that accept it, and gzip is listed
+# as a request coding the server understands (Accept-Encoding of the answers)
+function compression(handler)
+    return function(req::HTTP.Request)
+        if GZIP && lowercase(HTTP.header(req, "Content-Encoding")) == "gzip"
+            req.body = transcode(CodecZlib.GzipDecompressor, req.body)
+            HTTP.setheader(req, "Content-Encoding" => "identity")
+        end
+        res = handler(req)
+        if GZIP && res isa HTTP.Response
+            HTTP.setheader(res, "Accept-Encoding" => "gzip")
+            if length(res.body) >= GZIP_MIN_SIZE && occursin("gzip", lowercase(HTTP.header(req, "Accept-Encoding")))
+                res.body = transcode(CodecZlib.GzipCompressor, res.body)
+                HTTP.setheader(res, "Content-Encoding" => "gzip")
+                HTTP.setheader(res, "Content-Length" => string(length(res.body)))
+            end
+        end
+        return res
+    end
+end
+
+# port of the server (default 1200), e.g. `julia run_server.jl 1201`
+const PORT = length(ARGS) > 0 ? parse(Int, ARGS[1]) : 1200
+
 # run the server
-HTTP.serve(ROUTER, "127.0.0.1", 1200, verbose=false)
+HTTP.serve(compression(ROUTER), "127.0.0.1", PORT, verbose=false)
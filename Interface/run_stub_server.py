@@ -0,0 +1,235 @@
+# *************************************************************************** #
+# *                                                                         * #
+# *         Mstar2t - Central Michigan University University, 2023          * #
+# *                                                                         * #
+# *************************************************************************** #
+#  This file is part of Mstar2t.                                              #
+#                                                                             #
+#  Mstar2t is free software: you can redistribute it and/or modify it under   #
+#  the terms of the GNU General Public License as published by the Free       #
+#  Software Foundation, either version 3 of the License, or (at your option)  #
+#  any later version.                                                         #
+#                                                                             #
+#  Mstar2t is distributed in the hope that it will be useful, but WITHOUT     #
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or      #
+#  FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for   #
+#  more details.                                                              #
+#                                                                             #
+#  You should have received a copy of the GNU General Public License along    #
+#  with this program. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                             #
+# *************************************************************************** #
+
+
+
+# Lightweight stand-in of run_server.jl: same /api endpoints, message schema and
+# status codes, synthetic tensors of the requested grid shape. No Julia, no physics:
+# it measures the client side alone (decoding, plotting, exporting, pool, sharding).
+#   python run_stub_server.py 1200 --latency 0.1 --fail-rate 0.05
+
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+# shared Interface modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common.grid import Grid
+from common import compression
+
+
+# error codes of the computing server (body of a 210 answer)
+ERR_PATH = "-10"
+ERR_TAU_MODEL = "-20"
+ERR_TAU_DOMAIN = "-30"
+ERR_MATTHIESSEN = "-40"
+
+TAU_MODELS = ("constant", "acoustic", "impurity", "matthiessen")
+KB = 8.617333262e-5
+
+
+# synthetic transport tensors, smooth in mu and T, shape (6 | 1, num_mu, num_t)
+def synthetic_tensor(tensor_name, mus, T):
+    x = mus[:, np.newaxis] / (KB * T[np.newaxis, :])
+    fermi = 1.0 / (1.0 + np.exp(-np.clip(x, -500, 500)))
+    if tensor_name == "concentration":
+        return (1e20 * fermi * (T[np.newaxis, :] / 300.0)**1.5)[np.newaxis]
+    if tensor_name == "conductivity":
+        trace = 1e5 * fermi
+    elif tensor_name == "seebeck":
+        trace = -KB * (np.log1p(np.exp(-np.clip(x, -500, 500))) + 2.0)
+    else:
+        trace = 1e-8 * T[np.newaxis, :] * 1e5 * fermi
+    # xx, yy, zz slightly anisotropic, off-diagonal components zero
+    tensor = np.zeros((6,) + trace.shape)
+    tensor[0], tensor[1], tensor[2] = trace, 0.9 * trace, 1.1 * trace
+    return tensor
+
+
+# keep only the given number of significant digits (smaller JSON answers)
+def round_significant(data, digits):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = np.floor(np.log10(np.abs(data)))
+    exponent = np.where(np.isfinite(exponent), exponent, 0.0)
+    scale = 10.0**(digits - 1 - exponent)
+    return np.round(data * scale) / scale
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # keep-alive as the HTTP.jl server
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    # answers gzipped above the size threshold when the client accepts it, and gzip
+    # listed as a request coding the server understands (as run_server.jl)
+    def reply(self, status, body, content_type="application/json"):
+        body = body.encode("utf-8")
+        encoding = None
+        if self.server.options.gzip_min_size >= 0:
+            if compression.accepts_gzip(self.headers.get("Accept-Encoding")):
+                body, encoding = compression.encode(body, self.server.options.gzip_min_size)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if self.server.options.gzip_min_size >= 0:
+            self.send_header("Accept-Encoding", "gzip")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/api/check":
+            self.reply(200, "0", "text/plain")
+        else:
+            self.reply(404, "", "text/plain")
+
+    def do_POST(self):
+        routes = {"/api/clicalc": self.clicalc, "/api/guicalc": self.guicalc, "/api/guitaucalc": self.guitaucalc}
+        length = int(self.headers.get("Content-Length", 0))
+        body = compression.decode(self.rfile.read(length), self.headers.get("Content-Encoding"))
+        if self.path not in routes:
+            self.reply(404, "", "text/plain")
+            return
+        try:
+            message = json.loads(body)
+        except ValueError:
+            self.reply(400, "", "text/plain")
+            return
+
+        options = self.server.options
+        # failure injection: server crash (500) or physics error code (210)
+        if random.random() < options.fail_rate:
+            self.reply(500, "", "text/plain")
+            return
+        if random.random() < options.error_rate:
+            self.reply(210, options.error_code, "text/plain")
+            return
+
+        try:
+            mus = Grid.parse(message["# Fermi level"]).values()
+            T = Grid.parse(message["# temperature"]).values()
+        except (KeyError, ValueError):
+            self.reply(400, "", "text/plain")
+            return
+        code = self.check_tau(message)
+        if code is not None:
+            self.reply(210, code, "text/plain")
+            return
+
+        # one calculation at a time, as the julia server
+        with self.server.compute_lock:
+            delay = options.latency + options.latency_per_point * mus.size * T.size
+            if options.jitter > 0:
+                delay *= random.uniform(1.0 - options.jitter, 1.0 + options.jitter)
+            time.sleep(max(0.0, delay))
+        routes[self.path](message, mus, T)
+
+    @staticmethod
+    def check_tau(message):
+        model = next((v for k, v in message.items() if k.startswith("# tau model")), "constant")
+        if model not in TAU_MODELS:
+            return ERR_TAU_MODEL
+        if model == "matthiessen" and "1" not in str(message.get("# tau matthiessen models", "")):
+            return ERR_MATTHIESSEN
+        return None
+
+    # scalar instead of a list for single values, as the julia server
+    @staticmethod
+    def axis(values):
+        return values.tolist() if values.size > 1 else float(values[0])
+
+    def send_data(self, data, mus, T):
+        if self.server.options.digits is not None:
+            data = round_significant(data, self.server.options.digits)
+        answer = {"data": data.tolist(), "T": self.axis(T), "mu": self.axis(mus)}
+        if self.server.options.pad > 0:
+            answer["pad"] = "0" * self.server.options.pad
+        self.reply(200, json.dumps(answer))
+
+    def guicalc(self, message, mus, T):
+        self.send_data(synthetic_tensor(message.get("tensor_name", "conductivity"), mus, T), mus, T)
+
+    def guitaucalc(self, message, mus, T):
+        tau = 1e-14 * np.ones((mus.size, T.size)) * (300.0 / T[np.newaxis, :])
+        self.send_data(tau, mus, T)
+
+    def clicalc(self, message, mus, T):
+        path = message.get("# results fullpath") or ""
+        if not os.path.isdir(path):
+            self.reply(210, ERR_PATH, "text/plain")
+            return
+        self.reply(200, path, "text/plain")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stand-in of the computing server for client benchmarks")
+    parser.add_argument("port", nargs="?", type=int, default=1200)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds of fake computation for each request")
+    parser.add_argument("--latency-per-point", type=float, default=0.0,
+                        help="additional seconds for each (mu, T) point of the grid")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="relative random variation of the latency")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="probability of an internal server error (500)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="probability of a physics error code (210)")
+    parser.add_argument("--error-code", default=ERR_TAU_DOMAIN, choices=(ERR_PATH, ERR_TAU_MODEL, ERR_TAU_DOMAIN, ERR_MATTHIESSEN))
+    parser.add_argument("--digits", type=int, default=None,
+                        help="significant digits of the tensors (payload size, default: full precision)")
+    parser.add_argument("--pad", type=int, default=0,
+                        help="bytes of padding added to each answer (payload size)")
+    parser.add_argument("--gzip-min-size", type=int, default=compression.MIN_SIZE,
+                        help="smallest answer sent gzipped to the clients that accept it (-1: never)")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="compute requests in parallel instead of one at a time")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true")
+    options = parser.parse_args()
+    random.seed(options.seed)
+
+    server = ThreadingHTTPServer((options.host, options.port), StubHandler)
+    server.daemon_threads = True
+    server.options = options
+    server.compute_lock = threading.Lock() if not options.concurrent else threading.Semaphore(1 << 30)
+    print("Stub server listening on {}:{}".format(options.host, options.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()